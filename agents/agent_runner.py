@@ -109,7 +109,9 @@ class AgentRunner:
         self,
         factory: AgentFactory,
         llm_client: LLMClient,
-        verbose: bool = True
+        verbose: bool = True,
+        history_mode: str = "flat",
+        history_token_budget: int = 2048
     ):
         """
         Initialize the agent runner.
@@ -118,10 +120,15 @@ class AgentRunner:
             factory: AgentFactory with canvas configuration
             llm_client: LLM client for agent execution
             verbose: Whether to print execution details
+            history_mode: "flat" (last 10 messages in one user message) or
+                "chat" (prior turns as chat messages via send_messages)
+            history_token_budget: Token budget for the "chat" history window
         """
         self.factory = factory
         self.llm = llm_client
         self.verbose = verbose
+        self.history_mode = history_mode
+        self.history_token_budget = history_token_budget
         self.transcripts: Dict[int, RoundTranscript] = {}
 
     def execute_agent_turn(
@@ -151,8 +158,29 @@ class AgentRunner:
         }
         system_prompt = agent.compile_system_prompt(round_context)
 
+        # Chat mode: prior turns as chat messages within the token budget
+        chat_messages = None
+        if self.history_mode == "chat":
+            # Token-budgeted chat history window (shared with social_rl)
+            repo_root = str(Path(__file__).parent.parent)
+            if repo_root not in sys.path:
+                sys.path.insert(0, repo_root)
+            from social_rl.chat_history import build_chat_messages, flatten_chat_messages
+
+            chat_messages = build_chat_messages(
+                conversation_history,
+                agent.identifier,
+                opening=f"The round begins. You are {agent.name}. {round_config.scenario}",
+                closing=(
+                    f"It is now your turn to respond as {agent.name}." if conversation_history
+                    else "Respond to start the conversation."
+                ),
+                token_budget=self.history_token_budget
+            )
+            user_message = flatten_chat_messages(chat_messages, agent.identifier)
+
         # Build conversation context for the user message
-        if conversation_history:
+        elif conversation_history:
             context_lines = ["CONVERSATION SO FAR:"]
             for msg in conversation_history[-10:]:  # Last 10 messages
                 context_lines.append(f"[{msg.agent_id}]: {msg.content}")
@@ -164,7 +192,10 @@ class AgentRunner:
         # Execute via LLM
         start_time = time.time()
         try:
-            content = self.llm.send_message(system_prompt, user_message)
+            if chat_messages is not None and hasattr(self.llm, "send_messages"):
+                content = self.llm.send_messages(system_prompt, chat_messages)
+            else:
+                content = self.llm.send_message(system_prompt, user_message)
         except Exception as e:
             content = f"[Error: {str(e)}]"
 
@@ -8,6 +8,9 @@ regime trajectory table for easy H5 hypothesis checking.
 Usage:
     python experiments/analyze_sweep.py [--outputs-dir outputs/]
 
+    # Query the columnar store (see experiment_store.py) instead of the JSON files
+    python experiments/analyze_sweep.py --store outputs/_store
+
 Output format:
     Cond  Seed  R1                R2                      R3                      div_events
     A     1     ACTIVE_CONTEST    PATERNALISTIC_HARMONY   PATERNALISTIC_HARMONY   0
@@ -15,12 +18,16 @@ Output format:
     ...
 """
 
+import sys
 import argparse
 import json
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 from collections import defaultdict
 
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
 
 # Regime name abbreviations for compact display
 REGIME_ABBREV = {
@@ -227,6 +234,10 @@ Condition Definitions:
         choices=["A", "B", "C", "D", "E", "F", "G", "H"],
         help="Only show results for a specific condition"
     )
+    parser.add_argument(
+        "--store",
+        help="Columnar store directory (refreshed from --outputs-dir, then queried)"
+    )
 
     args = parser.parse_args()
 
@@ -238,41 +249,51 @@ Condition Definitions:
     # Scan all subdirectories
     experiments = []
 
-    for exp_dir in sorted(outputs_dir.iterdir()):
-        if not exp_dir.is_dir():
-            continue
+    if args.store:
+        from experiments.experiment_store import ExperimentStore, sweep_entries
 
-        exp_data = load_experiment(exp_dir)
-        if not exp_data:
-            continue
+        store = ExperimentStore(args.store)
+        store.ingest(str(outputs_dir), verbose=False)
+        experiments = [
+            entry for entry in sweep_entries(store)
+            if not args.filter_condition or entry["condition"] == args.filter_condition
+        ]
+    else:
+        for exp_dir in sorted(outputs_dir.iterdir()):
+            if not exp_dir.is_dir():
+                continue
 
-        meta = exp_data["meta"]
+            exp_data = load_experiment(exp_dir)
+            if not exp_data:
+                continue
 
-        # Infer condition if not set
-        condition = infer_condition(meta)
-        seed = meta.get("seed")
+            meta = exp_data["meta"]
 
-        # Extract trajectory
-        trajectory = extract_regime_trajectory(exp_data)
+            # Infer condition if not set
+            condition = infer_condition(meta)
+            seed = meta.get("seed")
 
-        # Get divergence events
-        div_events = meta.get("divergence_events", 0)
+            # Extract trajectory
+            trajectory = extract_regime_trajectory(exp_data)
 
-        exp_entry = {
-            "dir": exp_dir.name,
-            "condition": condition,
-            "seed": seed,
-            "trajectory": trajectory,
-            "divergence_events": div_events,
-            "meta": meta,
-        }
+            # Get divergence events
+            div_events = meta.get("divergence_events", 0)
 
-        # Filter if requested
-        if args.filter_condition:
-            if condition != args.filter_condition:
-                continue
+            exp_entry = {
+                "dir": exp_dir.name,
+                "condition": condition,
+                "seed": seed,
+                "trajectory": trajectory,
+                "divergence_events": div_events,
+                "meta": meta,
+            }
+
+            # Filter if requested
+            if args.filter_condition:
+                if condition != args.filter_condition:
+                    continue
 
-        experiments.append(exp_entry)
+            experiments.append(exp_entry)
 
     if not experiments:
         print("No experiments found in outputs directory.")
@@ -3,30 +3,39 @@ Semiotic Comparison: Challenge ON vs OFF
 
 Compares sign patterns across experimental conditions per the
 Empirical Social Semiotics methodology.
+
+Usage:
+    python experiments/compare_semiotic.py [--outputs-dir outputs/] [--off DIR] [--on DIR]
+
+    # Query the columnar store (see experiment_store.py) instead of the JSON files
+    python experiments/compare_semiotic.py --store outputs/_store
 """
 
-import json
 import sys
+import argparse
+from pathlib import Path
 sys.path.insert(0, '.')
 from social_rl.semiotic_coder import (
     SemioticCoder, JustificationType, VoiceMarker, RelationalStance
 )
-
-def load_experiment(path):
-    """Load all rounds from an experiment."""
-    rounds = {}
-    for round_num in [1, 2, 3]:
-        try:
-            with open(f'{path}/round{round_num}_social_rl.json') as f:
-                rounds[round_num] = json.load(f)
-        except FileNotFoundError:
-            pass
-    return rounds
-
-
-def analyze_experiment(path, name, coder):
+from social_rl.transcript import load_round_transcripts
+
+def load_experiment(path, store=None):
+    """Load all rounds from an experiment (from the columnar store if given)."""
+    if store is not None:
+        from experiments.experiment_store import round_transcripts
+        rounds = round_transcripts(store, Path(path).name)
+        return {r: data for r, data in rounds.items() if r in (1, 2, 3)}
+    return {
+        round_num: data
+        for round_num, data in load_round_transcripts(path).items()
+        if round_num in (1, 2, 3)
+    }
+
+
+def analyze_experiment(path, name, coder, store=None):
     """Analyze an experiment and return metrics by agent x round."""
-    rounds = load_experiment(path)
+    rounds = load_experiment(path, store)
     results = {}
 
     for round_num, data in rounds.items():
@@ -152,16 +161,50 @@ def print_comparison_table(off_results, on_results):
         print(f"  Justificatory: OFF={off_just*100:.0f}%   ON={on_just*100:.0f}%   Δ={((on_just-off_just)*100):+.0f}pp")
 
 
-if __name__ == "__main__":
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare semiotic patterns: Challenge OFF vs ON")
+    parser.add_argument(
+        "--outputs-dir",
+        default="outputs",
+        help="Directory containing experiment outputs (default: outputs/)"
+    )
+    parser.add_argument(
+        "--off",
+        default="ces_14B_performer_7B_coach",
+        help="Challenge OFF experiment directory under --outputs-dir"
+    )
+    parser.add_argument(
+        "--on",
+        default="ces_14B_7B_challenge_ON_v2",
+        help="Challenge ON experiment directory under --outputs-dir"
+    )
+    parser.add_argument(
+        "--store",
+        help="Columnar store directory (refreshed from --outputs-dir, then queried)"
+    )
+
+    args = parser.parse_args(argv)
+
+    store = None
+    if args.store:
+        from experiments.experiment_store import ExperimentStore
+
+        store = ExperimentStore(args.store)
+        store.ingest(args.outputs_dir, verbose=False)
+
     coder = SemioticCoder()
 
-    off_path = "outputs/ces_14B_performer_7B_coach"
-    on_path = "outputs/ces_14B_7B_challenge_ON_v2"
+    off_path = str(Path(args.outputs_dir) / args.off)
+    on_path = str(Path(args.outputs_dir) / args.on)
 
     print(f"Challenge OFF: {off_path}")
     print(f"Challenge ON:  {on_path}")
 
-    off_results = analyze_experiment(off_path, "Challenge OFF", coder)
-    on_results = analyze_experiment(on_path, "Challenge ON", coder)
+    off_results = analyze_experiment(off_path, "Challenge OFF", coder, store)
+    on_results = analyze_experiment(on_path, "Challenge ON", coder, store)
 
     print_comparison_table(off_results, on_results)
+
+
+if __name__ == "__main__":
+    main()
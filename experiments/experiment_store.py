@@ -0,0 +1,360 @@
+#!/usr/bin/env python3
+"""
+Columnar Experiment Store
+
+Compacts every experiment directory under outputs/ into a handful of
+Parquet tables so sweep analysis stops re-parsing meta.json,
+semiotic_state_log.json and every round transcript on each run:
+
+    meta           one row per experiment (condition, seed, modes, final regime, ...)
+    regimes        experiment x round regime trajectory (from meta.json)
+    round_metrics  experiment x round semiotic state (semiotic_state_log.json)
+    messages       every message of every round transcript
+    agent_feedback experiment x round x agent feedback scores
+
+Each table is a directory with one Parquet file per experiment
+({store}/{table}/{experiment}.parquet). Ingestion is incremental: a
+manifest records a signature (file names, sizes, mtimes) per directory,
+only new or changed directories are re-read, and only their files are
+rewritten or deleted - cost is proportional to what changed, not to the
+size of the store. Requires pyarrow.
+
+Usage:
+    # Build / refresh the store
+    python experiments/experiment_store.py ingest --outputs-dir outputs
+
+    # Show what is in it
+    python experiments/experiment_store.py info
+
+    # Analysis scripts read the store instead of the JSON files
+    python experiments/analyze_sweep.py --store outputs/_store
+"""
+
+import sys
+import json
+import hashlib
+import argparse
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Iterable
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from social_rl.transcript import find_round_transcripts, load_round_transcript
+from experiments.analyze_sweep import infer_condition
+
+
+DEFAULT_STORE = "outputs/_store"
+MANIFEST_FILENAME = "manifest.json"
+STORE_VERSION = 2  # 2: one Parquet file per experiment and table
+
+TABLES = ("meta", "regimes", "round_metrics", "messages", "agent_feedback")
+
+# Files whose changes trigger re-ingesting a directory
+_SOURCE_FILES = ("meta.json", "semiotic_state_log.json")
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        raise ImportError("Please install pyarrow: pip install pyarrow")
+    return pyarrow, pyarrow.parquet
+
+
+# =============================================================================
+# Row extraction (pure Python)
+# =============================================================================
+
+def experiment_signature(exp_dir: Path) -> str:
+    """Fingerprint of the files ingested from an experiment directory."""
+    paths = [exp_dir / name for name in _SOURCE_FILES if (exp_dir / name).exists()]
+    paths.extend(find_round_transcripts(exp_dir).values())
+
+    digest = hashlib.sha1()
+    for path in sorted(paths):
+        stat = path.stat()
+        digest.update(f"{path.name}:{stat.st_size}:{stat.st_mtime_ns}\n".encode())
+    return digest.hexdigest()
+
+
+def experiment_rows(exp_dir: Path) -> Optional[Dict[str, List[Dict[str, Any]]]]:
+    """
+    Extract the rows every table holds for one experiment directory.
+
+    Returns None for directories without a meta.json (not an experiment).
+    """
+    meta_path = exp_dir / "meta.json"
+    if not meta_path.exists():
+        return None
+
+    with open(meta_path) as f:
+        meta = json.load(f)
+    name = exp_dir.name
+
+    rows: Dict[str, List[Dict[str, Any]]] = {table: [] for table in TABLES}
+    rows["meta"].append({
+        "experiment": name,
+        "experiment_id": meta.get("experiment_id"),
+        "condition": infer_condition(meta),
+        "seed": meta.get("seed"),
+        "context_mode": meta.get("context_mode"),
+        "challenge_mode": meta.get("challenge_mode"),
+        "dual_llm": meta.get("dual_llm"),
+        "model": meta.get("model"),
+        "provider": meta.get("provider"),
+        "rounds_executed": meta.get("rounds_executed"),
+        "final_regime": meta.get("final_regime"),
+        "divergence_events": meta.get("divergence_events", 0),
+        "timestamp": meta.get("timestamp"),
+        "meta_json": json.dumps(meta),
+    })
+
+    for i, regime in enumerate(meta.get("regime_trajectory", []), 1):
+        rows["regimes"].append({"experiment": name, "round_number": i, "regime": regime})
+
+    semiotic_path = exp_dir / "semiotic_state_log.json"
+    if semiotic_path.exists():
+        with open(semiotic_path) as f:
+            semiotic_log = json.load(f)
+        for entry in semiotic_log.get("rounds", []):
+            raw = entry.get("raw_metrics", {})
+            rows["round_metrics"].append({
+                "experiment": name,
+                "round_number": entry.get("round_number"),
+                "regime": entry.get("regime"),
+                "engagement": raw.get("engagement"),
+                "voice_valence": raw.get("voice_valence"),
+                "stance_valence": raw.get("stance_valence"),
+                "justificatory_pct": raw.get("justificatory_pct"),
+                "ema_json": json.dumps(entry.get("ema_metrics") or {}),
+                "collapse_type": entry.get("collapse_type"),
+                "divergence_injected": entry.get("divergence_injected"),
+            })
+
+    for round_number, path in find_round_transcripts(exp_dir).items():
+        round_data = load_round_transcript(path)
+        for msg in round_data.get("messages", []):
+            rows["messages"].append({
+                "experiment": name,
+                "round_number": round_number,
+                "turn_number": msg.get("turn_number"),
+                "agent_id": msg.get("agent_id"),
+                "content": msg.get("content"),
+                "prar_cue_used": msg.get("prar_cue_used"),
+                "timestamp": msg.get("timestamp"),
+            })
+        for agent_id, fb in round_data.get("feedback", {}).items():
+            row = {"experiment": name, "round_number": round_number, "agent_id": agent_id}
+            # Scalar scores only (lists like concepts_embodied stay in the JSON)
+            row.update(
+                (k, v) for k, v in fb.items()
+                if isinstance(v, (int, float)) and k not in row
+            )
+            rows["agent_feedback"].append(row)
+
+    return rows
+
+
+def _rows_to_table(pa, rows: List[Dict[str, Any]]):
+    """Rows as a pyarrow.Table with every column any row has (missing = null)."""
+    # from_pylist alone takes the columns from the first row only
+    columns = list(dict.fromkeys(key for row in rows for key in row))
+    return pa.Table.from_pylist([{key: row.get(key) for key in columns} for row in rows])
+
+
+# =============================================================================
+# Store
+# =============================================================================
+
+class ExperimentStore:
+    """Parquet tables for all experiments under an outputs directory."""
+
+    def __init__(self, path: str = DEFAULT_STORE):
+        self.path = Path(path)
+        self.manifest = self._load_manifest()
+
+    def _load_manifest(self) -> Dict[str, Any]:
+        manifest_path = self.path / MANIFEST_FILENAME
+        if manifest_path.exists():
+            with open(manifest_path) as f:
+                manifest = json.load(f)
+            if manifest.get("version") == STORE_VERSION:
+                return manifest
+        # Missing or older layout: start over (everything is re-ingested)
+        for table in TABLES:
+            legacy = self.path / f"{table}.parquet"
+            if legacy.exists():
+                legacy.unlink()
+        return {"version": STORE_VERSION, "experiments": {}}
+
+    def experiments(self) -> List[str]:
+        """Names of the ingested experiment directories."""
+        return sorted(self.manifest["experiments"])
+
+    def ingest(self, outputs_dir: str = "outputs", verbose: bool = True) -> Dict[str, int]:
+        """
+        Bring the store up to date with an outputs directory.
+
+        Only new or changed experiment directories are read and only their
+        table files are written; files of directories that changed or
+        disappeared are deleted.
+
+        Returns:
+            Counts of added / updated / removed / unchanged experiments
+        """
+        pa, pq = _import_pyarrow()
+        outputs_path = Path(outputs_dir)
+        known = self.manifest["experiments"]
+
+        current: Dict[str, str] = {}
+        fresh: Dict[str, Dict[str, List[Dict[str, Any]]]] = {}
+        stats = {"added": 0, "updated": 0, "removed": 0, "unchanged": 0}
+
+        for exp_dir in sorted(outputs_path.iterdir()):
+            if not exp_dir.is_dir() or exp_dir.resolve() == self.path.resolve():
+                continue
+            if not (exp_dir / "meta.json").exists():
+                continue
+
+            signature = experiment_signature(exp_dir)
+            current[exp_dir.name] = signature
+            if known.get(exp_dir.name) == signature:
+                stats["unchanged"] += 1
+                continue
+
+            try:
+                fresh[exp_dir.name] = experiment_rows(exp_dir)
+            except Exception as e:
+                print(f"Warning: Failed to ingest {exp_dir}: {e}")
+                current.pop(exp_dir.name)
+                continue
+
+            stats["updated" if exp_dir.name in known else "added"] += 1
+
+        stale = {name for name in known if known[name] != current.get(name)}
+        stats["removed"] = len(set(known) - set(current))
+
+        for name in stale:
+            for table in TABLES:
+                path = self._part_path(table, name)
+                if path.exists():
+                    path.unlink()
+
+        for name, rows in fresh.items():
+            for table, table_rows in rows.items():
+                if table_rows:
+                    path = self._part_path(table, name)
+                    path.parent.mkdir(parents=True, exist_ok=True)
+                    pq.write_table(_rows_to_table(pa, table_rows), path)
+
+        self.manifest["experiments"] = current
+        self.path.mkdir(parents=True, exist_ok=True)
+        with open(self.path / MANIFEST_FILENAME, "w") as f:
+            json.dump(self.manifest, f, indent=2)
+
+        if verbose:
+            print(f"Store {self.path}: {stats['added']} added, {stats['updated']} updated, "
+                  f"{stats['removed']} removed, {stats['unchanged']} unchanged")
+        return stats
+
+    def _table_dir(self, table: str) -> Path:
+        if table not in TABLES:
+            raise ValueError(f"Unknown table: {table} (expected one of {TABLES})")
+        return self.path / table
+
+    def _part_path(self, table: str, experiment: str) -> Path:
+        return self._table_dir(table) / f"{experiment}.parquet"
+
+    def table(self, table: str, experiments: Optional[Iterable[str]] = None):
+        """
+        Read one table as a pyarrow.Table.
+
+        Args:
+            table: One of TABLES
+            experiments: Only rows for these experiment directory names
+        """
+        pa, pq = _import_pyarrow()
+        table_dir = self._table_dir(table)
+        if experiments is None:
+            paths = sorted(table_dir.glob("*.parquet"))
+        else:
+            paths = [self._part_path(table, name) for name in sorted(set(experiments))]
+        parts = [pq.read_table(path) for path in paths if path.exists()]
+        if not parts:
+            return pa.table({"experiment": pa.array([], pa.string())})
+        # Per-experiment files may differ in columns (feedback scores) or
+        # infer null for all-missing ones; unify them on concatenation
+        return pa.concat_tables(parts, promote_options="permissive")
+
+    def rows(self, table: str, experiments: Optional[Iterable[str]] = None) -> List[Dict[str, Any]]:
+        """Read one table as a list of row dicts."""
+        return self.table(table, experiments).to_pylist()
+
+
+# =============================================================================
+# Views used by the analysis scripts
+# =============================================================================
+
+def sweep_entries(store: ExperimentStore) -> List[Dict[str, Any]]:
+    """
+    Experiment entries in the shape analyze_sweep.print_trajectory_table expects.
+    """
+    trajectories = defaultdict(dict)
+    for row in store.rows("regimes"):
+        trajectories[row["experiment"]][row["round_number"]] = row["regime"]
+
+    entries = []
+    for row in store.rows("meta"):
+        by_round = trajectories.get(row["experiment"], {})
+        trajectory = [by_round.get(i) for i in range(1, 4)]
+        entries.append({
+            "dir": row["experiment"],
+            "condition": row["condition"],
+            "seed": row["seed"],
+            "trajectory": trajectory,
+            "divergence_events": row["divergence_events"] or 0,
+            "meta": json.loads(row["meta_json"]),
+        })
+    return entries
+
+
+def round_transcripts(store: ExperimentStore, experiment: str) -> Dict[int, Dict[str, Any]]:
+    """
+    Rounds of one experiment as {round: {"messages": [...], "feedback": {...}}}.
+
+    Messages carry agent_id / content / turn_number; feedback holds the
+    scalar scores per agent.
+    """
+    rounds: Dict[int, Dict[str, Any]] = defaultdict(lambda: {"messages": [], "feedback": {}})
+    for row in store.rows("messages", [experiment]):
+        rounds[row["round_number"]]["messages"].append(row)
+    for row in store.rows("agent_feedback", [experiment]):
+        rounds[row["round_number"]]["feedback"][row["agent_id"]] = row
+    for round_data in rounds.values():
+        round_data["messages"].sort(key=lambda m: m["turn_number"] or 0)
+    return dict(sorted(rounds.items()))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Columnar store for experiment outputs")
+    parser.add_argument("command", choices=["ingest", "info"])
+    parser.add_argument("--outputs-dir", default="outputs", help="Experiment outputs (default: outputs/)")
+    parser.add_argument("--store", default=DEFAULT_STORE, help=f"Store directory (default: {DEFAULT_STORE})")
+    args = parser.parse_args()
+
+    store = ExperimentStore(args.store)
+    if args.command == "ingest":
+        store.ingest(args.outputs_dir)
+    else:
+        print(f"Store: {store.path}")
+        print(f"Experiments: {len(store.experiments())}")
+        for table in TABLES:
+            print(f"  {table:<15} {store.table(table).num_rows:>8} rows")
+
+
+if __name__ == "__main__":
+    main()
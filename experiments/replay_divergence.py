@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+"""
+Counterfactual Divergence Replay
+
+Re-simulates SemioticStateTracker divergence decisions offline from the
+round metrics already recorded in outputs/*/semiotic_state_log.json, for a
+whole grid of SemioticStateConfig candidates at once. Every (experiment,
+config) pair is one lane of a BatchedSemioticStateTracker, so a sweep over
+thousands of configs is a few vectorized steps per round instead of new
+LLM runs.
+
+The replay is counterfactual on the observed metric stream: it reports when
+and how often divergence *would* have fired under each config, not how the
+conversation would have changed afterwards. A firing after round r is the
+injection the adaptive context would have made during round r + 1.
+
+Usage:
+    # Default grid over ema_alpha x min_dwell_rounds x collapse_confirmation_rounds
+    python experiments/replay_divergence.py --outputs-dir outputs
+
+    # Custom grid (any SemioticStateConfig field the trackers read, comma-separated values)
+    python experiments/replay_divergence.py \\
+        --grid ema_alpha=0.2,0.35,0.5,0.8 \\
+        --grid harmony_collapse_engagement_threshold=0.2,0.3,0.4 \\
+        --grid collapse_confirmation_rounds=1,2 --top 15 --json replay.json
+
+Requires numpy.
+"""
+
+import sys
+import json
+import argparse
+import itertools
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field, fields, replace, asdict
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Sequence
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from social_rl.context_injector import (
+    SemioticStateConfig, BatchedSemioticStateTracker, SEMIOTIC_METRICS,
+    COLLAPSE_STATES
+)
+from social_rl.optional_deps import import_numpy
+from experiments.analyze_sweep import load_experiment, infer_condition
+from experiments.social_aesthetics_regimes import classify_regimes
+
+
+DEFAULT_GRID = {
+    "ema_alpha": [0.2, 0.35, 0.5, 0.65, 0.8],
+    "min_dwell_rounds": [1, 2, 3],
+    "collapse_confirmation_rounds": [1, 2, 3],
+}
+
+# SemioticStateConfig fields neither tracker reads: sweeping them changes nothing
+IGNORED_CONFIG_FIELDS = frozenset({"hysteresis_band"})
+
+
+@dataclass
+class ReplayExperiment:
+    """Recorded round metrics of one experiment."""
+    name: str
+    condition: Optional[str]
+    metrics: List[List[float]]            # rounds x SEMIOTIC_METRICS
+    regimes: List[str] = field(default_factory=list)  # observed regime per round
+
+
+def load_replay_experiments(outputs_dir: str = "outputs") -> List[ReplayExperiment]:
+    """Load every experiment under outputs_dir that logged round metrics."""
+    experiments = []
+    for exp_dir in sorted(Path(outputs_dir).iterdir()):
+        if not exp_dir.is_dir():
+            continue
+        exp_data = load_experiment(exp_dir)
+        if not exp_data or not exp_data["semiotic_log"]:
+            continue
+
+        rounds = sorted(
+            exp_data["semiotic_log"].get("rounds", []),
+            key=lambda entry: entry.get("round_number", 0)
+        )
+        metrics = [
+            [float((entry.get("raw_metrics") or {}).get(name, float("nan"))) for name in SEMIOTIC_METRICS]
+            for entry in rounds
+        ]
+        if metrics:
+            experiments.append(ReplayExperiment(
+                name=exp_data["dir"],
+                condition=infer_condition(exp_data["meta"]),
+                metrics=metrics,
+            ))
+
+    # Observed regimes for all rounds in one batch
+    rows = [row for exp in experiments for row in exp.metrics]
+    if rows:
+        labels = iter(classify_regimes(rows).labels)
+        for exp in experiments:
+            exp.regimes = [
+                regime.name if regime else "UNKNOWN"
+                for regime in itertools.islice(labels, len(exp.metrics))
+            ]
+    return experiments
+
+
+def config_grid(
+    base: Optional[SemioticStateConfig] = None,
+    **values: Sequence[Any]
+) -> List[SemioticStateConfig]:
+    """
+    Cartesian product of SemioticStateConfig field values.
+
+    Example:
+        config_grid(ema_alpha=[0.2, 0.5], min_dwell_rounds=[1, 2])  # 4 configs
+    """
+    base = base or SemioticStateConfig()
+    known = {f.name for f in fields(SemioticStateConfig)}
+    unknown = set(values) - known
+    if unknown:
+        raise ValueError(f"Unknown SemioticStateConfig fields: {sorted(unknown)}")
+    ignored = IGNORED_CONFIG_FIELDS.intersection(values)
+    if ignored:
+        raise ValueError(
+            f"SemioticStateConfig fields {sorted(ignored)} are not used by the "
+            f"semiotic trackers; sweeping them would not change any decision"
+        )
+
+    names = list(values)
+    return [
+        replace(base, **dict(zip(names, combo)))
+        for combo in itertools.product(*(values[name] for name in names))
+    ]
+
+
+@dataclass
+class ReplayResult:
+    """Divergence decisions of every config on every experiment."""
+    configs: List[SemioticStateConfig]
+    experiments: List[ReplayExperiment]
+    # experiment name -> (n_configs, rounds) collapse codes injected after each round (0 = none)
+    fired: Dict[str, Any]
+
+    def fire_counts(self):
+        """(n_configs, n_experiments) number of injections."""
+        np = import_numpy()
+        return np.stack(
+            [(self.fired[exp.name] != 0).sum(axis=1) for exp in self.experiments], axis=1
+        )
+
+    def first_fire_rounds(self):
+        """(n_configs, n_experiments) round after which divergence first fired (0 = never)."""
+        np = import_numpy()
+        columns = []
+        for exp in self.experiments:
+            fired = self.fired[exp.name] != 0
+            columns.append(np.where(fired.any(axis=1), fired.argmax(axis=1) + 1, 0))
+        return np.stack(columns, axis=1)
+
+    def config_summary(self, index: int) -> Dict[str, Any]:
+        """Firing report for one config."""
+        by_type: Counter = Counter()
+        by_regime: Counter = Counter()
+        by_condition: Dict[str, List[int]] = defaultdict(lambda: [0, 0])
+        first_rounds = []
+
+        for exp in self.experiments:
+            codes = self.fired[exp.name][index]
+            fired_rounds = [r for r, code in enumerate(codes.tolist(), 1) if code]
+            for r in fired_rounds:
+                by_type[COLLAPSE_STATES[codes[r - 1]]] += 1
+                by_regime[exp.regimes[r - 1]] += 1
+            condition = by_condition[exp.condition or "?"]
+            condition[1] += 1
+            if fired_rounds:
+                condition[0] += 1
+                first_rounds.append(fired_rounds[0])
+
+        return {
+            "config": asdict(self.configs[index]),
+            "total_injections": sum(by_type.values()),
+            "experiments_fired": len(first_rounds),
+            "mean_first_fire_round": (
+                sum(first_rounds) / len(first_rounds) if first_rounds else None
+            ),
+            "by_collapse_type": dict(by_type),
+            "by_observed_regime": dict(by_regime),
+            "fire_rate_by_condition": {
+                cond: fired / total for cond, (fired, total) in sorted(by_condition.items())
+            },
+        }
+
+    def regime_trajectories(self) -> Counter:
+        """How often each observed regime trajectory occurred."""
+        return Counter(tuple(exp.regimes) for exp in self.experiments)
+
+
+def replay(
+    experiments: List[ReplayExperiment],
+    configs: List[SemioticStateConfig]
+) -> ReplayResult:
+    """
+    Replay every config against every experiment.
+
+    Experiments with the same number of rounds share one batched tracker
+    whose lanes are (experiment, config) pairs.
+    """
+    np = import_numpy()
+    by_length: Dict[int, List[ReplayExperiment]] = defaultdict(list)
+    for exp in experiments:
+        by_length[len(exp.metrics)].append(exp)
+
+    n_configs = len(configs)
+    fired: Dict[str, Any] = {}
+    for rounds, group in by_length.items():
+        # (rounds, experiments, 4) -> each experiment's row repeated for every config
+        metrics = np.array([exp.metrics for exp in group], dtype=np.float64).transpose(1, 0, 2)
+        tracker = BatchedSemioticStateTracker(configs * len(group), capacity=rounds)
+        for r in range(rounds):
+            tracker.step(np.repeat(metrics[r], n_configs, axis=0))
+
+        history = tracker.divergence_history.reshape(rounds, len(group), n_configs)
+        for i, exp in enumerate(group):
+            fired[exp.name] = history[:, i, :].T.copy()
+
+    return ReplayResult(configs=list(configs), experiments=list(experiments), fired=fired)
+
+
+def parse_grid(specs: List[str]) -> Dict[str, List[Any]]:
+    """Parse --grid field=v1,v2,... arguments using the field's default type."""
+    types = {f.name: type(f.default) for f in fields(SemioticStateConfig)}
+    grid = {}
+    for spec in specs:
+        name, _, values = spec.partition("=")
+        if name not in types or not values:
+            raise ValueError(f"Invalid --grid spec: {spec!r} (expected <config field>=v1,v2,...)")
+        grid[name] = [types[name](v) for v in values.split(",")]
+    return grid
+
+
+def print_report(result: ReplayResult, top: int = 10) -> None:
+    """Print the most and least trigger-happy configs and observed trajectories."""
+    counts = result.fire_counts()
+    totals = counts.sum(axis=1)
+    order = sorted(range(len(result.configs)), key=lambda i: (-totals[i], i))
+    grid_fields = [
+        f.name for f in fields(SemioticStateConfig)
+        if len({getattr(c, f.name) for c in result.configs}) > 1
+    ] or ["ema_alpha"]
+
+    print(f"\nReplayed {len(result.configs)} configs x {len(result.experiments)} experiments")
+    print("\nObserved regime trajectories:")
+    for trajectory, n in result.regime_trajectories().most_common():
+        print(f"  {n:4d}  {' -> '.join(trajectory)}")
+
+    header = "  ".join(f"{name[:24]:>24}" for name in grid_fields)
+    print(f"\n{header}  {'fires':>6}  {'exps':>5}  {'first':>5}  types")
+    shown = order[:top] + [i for i in order[-top:] if i not in order[:top]]
+    for i in shown:
+        summary = result.config_summary(i)
+        values = "  ".join(f"{getattr(result.configs[i], name)!s:>24}" for name in grid_fields)
+        first = summary["mean_first_fire_round"]
+        print(
+            f"{values}  {summary['total_injections']:>6}  {summary['experiments_fired']:>5}  "
+            f"{first if first is None else round(first, 2)!s:>5}  {summary['by_collapse_type']}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Replay divergence-injection thresholds against recorded round metrics",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument(
+        "--outputs-dir",
+        default="outputs",
+        help="Directory containing experiment outputs (default: outputs/)"
+    )
+    parser.add_argument(
+        "--grid",
+        action="append",
+        default=[],
+        metavar="FIELD=V1,V2,...",
+        help="SemioticStateConfig field values to sweep (repeatable; default: a small alpha/dwell/confirmation grid)"
+    )
+    parser.add_argument("--top", type=int, default=10, help="Configs to show at each end of the ranking")
+    parser.add_argument("--json", help="Write per-config summaries to this file")
+
+    args = parser.parse_args()
+
+    experiments = load_replay_experiments(args.outputs_dir)
+    if not experiments:
+        print(f"No semiotic_state_log.json with rounds found under {args.outputs_dir}")
+        return
+
+    try:
+        configs = config_grid(**(parse_grid(args.grid) or DEFAULT_GRID))
+    except ValueError as e:
+        parser.error(str(e))
+    result = replay(experiments, configs)
+    print_report(result, top=args.top)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump([result.config_summary(i) for i in range(len(configs))], f, indent=2)
+        print(f"\nWrote {len(configs)} config summaries to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
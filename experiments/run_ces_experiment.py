@@ -153,6 +153,16 @@ OllamaClient = llm_module.OllamaClient
 OpenAIClient = llm_module.OpenAIClient
 MockClient = llm_module.MockClient
 
+cache_spec = importlib.util.spec_from_file_location(
+    "response_cache",
+    str(PROJECT_ROOT / "local_rcm" / "response_cache.py")
+)
+cache_module = importlib.util.module_from_spec(cache_spec)
+cache_spec.loader.exec_module(cache_module)
+
+ResponseCache = cache_module.ResponseCache
+CachedLLMClient = cache_module.CachedLLMClient
+
 
 class DualLLMCompatibleClient:
     """Wrapper for DualLLMClient compatibility."""
@@ -176,11 +186,71 @@ class DualLLMCompatibleClient:
         })
         return self._client.send_message(system_prompt, user_message)
 
+    def stream_message(
+        self,
+        system_prompt: str,
+        user_message: str,
+        temperature: float = None,
+        max_tokens: int = 512
+    ):
+        self._calls.append({
+            "temperature": temperature or self._default_temperature,
+            "max_tokens": max_tokens,
+            "prompt_length": len(system_prompt) + len(user_message),
+            "stream": True
+        })
+        if hasattr(self._client, "stream_message"):
+            yield from self._client.stream_message(system_prompt, user_message)
+        else:
+            yield self._client.send_message(system_prompt, user_message)
+
     @property
     def call_log(self):
         return self._calls
 
 
+class EndpointGatedClient:
+    """
+    Hold an endpoint gate for the duration of each LLM call.
+
+    The gate is any context-manager semaphore (threading, or a
+    multiprocessing.Manager semaphore proxy shared across sweep workers),
+    so concurrent runs respect one global in-flight cap per endpoint.
+    """
+
+    def __init__(self, client, gate):
+        self._client = client
+        self._gate = gate
+
+    def send_message(self, *args, **kwargs) -> str:
+        with self._gate:
+            return self._client.send_message(*args, **kwargs)
+
+    def send_json(self, *args, **kwargs) -> Dict:
+        with self._gate:
+            return self._client.send_json(*args, **kwargs)
+
+    def stream_message(self, *args, **kwargs):
+        # Gate is held until the stream is exhausted or closed
+        with self._gate:
+            if hasattr(self._client, "stream_message"):
+                yield from self._client.stream_message(*args, **kwargs)
+            else:
+                yield self._client.send_message(*args, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self._client, name)
+
+
+def endpoint_key(provider: str, base_url: Optional[str] = None) -> str:
+    """Key identifying the LLM endpoint a client talks to (for sweep gating)."""
+    if provider == "mock":
+        return "mock"
+    if provider == "ollama":
+        return (base_url or "http://localhost:11434").rstrip("/")
+    return (base_url or "").rstrip("/")
+
+
 # =============================================================================
 # Simulated CES Data (representative profiles)
 # =============================================================================
@@ -387,6 +457,14 @@ def run_ces_experiment(
     # 2x2x2 sweep condition and seed tracking
     condition: Optional[str] = None,  # e.g., "A", "B", ..., "H"
     seed: Optional[int] = None,  # Seed number for replication
+    # Per-endpoint in-flight gates (see experiments/run_sweep.py)
+    endpoint_gates: Optional[Dict[str, Any]] = None,
+    # SQLite file for caching deterministic coach calls across runs
+    response_cache_path: Optional[str] = None,
+    # Overlap coach validation with the next speaker's performer call
+    pipeline_turns: bool = False,
+    # Continue an interrupted run from its checkpoint log
+    resume_dir: Optional[str] = None,
 ) -> Dict[str, Any]:
     """
     Run a CES-grounded Social RL experiment.
@@ -394,7 +472,20 @@ def run_ces_experiment(
     For TRUE dual-LLM (two separate models on different GPUs):
         --performer-url https://a100-pod/v1 --performer-model Qwen/Qwen2.5-14B-Instruct
         --coach-url https://a40-pod/v1 --coach-model Qwen/Qwen2.5-7B-Instruct
+
+    endpoint_gates maps endpoint_key() values to semaphores; every LLM call
+    to that endpoint holds its gate, which lets concurrent sweep workers
+    share one in-flight cap per server.
+
+    response_cache_path enables a persistent cache for coach validation
+    calls (temperature <= coach_temperature), so re-running a condition
+    with the same canvas and seed does not re-send identical validations.
+
+    resume_dir continues an interrupted run from the checkpoint.jsonl in
+    that output directory: completed rounds are reloaded, and a round that
+    crashed mid-way restarts at its last completed turn.
     """
+    endpoint_gates = endpoint_gates or {}
     from social_rl.runner import SocialRLRunner, SocialRLConfig
     from social_rl.dual_llm_client import DualLLMClient, DualLLMConfig, create_true_dual_llm
 
@@ -417,6 +508,8 @@ def run_ces_experiment(
 
     # Generate experiment ID
     import os
+    if resume_dir:
+        experiment_id = Path(resume_dir).name
     if not experiment_id:
         timestamp = datetime.datetime.now().strftime("%Y-%m-%d_%H%M%S")
         experiment_id = f"ces_experiment_{timestamp}"
@@ -434,6 +527,12 @@ def run_ces_experiment(
             coach_model=coach_model,
             api_key=effective_api_key or "not-needed"
         )
+        performer_gate = endpoint_gates.get(endpoint_key("vllm", performer_url))
+        coach_gate = endpoint_gates.get(endpoint_key("vllm", coach_url))
+        if performer_gate is not None:
+            dual_llm.performer = EndpointGatedClient(dual_llm.performer, performer_gate)
+        if coach_gate is not None:
+            dual_llm.coach = EndpointGatedClient(dual_llm.coach, coach_gate)
         # Create a wrapped client for the runner (uses performer for non-dual calls)
         base_client = OpenAIClient(
             api_key=effective_api_key or "not-needed",
@@ -441,6 +540,8 @@ def run_ces_experiment(
             base_url=performer_url,
             timeout=180.0
         )
+        if performer_gate is not None:
+            base_client = EndpointGatedClient(base_client, performer_gate)
         wrapped_client = DualLLMCompatibleClient(base_client)
         print("TRUE dual-LLM configured (separate models on separate GPUs)\n")
     else:
@@ -466,6 +567,10 @@ def run_ces_experiment(
         else:
             raise ValueError(f"Unknown provider: {provider}")
 
+        gate = endpoint_gates.get(endpoint_key(provider, base_url))
+        if gate is not None:
+            base_client = EndpointGatedClient(base_client, gate)
+
         wrapped_client = DualLLMCompatibleClient(base_client)
 
         # Create Dual-LLM client (pseudo - same model, different temps)
@@ -484,6 +589,15 @@ def run_ces_experiment(
             )
             print("Pseudo dual-LLM configured (same model, different temps)\n")
 
+    if dual_llm and response_cache_path:
+        dual_llm.coach = CachedLLMClient(
+            dual_llm.coach,
+            ResponseCache(response_cache_path),
+            model=coach_model if true_dual_mode else model,
+            temperature_threshold=dual_llm.config.coach_temperature
+        )
+        print(f"Coach response cache: {response_cache_path}\n")
+
     # Generate CES agents
     print("Generating CES-grounded agents...")
     mapper = CESVariableMapper()
@@ -505,23 +619,36 @@ def run_ces_experiment(
         use_coach_validation=use_dual_llm,
         verbose=verbose,
         auto_save=True,
-        challenge_mode=challenge_mode  # For A/B testing: "off", "adaptive", "always"
+        challenge_mode=challenge_mode,  # For A/B testing: "off", "adaptive", "always"
+        pipeline_turns=pipeline_turns
     )
     print(f"Context mode: {context_mode}")
     print(f"Challenge mode: {challenge_mode}")
 
-    # Create runner
-    runner = SocialRLRunner(
-        canvas=canvas,
-        llm_client=wrapped_client,
-        config=config,
-        dual_llm_client=dual_llm,
-        experiment_id=experiment_id
-    )
+    # Create runner (or reload it from the checkpoint log)
+    if resume_dir:
+        runner = SocialRLRunner.resume(
+            resume_dir,
+            llm_client=wrapped_client,
+            dual_llm_client=dual_llm
+        )
+        canvas = runner.canvas
+    else:
+        runner = SocialRLRunner(
+            canvas=canvas,
+            llm_client=wrapped_client,
+            config=config,
+            dual_llm_client=dual_llm,
+            experiment_id=experiment_id
+        )
 
     # Execute rounds with semiotic tracking
     results = []
     semiotic_state_log = []  # Track semiotic state per round
+    checkpointed_states = {
+        extra["semiotic_state"]["round_number"]: extra["semiotic_state"]
+        for extra in runner.checkpoint_extras if "semiotic_state" in extra
+    }
 
     for round_num in range(1, min(rounds + 1, len(canvas.get("rounds", [])) + 1)):
         print(f"\n{'='*60}")
@@ -529,7 +656,17 @@ def run_ces_experiment(
         print(f"{'='*60}\n")
 
         try:
-            result = runner.execute_round(round_num, max_turns=max_turns)
+            if round_num in checkpointed_states:
+                # Finished before the interruption, semiotic update included
+                print(f"  (restored from checkpoint)")
+                results.append(runner.round_results[round_num])
+                semiotic_state_log.append(checkpointed_states[round_num])
+                continue
+
+            if round_num in runner.round_results:
+                result = runner.round_results[round_num]
+            else:
+                result = runner.execute_round(round_num, max_turns=max_turns)
             results.append(result)
 
             # === SEMIOTIC STATE TRACKING (émile-inspired) ===
@@ -577,6 +714,7 @@ def run_ces_experiment(
                 "divergence_injected": divergence_injected
             }
             semiotic_state_log.append(state_entry)
+            runner.save_checkpoint(extra={"semiotic_state": state_entry})
 
             # Print semiotic state summary
             print(f"\n  [SEMIOTIC STATE] Round {round_num}:")
@@ -625,6 +763,8 @@ def run_ces_experiment(
         "final_regime": semiotic_state_log[-1]["regime"] if semiotic_state_log else None,
         "divergence_events": sum(1 for s in semiotic_state_log if s["divergence_injected"])
     }
+    if dual_llm and isinstance(dual_llm.coach, CachedLLMClient):
+        meta["response_cache"] = dual_llm.coach.get_stats()
 
     # Save meta
     if results and runner.output_dir:
@@ -732,6 +872,20 @@ Examples:
         type=int,
         help="Seed number for replication (e.g., 1, 2, 3)"
     )
+    parser.add_argument(
+        "--response-cache",
+        help="SQLite file caching deterministic coach calls across runs"
+    )
+    parser.add_argument(
+        "--pipeline-turns",
+        action="store_true",
+        help="Start the next speaker's generation while the coach validates (dual-LLM only)"
+    )
+    parser.add_argument(
+        "--resume",
+        metavar="DIR",
+        help="Resume an interrupted run from its output directory (checkpoint.jsonl)"
+    )
 
     args = parser.parse_args()
 
@@ -758,6 +912,9 @@ Examples:
             # 2x2x2 sweep condition and seed tracking
             condition=args.condition,
             seed=args.seed,
+            response_cache_path=args.response_cache,
+            pipeline_turns=args.pipeline_turns,
+            resume_dir=args.resume,
         )
 
         print(f"\nExperiment completed!")
@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""
+2x2x2 Architecture Sweep Scheduler
+
+Runs every (condition, seed) pair of the sweep concurrently instead of as
+separate sequential invocations of run_ces_experiment.py. Each run writes
+to its usual output directory (outputs/{condition}_seed{seed}{suffix}/), so
+analyze_sweep.py picks the results up unchanged.
+
+All workers share one global in-flight cap per LLM endpoint, so adding
+seeds never floods a single vLLM/Ollama server - the sweep takes roughly
+the time of the slowest run rather than the sum of all runs.
+
+Usage:
+    # Full sweep, seeds 1-3, against one local Ollama server
+    python experiments/run_sweep.py --conditions A-H --seeds 1 2 3 \\
+        --provider ollama --model qwen2.5:7b --max-inflight 4
+
+    # Condition G only, TRUE dual-LLM endpoints
+    python experiments/run_sweep.py --conditions G --seeds 1 2 3 4 5 \\
+        --performer-url https://a100-pod/v1 --performer-model Qwen/Qwen2.5-14B-Instruct \\
+        --coach-url https://a40-pod/v1 --coach-model Qwen/Qwen2.5-7B-Instruct
+
+    # Smoke test
+    python experiments/run_sweep.py --conditions A B --seeds 1 --provider mock --rounds 1
+"""
+
+import sys
+import time
+import argparse
+import contextlib
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+
+# Condition grid - same mapping as analyze_sweep.infer_condition()
+SWEEP_CONDITIONS: Dict[str, Dict[str, Any]] = {
+    "A": {"challenge_mode": "off",    "context_mode": "progressive", "use_dual_llm": True},
+    "B": {"challenge_mode": "off",    "context_mode": "progressive", "use_dual_llm": False},
+    "C": {"challenge_mode": "off",    "context_mode": "adaptive",    "use_dual_llm": True},
+    "D": {"challenge_mode": "off",    "context_mode": "adaptive",    "use_dual_llm": False},
+    "E": {"challenge_mode": "always", "context_mode": "progressive", "use_dual_llm": True},
+    "F": {"challenge_mode": "always", "context_mode": "progressive", "use_dual_llm": False},
+    "G": {"challenge_mode": "always", "context_mode": "adaptive",    "use_dual_llm": True},
+    "H": {"challenge_mode": "always", "context_mode": "adaptive",    "use_dual_llm": False},
+}
+
+
+def parse_conditions(specs: List[str]) -> List[str]:
+    """Expand condition specs like ["A-D", "G"] into ["A", "B", "C", "D", "G"]."""
+    conditions = []
+    for spec in specs:
+        for part in spec.upper().split(","):
+            part = part.strip()
+            if not part:
+                continue
+            if "-" in part:
+                start, end = part.split("-", 1)
+                part_conditions = [chr(c) for c in range(ord(start), ord(end) + 1)]
+            else:
+                part_conditions = [part]
+            for cond in part_conditions:
+                if cond not in SWEEP_CONDITIONS:
+                    raise ValueError(f"Unknown condition: {cond}. Use A-H.")
+                if cond not in conditions:
+                    conditions.append(cond)
+    return conditions
+
+
+def build_sweep_jobs(
+    conditions: List[str],
+    seeds: List[int],
+    experiment_suffix: str = "",
+    **run_kwargs
+) -> List[Dict[str, Any]]:
+    """Build one run_ces_experiment kwargs dict per (condition, seed) pair."""
+    jobs = []
+    for cond in conditions:
+        for seed in seeds:
+            job = dict(run_kwargs)
+            job.update(SWEEP_CONDITIONS[cond])
+            job.update({
+                "condition": cond,
+                "seed": seed,
+                "experiment_id": f"{cond}_seed{seed}{experiment_suffix}",
+            })
+            jobs.append(job)
+    return jobs
+
+
+def sweep_endpoints(
+    provider: str,
+    base_url: Optional[str] = None,
+    performer_url: Optional[str] = None,
+    coach_url: Optional[str] = None
+) -> List[str]:
+    """List the distinct endpoint keys a sweep will talk to."""
+    from experiments.run_ces_experiment import endpoint_key
+
+    if performer_url and coach_url:
+        keys = [endpoint_key("vllm", performer_url), endpoint_key("vllm", coach_url)]
+    else:
+        keys = [endpoint_key(provider, base_url)]
+    return list(dict.fromkeys(keys))
+
+
+def _run_sweep_job(job: Dict[str, Any], endpoint_gates: Dict[str, Any], log_dir: Optional[str]) -> Dict[str, Any]:
+    """Worker entry point: run one experiment, optionally logging to a file."""
+    from experiments.run_ces_experiment import run_ces_experiment
+
+    start = time.time()
+    log_ctx = contextlib.nullcontext()
+    log_file = None
+    if log_dir:
+        Path(log_dir).mkdir(parents=True, exist_ok=True)
+        log_file = open(Path(log_dir) / f"{job['experiment_id']}.log", "w")
+        log_ctx = contextlib.redirect_stdout(log_file)
+
+    try:
+        with log_ctx:
+            result = run_ces_experiment(endpoint_gates=endpoint_gates, **job)
+        return {
+            "experiment_id": job["experiment_id"],
+            "condition": job["condition"],
+            "seed": job["seed"],
+            "ok": True,
+            "output_dir": result.get("output_dir"),
+            "final_regime": result["meta"].get("final_regime"),
+            "llm_calls": len(result.get("llm_calls", [])),
+            "duration_seconds": time.time() - start,
+        }
+    except Exception as e:
+        return {
+            "experiment_id": job["experiment_id"],
+            "condition": job["condition"],
+            "seed": job["seed"],
+            "ok": False,
+            "error": f"{type(e).__name__}: {e}",
+            "duration_seconds": time.time() - start,
+        }
+    finally:
+        if log_file:
+            log_file.close()
+
+
+def run_sweep(
+    jobs: List[Dict[str, Any]],
+    endpoints: List[str],
+    max_inflight_per_endpoint: int = 4,
+    max_workers: Optional[int] = None,
+    log_dir: Optional[str] = "outputs/sweep_logs",
+) -> List[Dict[str, Any]]:
+    """
+    Run sweep jobs concurrently across a process pool.
+
+    Args:
+        jobs: run_ces_experiment kwargs per run (see build_sweep_jobs)
+        endpoints: Endpoint keys to gate (see sweep_endpoints)
+        max_inflight_per_endpoint: Global cap on concurrent LLM calls per endpoint
+        max_workers: Process pool size (default: one process per run)
+        log_dir: Per-run stdout logs (None = inherit stdout, interleaved)
+
+    Returns:
+        One status dict per run, in job order
+    """
+    if not jobs:
+        return []
+
+    with multiprocessing.Manager() as manager:
+        endpoint_gates = {
+            key: manager.BoundedSemaphore(max_inflight_per_endpoint)
+            for key in endpoints
+        }
+
+        statuses: Dict[str, Dict[str, Any]] = {}
+        with ProcessPoolExecutor(max_workers=max_workers or len(jobs)) as pool:
+            futures = {
+                pool.submit(_run_sweep_job, job, endpoint_gates, log_dir): job
+                for job in jobs
+            }
+            for future in as_completed(futures):
+                status = future.result()
+                statuses[status["experiment_id"]] = status
+                state = "done" if status["ok"] else f"FAILED ({status['error']})"
+                print(f"  [{status['experiment_id']}] {state} in {status['duration_seconds']:.1f}s")
+
+    return [statuses[job["experiment_id"]] for job in jobs]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Run the 2x2x2 architecture sweep concurrently",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Condition Definitions:
+    A: challenge=off,    context=progressive, dual=True
+    B: challenge=off,    context=progressive, dual=False
+    C: challenge=off,    context=adaptive,    dual=True
+    D: challenge=off,    context=adaptive,    dual=False
+    E: challenge=always, context=progressive, dual=True
+    F: challenge=always, context=progressive, dual=False
+    G: challenge=always, context=adaptive,    dual=True   (TARGET for H5)
+    H: challenge=always, context=adaptive,    dual=False
+"""
+    )
+
+    parser.add_argument("--conditions", nargs="+", default=["A-H"],
+                        help="Conditions to run, e.g. 'A-H' or 'A C G' (default: A-H)")
+    parser.add_argument("--seeds", nargs="+", type=int, default=[1],
+                        help="Seed numbers to run for every condition (default: 1)")
+    parser.add_argument("--experiment-suffix", default="",
+                        help="Suffix appended to each experiment ID (e.g. '_fixed')")
+
+    parser.add_argument("--model", "-m", default="qwen2.5:7b", help="Model name")
+    parser.add_argument("--provider", "-p", default="ollama", choices=["ollama", "vllm", "mock"])
+    parser.add_argument("--rounds", "-r", type=int, default=3, help="Number of rounds")
+    parser.add_argument("--max-turns", "-t", type=int, default=12, help="Max turns per round")
+    parser.add_argument("--base-url", help="Base URL for vLLM endpoint (single model mode)")
+    parser.add_argument("--api-key", help="API key for vLLM")
+
+    parser.add_argument("--performer-url", help="Base URL for Performer endpoint (TRUE dual-LLM)")
+    parser.add_argument("--performer-model", help="Model name for Performer")
+    parser.add_argument("--coach-url", help="Base URL for Coach endpoint (TRUE dual-LLM)")
+    parser.add_argument("--coach-model", help="Model name for Coach")
+
+    parser.add_argument("--max-inflight", type=int, default=4,
+                        help="Global cap on concurrent LLM requests per endpoint (default: 4)")
+    parser.add_argument("--workers", type=int,
+                        help="Process pool size (default: one process per run)")
+    parser.add_argument("--log-dir", default="outputs/sweep_logs",
+                        help="Directory for per-run stdout logs (default: outputs/sweep_logs)")
+
+    args = parser.parse_args()
+
+    conditions = parse_conditions(args.conditions)
+    jobs = build_sweep_jobs(
+        conditions,
+        args.seeds,
+        experiment_suffix=args.experiment_suffix,
+        model=args.model,
+        provider=args.provider,
+        rounds=args.rounds,
+        max_turns=args.max_turns,
+        verbose=False,
+        base_url=args.base_url,
+        api_key=args.api_key,
+        performer_url=args.performer_url,
+        performer_model=args.performer_model,
+        coach_url=args.coach_url,
+        coach_model=args.coach_model,
+    )
+    endpoints = sweep_endpoints(args.provider, args.base_url, args.performer_url, args.coach_url)
+
+    print("=" * 60)
+    print("2x2x2 ARCHITECTURE SWEEP")
+    print("=" * 60)
+    print(f"Conditions: {' '.join(conditions)}")
+    print(f"Seeds: {' '.join(str(s) for s in args.seeds)}")
+    print(f"Runs: {len(jobs)}")
+    print(f"Endpoints: {', '.join(endpoints)} (max {args.max_inflight} in flight each)")
+    print("=" * 60)
+
+    start = time.time()
+    statuses = run_sweep(
+        jobs,
+        endpoints,
+        max_inflight_per_endpoint=args.max_inflight,
+        max_workers=args.workers,
+        log_dir=args.log_dir,
+    )
+
+    failed = [s for s in statuses if not s["ok"]]
+    print(f"\nSweep complete: {len(statuses) - len(failed)}/{len(statuses)} runs "
+          f"in {time.time() - start:.1f}s")
+    for s in statuses:
+        regime = s.get("final_regime") or "-"
+        print(f"  {s['condition']}  seed {s['seed']}: {regime if s['ok'] else 'FAILED'}")
+    print("\nAnalyze with: python experiments/analyze_sweep.py")
+
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
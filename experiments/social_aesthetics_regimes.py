@@ -251,6 +251,18 @@ REGIME_DESCRIPTIONS = {
 }
 
 
+# Priority order: pathological collapses first, then transitional, then healthy
+# ENGAGED_HARMONY added after G1 showed high-engagement convergence pattern
+REGIME_PRIORITY = [
+    RegimeType.PROCEDURALIST_RETREAT,  # Worst: defensive withdrawal
+    RegimeType.PATERNALISTIC_HARMONY,   # Bad: false consensus (LOW engagement)
+    RegimeType.STIMULATED_DIALOGUE,     # Transitional: may collapse
+    RegimeType.ACTIVE_CONTESTATION,     # Healthy but unstable
+    RegimeType.ENGAGED_HARMONY,         # Healthy: genuine consensus (HIGH engagement)
+    RegimeType.PRODUCTIVE_DISSONANCE,   # Aspirational: sustained productive tension
+]
+
+
 def identify_regime(
     engagement: float,
     voice_valence: float,
@@ -265,18 +277,7 @@ def identify_regime(
 
     Post-G1 Update: Added ENGAGED_HARMONY as sixth regime.
     """
-    # Priority order: pathological collapses first, then transitional, then healthy
-    # ENGAGED_HARMONY added after G1 showed high-engagement convergence pattern
-    priority_order = [
-        RegimeType.PROCEDURALIST_RETREAT,  # Worst: defensive withdrawal
-        RegimeType.PATERNALISTIC_HARMONY,   # Bad: false consensus (LOW engagement)
-        RegimeType.STIMULATED_DIALOGUE,     # Transitional: may collapse
-        RegimeType.ACTIVE_CONTESTATION,     # Healthy but unstable
-        RegimeType.ENGAGED_HARMONY,         # Healthy: genuine consensus (HIGH engagement)
-        RegimeType.PRODUCTIVE_DISSONANCE,   # Aspirational: sustained productive tension
-    ]
-
-    for regime in priority_order:
+    for regime in REGIME_PRIORITY:
         signature = REGIME_SIGNATURES[regime]
         if signature.matches(engagement, voice_valence, stance_valence, justificatory_pct):
             return regime
@@ -284,6 +285,89 @@ def identify_regime(
     return None  # No clear match
 
 
+def signature_bounds():
+    """
+    Lower / upper bound arrays of shape (6, 4), rows in REGIME_PRIORITY order.
+
+    Columns are (engagement, voice_valence, stance_valence, justificatory_pct).
+    """
+    from social_rl.optional_deps import import_numpy
+
+    np = import_numpy()
+    signatures = [REGIME_SIGNATURES[regime] for regime in REGIME_PRIORITY]
+    ranges = [
+        (sig.engagement_range, sig.voice_valence_range,
+         sig.stance_valence_range, sig.justificatory_pct_range)
+        for sig in signatures
+    ]
+    lower = np.array([[r[0] for r in row] for row in ranges], dtype=np.float64)
+    upper = np.array([[r[1] for r in row] for row in ranges], dtype=np.float64)
+    return lower, upper
+
+
+@dataclass
+class RegimeClassification:
+    """Batch regime classification of N metric rows."""
+
+    labels: list[Optional[RegimeType]]   # identify_regime() per row
+    distances: "numpy.ndarray"           # (N,) distance to the nearest signature (0 = inside one)
+    nearest: list[Optional[RegimeType]]  # nearest signature (None for rows with NaN)
+
+
+def classify_regimes(metrics, chunk_size: int = 8192) -> RegimeClassification:
+    """Classify many (eng, voice, stance, just) rows at once.
+
+    Labels equal identify_regime() row by row: bounds are inclusive and the
+    first matching signature in REGIME_PRIORITY wins. Distances are
+    Euclidean distances from each row to the nearest signature box; ties
+    for nearest resolve in REGIME_PRIORITY order, so a row that matches a
+    regime has that regime as its nearest at distance 0.
+
+    Args:
+        metrics: Array-like of shape (N, 4)
+        chunk_size: Rows classified per vectorized step (bounds memory on
+            dense synthetic grids)
+    """
+    from social_rl.optional_deps import import_numpy
+
+    np = import_numpy()
+    rows = np.asarray(metrics, dtype=np.float64)
+    if rows.ndim != 2 or rows.shape[1] != 4:
+        raise ValueError(f"Expected an (N, 4) array of metrics, got shape {rows.shape}")
+
+    lower, upper = signature_bounds()
+    label_index = np.empty(len(rows), dtype=np.int64)
+    nearest_index = np.empty(len(rows), dtype=np.int64)
+    distances = np.empty(len(rows), dtype=np.float64)
+
+    for start in range(0, len(rows), max(1, chunk_size)):
+        chunk = rows[start:start + chunk_size]
+        inside = np.ones((len(chunk), len(REGIME_PRIORITY)), dtype=bool)
+        squared = np.zeros((len(chunk), len(REGIME_PRIORITY)))
+
+        # One metric column at a time against all six signatures: (n, 6) arrays
+        for col in range(4):
+            x = chunk[:, col, None]
+            # Only one side can be out of range; inside the box the gap is 0
+            gap = np.maximum(np.maximum(lower[:, col] - x, x - upper[:, col]), 0.0)
+            inside &= gap == 0.0
+            squared += gap * gap
+
+        end = start + len(chunk)
+        label_index[start:end] = np.where(inside.any(axis=1), inside.argmax(axis=1), -1)
+        nearest_index[start:end] = squared.argmin(axis=1)
+        distances[start:end] = np.sqrt(squared.min(axis=1))
+
+    # Index -1 (no match / NaN row) maps to None
+    lookup = REGIME_PRIORITY + [None]
+    nearest_index[np.isnan(rows).any(axis=1)] = -1
+    return RegimeClassification(
+        labels=[lookup[i] for i in label_index.tolist()],
+        distances=distances,
+        nearest=[lookup[i] for i in nearest_index.tolist()],
+    )
+
+
 def regime_trajectory(round_metrics: list[dict]) -> list[RegimeType]:
     """Identify the regime trajectory across rounds."""
     trajectory = []
@@ -12,7 +12,14 @@ from .canvas_state import (
     compile_final_document
 )
 from .runtime_parser import Runtime
-from .llm_client import create_llm_client, StudentInteractionHandler, StudentSimulator, FRAMEWORK_THEORISTS
+from .llm_client import (
+    create_llm_client,
+    create_async_llm_client,
+    StudentInteractionHandler,
+    StudentSimulator,
+    FRAMEWORK_THEORISTS,
+)
+from .response_cache import ResponseCache, CachedLLMClient
 
 __version__ = "0.1.0"
 __all__ = [
@@ -22,7 +29,10 @@ __all__ = [
     "compile_final_document",
     "Runtime",
     "create_llm_client",
+    "create_async_llm_client",
     "StudentInteractionHandler",
     "StudentSimulator",
     "FRAMEWORK_THEORISTS",
+    "ResponseCache",
+    "CachedLLMClient",
 ]
@@ -9,10 +9,48 @@ Supports OpenAI, Anthropic, and local models. The LLM's role is:
 """
 
 import json
-from typing import Dict, Optional, Any
+import asyncio
+from typing import Dict, List, Optional, Any, Iterator
 from abc import ABC, abstractmethod
 
 
+# Key marking a send_json() reply as a fallback for a failed call, not a
+# model answer (response caches must not store it)
+JSON_ERROR_KEY = "llm_error"
+
+
+def json_error_fallback(error: Exception) -> Dict:
+    """Non-blocking coach verdict returned when a local model call fails."""
+    return {
+        "ok": True,
+        "reason": "Validation skipped due to local model error",
+        JSON_ERROR_KEY: str(error)
+    }
+
+
+def chat_messages_as_prompt(messages: List[Dict[str, str]]) -> str:
+    """
+    Render generic chat messages as one user message, for the send_messages /
+    stream_messages fallback of clients without chat history. The speaker's
+    own turns become "[You]: ..." lines.
+    """
+    return "\n\n".join(
+        f"[You]: {m['content']}" if m["role"] == "assistant" else m["content"]
+        for m in messages
+    )
+
+
+def merge_consecutive_roles(messages: List[Dict[str, str]]) -> List[Dict[str, str]]:
+    """Join consecutive messages with the same role (APIs requiring alternation)."""
+    merged: List[Dict[str, str]] = []
+    for m in messages:
+        if merged and merged[-1]["role"] == m["role"]:
+            merged[-1] = {"role": m["role"], "content": f"{merged[-1]['content']}\n\n{m['content']}"}
+        else:
+            merged.append({"role": m["role"], "content": m["content"]})
+    return merged
+
+
 class LLMClient(ABC):
     """Abstract base class for LLM clients"""
 
@@ -21,6 +59,16 @@ class LLMClient(ABC):
         """Send a message and get text response"""
         pass
 
+    def send_messages(self, system_prompt: str, messages: List[Dict[str, str]]) -> str:
+        """
+        Send a chat history ({"role": "user"|"assistant", "content": ...} dicts,
+        ending with a user message) and get text response.
+
+        Clients without native chat support flatten the history into one
+        user message.
+        """
+        return self.send_message(system_prompt, chat_messages_as_prompt(messages))
+
     @abstractmethod
     def send_json(self, system_prompt: str, user_message: str) -> Dict:
         """Send a message and get JSON response"""
@@ -53,15 +101,58 @@ class OpenAIClient(LLMClient):
             raise ImportError("Please install openai: pip install openai")
 
     def send_message(self, system_prompt: str, user_message: str) -> str:
+        return self.send_messages(system_prompt, [{"role": "user", "content": user_message}])
+
+    def send_messages(self, system_prompt: str, messages: List[Dict[str, str]]) -> str:
         response = self.client.chat.completions.create(
             model=self.model,
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_message}
-            ]
+            messages=[{"role": "system", "content": system_prompt}] + list(messages)
         )
         return response.choices[0].message.content
 
+    def stream_message(
+        self,
+        system_prompt: str,
+        user_message: str,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None
+    ) -> Iterator[str]:
+        """
+        Yield the reply as text deltas (OpenAI-compatible SSE).
+
+        Closing the generator early closes the HTTP stream, so the server
+        stops generating tokens nobody will read.
+        """
+        return self.stream_messages(
+            system_prompt, [{"role": "user", "content": user_message}], temperature, max_tokens
+        )
+
+    def stream_messages(
+        self,
+        system_prompt: str,
+        messages: List[Dict[str, str]],
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None
+    ) -> Iterator[str]:
+        """Chat-history variant of stream_message()."""
+        kwargs = {}
+        if temperature is not None:
+            kwargs["temperature"] = temperature
+        if max_tokens is not None:
+            kwargs["max_tokens"] = max_tokens
+        stream = self.client.chat.completions.create(
+            model=self.model,
+            messages=[{"role": "system", "content": system_prompt}] + list(messages),
+            stream=True,
+            **kwargs
+        )
+        try:
+            for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        finally:
+            stream.close()
+
     def send_json(self, system_prompt: str, user_message: str) -> Dict:
         """
         Request a JSON reply from the model, without relying on native JSON mode.
@@ -81,28 +172,31 @@ class OpenAIClient(LLMClient):
             temperature=0,
         )
         content = response.choices[0].message.content
+        return _parse_json_response(content)
 
-        # Try to extract JSON from common patterns
-        try:
-            text = content.strip()
-
-            # Case 1: fenced code block ```json ... ```
-            if "```json" in text:
-                json_str = text.split("```json", 1)[1].split("```", 1)[0].strip()
-            elif "```" in text:
-                # Generic fenced block ``` ... ```
-                json_str = text.split("```", 1)[1].split("```", 1)[0].strip()
-            else:
-                # Fallback: best-effort slice from first '{' to last '}'
-                start = text.find("{")
-                end = text.rfind("}")
-                if start == -1 or end == -1 or end <= start:
-                    raise ValueError(f"No JSON object found in response: {text}")
-                json_str = text[start : end + 1]
-
-            return json.loads(json_str)
-        except Exception as e:
-            raise ValueError(f"Failed to parse JSON from LLM response: {content}") from e
+
+def _parse_json_response(content: str) -> Dict:
+    """Extract a JSON object from an LLM reply (fenced block or bare braces)."""
+    try:
+        text = content.strip()
+
+        # Case 1: fenced code block ```json ... ```
+        if "```json" in text:
+            json_str = text.split("```json", 1)[1].split("```", 1)[0].strip()
+        elif "```" in text:
+            # Generic fenced block ``` ... ```
+            json_str = text.split("```", 1)[1].split("```", 1)[0].strip()
+        else:
+            # Fallback: best-effort slice from first '{' to last '}'
+            start = text.find("{")
+            end = text.rfind("}")
+            if start == -1 or end == -1 or end <= start:
+                raise ValueError(f"No JSON object found in response: {text}")
+            json_str = text[start : end + 1]
+
+        return json.loads(json_str)
+    except Exception as e:
+        raise ValueError(f"Failed to parse JSON from LLM response: {content}") from e
 
 
 class AnthropicClient(LLMClient):
@@ -118,16 +212,50 @@ class AnthropicClient(LLMClient):
             raise ImportError("Please install anthropic: pip install anthropic")
 
     def send_message(self, system_prompt: str, user_message: str) -> str:
+        return self.send_messages(system_prompt, [{"role": "user", "content": user_message}])
+
+    def send_messages(self, system_prompt: str, messages: List[Dict[str, str]]) -> str:
+        # Messages API requires alternating roles
         response = self.client.messages.create(
             model=self.model,
             max_tokens=1024,
             system=system_prompt,
-            messages=[
-                {"role": "user", "content": user_message}
-            ]
+            messages=merge_consecutive_roles(messages)
         )
         return response.content[0].text
 
+    def stream_message(
+        self,
+        system_prompt: str,
+        user_message: str,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None
+    ) -> Iterator[str]:
+        """Yield the reply as text deltas."""
+        return self.stream_messages(
+            system_prompt, [{"role": "user", "content": user_message}], temperature, max_tokens
+        )
+
+    def stream_messages(
+        self,
+        system_prompt: str,
+        messages: List[Dict[str, str]],
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None
+    ) -> Iterator[str]:
+        """Chat-history variant of stream_message()."""
+        kwargs = {}
+        if temperature is not None:
+            kwargs["temperature"] = temperature
+        with self.client.messages.stream(
+            model=self.model,
+            max_tokens=max_tokens or 1024,
+            system=system_prompt,
+            messages=merge_consecutive_roles(messages),
+            **kwargs
+        ) as stream:
+            yield from stream.text_stream
+
     def send_json(self, system_prompt: str, user_message: str) -> Dict:
         # Anthropic doesn't have native JSON mode yet, so we parse the response
         response_text = self.send_message(
@@ -155,6 +283,34 @@ class MockClient(LLMClient):
         self.call_count += 1
         return f"Mock response #{self.call_count}"
 
+    def send_messages(self, system_prompt: str, messages: List[Dict[str, str]]) -> str:
+        self.call_count += 1
+        return f"Mock response #{self.call_count}"
+
+    def stream_message(
+        self,
+        system_prompt: str,
+        user_message: str,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None
+    ) -> Iterator[str]:
+        """Yield the mock response word by word."""
+        words = self.send_message(system_prompt, user_message).split(" ")
+        for i, word in enumerate(words):
+            yield word if i == 0 else " " + word
+
+    def stream_messages(
+        self,
+        system_prompt: str,
+        messages: List[Dict[str, str]],
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None
+    ) -> Iterator[str]:
+        """Yield the mock response word by word."""
+        return self.stream_message(
+            system_prompt, chat_messages_as_prompt(messages), temperature, max_tokens
+        )
+
     def send_json(self, system_prompt: str, user_message: str) -> Dict:
         self.call_count += 1
         return {"ok": True, "reason": "Mock validation passed"}
@@ -593,33 +749,100 @@ OR
 class OllamaClient(LLMClient):
     """Ollama API client for local models"""
 
-    def __init__(self, model: str = "gemma:2b", base_url: str = "http://localhost:11434"):
+    def __init__(
+        self,
+        model: str = "gemma:2b",
+        base_url: str = "http://localhost:11434",
+        timeout: Optional[float] = None
+    ):
         self.model = model
         self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
         try:
             import requests
             self.requests = requests
+            # Keep-alive session so consecutive turns reuse the same TCP connection
+            self.session = requests.Session()
         except ImportError:
             raise ImportError("Please install requests: pip install requests")
 
     def send_message(self, system_prompt: str, user_message: str) -> str:
+        return self.send_messages(system_prompt, [{"role": "user", "content": user_message}])
+
+    def send_messages(self, system_prompt: str, messages: List[Dict[str, str]]) -> str:
         url = f"{self.base_url}/api/chat"
         payload = {
             "model": self.model,
-            "messages": [
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_message}
-            ],
+            "messages": [{"role": "system", "content": system_prompt}] + list(messages),
             "stream": False
         }
         
         try:
-            response = self.requests.post(url, json=payload)
+            response = self.session.post(url, json=payload, timeout=self.timeout)
             response.raise_for_status()
             return response.json()["message"]["content"]
         except Exception as e:
             return f"Error calling Ollama: {str(e)}"
 
+    def stream_message(
+        self,
+        system_prompt: str,
+        user_message: str,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None
+    ) -> Iterator[str]:
+        """
+        Yield the reply as text deltas (Ollama `stream: true` NDJSON).
+
+        Closing the generator early closes the connection, which makes
+        Ollama abort the generation.
+        """
+        return self.stream_messages(
+            system_prompt, [{"role": "user", "content": user_message}], temperature, max_tokens
+        )
+
+    def stream_messages(
+        self,
+        system_prompt: str,
+        messages: List[Dict[str, str]],
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None
+    ) -> Iterator[str]:
+        """Chat-history variant of stream_message()."""
+        url = f"{self.base_url}/api/chat"
+        payload = {
+            "model": self.model,
+            "messages": [{"role": "system", "content": system_prompt}] + list(messages),
+            "stream": True
+        }
+        options = {}
+        if temperature is not None:
+            options["temperature"] = temperature
+        if max_tokens is not None:
+            options["num_predict"] = max_tokens
+        if options:
+            payload["options"] = options
+
+        try:
+            response = self.session.post(url, json=payload, timeout=self.timeout, stream=True)
+            response.raise_for_status()
+        except Exception as e:
+            yield f"Error calling Ollama: {str(e)}"
+            return
+
+        try:
+            for line in response.iter_lines():
+                if not line:
+                    continue
+                chunk = json.loads(line)
+                delta = chunk.get("message", {}).get("content", "")
+                if delta:
+                    yield delta
+                if chunk.get("done"):
+                    break
+        finally:
+            response.close()
+
     def send_json(self, system_prompt: str, user_message: str) -> Dict:
         url = f"{self.base_url}/api/chat"
         payload = {
@@ -633,7 +856,7 @@ class OllamaClient(LLMClient):
         }
         
         try:
-            response = self.requests.post(url, json=payload)
+            response = self.session.post(url, json=payload, timeout=self.timeout)
             response.raise_for_status()
             content = response.json()["message"]["content"]
             return json.loads(content)
@@ -645,7 +868,374 @@ class OllamaClient(LLMClient):
             # Let's default to False if we can't parse, to force a retry?
             # No, that might block the user forever.
             # Let's try to be smarter.
-            return {"ok": True, "reason": "Validation skipped due to local model error"}
+            return json_error_fallback(e)
+
+
+# =============================================================================
+# ASYNC CLIENTS - Keep many generations in flight against vLLM/Ollama servers
+# =============================================================================
+
+def create_async_http_session(
+    max_connections: int = 32,
+    max_keepalive_connections: int = 16,
+    keepalive_expiry: float = 60.0,
+    timeout: float = 180.0
+):
+    """
+    Create a pooled keep-alive HTTP session shared by async clients.
+
+    Pass the same session to several async clients (e.g. performer + coach)
+    so they reuse warm TCP/TLS connections instead of reconnecting per turn.
+    The caller owns the session and should `await session.aclose()` when done.
+    """
+    try:
+        import httpx
+    except ImportError:
+        raise ImportError("Please install httpx: pip install httpx")
+
+    return httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry
+        ),
+        timeout=timeout
+    )
+
+
+class AsyncLLMClient(ABC):
+    """
+    Abstract base class for async LLM clients.
+
+    Async clients accept optional temperature/max_tokens so they also satisfy
+    the social_rl LLMClientProtocol signature. Concurrency is bounded by a
+    per-client semaphore; pass a shared semaphore to cap several clients that
+    point at the same endpoint.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 8,
+        timeout: float = 120.0,
+        semaphore: Optional[asyncio.Semaphore] = None
+    ):
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self._semaphore = semaphore
+        self._owns_session = False
+
+    @property
+    def semaphore(self) -> asyncio.Semaphore:
+        """In-flight request limiter (created lazily inside the running loop)."""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    @abstractmethod
+    async def send_message(
+        self,
+        system_prompt: str,
+        user_message: str,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        timeout: Optional[float] = None
+    ) -> str:
+        """Send a message and get text response"""
+        pass
+
+    @abstractmethod
+    async def send_json(
+        self,
+        system_prompt: str,
+        user_message: str,
+        timeout: Optional[float] = None
+    ) -> Dict:
+        """Send a message and get JSON response"""
+        pass
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP session if this client created it."""
+        pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+
+
+class AsyncOpenAIClient(AsyncLLMClient):
+    """Async OpenAI client - also works with vLLM and other OpenAI-compatible APIs"""
+
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "gpt-4",
+        base_url: str = None,
+        timeout: float = 120.0,
+        max_concurrency: int = 8,
+        http_client: Any = None,
+        semaphore: Optional[asyncio.Semaphore] = None
+    ):
+        super().__init__(max_concurrency, timeout, semaphore)
+        self.api_key = api_key
+        self.model = model
+        self.base_url = base_url
+        try:
+            from openai import AsyncOpenAI
+        except ImportError:
+            raise ImportError("Please install openai: pip install openai")
+
+        if http_client is None:
+            http_client = create_async_http_session(
+                max_connections=max_concurrency * 2,
+                max_keepalive_connections=max_concurrency,
+                timeout=timeout
+            )
+            self._owns_session = True
+        self.http_client = http_client
+
+        kwargs = {"api_key": api_key, "timeout": timeout, "http_client": http_client}
+        if base_url:
+            kwargs["base_url"] = base_url
+            # Same ngrok header as the sync client (403 Forbidden fix)
+            kwargs["default_headers"] = {"ngrok-skip-browser-warning": "true"}
+        self.client = AsyncOpenAI(**kwargs)
+
+    async def send_message(
+        self,
+        system_prompt: str,
+        user_message: str,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        timeout: Optional[float] = None
+    ) -> str:
+        kwargs = {}
+        if temperature is not None:
+            kwargs["temperature"] = temperature
+        if max_tokens is not None:
+            kwargs["max_tokens"] = max_tokens
+        async with self.semaphore:
+            response = await self.client.chat.completions.create(
+                model=self.model,
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_message}
+                ],
+                timeout=timeout or self.timeout,
+                **kwargs
+            )
+        return response.choices[0].message.content
+
+    async def send_json(
+        self,
+        system_prompt: str,
+        user_message: str,
+        timeout: Optional[float] = None
+    ) -> Dict:
+        content = await self.send_message(
+            system_prompt,
+            user_message + "\n\nRespond with valid JSON only, no explanations.",
+            temperature=0,
+            timeout=timeout
+        )
+        return _parse_json_response(content)
+
+    async def aclose(self) -> None:
+        if self._owns_session:
+            await self.http_client.aclose()
+
+
+class AsyncAnthropicClient(AsyncLLMClient):
+    """Async Anthropic API client (Claude)"""
+
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "claude-3-5-sonnet-20241022",
+        timeout: float = 120.0,
+        max_concurrency: int = 8,
+        http_client: Any = None,
+        semaphore: Optional[asyncio.Semaphore] = None
+    ):
+        super().__init__(max_concurrency, timeout, semaphore)
+        self.api_key = api_key
+        self.model = model
+        try:
+            from anthropic import AsyncAnthropic
+        except ImportError:
+            raise ImportError("Please install anthropic: pip install anthropic")
+
+        if http_client is None:
+            http_client = create_async_http_session(
+                max_connections=max_concurrency * 2,
+                max_keepalive_connections=max_concurrency,
+                timeout=timeout
+            )
+            self._owns_session = True
+        self.http_client = http_client
+        self.client = AsyncAnthropic(api_key=api_key, timeout=timeout, http_client=http_client)
+
+    async def send_message(
+        self,
+        system_prompt: str,
+        user_message: str,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        timeout: Optional[float] = None
+    ) -> str:
+        kwargs = {}
+        if temperature is not None:
+            kwargs["temperature"] = temperature
+        async with self.semaphore:
+            response = await self.client.messages.create(
+                model=self.model,
+                max_tokens=max_tokens or 1024,
+                system=system_prompt,
+                messages=[
+                    {"role": "user", "content": user_message}
+                ],
+                timeout=timeout or self.timeout,
+                **kwargs
+            )
+        return response.content[0].text
+
+    async def send_json(
+        self,
+        system_prompt: str,
+        user_message: str,
+        timeout: Optional[float] = None
+    ) -> Dict:
+        response_text = await self.send_message(
+            system_prompt,
+            user_message + "\n\nRespond with valid JSON only.",
+            timeout=timeout
+        )
+        return _parse_json_response(response_text)
+
+    async def aclose(self) -> None:
+        if self._owns_session:
+            await self.http_client.aclose()
+
+
+class AsyncOllamaClient(AsyncLLMClient):
+    """Async Ollama API client for local models"""
+
+    def __init__(
+        self,
+        model: str = "gemma:2b",
+        base_url: str = "http://localhost:11434",
+        timeout: float = 120.0,
+        max_concurrency: int = 4,
+        http_client: Any = None,
+        semaphore: Optional[asyncio.Semaphore] = None
+    ):
+        super().__init__(max_concurrency, timeout, semaphore)
+        self.model = model
+        self.base_url = base_url.rstrip('/')
+        if http_client is None:
+            http_client = create_async_http_session(
+                max_connections=max_concurrency * 2,
+                max_keepalive_connections=max_concurrency,
+                timeout=timeout
+            )
+            self._owns_session = True
+        self.http_client = http_client
+
+    async def _chat(self, payload: Dict[str, Any], timeout: Optional[float]) -> str:
+        async with self.semaphore:
+            response = await self.http_client.post(
+                f"{self.base_url}/api/chat",
+                json=payload,
+                timeout=timeout or self.timeout
+            )
+        response.raise_for_status()
+        return response.json()["message"]["content"]
+
+    async def send_message(
+        self,
+        system_prompt: str,
+        user_message: str,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        timeout: Optional[float] = None
+    ) -> str:
+        payload = {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_message}
+            ],
+            "stream": False
+        }
+        options = {}
+        if temperature is not None:
+            options["temperature"] = temperature
+        if max_tokens is not None:
+            options["num_predict"] = max_tokens
+        if options:
+            payload["options"] = options
+
+        try:
+            return await self._chat(payload, timeout)
+        except Exception as e:
+            return f"Error calling Ollama: {str(e)}"
+
+    async def send_json(
+        self,
+        system_prompt: str,
+        user_message: str,
+        timeout: Optional[float] = None
+    ) -> Dict:
+        payload = {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_message}
+            ],
+            "format": "json",
+            "stream": False
+        }
+        try:
+            return json.loads(await self._chat(payload, timeout))
+        except Exception as e:
+            print(f"Ollama JSON Error: {e}")
+            # Same non-blocking fallback as the sync OllamaClient
+            return json_error_fallback(e)
+
+    async def aclose(self) -> None:
+        if self._owns_session:
+            await self.http_client.aclose()
+
+
+class AsyncMockClient(AsyncLLMClient):
+    """Async mock client for testing without API calls"""
+
+    def __init__(self, max_concurrency: int = 8):
+        super().__init__(max_concurrency)
+        self.call_count = 0
+
+    async def send_message(
+        self,
+        system_prompt: str,
+        user_message: str,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        timeout: Optional[float] = None
+    ) -> str:
+        async with self.semaphore:
+            self.call_count += 1
+            return f"Mock response #{self.call_count}"
+
+    async def send_json(
+        self,
+        system_prompt: str,
+        user_message: str,
+        timeout: Optional[float] = None
+    ) -> Dict:
+        async with self.semaphore:
+            self.call_count += 1
+            return {"ok": True, "reason": "Mock validation passed"}
 
 
 def create_llm_client(
@@ -701,6 +1291,56 @@ def create_llm_client(
         raise ValueError(f"Unknown provider: {provider}")
 
 
+def create_async_llm_client(
+    provider: str = "mock",
+    api_key: Optional[str] = None,
+    model: Optional[str] = None,
+    base_url: Optional[str] = None,
+    timeout: float = 120.0,
+    max_concurrency: int = 8,
+    http_client: Any = None
+) -> AsyncLLMClient:
+    """
+    Factory function to create the appropriate async LLM client.
+
+    Same providers as create_llm_client. Pass a shared `http_client`
+    (see create_async_http_session) to pool connections across clients.
+
+    Returns:
+        AsyncLLMClient instance
+    """
+    if provider == "openai":
+        if not api_key:
+            raise ValueError("API key required for OpenAI")
+        return AsyncOpenAIClient(api_key, model or "gpt-4", base_url, timeout, max_concurrency, http_client)
+
+    elif provider == "runpod":
+        if not base_url:
+            raise ValueError("base_url required for RunPod (e.g., https://api.runpod.ai/v2/YOUR_ENDPOINT_ID/openai/v1)")
+        if not api_key:
+            raise ValueError("api_key required for RunPod")
+        return AsyncOpenAIClient(api_key, model or "default", base_url, timeout, max_concurrency, http_client)
+
+    elif provider == "vllm":
+        if not base_url:
+            raise ValueError("base_url required for vLLM (e.g., http://localhost:8000/v1)")
+        return AsyncOpenAIClient(api_key or "not-needed", model or "default", base_url, timeout, max_concurrency, http_client)
+
+    elif provider == "anthropic":
+        if not api_key:
+            raise ValueError("API key required for Anthropic")
+        return AsyncAnthropicClient(api_key, model or "claude-3-5-sonnet-20241022", timeout, max_concurrency, http_client)
+
+    elif provider == "ollama":
+        return AsyncOllamaClient(model or "gemma:2b", base_url or "http://localhost:11434", timeout, max_concurrency, http_client)
+
+    elif provider == "mock":
+        return AsyncMockClient(max_concurrency)
+
+    else:
+        raise ValueError(f"Unknown provider: {provider}")
+
+
 if __name__ == "__main__":
     # Test the mock client
     client = create_llm_client("mock")
@@ -0,0 +1,326 @@
+"""
+Response Cache - Content-addressed caching of LLM calls
+
+Identical requests (same system prompt, user message, model, temperature and
+max_tokens) are answered from cache instead of the GPU. Typical hits:
+- Re-running a condition with the same canvas and seed (coach validation)
+- StudentInteractionHandler.validate_answer on repeated answers
+- Re-analysis / replay runs over existing transcripts
+
+The cache is a small in-memory LRU in front of an optional SQLite file, so
+entries survive across processes and runs. By default only deterministic
+calls (temperature <= threshold) are cached; sampled generations are passed
+straight through. send_json calls without a temperature count as
+temperature 0, as the local_rcm clients run them.
+"""
+
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from llm_client import JSON_ERROR_KEY
+
+
+# Replies that signal a transport failure rather than a model answer:
+# "Error calling ..." strings, and send_json() fallbacks carrying
+# JSON_ERROR_KEY (or, from older clients, the fallback reason)
+_ERROR_PREFIXES = ("Error calling",)
+_FALLBACK_REASONS = ("Validation skipped due to local model error",)
+
+
+def is_error_response(response: Any) -> bool:
+    """True for client replies that report a failed call."""
+    if isinstance(response, str):
+        return response.startswith(_ERROR_PREFIXES)
+    if isinstance(response, dict):
+        return JSON_ERROR_KEY in response or response.get("reason") in _FALLBACK_REASONS
+    return False
+
+
+_MISSING = object()
+
+
+def make_cache_key(**request: Any) -> str:
+    """Hash a full request description into a stable cache key."""
+    payload = json.dumps(request, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """
+    Two-tier response store: in-memory LRU + optional SQLite persistence.
+
+    Usage:
+        cache = ResponseCache("outputs/llm_cache.sqlite", ttl_seconds=7 * 86400)
+        key = make_cache_key(system="...", user="...", model="qwen2.5:7b")
+        if (value := cache.get(key)) is None:
+            value = client.send_message(...)
+            cache.put(key, value)
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        max_memory_entries: int = 1024,
+        max_disk_entries: Optional[int] = 100_000,
+        ttl_seconds: Optional[float] = None
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            path: SQLite file for persistence (None = memory only)
+            max_memory_entries: LRU capacity of the in-memory tier
+            max_disk_entries: Row cap for the SQLite tier (None = unbounded)
+            ttl_seconds: Entries older than this are treated as misses (None = never expire)
+        """
+        self.path = path
+        self.max_memory_entries = max_memory_entries
+        self.max_disk_entries = max_disk_entries
+        self.ttl_seconds = ttl_seconds
+
+        self._memory: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+        self.hits = 0
+        self.misses = 0
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.evictions = 0
+
+        if path:
+            self._conn = sqlite3.connect(path, timeout=30.0, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+                "created REAL NOT NULL, accessed REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS responses_accessed ON responses(accessed)"
+            )
+            self._conn.commit()
+
+    def _expired(self, created: float, now: float) -> bool:
+        return self.ttl_seconds is not None and now - created > self.ttl_seconds
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the cached value for key, or default on a miss."""
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                value, created = entry
+                if not self._expired(created, now):
+                    self._memory.move_to_end(key)
+                    self.hits += 1
+                    self.memory_hits += 1
+                    return value
+                del self._memory[key]
+
+            if self._conn is not None:
+                row = self._conn.execute(
+                    "SELECT value, created FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None:
+                    if not self._expired(row[1], now):
+                        value = json.loads(row[0])
+                        self._conn.execute(
+                            "UPDATE responses SET accessed = ? WHERE key = ?", (now, key)
+                        )
+                        self._conn.commit()
+                        self._remember(key, value, row[1])
+                        self.hits += 1
+                        self.disk_hits += 1
+                        return value
+                    self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                    self._conn.commit()
+
+            self.misses += 1
+            return default
+
+    def put(self, key: str, value: Any) -> None:
+        """Store a JSON-serializable value under key."""
+        now = time.time()
+        with self._lock:
+            self._remember(key, value, now)
+            if self._conn is not None:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO responses (key, value, created, accessed) "
+                    "VALUES (?, ?, ?, ?)",
+                    (key, json.dumps(value, ensure_ascii=False), now, now)
+                )
+                self._evict_disk()
+                self._conn.commit()
+
+    def _remember(self, key: str, value: Any, created: float) -> None:
+        self._memory[key] = (value, created)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+            self.evictions += 1
+
+    def _evict_disk(self) -> None:
+        if self.max_disk_entries is None:
+            return
+        count = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+        excess = count - self.max_disk_entries
+        if excess > 0:
+            self._conn.execute(
+                "DELETE FROM responses WHERE key IN ("
+                "SELECT key FROM responses ORDER BY accessed ASC LIMIT ?)",
+                (excess,)
+            )
+            self.evictions += excess
+
+    def prune(self) -> int:
+        """Drop all expired entries from both tiers. Returns rows removed from disk."""
+        if self.ttl_seconds is None:
+            return 0
+        now = time.time()
+        with self._lock:
+            for key in [k for k, (_, created) in self._memory.items() if self._expired(created, now)]:
+                del self._memory[key]
+            if self._conn is None:
+                return 0
+            cursor = self._conn.execute(
+                "DELETE FROM responses WHERE created < ?", (now - self.ttl_seconds,)
+            )
+            self._conn.commit()
+            return cursor.rowcount
+
+    def clear(self) -> None:
+        """Remove every entry (statistics are kept)."""
+        with self._lock:
+            self._memory.clear()
+            if self._conn is not None:
+                self._conn.execute("DELETE FROM responses")
+                self._conn.commit()
+
+    def close(self) -> None:
+        """Close the SQLite connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def __len__(self) -> int:
+        with self._lock:
+            if self._conn is not None:
+                return self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+            return len(self._memory)
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get hit/miss statistics."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "evictions": self.evictions,
+            "hit_rate": self.hit_rate,
+            "memory_entries": len(self._memory),
+        }
+
+
+class CachedLLMClient:
+    """
+    Caching wrapper around any LLM client.
+
+    Works with both local_rcm LLMClient (send_message(system, user)) and the
+    social_rl LLMClientProtocol (send_message(system, user, temperature,
+    max_tokens)); call arguments are forwarded unchanged.
+
+    Usage:
+        cache = ResponseCache("outputs/llm_cache.sqlite")
+        coach = CachedLLMClient(coach_client, cache, temperature_threshold=0.1)
+        dual = DualLLMClient(performer_client, coach)
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        cache: Optional[ResponseCache] = None,
+        model: Optional[str] = None,
+        deterministic_only: bool = True,
+        temperature_threshold: float = 0.0,
+        default_temperature: Optional[float] = None,
+        json_temperature: Optional[float] = 0.0
+    ):
+        """
+        Initialize the wrapper.
+
+        Args:
+            client: Wrapped client (anything with send_message / send_json)
+            cache: Backing cache (default: fresh in-memory ResponseCache)
+            model: Model name for the cache key (default: client.model)
+            deterministic_only: Only cache calls with temperature <= temperature_threshold
+            temperature_threshold: Highest temperature treated as deterministic
+            default_temperature: Temperature assumed when a send_message call
+                does not pass one (None = unknown, never cached when deterministic_only)
+            json_temperature: Temperature assumed when a send_json call does not
+                pass one (local_rcm clients run send_json at temperature 0)
+        """
+        self._client = client
+        self.cache = cache if cache is not None else ResponseCache()
+        self.model = model or getattr(client, "model", None) or type(client).__name__
+        self.deterministic_only = deterministic_only
+        self.temperature_threshold = temperature_threshold
+        self.default_temperature = default_temperature
+        self.json_temperature = json_temperature
+
+    def _should_cache(self, temperature: Optional[float]) -> bool:
+        if not self.deterministic_only:
+            return True
+        return temperature is not None and temperature <= self.temperature_threshold
+
+    def _call(self, method: str, system_prompt: str, user_message: str, args: tuple, kwargs: dict) -> Any:
+        temperature = kwargs.get("temperature", args[0] if args else None)
+        max_tokens = kwargs.get("max_tokens", args[1] if len(args) > 1 else None)
+        if temperature is None:
+            temperature = self.json_temperature if method == "send_json" else self.default_temperature
+
+        send = getattr(self._client, method)
+        if not self._should_cache(temperature):
+            return send(system_prompt, user_message, *args, **kwargs)
+
+        key = make_cache_key(
+            method=method,
+            system_prompt=system_prompt,
+            user_message=user_message,
+            model=self.model,
+            temperature=temperature,
+            max_tokens=max_tokens,
+        )
+        cached = self.cache.get(key, _MISSING)
+        # Failures stored by older versions are treated as misses
+        if cached is not _MISSING and not is_error_response(cached):
+            return cached
+
+        response = send(system_prompt, user_message, *args, **kwargs)
+        if not is_error_response(response):
+            self.cache.put(key, response)
+        return response
+
+    def send_message(self, system_prompt: str, user_message: str, *args, **kwargs) -> str:
+        return self._call("send_message", system_prompt, user_message, args, kwargs)
+
+    def send_json(self, system_prompt: str, user_message: str, *args, **kwargs) -> Dict:
+        return self._call("send_json", system_prompt, user_message, args, kwargs)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        return self.cache.get_stats()
+
+    def __getattr__(self, name):
+        return getattr(self._client, name)
@@ -40,6 +40,7 @@ from .feedback_extractor import (
     SocialFeedbackExtractor,
     SocialFeedback,
     ConceptMarkers,
+    RoundFeedbackAccumulator,
     create_extractor_for_framework
 )
 
@@ -56,6 +57,7 @@ from .runner import (
     SocialRLConfig,
     SocialRLMessage,
     SocialRLRoundResult,
+    TurnDelta,
     create_social_rl_runner
 )
 
@@ -71,6 +73,7 @@ __all__ = [
     "SocialFeedbackExtractor",
     "SocialFeedback",
     "ConceptMarkers",
+    "RoundFeedbackAccumulator",
     "create_extractor_for_framework",
 
     # Process Retrieval
@@ -85,14 +88,21 @@ __all__ = [
     "SocialRLConfig",
     "SocialRLMessage",
     "SocialRLRoundResult",
+    "TurnDelta",
     "create_social_rl_runner",
 
     # Dual-LLM Client
     "DualLLMClient",
     "DualLLMConfig",
+    "ValidationItem",
     "create_dual_llm_client",
     "create_dual_llm_from_single",
 
+    # Transcripts
+    "TranscriptWriter",
+    "load_round_transcript",
+    "load_round_transcripts",
+
     # Schema
     "SCHEMA_VERSION",
 ]
@@ -101,10 +111,18 @@ __all__ = [
 from .dual_llm_client import (
     DualLLMClient,
     DualLLMConfig,
+    ValidationItem,
     create_dual_llm_client,
     create_dual_llm_from_single,
 )
 
+# Import transcript store
+from .transcript import (
+    TranscriptWriter,
+    load_round_transcript,
+    load_round_transcripts,
+)
+
 # Import schema version
 from .schema import SCHEMA_VERSION
 
@@ -0,0 +1,112 @@
+"""
+Chat History - Structured chat messages with a token-budgeted window.
+
+Instead of re-flattening the last N messages into one "CONVERSATION SO FAR"
+string every turn, a speaker's view of the round is sent as chat messages:
+
+    user       "The round begins. <scenario>"     (opening, always kept)
+    user       "[Owner+Marta]: ..."               (other agents' turns)
+    assistant  "..."                              (the speaker's own turns)
+    ...
+    user       "It is now your turn ..."          (closing)
+
+The window keeps the newest turns that fit a token budget, so long turns
+cannot blow the context and short ones do not waste it. Until the budget is
+reached the history only grows by appended messages, which keeps the prompt
+prefix stable for server-side prefix caching (vLLM, Ollama).
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+
+TokenCounter = Callable[[str], int]
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap token estimate (~4 characters per token for English text)."""
+    return (len(text) + 3) // 4
+
+
+def message_field(message: Any, name: str) -> str:
+    """agent_id / content of a message dict or message object."""
+    return message[name] if isinstance(message, dict) else getattr(message, name)
+
+
+def history_window_start(
+    history: Sequence[Any],
+    token_budget: int,
+    count_tokens: TokenCounter = estimate_tokens
+) -> int:
+    """
+    Index of the oldest message in the window.
+
+    Keeps the newest messages (dicts or objects with agent_id / content)
+    whose token counts fit token_budget. The most recent message is always
+    kept.
+    """
+    used = 0
+    start = len(history)
+    while start > 0:
+        cost = count_tokens(message_field(history[start - 1], "content"))
+        if used + cost > token_budget and start < len(history):
+            break
+        used += cost
+        start -= 1
+    return start
+
+
+def build_chat_messages(
+    history: Sequence[Any],
+    agent_id: str,
+    opening: str,
+    closing: str,
+    token_budget: int,
+    count_tokens: TokenCounter = estimate_tokens,
+    start: Optional[int] = None,
+    summary: Optional[str] = None
+) -> List[Dict[str, str]]:
+    """
+    Build the chat messages one speaker sees for its turn.
+
+    Args:
+        history: Messages so far (dicts or objects with agent_id / content)
+        agent_id: The speaker; its own turns become assistant messages
+        opening: First user message (kept regardless of the budget)
+        closing: Final user message asking for the turn
+        token_budget: Token budget for the history turns
+        count_tokens: Token counter (default: estimate_tokens)
+        start: Window start chosen by the caller (e.g. a ContextWindow);
+               overrides token_budget
+        summary: Summary of the turns before start, appended to the opening
+
+    Returns:
+        List of {"role", "content"} dicts, ending with the closing user message
+    """
+    if start is None:
+        start = history_window_start(history, token_budget, count_tokens)
+    if summary:
+        opening = f"{opening}\n\n{summary}"
+    messages = [{"role": "user", "content": opening}]
+    for msg in history[start:]:
+        speaker = message_field(msg, "agent_id")
+        content = message_field(msg, "content")
+        if speaker == agent_id:
+            messages.append({"role": "assistant", "content": content})
+        else:
+            messages.append({"role": "user", "content": f"[{speaker}]: {content}"})
+    messages.append({"role": "user", "content": closing})
+    return messages
+
+
+def flatten_chat_messages(messages: List[Dict[str, str]], agent_id: str) -> str:
+    """
+    Render build_chat_messages() output as one "CONVERSATION SO FAR" user
+    message, for clients that only take a (system, user) pair.
+    """
+    opening, *turns, closing = messages
+    lines = ["CONVERSATION SO FAR:"]
+    lines.extend(
+        f"[{agent_id}]: {m['content']}" if m["role"] == "assistant" else m["content"]
+        for m in turns
+    )
+    return f"{opening['content']}\n\n" + "\n".join(lines) + f"\n\n{closing['content']}"
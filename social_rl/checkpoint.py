@@ -0,0 +1,105 @@
+"""
+Checkpoint Log - Append-only per-turn checkpoints for SocialRLRunner.
+
+Every completed turn appends one JSON line to checkpoint.jsonl in the
+experiment's output directory:
+
+    {"type": "header", "experiment_id": ..., "canvas": {...}, "config": {...}}
+    {"type": "turn",   "round_number": 3, "turn_number": 11, "message": {...}, "state": {...}}
+    {"type": "round",  "round_number": 3, "result": {...}, "state": {...}}
+    {"type": "state",  "extra": {...}, "state": {...}}
+
+Turn records store the message's turn_context as a normalized reference;
+the "string" / "static" table records it points to are appended just
+before it (see context_store.TurnContextCodec).
+
+"state" carries everything a resumed runner needs that is not in the
+transcript itself (accumulated feedback, ProcessRetriever policies,
+SemioticStateTracker EMA state, ...). Append-only parts of it (policy
+history, per-agent feedback lists, finished rounds' feedback) are written
+as deltas against the previous record, so records do not grow with the
+length of the run. SocialRLRunner.resume() replays the log and continues
+from the last completed turn, so a crash on turn 11 of round 3 only costs
+the turn that was in flight.
+"""
+
+import os
+import json
+from pathlib import Path
+from typing import Dict, Any, List, Union
+
+
+CHECKPOINT_FILENAME = "checkpoint.jsonl"
+
+
+class CheckpointLog:
+    """Append-only JSONL checkpoint file."""
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+
+    def start(self, header: Dict[str, Any]) -> None:
+        """Begin a fresh log (truncates any previous run in the same directory)."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "w") as f:
+            f.write(json.dumps(dict(header, type="header"), default=str) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def append(self, record_type: str, **fields: Any) -> None:
+        """Append one record and force it to disk."""
+        with open(self.path, "a") as f:
+            f.write(json.dumps(dict(fields, type=record_type), default=str) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def read(self) -> List[Dict[str, Any]]:
+        """
+        Read all complete records.
+
+        A torn final line (crash mid-write) is ignored; corruption anywhere
+        else raises ValueError.
+        """
+        if not self.path.exists():
+            raise FileNotFoundError(f"No checkpoint log at {self.path}")
+
+        with open(self.path) as f:
+            lines = [line for line in f.read().split("\n") if line.strip()]
+
+        records = []
+        for i, line in enumerate(lines):
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError:
+                if i == len(lines) - 1:
+                    break
+                raise ValueError(f"Corrupt checkpoint record at line {i + 1} of {self.path}")
+
+        if not records or records[0].get("type") != "header":
+            raise ValueError(f"Checkpoint log {self.path} has no header record")
+        return records
+
+    def repair(self) -> None:
+        """
+        Cut a torn final line (crash mid-write) off the file.
+
+        read() already skips it, but appending after it would continue the
+        torn bytes on the same line and corrupt the next record. Call this
+        before appending to a log from an interrupted run.
+        """
+        with open(self.path, "rb+") as f:
+            data = f.read()
+            body = data.rstrip(b"\n")
+            start = body.rfind(b"\n") + 1
+            try:
+                json.loads(body[start:])
+            except ValueError:
+                f.truncate(start)
+            else:
+                if not data.endswith(b"\n"):
+                    f.write(b"\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def exists(self) -> bool:
+        return self.path.exists()
@@ -0,0 +1,227 @@
+"""
+Semiotic Code Cache - Persistent LLM codes keyed by utterance and prompt version
+
+LLM semiotic coding is deterministic enough (temperature 0.1) that an
+utterance coded once never needs to be sent again. Codes are stored under
+
+    (content hash, agent_id, prompt version, model)
+
+where the prompt version is a hash of LLM_CODING_PROMPT and the coder's
+system prompt. Editing the prompt therefore invalidates every earlier code
+automatically: old rows are never served, report() counts them as stale,
+and prune() drops them. The model name comes from the client's .model
+attribute or SemioticCoder(model=...); a coder with a cache but no model
+name raises ValueError rather than guessing one.
+
+Usage:
+    cache = SemioticCodeCache("outputs/semiotic_codes.sqlite")
+    coder = SemioticCoder(llm_client, use_llm=True, code_cache=cache)
+
+    print(coder.recoding_report(experiment_dirs))   # what a run would cost
+    codes = coder.code_transcript(round_data)       # only new utterances hit the LLM
+"""
+
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from dataclasses import asdict
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from .semiotic_coder import (
+    SemioticCode, JustificationType, VoiceMarker, RelationalStance, llm_prompt_version
+)
+
+
+# Per-utterance fields that are not part of the cached code
+_UTTERANCE_FIELDS = ("agent_id", "turn_number", "round_number", "content")
+
+
+def content_hash(content: str) -> str:
+    """Stable hash of an utterance's text."""
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+class SemioticCodeCache:
+    """
+    LLM semiotic codes in memory, optionally persisted to SQLite.
+
+    Only successful LLM codes should be stored; lexicon fallbacks are
+    cheap and would otherwise mask a transient LLM failure forever.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        Args:
+            path: SQLite file for persistence (None = memory only)
+        """
+        self.path = path
+        self._memory: Dict[Tuple[str, str, str, str], str] = {}
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+        self.hits = 0
+        self.misses = 0
+
+        if path:
+            self._conn = sqlite3.connect(path, timeout=30.0, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS codes ("
+                "content_hash TEXT NOT NULL, agent_id TEXT NOT NULL, "
+                "prompt_version TEXT NOT NULL, model TEXT NOT NULL, "
+                "code TEXT NOT NULL, created REAL NOT NULL, "
+                "PRIMARY KEY (content_hash, agent_id, prompt_version, model))"
+            )
+            self._conn.commit()
+
+    @staticmethod
+    def _key(content: str, agent_id: str, model: str) -> Tuple[str, str, str, str]:
+        return (content_hash(content), agent_id, llm_prompt_version(), model)
+
+    def get(
+        self,
+        content: str,
+        agent_id: str,
+        model: str,
+        turn: int,
+        round_num: int
+    ) -> Optional[SemioticCode]:
+        """Return the cached code for this utterance (under the current prompt), or None."""
+        key = self._key(content, agent_id, model)
+        with self._lock:
+            payload = self._memory.get(key)
+            if payload is None and self._conn is not None:
+                row = self._conn.execute(
+                    "SELECT code FROM codes WHERE content_hash = ? AND agent_id = ? "
+                    "AND prompt_version = ? AND model = ?", key
+                ).fetchone()
+                if row is not None:
+                    payload = self._memory[key] = row[0]
+
+            if payload is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+
+        data = json.loads(payload)
+        return SemioticCode(
+            agent_id=agent_id,
+            turn_number=turn,
+            round_number=round_num,
+            content=content,
+            justification=JustificationType(data["justification"]),
+            voice=VoiceMarker(data["voice"]),
+            stance=RelationalStance(data["stance"]),
+            justification_markers=data["justification_markers"],
+            voice_markers=data["voice_markers"],
+            stance_markers=data["stance_markers"],
+            confidence=data["confidence"],
+            coder_notes=data["coder_notes"]
+        )
+
+    def put(self, code: SemioticCode, model: str) -> None:
+        """Store an LLM code under the current prompt version."""
+        data = {k: v for k, v in asdict(code).items() if k not in _UTTERANCE_FIELDS}
+        data["justification"] = code.justification.value
+        data["voice"] = code.voice.value
+        data["stance"] = code.stance.value
+        payload = json.dumps(data, ensure_ascii=False)
+
+        key = self._key(code.content, code.agent_id, model)
+        with self._lock:
+            self._memory[key] = payload
+            if self._conn is not None:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO codes "
+                    "(content_hash, agent_id, prompt_version, model, code, created) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    key + (payload, time.time())
+                )
+                self._conn.commit()
+
+    def _versions(self, model: str) -> Dict[Tuple[str, str], set]:
+        """Prompt versions each (content hash, agent_id) has been coded under."""
+        versions: Dict[Tuple[str, str], set] = {}
+        rows: Iterable[Tuple[str, str, str]]
+        if self._conn is not None:
+            rows = self._conn.execute(
+                "SELECT content_hash, agent_id, prompt_version FROM codes WHERE model = ?",
+                (model,)
+            ).fetchall()
+        else:
+            rows = [(h, a, v) for (h, a, v, m) in self._memory if m == model]
+        for h, a, v in rows:
+            versions.setdefault((h, a), set()).add(v)
+        return versions
+
+    def report(self, utterances: Iterable[Tuple[str, str]], model: str) -> Dict[str, Any]:
+        """
+        Count how many utterances a coding run would send to the LLM.
+
+        Args:
+            utterances: (content, agent_id) pairs
+            model: Coder model name
+
+        Returns:
+            total / cached / stale (coded under an older prompt) / new
+            (never coded) counts, needs_recoding = stale + new, and the
+            current prompt_version
+        """
+        current = llm_prompt_version()
+        with self._lock:
+            versions = self._versions(model)
+
+        counts = {"total": 0, "cached": 0, "stale": 0, "new": 0}
+        for content, agent_id in utterances:
+            counts["total"] += 1
+            seen = versions.get((content_hash(content), agent_id))
+            if not seen:
+                counts["new"] += 1
+            elif current in seen:
+                counts["cached"] += 1
+            else:
+                counts["stale"] += 1
+
+        counts["needs_recoding"] = counts["stale"] + counts["new"]
+        counts["prompt_version"] = current
+        return counts
+
+    def prune(self) -> int:
+        """Drop codes made under any other prompt version. Returns rows removed."""
+        current = llm_prompt_version()
+        with self._lock:
+            stale = [key for key in self._memory if key[2] != current]
+            for key in stale:
+                del self._memory[key]
+            if self._conn is None:
+                return len(stale)
+            cursor = self._conn.execute(
+                "DELETE FROM codes WHERE prompt_version != ?", (current,)
+            )
+            self._conn.commit()
+            return cursor.rowcount
+
+    def close(self) -> None:
+        """Close the SQLite connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def __len__(self) -> int:
+        with self._lock:
+            if self._conn is not None:
+                return self._conn.execute("SELECT COUNT(*) FROM codes").fetchone()[0]
+            return len(self._memory)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get hit/miss statistics."""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "entries": len(self),
+        }
@@ -19,8 +19,13 @@ ADAPTIVE Mode Enhancement (inspired by émile-Mini):
 from dataclasses import dataclass, field
 from typing import Dict, Any, List, Optional, Callable
 from enum import Enum
+import copy
 import json
 
+from .chat_history import history_window_start
+from .conversation_index import ConversationIndex
+from .optional_deps import import_numpy
+
 
 # =============================================================================
 # SEMIOTIC STATE TRACKER (émile-inspired)
@@ -210,6 +215,240 @@ class SemioticStateTracker:
         }
 
 
+# Metric column order used by the batched tracker
+SEMIOTIC_METRICS = ("engagement", "voice_valence", "stance_valence", "justificatory_pct")
+
+# Collapse state codes used by the batched tracker (index -> scalar value)
+COLLAPSE_STATES = (None, "harmony", "retreat")
+
+
+class BatchedSemioticStateTracker:
+    """
+    SemioticStateTracker for many experiments ("lanes") advanced in lock-step.
+
+    Each round is one vectorized step over all lanes: the EMA update,
+    collapse detection, dwell check and divergence bookkeeping use the same
+    float operations as the scalar tracker, so every lane reproduces
+    SemioticStateTracker bit for bit. Lanes may use different configs,
+    which makes threshold sweeps a single array pass.
+
+    History lives in preallocated arrays (grown by doubling) instead of
+    lists of dicts:
+        raw_history / ema_history: (rounds, lanes, 4) in SEMIOTIC_METRICS order
+        collapse_history:          (rounds, lanes) collapse state codes
+        divergence_history:        (rounds, lanes) injected collapse codes, 0 = none
+
+    Collapse codes index COLLAPSE_STATES. NaN in a metric row marks a missing
+    key, which leaves that EMA unchanged as in the scalar update().
+    """
+
+    def __init__(
+        self,
+        configs: Optional[Any] = None,
+        n_lanes: int = 1,
+        capacity: int = 16
+    ):
+        """
+        Args:
+            configs: One SemioticStateConfig shared by all lanes, or a sequence
+                     with one config per lane (n_lanes is then its length)
+            n_lanes: Number of lanes when a single config is given
+            capacity: Rounds of history to preallocate
+        """
+        np = import_numpy()
+        if configs is None or isinstance(configs, SemioticStateConfig):
+            configs = [configs or SemioticStateConfig()] * n_lanes
+        self.configs: List[SemioticStateConfig] = list(configs)
+        n = self.n_lanes = len(self.configs)
+
+        def column(name, dtype):
+            return np.array([getattr(c, name) for c in self.configs], dtype=dtype)
+
+        self._alpha = column("ema_alpha", np.float64)[:, None]
+        self._min_dwell = column("min_dwell_rounds", np.int64)
+        self._harmony_engagement = column("harmony_collapse_engagement_threshold", np.float64)
+        self._harmony_stance = column("harmony_collapse_stance_threshold", np.float64)
+        self._harmony_justification = column("harmony_collapse_justification_threshold", np.float64)
+        self._retreat_voice = column("retreat_voice_threshold", np.float64)
+        self._retreat_justification = column("retreat_justification_threshold", np.float64)
+        self._confirmation_rounds = column("collapse_confirmation_rounds", np.int64)
+
+        # EMA-smoothed metrics, columns in SEMIOTIC_METRICS order
+        self.ema = np.tile(np.array([0.5, 0.0, 0.5, 0.4]), (n, 1))
+
+        # State tracking
+        self.round_count: int = 0
+        self.last_divergence_round = -self._min_dwell
+        self.collapse_state = np.zeros(n, dtype=np.int8)
+        self.collapse_rounds = np.zeros(n, dtype=np.int64)
+
+        # History for analysis
+        capacity = max(int(capacity), 1)
+        self._raw = np.full((capacity, n, 4), np.nan)
+        self._ema = np.empty((capacity, n, 4))
+        self._collapse = np.zeros((capacity, n), dtype=np.int8)
+        self._divergence = np.zeros((capacity, n), dtype=np.int8)
+
+    @staticmethod
+    def stack_metrics(round_metrics: List[Dict[str, float]]):
+        """Stack one round_metrics dict per lane into an (n_lanes, 4) array."""
+        np = import_numpy()
+        return np.array(
+            [[m.get(name, np.nan) for name in SEMIOTIC_METRICS] for m in round_metrics],
+            dtype=np.float64
+        )
+
+    def _grow(self) -> None:
+        np = import_numpy()
+        extra = len(self._raw)
+        self._raw = np.concatenate([self._raw, np.full_like(self._raw, np.nan)])
+        self._ema = np.concatenate([self._ema, np.empty_like(self._ema)])
+        self._collapse = np.concatenate([self._collapse, np.zeros_like(self._collapse[:extra])])
+        self._divergence = np.concatenate([self._divergence, np.zeros_like(self._divergence[:extra])])
+
+    def update(self, round_metrics) -> None:
+        """
+        Update every lane's EMA metrics with one round of data.
+
+        Args:
+            round_metrics: (n_lanes, 4) array-like in SEMIOTIC_METRICS order
+                           (NaN = metric missing for that lane)
+        """
+        np = import_numpy()
+        metrics = np.asarray(round_metrics, dtype=np.float64)
+        if metrics.shape != (self.n_lanes, 4):
+            raise ValueError(
+                f"round_metrics must have shape ({self.n_lanes}, 4), got {metrics.shape}"
+            )
+
+        if self.round_count == len(self._raw):
+            self._grow()
+        self.round_count += 1
+        alpha = self._alpha
+
+        # EMA update: new = (1-α)*old + α*current (same operation order as scalar)
+        updated = (1 - alpha) * self.ema + alpha * metrics
+        self.ema = np.where(np.isnan(metrics), self.ema, updated)
+
+        row = self.round_count - 1
+        self._raw[row] = metrics
+        self._ema[row] = self.ema
+
+        self._update_collapse_detection()
+        self._collapse[row] = self.collapse_state
+
+    def _update_collapse_detection(self) -> None:
+        """Detect collapse states for all lanes."""
+        np = import_numpy()
+        engagement, voice, stance, justification = self.ema.T
+
+        low_engagement = engagement < self._harmony_engagement
+        harmony_detected = (
+            low_engagement &
+            (stance > self._harmony_stance) &
+            (justification > self._harmony_justification)
+        )
+        retreat_detected = (
+            low_engagement &
+            (voice < self._retreat_voice) &
+            (justification > self._retreat_justification)
+        )
+        new_state = np.where(harmony_detected, 1, np.where(retreat_detected, 2, 0)).astype(np.int8)
+
+        # Track consecutive rounds in same collapse state
+        collapsed = new_state != 0
+        same = collapsed & (new_state == self.collapse_state)
+        self.collapse_rounds = np.where(same, self.collapse_rounds + 1, collapsed.astype(np.int64))
+        self.collapse_state = new_state
+
+    def should_inject_divergence(self):
+        """
+        Vectorized SemioticStateTracker.should_inject_divergence().
+
+        Returns:
+            Tuple of (inject: bool array, collapse_codes: int8 array), with
+            collapse_codes 0 wherever inject is False
+        """
+        np = import_numpy()
+        dwell_ok = (self.round_count - self.last_divergence_round) >= self._min_dwell
+        inject = (
+            dwell_ok &
+            (self.collapse_state != 0) &
+            (self.collapse_rounds >= self._confirmation_rounds)
+        )
+        return inject, np.where(inject, self.collapse_state, 0).astype(np.int8)
+
+    def record_divergence_injection(self, collapse_codes) -> None:
+        """Record injections for every lane with a non-zero collapse code."""
+        np = import_numpy()
+        collapse_codes = np.asarray(collapse_codes, dtype=np.int8)
+        injected = collapse_codes != 0
+        self.last_divergence_round = np.where(injected, self.round_count, self.last_divergence_round)
+        self.collapse_rounds = np.where(injected, 0, self.collapse_rounds)
+        if self.round_count:
+            row = self._divergence[self.round_count - 1]
+            row[injected] = collapse_codes[injected]
+
+    def step(self, round_metrics, inject: bool = True):
+        """
+        One round for all lanes: update, decide and (optionally) record.
+
+        Returns:
+            (inject, collapse_codes) from should_inject_divergence()
+        """
+        self.update(round_metrics)
+        decision = self.should_inject_divergence()
+        if inject:
+            self.record_divergence_injection(decision[1])
+        return decision
+
+    @property
+    def raw_history(self):
+        return self._raw[:self.round_count]
+
+    @property
+    def ema_history(self):
+        return self._ema[:self.round_count]
+
+    @property
+    def collapse_history(self):
+        return self._collapse[:self.round_count]
+
+    @property
+    def divergence_history(self):
+        return self._divergence[:self.round_count]
+
+    def divergence_counts(self):
+        """Number of divergence injections per lane."""
+        return (self.divergence_history != 0).sum(axis=0)
+
+    def lane_metric_history(self, lane: int) -> List[Dict[str, Any]]:
+        """One lane's history in SemioticStateTracker.metric_history format."""
+        history = []
+        for row in range(self.round_count):
+            raw = self._raw[row, lane]
+            history.append({
+                'round': row + 1,
+                'raw': {
+                    name: float(value)
+                    for name, value in zip(SEMIOTIC_METRICS, raw) if value == value
+                },
+                'ema': dict(zip(SEMIOTIC_METRICS, self._ema[row, lane].tolist()))
+            })
+        return history
+
+    def lane_state_summary(self, lane: int) -> Dict[str, Any]:
+        """One lane's state in SemioticStateTracker.get_state_summary() format."""
+        return {
+            'round': self.round_count,
+            'ema': dict(zip(SEMIOTIC_METRICS, self.ema[lane].tolist())),
+            'collapse_state': COLLAPSE_STATES[self.collapse_state[lane]],
+            'collapse_rounds': int(self.collapse_rounds[lane]),
+            'rounds_since_divergence': self.round_count - int(self.last_divergence_round[lane]),
+            'total_divergence_injections': int(self.divergence_counts()[lane])
+        }
+
+
 # Divergence intervention templates (what to inject when collapse detected)
 DIVERGENCE_INTERVENTIONS = {
     "harmony": {
@@ -376,7 +615,8 @@ class ContextInjector:
         framework: TheoreticalFramework,
         llm_client: Optional[Any] = None,
         mode: ManifestationType = ManifestationType.PROGRESSIVE,
-        semiotic_config: Optional[SemioticStateConfig] = None
+        semiotic_config: Optional[SemioticStateConfig] = None,
+        recent_token_budget: Optional[int] = None
     ):
         """
         Initialize the context injector.
@@ -386,10 +626,13 @@ class ContextInjector:
             llm_client: Optional LLM for adaptive manifestation generation
             mode: Manifestation generation strategy
             semiotic_config: Configuration for ADAPTIVE mode semiotic tracking
+            recent_token_budget: TurnContext.recent_exchanges holds the newest
+                messages within this many tokens (None = last 3 messages)
         """
         self.framework = framework
         self.llm = llm_client
         self.mode = mode
+        self.recent_token_budget = recent_token_budget
 
         # Accumulated social feedback per agent
         self.agent_feedback: Dict[str, List[Dict[str, Any]]] = {}
@@ -405,6 +648,14 @@ class ContextInjector:
         # Track whether divergence was injected in current round (for logging)
         self._current_round_divergence: Optional[Dict[str, Any]] = None
 
+        # Progressive manifestations memoized per (round, intensity)
+        self._component_cache: Dict[tuple, Any] = {}
+        self._cache_round: Optional[int] = None
+        self.cache_stats = {"hits": 0, "misses": 0}
+
+        # Mention counts and recent interaction patterns, updated per message
+        self.conversation_index = ConversationIndex()
+
     def _load_prar_templates(self) -> Dict[str, str]:
         """Load PRAR process retrieval cue templates."""
         return {
@@ -419,7 +670,7 @@ class ContextInjector:
         agent_config: Dict[str, Any],
         round_config: Dict[str, Any],
         turn_number: int,
-        conversation_history: List[Dict[str, str]],
+        conversation_history: List[Any],
         accumulated_feedback: Optional[Dict[str, Any]] = None
     ) -> TurnContext:
         """
@@ -430,14 +681,23 @@ class ContextInjector:
             agent_config: Agent configuration dict
             round_config: Round configuration dict
             turn_number: Current turn number
-            conversation_history: Messages so far
+            conversation_history: Messages so far (dicts or objects with
+                agent_id / content); indexed incrementally across turns
             accumulated_feedback: Social feedback from previous rounds
 
         Returns:
             TurnContext with all dynamic components
         """
+        conversation_history = self.conversation_index.sync(conversation_history)
+
+        round_number = round_config.get("round_number", 1)
+        if round_number != self._cache_round:
+            self.clear_component_cache()
+            self._cache_round = round_number
+
         # Calculate intensity based on turn progression
-        max_turns = self._parse_max_turns(round_config.get("end_condition", "15"))
+        end_condition = round_config.get("end_condition", "15")
+        max_turns = self._parse_max_turns(end_condition)
         intensity = self._calculate_intensity(turn_number, max_turns)
 
         # Generate manifestations based on mode
@@ -445,7 +705,7 @@ class ContextInjector:
             concept_a_manif = round_config.get("concept_a_manifestation", "")
             concept_b_manif = round_config.get("concept_b_manifestation", "")
         elif self.mode == ManifestationType.PROGRESSIVE:
-            concept_a_manif, concept_b_manif = self._generate_progressive_manifestations(
+            concept_a_manif, concept_b_manif = self._progressive_manifestations(
                 round_config, intensity
             )
         elif self.mode == ManifestationType.REACTIVE:
@@ -473,7 +733,7 @@ class ContextInjector:
 
         return TurnContext(
             agent_id=agent_id,
-            round_number=round_config.get("round_number", 1),
+            round_number=round_number,
             turn_number=turn_number,
             base_scenario=round_config.get("scenario", ""),
             base_rules=round_config.get("rules", ""),
@@ -481,11 +741,51 @@ class ContextInjector:
             concept_a_manifestation=concept_a_manif,
             concept_b_manifestation=concept_b_manif,
             experiential_context=experiential,
-            recent_exchanges=conversation_history[-3:] if conversation_history else [],
+            recent_exchanges=self._recent_exchanges(conversation_history),
             social_feedback_summary=social_summary,
             prar_cue=prar_cue
         )
 
+    def _memoized(self, key: tuple, compute: Callable[[], Any]) -> Any:
+        """Cached value of a per-round component, computed on first use."""
+        try:
+            value = self._component_cache[key]
+        except KeyError:
+            value = self._component_cache[key] = compute()
+            self.cache_stats["misses"] += 1
+        else:
+            self.cache_stats["hits"] += 1
+        return value
+
+    def clear_component_cache(self) -> None:
+        """Drop memoized turn components (done on round change and feedback update)."""
+        self._component_cache.clear()
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Hit/miss counts of the memoized turn components."""
+        lookups = self.cache_stats["hits"] + self.cache_stats["misses"]
+        return {
+            **self.cache_stats,
+            "hit_rate": self.cache_stats["hits"] / lookups if lookups else 0.0,
+            "entries": len(self._component_cache),
+        }
+
+    def _progressive_manifestations(self, round_config: Dict[str, Any], intensity: str) -> tuple:
+        """Memoized _generate_progressive_manifestations (fixed within a round)."""
+        return self._memoized(
+            ("progressive", intensity),
+            lambda: self._generate_progressive_manifestations(round_config, intensity)
+        )
+
+    def _recent_exchanges(self, conversation_history: List[Dict[str, str]]) -> List[Dict[str, str]]:
+        """Newest messages for TurnContext.recent_exchanges."""
+        if not conversation_history:
+            return []
+        if self.recent_token_budget is None:
+            return conversation_history[-3:]
+        start = history_window_start(conversation_history, self.recent_token_budget)
+        return conversation_history[start:]
+
     def _calculate_intensity(self, turn_number: int, max_turns: int) -> str:
         """Calculate intensity level based on round progression."""
         progress = turn_number / max(max_turns, 1)
@@ -540,16 +840,13 @@ class ContextInjector:
         intensity: str
     ) -> tuple:
         """Generate manifestations that react to conversation dynamics."""
-        base_a, base_b = self._generate_progressive_manifestations(round_config, intensity)
+        base_a, base_b = self._progressive_manifestations(round_config, intensity)
 
         if not conversation_history:
             return base_a, base_b
 
-        # Analyze recent exchanges for reactive elements
-        recent = conversation_history[-3:] if len(conversation_history) >= 3 else conversation_history
-
-        # Detect interaction patterns
-        patterns = self._detect_interaction_patterns(recent)
+        # Interaction patterns over the recent exchanges (kept by the index)
+        patterns = self.conversation_index.recent_patterns()
 
         # Add reactive context
         reactive_context = self._generate_reactive_context(patterns)
@@ -691,13 +988,7 @@ class ContextInjector:
             return "The conversation begins."
 
         # Count references to this agent
-        references = sum(
-            1 for msg in conversation_history
-            if agent_id.split("+")[-1].lower() in msg.get("content", "").lower()
-        )
-
-        # Recent speaker pattern
-        recent_speakers = [msg.get("agent_id", "") for msg in conversation_history[-3:]]
+        references = self.conversation_index.references(agent_id)
 
         summary_parts = []
         if references > 0:
@@ -712,28 +1003,6 @@ class ContextInjector:
 
         return " ".join(summary_parts) if summary_parts else "The conversation continues."
 
-    def _detect_interaction_patterns(self, recent: List[Dict[str, str]]) -> Dict[str, Any]:
-        """Detect patterns in recent interactions."""
-        patterns = {
-            "conflict": False,
-            "compliance": False,
-            "question_asked": False,
-            "directive_given": False
-        }
-
-        for msg in recent:
-            content = msg.get("content", "").lower()
-            if "?" in content:
-                patterns["question_asked"] = True
-            if any(word in content for word in ["must", "will", "should", "need to"]):
-                patterns["directive_given"] = True
-            if any(word in content for word in ["yes", "understand", "okay", "i'll"]):
-                patterns["compliance"] = True
-            if any(word in content for word in ["but", "however", "disagree", "refuse"]):
-                patterns["conflict"] = True
-
-        return patterns
-
     def _generate_reactive_context(self, patterns: Dict[str, Any]) -> str:
         """Generate context based on detected patterns."""
         if patterns["conflict"]:
@@ -779,19 +1048,58 @@ class ContextInjector:
         This replaces the static AgentConfig.compile_system_prompt().
         """
         parts = []
+        parts.extend(self._identity_lines(agent_config))
+        parts.extend(self._situation_lines(turn_context))
+        parts.extend(self._turn_guidance_lines(turn_context))
+        parts.extend(self._behavior_lines(agent_config))
+        return "\n".join(parts)
+
+    def compile_static_prompt(
+        self,
+        agent_config: Dict[str, Any],
+        turn_context: TurnContext
+    ) -> str:
+        """
+        Compile the per-agent, per-round part of the prompt only.
 
+        Identity, round situation and behavioral rules do not change between
+        an agent's turns in a round, so this string is byte-identical across
+        them and can be served from a server-side prefix (KV) cache. The
+        per-turn parts come from compile_turn_guidance().
+        """
+        parts = []
+        parts.extend(self._identity_lines(agent_config))
+        parts.extend(self._situation_lines(turn_context))
+        parts.extend(self._behavior_lines(agent_config))
+        return "\n".join(parts).rstrip("\n")
+
+    def compile_turn_guidance(self, turn_context: TurnContext) -> str:
+        """Compile the per-turn parts of the prompt (experience, social context, cue)."""
+        return "\n".join(self._turn_guidance_lines(turn_context)).rstrip("\n")
+
+    @staticmethod
+    def _identity_lines(agent_config: Dict[str, Any]) -> List[str]:
         # Base agent identity
-        parts.append(f"ROLE: You are {agent_config.get('identifier', 'Unknown')}")
-        parts.append(f"PRIMARY GOAL: {agent_config.get('goal', '')}")
-        parts.append(f"PERSONA: {agent_config.get('persona', '')}")
-        parts.append("")
+        return [
+            f"ROLE: You are {agent_config.get('identifier', 'Unknown')}",
+            f"PRIMARY GOAL: {agent_config.get('goal', '')}",
+            f"PERSONA: {agent_config.get('persona', '')}",
+            "",
+        ]
 
+    @staticmethod
+    def _situation_lines(turn_context: TurnContext) -> List[str]:
         # Current round context
-        parts.append("=== CURRENT SITUATION ===")
-        parts.append(f"SCENARIO: {turn_context.base_scenario}")
-        parts.append(f"RULES: {turn_context.base_rules}")
-        parts.append(f"TASKS: {turn_context.base_tasks}")
-        parts.append("")
+        return [
+            "=== CURRENT SITUATION ===",
+            f"SCENARIO: {turn_context.base_scenario}",
+            f"RULES: {turn_context.base_rules}",
+            f"TASKS: {turn_context.base_tasks}",
+            "",
+        ]
+
+    def _turn_guidance_lines(self, turn_context: TurnContext) -> List[str]:
+        parts = []
 
         # Dynamic theoretical context (the key innovation)
         parts.append("=== HOW YOU'RE EXPERIENCING THIS ===")
@@ -813,18 +1121,46 @@ class ContextInjector:
             parts.append(turn_context.prar_cue)
             parts.append("")
 
+        return parts
+
+    @staticmethod
+    def _behavior_lines(agent_config: Dict[str, Any]) -> List[str]:
         # Behavioral constraints from agent config
         behaviors = agent_config.get("behaviors", {}).get("raw", "")
-        if behaviors:
-            parts.append(f"BEHAVIORAL RULES: {behaviors}")
+        return [f"BEHAVIORAL RULES: {behaviors}"] if behaviors else []
 
-        return "\n".join(parts)
+    def snapshot_turn_state(self) -> Dict[str, Any]:
+        """
+        Capture everything generate_turn_context() mutates, so a speculative
+        turn can be undone with restore_turn_state().
+        """
+        tracker = self.semiotic_tracker
+        return {
+            "tracker": copy.deepcopy(tracker.__dict__) if tracker is not None else None,
+            "round_divergence": self._current_round_divergence,
+            "component_cache": dict(self._component_cache),
+            "cache_round": self._cache_round,
+            "cache_stats": dict(self.cache_stats),
+            "conversation_index": self.conversation_index.checkpoint(),
+        }
+
+    def restore_turn_state(self, snapshot: Dict[str, Any]) -> None:
+        """Undo generate_turn_context() calls made since snapshot_turn_state()."""
+        if self.semiotic_tracker is not None:
+            self.semiotic_tracker.__dict__.clear()
+            self.semiotic_tracker.__dict__.update(snapshot["tracker"])
+        self._current_round_divergence = snapshot["round_divergence"]
+        self._component_cache = dict(snapshot["component_cache"])
+        self._cache_round = snapshot["cache_round"]
+        self.cache_stats = dict(snapshot["cache_stats"])
+        self.conversation_index.rollback(snapshot["conversation_index"])
 
     def update_feedback(self, agent_id: str, feedback: Dict[str, Any]):
         """Update accumulated feedback for an agent."""
         if agent_id not in self.agent_feedback:
             self.agent_feedback[agent_id] = []
         self.agent_feedback[agent_id].append(feedback)
+        self.clear_component_cache()
 
     def get_accumulated_feedback(self) -> Dict[str, Dict[str, float]]:
         """Get summarized accumulated feedback for all agents."""
@@ -921,7 +1257,11 @@ class ContextInjector:
 
 
 # Convenience function for testing
-def create_context_injector_from_canvas(canvas: Dict[str, Any], mode: str = "progressive") -> ContextInjector:
+def create_context_injector_from_canvas(
+    canvas: Dict[str, Any],
+    mode: str = "progressive",
+    recent_token_budget: Optional[int] = None
+) -> ContextInjector:
     """Create a ContextInjector from canvas data."""
     project = canvas.get("project", {})
     framework = TheoreticalFramework.from_canvas_project(project)
@@ -933,7 +1273,11 @@ def create_context_injector_from_canvas(canvas: Dict[str, Any], mode: str = "pro
         "adaptive": ManifestationType.ADAPTIVE
     }
 
-    return ContextInjector(framework, mode=mode_map.get(mode, ManifestationType.PROGRESSIVE))
+    return ContextInjector(
+        framework,
+        mode=mode_map.get(mode, ManifestationType.PROGRESSIVE),
+        recent_token_budget=recent_token_budget
+    )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,150 @@
+"""
+Context Store - Normalized on-disk representation of turn contexts.
+
+A turn_context dict repeats the same round-level text every turn
+(base_scenario / base_rules / base_tasks), the same manifestation and cue
+strings across many turns, and copies of earlier messages in
+recent_exchanges. TurnContextCodec stores each of those once:
+
+- Static round fields go in one "static" table record per round
+- Every other string is interned once as a "string" table record and
+  referenced by id
+- recent_exchanges entries that repeat an earlier message become that
+  message's index
+
+Table records are emitted alongside the data (append-only), so a reader
+that replays a log in order can rehydrate any turn_context on demand:
+
+    {"type":"static","round_number":1,"fields":{"base_scenario":"..."}}
+    {"type":"string","id":0,"value":"Worker+Alice"}
+    {"type":"message",...,"turn_context_ref":{"static":[...],"strings":{...},"values":{...}}}
+"""
+
+from typing import Dict, Any, List, Tuple, Union
+
+
+STATIC_CONTEXT_FIELDS = ("base_scenario", "base_rules", "base_tasks")
+
+TABLE_RECORD_TYPES = ("string", "static")
+
+
+class TurnContextCodec:
+    """
+    Encoder/decoder for normalized turn contexts.
+
+    One codec instance covers one log; messages must be registered with
+    add_message() in log order so exchange references resolve.
+    """
+
+    def __init__(self):
+        self.strings: List[str] = []
+        self.statics: Dict[int, Dict[str, Any]] = {}
+        self.messages: List[Dict[str, str]] = []
+        self._string_ids: Dict[str, int] = {}
+        self._message_ids: Dict[Tuple[str, str], int] = {}
+
+    # ------------------------------------------------------------------
+    # Tables
+    # ------------------------------------------------------------------
+
+    def add_message(self, agent_id: str, content: str) -> int:
+        """Register a transcript message; returns its index."""
+        index = len(self.messages)
+        self.messages.append({"agent_id": agent_id, "content": content})
+        self._message_ids.setdefault((agent_id, content), index)
+        return index
+
+    def load_record(self, record: Dict[str, Any]) -> bool:
+        """
+        Apply a table record read back from a log.
+
+        Returns True if the record was a table record (and so carries no
+        transcript data of its own).
+        """
+        if record.get("type") == "string":
+            self._intern(record["value"], record["id"])
+            return True
+        if record.get("type") == "static":
+            self.statics[record["round_number"]] = record["fields"]
+            return True
+        return False
+
+    def _intern(self, value: str, string_id: int = None) -> Tuple[int, bool]:
+        if value in self._string_ids:
+            return self._string_ids[value], False
+        if string_id is None:
+            string_id = len(self.strings)
+        while len(self.strings) <= string_id:
+            self.strings.append("")
+        self.strings[string_id] = value
+        self._string_ids[value] = string_id
+        return string_id, True
+
+    # ------------------------------------------------------------------
+    # Encode / decode
+    # ------------------------------------------------------------------
+
+    def encode(self, context: Dict[str, Any]) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+        """
+        Normalize one turn_context dict.
+
+        Returns:
+            (ref, table_records): the compact reference to store with the
+            message, and any new table records that must be written before it
+        """
+        table_records: List[Dict[str, Any]] = []
+        round_number = context.get("round_number")
+
+        static_fields = {k: context[k] for k in STATIC_CONTEXT_FIELDS if k in context}
+        if static_fields and round_number not in self.statics:
+            self.statics[round_number] = static_fields
+            table_records.append({
+                "type": "static", "round_number": round_number, "fields": static_fields
+            })
+        round_static = self.statics.get(round_number, {})
+
+        ref: Dict[str, Any] = {}
+        static_used, strings, values = [], {}, {}
+        for key, value in context.items():
+            if key in STATIC_CONTEXT_FIELDS and round_static.get(key) == value:
+                static_used.append(key)
+            elif key == "recent_exchanges" and isinstance(value, list):
+                ref["exchanges"] = [self._exchange_ref(e) for e in value]
+            elif isinstance(value, str):
+                string_id, new = self._intern(value)
+                if new:
+                    table_records.append({"type": "string", "id": string_id, "value": value})
+                strings[key] = string_id
+            else:
+                values[key] = value
+
+        if static_used:
+            ref["static"] = static_used
+        if strings:
+            ref["strings"] = strings
+        if values:
+            ref["values"] = values
+        return ref, table_records
+
+    def _exchange_ref(self, exchange: Dict[str, Any]) -> Union[int, Dict[str, Any]]:
+        key = (exchange.get("agent_id"), exchange.get("content"))
+        if set(exchange) == {"agent_id", "content"} and key in self._message_ids:
+            return self._message_ids[key]
+        return exchange
+
+    def decode(self, ref: Dict[str, Any]) -> Dict[str, Any]:
+        """Rehydrate a turn_context dict from its reference."""
+        values = ref.get("values", {})
+        round_static = self.statics.get(values.get("round_number"), {})
+
+        context: Dict[str, Any] = dict(values)
+        for key in ref.get("static", []):
+            context[key] = round_static[key]
+        for key, string_id in ref.get("strings", {}).items():
+            context[key] = self.strings[string_id]
+        if "exchanges" in ref:
+            context["recent_exchanges"] = [
+                dict(self.messages[e]) if isinstance(e, int) else e
+                for e in ref["exchanges"]
+            ]
+        return context
@@ -0,0 +1,195 @@
+"""
+ContextWindow - Token-budgeted conversation window with a rolling summary.
+
+A fixed "last N messages" window ignores message length: verbose agents
+push prompts past the model context while short messages waste it. A
+ContextWindow instead keeps the newest turns that fit a token budget and
+folds everything older into a rolling summary:
+
+    EARLIER IN THIS ROUND (6 turns summarized):
+    - [Owner+Marta]: The quota goes up by ten percent starting today.
+    - [Worker+Alice]: We cannot keep up with the line as it is.
+    ...
+
+Token counts are computed once per message, and each summary is computed
+once per eviction boundary and cached, so the per-turn cost and the prompt
+size stay bounded however long the round runs. Evictions happen in batches
+(evict_batch messages), which keeps the window start - and therefore the
+prompt prefix - unchanged between evictions.
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from .chat_history import TokenCounter, estimate_tokens, message_field
+
+
+Summarizer = Callable[[Optional[str], List[Any]], str]
+
+SUMMARY_HEADER = "EARLIER IN THIS ROUND"
+
+
+def tiktoken_counter(encoding: str = "cl100k_base") -> TokenCounter:
+    """Token counter backed by a local tiktoken encoding."""
+    try:
+        import tiktoken
+    except ImportError:
+        raise ImportError("Please install tiktoken: pip install tiktoken")
+    encoder = tiktoken.get_encoding(encoding)
+    return lambda text: len(encoder.encode(text))
+
+
+def extractive_summary(
+    previous: Optional[str],
+    evicted: List[Any],
+    max_points: int = 8,
+    max_chars: int = 160
+) -> str:
+    """
+    Fold evicted messages into a rolling summary without an LLM call.
+
+    Keeps the first sentence of each evicted turn (at most max_chars) and
+    only the newest max_points of them, so the summary stays bounded.
+    """
+    points: List[str] = []
+    summarized = 0
+    if previous:
+        header, *points = previous.split("\n")
+        summarized = int(header.split("(", 1)[1].split(" ", 1)[0])
+
+    for message in evicted:
+        content = " ".join(message_field(message, "content").split())
+        end = min((i for i in (content.find(". "), content.find("? "), content.find("! ")) if i != -1), default=-1)
+        point = content[:end + 1] if end != -1 else content
+        if len(point) > max_chars:
+            point = point[:max_chars - 3].rstrip() + "..."
+        points.append(f"- [{message_field(message, 'agent_id')}]: {point}")
+
+    summarized += len(evicted)
+    return "\n".join([f"{SUMMARY_HEADER} ({summarized} turns summarized):"] + points[-max_points:])
+
+
+class ContextWindow:
+    """
+    Token-budgeted view of one round's conversation.
+
+    Messages may be dicts or objects with agent_id / content. view() is
+    called with the round's full history each turn; per-message token
+    counts and per-boundary summaries are cached across calls.
+
+    Usage:
+        window = ContextWindow(token_budget=1500)
+        summary, start = window.view(history)   # history[start:] fits the budget
+    """
+
+    def __init__(
+        self,
+        token_budget: int = 2048,
+        count_tokens: TokenCounter = estimate_tokens,
+        summarizer: Summarizer = extractive_summary,
+        summary_reserve: int = 256,
+        evict_batch: int = 4
+    ):
+        """
+        Args:
+            token_budget: Tokens for the summary plus the kept turns
+            count_tokens: Token counter (default: ~4 characters per token)
+            summarizer: (previous_summary, evicted_messages) -> summary
+            summary_reserve: Tokens set aside for the summary once turns are evicted
+            evict_batch: Evict in multiples of this many messages
+        """
+        self.token_budget = token_budget
+        self.count_tokens = count_tokens
+        self.summarizer = summarizer
+        self.summary_reserve = summary_reserve
+        self.evict_batch = max(1, evict_batch)
+
+        self._contents: List[str] = []
+        self._tokens: List[int] = []
+        self._total = 0
+        self._summaries: Dict[int, str] = {}
+        self.stats = {"views": 0, "tokens_counted": 0, "summaries_computed": 0}
+
+    def _sync(self, history: Sequence[Any]) -> None:
+        """Count tokens for new (or changed) messages only."""
+        known = min(len(self._contents), len(history))
+        for i in range(known):
+            if message_field(history[i], "content") != self._contents[i]:
+                known = i
+                break
+        if known < len(self._contents):
+            # History was rewritten: drop counts and summaries past the change
+            self._total -= sum(self._tokens[known:])
+            # Rebind rather than truncate in place (see checkpoint())
+            self._contents, self._tokens = self._contents[:known], self._tokens[:known]
+            self._summaries = {b: s for b, s in self._summaries.items() if b <= known}
+        for message in history[known:]:
+            content = message_field(message, "content")
+            self._contents.append(content)
+            self._tokens.append(self.count_tokens(content))
+            self._total += self._tokens[-1]
+            self.stats["tokens_counted"] += 1
+
+    def _window_start(self) -> int:
+        if self._total <= self.token_budget:
+            return 0
+
+        # Newest messages that fit next to the summary (the newest is always kept)
+        budget = self.token_budget - self.summary_reserve
+        used = 0
+        start = len(self._tokens)
+        while start > 0:
+            cost = self._tokens[start - 1]
+            if used + cost > budget and start < len(self._tokens):
+                break
+            used += cost
+            start -= 1
+
+        # Round the boundary up to a batch multiple so it moves rarely
+        batched = -(-start // self.evict_batch) * self.evict_batch
+        return min(batched, len(self._tokens) - 1)
+
+    def _summary(self, history: Sequence[Any], start: int) -> Optional[str]:
+        """Summary of history[:start], folded on from the nearest cached boundary."""
+        if start == 0:
+            return None
+        if start not in self._summaries:
+            base = max((b for b in self._summaries if b < start), default=0)
+            self._summaries[start] = self.summarizer(
+                self._summaries.get(base), list(history[base:start])
+            )
+            self.stats["summaries_computed"] += 1
+        return self._summaries[start]
+
+    def checkpoint(self) -> Tuple:
+        """
+        Cheap snapshot for rollback(): the per-message lists are only
+        appended to in place, so their length marks the state.
+        """
+        return (
+            self._contents, self._tokens, len(self._tokens), self._total,
+            dict(self._summaries), dict(self.stats)
+        )
+
+    def rollback(self, checkpoint: Tuple) -> None:
+        """Return to the state at checkpoint()."""
+        contents, tokens, length, total, summaries, stats = checkpoint
+        del contents[length:], tokens[length:]
+        self._contents, self._tokens, self._total = contents, tokens, total
+        self._summaries = dict(summaries)
+        self.stats = dict(stats)
+
+    def view(self, history: Sequence[Any]) -> Tuple[Optional[str], int]:
+        """
+        Window over history.
+
+        Returns:
+            (summary of history[:start] or None, start)
+        """
+        self.stats["views"] += 1
+        self._sync(history)
+        start = self._window_start()
+        return self._summary(history, start), start
+
+    def window_tokens(self, start: int) -> int:
+        """Token count of the kept turns from start (after view())."""
+        return sum(self._tokens[start:])
@@ -0,0 +1,158 @@
+"""
+ConversationIndex - Incremental per-round conversation state for ContextInjector.
+
+Social context used to be recomputed from the whole history every turn:
+lowercasing and scanning every message for references to the speaker, and
+rebuilding the history as a list of dicts. Over a round that is quadratic.
+The index is updated once per appended message instead:
+
+- messages: the round as {"agent_id", "content"} dicts, built once each
+- mention counters: messages referencing each agent (by the name after "+")
+- a ring buffer of the interaction flags of the last `window` messages
+
+so reference counts and recent interaction patterns are O(1) reads.
+
+sync(history) accepts the caller's history (dicts or SocialRLMessage-like
+objects) each turn. History is expected to grow by appending; if it is
+shorter than the index or its last indexed message changed (a new round,
+a rejected speculative turn), the index is rebuilt from the first
+differing message.
+"""
+
+from collections import deque
+from typing import Any, Deque, Dict, List, Sequence, Tuple
+
+from .chat_history import message_field
+
+
+PATTERN_KEYWORDS = {
+    "conflict": ["but", "however", "disagree", "refuse"],
+    "compliance": ["yes", "understand", "okay", "i'll"],
+    "question_asked": ["?"],
+    "directive_given": ["must", "will", "should", "need to"],
+}
+
+
+def message_patterns(content: str) -> Dict[str, bool]:
+    """Interaction-pattern flags of one message."""
+    lowered = content.lower()
+    return {
+        name: any(word in lowered for word in words)
+        for name, words in PATTERN_KEYWORDS.items()
+    }
+
+
+def mention_key(agent_id: str) -> str:
+    """Lowercased name others use to reference an agent ("Worker+Alice" -> "alice")."""
+    return agent_id.split("+")[-1].lower()
+
+
+class ConversationIndex:
+    """
+    Incrementally maintained view of one round's conversation.
+
+    Usage:
+        index = ConversationIndex()
+        messages = index.sync(history)        # once per turn
+        index.references("Worker+Alice")      # messages mentioning "alice"
+        index.recent_patterns()               # flags over the last 3 messages
+    """
+
+    def __init__(self, window: int = 3):
+        """
+        Args:
+            window: Number of recent messages for pattern flags
+        """
+        self.window = window
+        self.messages: List[Dict[str, str]] = []
+        self._lowered: List[str] = []
+        self._mentions: Dict[str, int] = {}
+        self._recent: Deque[Dict[str, bool]] = deque(maxlen=window)
+        self.stats = {"appended": 0, "rebuilds": 0}
+
+    def __len__(self) -> int:
+        return len(self.messages)
+
+    def reset(self) -> None:
+        """Forget all messages (mention keys stay tracked)."""
+        self.messages = []
+        self._lowered = []
+        self._mentions = dict.fromkeys(self._mentions, 0)
+        self._recent.clear()
+
+    def append(self, agent_id: str, content: str) -> None:
+        """Index one new message."""
+        lowered = content.lower()
+        self.messages.append({"agent_id": agent_id, "content": content})
+        self._lowered.append(lowered)
+        for key in self._mentions:
+            if key in lowered:
+                self._mentions[key] += 1
+        self._recent.append(message_patterns(content))
+        self.stats["appended"] += 1
+
+    def checkpoint(self) -> Tuple:
+        """
+        Cheap snapshot for rollback(): message lists are only appended to in
+        place (reset() rebinds them), so their length marks the state.
+        """
+        return (
+            self.messages, self._lowered, len(self.messages),
+            dict(self._mentions), list(self._recent), dict(self.stats)
+        )
+
+    def rollback(self, checkpoint: Tuple) -> None:
+        """Return to the state at checkpoint()."""
+        messages, lowered, length, mentions, recent, stats = checkpoint
+        del messages[length:], lowered[length:]
+        self.messages, self._lowered = messages, lowered
+        self._mentions = dict(mentions)
+        self._recent.clear()
+        self._recent.extend(recent)
+        self.stats = dict(stats)
+
+    def sync(self, history: Sequence[Any]) -> List[Dict[str, str]]:
+        """
+        Bring the index up to date with history and return its message dicts.
+
+        Only messages past the indexed length are processed unless history
+        was rewritten.
+        """
+        known = len(self.messages)
+        if known and (len(history) < known or not self._same(history[known - 1], known - 1)):
+            keep = next(
+                (i for i in range(min(known, len(history))) if not self._same(history[i], i)),
+                min(known, len(history))
+            )
+            kept = self.messages[:keep]
+            self.reset()
+            for message in kept:
+                self.append(message["agent_id"], message["content"])
+            self.stats["rebuilds"] += 1
+            known = keep
+
+        for message in history[known:]:
+            self.append(message_field(message, "agent_id"), message_field(message, "content"))
+        return self.messages
+
+    def _same(self, message: Any, i: int) -> bool:
+        indexed = self.messages[i]
+        return (
+            message_field(message, "content") == indexed["content"]
+            and message_field(message, "agent_id") == indexed["agent_id"]
+        )
+
+    def references(self, agent_id: str) -> int:
+        """Number of messages that mention agent_id's name."""
+        key = mention_key(agent_id)
+        if key not in self._mentions:
+            # First request for this agent: count once, then keep it incremental
+            self._mentions[key] = sum(1 for lowered in self._lowered if key in lowered)
+        return self._mentions[key]
+
+    def recent_patterns(self) -> Dict[str, bool]:
+        """Interaction-pattern flags over the last `window` messages."""
+        return {
+            name: any(flags[name] for flags in self._recent)
+            for name in PATTERN_KEYWORDS
+        }
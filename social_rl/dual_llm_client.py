@@ -15,9 +15,14 @@ Performer (higher temperature):
 - Produces creative, contextually appropriate content
 """
 
-from typing import Optional, Dict, Any, Tuple, List
+from typing import Optional, Dict, Any, Tuple, List, Callable, Iterator
 from dataclasses import dataclass, field
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import asyncio
+import inspect
+import sys
 import time
 
 
@@ -45,6 +50,16 @@ class CoachCritique:
     accepted: bool
 
 
+@dataclass
+class ValidationItem:
+    """One output awaiting coach validation (see DualLLMClient.validate_batch)."""
+    content: str
+    agent_id: str
+    rules: List[str]
+    context: Optional[Dict[str, Any]] = None
+    turn_number: int = 0
+
+
 @dataclass
 class GenerationResult:
     """Result from a generation with optional validation."""
@@ -56,6 +71,7 @@ class GenerationResult:
     retries: int = 0
     coach_critiques: List[CoachCritique] = field(default_factory=list)
     duration_seconds: float = 0.0
+    stream_cancelled: bool = False  # Final content was cut short by stream_guard
 
 
 class LLMClientProtocol(ABC):
@@ -73,6 +89,78 @@ class LLMClientProtocol(ABC):
         pass
 
 
+def consume_stream(
+    deltas: Iterator[str],
+    on_delta: Optional[Callable[[str, str], None]] = None,
+    stream_guard: Optional[Callable[[str], Optional[str]]] = None,
+    stream_settled: Optional[Callable[[str], int]] = None
+) -> Tuple[str, bool]:
+    """
+    Accumulate a token stream, optionally cancelling it early.
+
+    With a stream_guard, on_delta only ever sees text the guard has let
+    through, so the streamed deltas always add up to the returned text:
+    deltas are held back up to stream_settled(text_so_far), and on
+    cancellation only the kept text not yet streamed is emitted. Without
+    stream_settled everything is held back until the stream ends.
+
+    Args:
+        deltas: Text deltas (e.g. from a client's stream_message)
+        on_delta: Called with (delta, text_so_far) for every delta
+        stream_guard: Called with text_so_far; return None to keep going,
+            or the text to keep (a prefix of text_so_far) to cancel the
+            generation
+        stream_settled: Called with text_so_far; returns the length of its
+            prefix that stream_guard can no longer cut
+
+    Returns:
+        Tuple of (text, cancelled)
+    """
+    text = ""
+    emitted = 0
+
+    def emit(upto: str) -> None:
+        nonlocal emitted
+        if on_delta and len(upto) > emitted:
+            on_delta(upto[emitted:], upto)
+        emitted = max(emitted, len(upto))
+
+    try:
+        for delta in deltas:
+            text += delta
+            if not stream_guard:
+                emit(text)
+                continue
+            kept = stream_guard(text)
+            if kept is not None:
+                emit(kept)
+                return kept, True
+            if stream_settled:
+                emit(text[:stream_settled(text)])
+    finally:
+        # Closing the generator closes the HTTP stream -> server stops decoding
+        close = getattr(deltas, "close", None)
+        if close:
+            close()
+    emit(text)
+    return text, False
+
+
+class AsyncLLMClientProtocol(ABC):
+    """Protocol for async LLM clients used with DualLLMClient.agenerate*."""
+
+    @abstractmethod
+    async def send_message(
+        self,
+        system_prompt: str,
+        user_message: str,
+        temperature: float = 0.7,
+        max_tokens: int = 512
+    ) -> str:
+        """Send a message and await a response."""
+        pass
+
+
 class DualLLMClient:
     """
     Dual-LLM client implementing Coach/Performer architecture.
@@ -97,11 +185,15 @@ class DualLLMClient:
         )
     """
 
+    # Default cap on concurrent coach requests in validate_batch / avalidate_batch
+    MAX_BATCH_CONCURRENCY = 8
+
     def __init__(
         self,
         performer_client: LLMClientProtocol,
         coach_client: Optional[LLMClientProtocol] = None,
-        config: Optional[DualLLMConfig] = None
+        config: Optional[DualLLMConfig] = None,
+        http_session: Optional[Any] = None
     ):
         """
         Initialize dual-LLM client.
@@ -110,12 +202,30 @@ class DualLLMClient:
             performer_client: LLM client for generation
             coach_client: LLM client for validation (defaults to performer_client)
             config: Configuration options
+            http_session: Async HTTP session shared by the clients; closed by aclose()
         """
         self.performer = performer_client
         self.coach = coach_client or performer_client
         self.config = config or DualLLMConfig()
+        self.http_session = http_session
         self._critique_log: List[CoachCritique] = []
 
+    async def aclose(self) -> None:
+        """Close the shared HTTP session and any sessions the clients own."""
+        clients = [self.performer] if self.coach is self.performer else [self.performer, self.coach]
+        for client in clients:
+            if inspect.iscoroutinefunction(getattr(client, "aclose", None)):
+                await client.aclose()
+        if self.http_session is not None:
+            await self.http_session.aclose()
+            self.http_session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+
     def generate(
         self,
         system_prompt: str,
@@ -135,16 +245,7 @@ class DualLLMClient:
         Returns:
             Generated text response
         """
-        if mode == "performer":
-            client = self.performer
-            temp = self.config.performer_temperature
-            tokens = max_tokens or self.config.performer_max_tokens
-        elif mode == "coach":
-            client = self.coach
-            temp = self.config.coach_temperature
-            tokens = max_tokens or self.config.coach_max_tokens
-        else:
-            raise ValueError(f"Unknown mode: {mode}. Use 'performer' or 'coach'.")
+        client, temp, tokens = self._resolve_mode(mode, max_tokens)
 
         return client.send_message(
             system_prompt=system_prompt,
@@ -153,6 +254,56 @@ class DualLLMClient:
             max_tokens=tokens
         )
 
+    def generate_stream(
+        self,
+        system_prompt: str,
+        user_message: str,
+        mode: str = "performer",
+        max_tokens: Optional[int] = None
+    ) -> Iterator[str]:
+        """
+        Stream a response as text deltas.
+
+        Uses the client's stream_message() when available; clients without
+        streaming support yield their full response as a single delta.
+        """
+        client, temp, tokens = self._resolve_mode(mode, max_tokens)
+
+        if hasattr(client, "stream_message"):
+            yield from client.stream_message(
+                system_prompt=system_prompt,
+                user_message=user_message,
+                temperature=temp,
+                max_tokens=tokens
+            )
+        else:
+            yield client.send_message(
+                system_prompt=system_prompt,
+                user_message=user_message,
+                temperature=temp,
+                max_tokens=tokens
+            )
+
+    def _resolve_mode(
+        self,
+        mode: str,
+        max_tokens: Optional[int] = None
+    ) -> Tuple[Any, float, int]:
+        """Return (client, temperature, max_tokens) for a generation mode."""
+        if mode == "performer":
+            return (
+                self.performer,
+                self.config.performer_temperature,
+                max_tokens or self.config.performer_max_tokens
+            )
+        elif mode == "coach":
+            return (
+                self.coach,
+                self.config.coach_temperature,
+                max_tokens or self.config.coach_max_tokens
+            )
+        raise ValueError(f"Unknown mode: {mode}. Use 'performer' or 'coach'.")
+
     def generate_validated(
         self,
         system_prompt: str,
@@ -160,7 +311,12 @@ class DualLLMClient:
         agent_id: str,
         rules: List[str],
         context: Optional[Dict[str, Any]] = None,
-        turn_number: int = 0
+        turn_number: int = 0,
+        on_delta: Optional[Callable[[str, str], None]] = None,
+        stream_guard: Optional[Callable[[str], Optional[str]]] = None,
+        stream_settled: Optional[Callable[[str], int]] = None,
+        draft: Optional[str] = None,
+        draft_validation: Optional[Tuple[bool, List[str], Optional[str]]] = None
     ) -> GenerationResult:
         """
         Generate a response with coach validation.
@@ -169,6 +325,10 @@ class DualLLMClient:
         against rules. If violations are found, the performer regenerates
         with corrective feedback.
 
+        A pipelined caller that already holds the performer's first output
+        (and possibly the coach's verdict on it) passes them as draft /
+        draft_validation; the rest of the loop is unchanged.
+
         Args:
             system_prompt: System prompt for performer
             user_message: User message/context
@@ -176,6 +336,11 @@ class DualLLMClient:
             rules: List of rules to validate against
             context: Additional context for validation
             turn_number: Current turn number
+            on_delta: Stream performer tokens, called with (delta, text_so_far)
+            stream_guard: Cancel a performer stream early (see consume_stream)
+            stream_settled: How much of the stream stream_guard can no longer cut
+            draft: Initial performer output to validate instead of generating
+            draft_validation: Coach verdict (is_valid, violations, suggested) for draft
 
         Returns:
             GenerationResult with content, validation status, and critiques
@@ -183,14 +348,127 @@ class DualLLMClient:
         start_time = time.time()
         critiques = []
         retries = 0
+        streaming = on_delta is not None or stream_guard is not None
+        cancelled = False
+
+        def perform(prompt: str) -> Tuple[str, bool]:
+            if not streaming:
+                return self.generate(prompt, user_message, mode="performer"), False
+            return consume_stream(
+                self.generate_stream(prompt, user_message, mode="performer"),
+                on_delta, stream_guard, stream_settled
+            )
 
         # Initial generation
-        content = self.generate(system_prompt, user_message, mode="performer")
+        if draft is not None:
+            content = draft
+        else:
+            content, cancelled = perform(system_prompt)
 
         # Validation loop
         for attempt in range(self.config.max_validation_retries + 1):
-            # Validate with coach
-            is_valid, violations, suggested = self._validate_with_coach(
+            # Validate with coach (the draft's verdict may already be known)
+            if attempt == 0 and draft is not None and draft_validation is not None:
+                is_valid, violations, suggested = draft_validation
+            else:
+                is_valid, violations, suggested = self.validate(
+                    content=content,
+                    agent_id=agent_id,
+                    rules=rules,
+                    context=context
+                )
+
+            if is_valid:
+                break
+
+            # Log critique
+            critique = self._make_critique(
+                agent_id, turn_number, content, violations, suggested
+            )
+            critiques.append(critique)
+            self._critique_log.append(critique)
+
+            if attempt < self.config.max_validation_retries:
+                # Regenerate with corrective feedback
+                retries += 1
+                corrective_prompt = self._build_corrective_prompt(
+                    system_prompt, violations, suggested
+                )
+                content, cancelled = perform(corrective_prompt)
+
+        duration = time.time() - start_time
+
+        return GenerationResult(
+            content=content,
+            agent_id=agent_id,
+            mode="performer",
+            temperature=self.config.performer_temperature,
+            validation_passed=len(critiques) == 0 or critiques[-1].accepted if critiques else True,
+            retries=retries,
+            coach_critiques=critiques,
+            duration_seconds=duration,
+            stream_cancelled=cancelled
+        )
+
+    # =========================================================================
+    # Async generation (keeps performer/coach requests in flight concurrently)
+    # =========================================================================
+
+    async def agenerate(
+        self,
+        system_prompt: str,
+        user_message: str,
+        mode: str = "performer",
+        max_tokens: Optional[int] = None
+    ) -> str:
+        """
+        Async version of generate().
+
+        Awaits the client directly if its send_message is a coroutine
+        (e.g. local_rcm AsyncOpenAIClient / AsyncOllamaClient); otherwise
+        runs the blocking client in a worker thread so the event loop stays free.
+        """
+        client, temp, tokens = self._resolve_mode(mode, max_tokens)
+
+        if inspect.iscoroutinefunction(client.send_message):
+            return await client.send_message(
+                system_prompt=system_prompt,
+                user_message=user_message,
+                temperature=temp,
+                max_tokens=tokens
+            )
+        return await asyncio.to_thread(
+            client.send_message,
+            system_prompt=system_prompt,
+            user_message=user_message,
+            temperature=temp,
+            max_tokens=tokens
+        )
+
+    async def agenerate_validated(
+        self,
+        system_prompt: str,
+        user_message: str,
+        agent_id: str,
+        rules: List[str],
+        context: Optional[Dict[str, Any]] = None,
+        turn_number: int = 0
+    ) -> GenerationResult:
+        """
+        Async version of generate_validated().
+
+        Same performer -> coach -> corrective-regeneration loop; many of these
+        can be awaited together (e.g. with asyncio.gather) to keep several
+        generations in flight against the same servers.
+        """
+        start_time = time.time()
+        critiques = []
+        retries = 0
+
+        content = await self.agenerate(system_prompt, user_message, mode="performer")
+
+        for attempt in range(self.config.max_validation_retries + 1):
+            is_valid, violations, suggested = await self.avalidate(
                 content=content,
                 agent_id=agent_id,
                 rules=rules,
@@ -200,27 +478,18 @@ class DualLLMClient:
             if is_valid:
                 break
 
-            # Log critique
-            critique = CoachCritique(
-                agent_id=agent_id,
-                turn_number=turn_number,
-                original_content=content,
-                critique=f"Violations: {', '.join(violations)}",
-                violations=violations,
-                suggested_revision=suggested,
-                timestamp=time.time(),
-                accepted=False
+            critique = self._make_critique(
+                agent_id, turn_number, content, violations, suggested
             )
             critiques.append(critique)
             self._critique_log.append(critique)
 
             if attempt < self.config.max_validation_retries:
-                # Regenerate with corrective feedback
                 retries += 1
                 corrective_prompt = self._build_corrective_prompt(
                     system_prompt, violations, suggested
                 )
-                content = self.generate(corrective_prompt, user_message, mode="performer")
+                content = await self.agenerate(corrective_prompt, user_message, mode="performer")
 
         duration = time.time() - start_time
 
@@ -235,7 +504,40 @@ class DualLLMClient:
             duration_seconds=duration
         )
 
-    def _validate_with_coach(
+    async def avalidate_batch(
+        self,
+        items: List[ValidationItem],
+        max_concurrency: Optional[int] = None,
+        log_critiques: bool = True
+    ) -> List[Optional[CoachCritique]]:
+        """
+        Async version of validate_batch(): coach requests are awaited together,
+        at most max_concurrency (default MAX_BATCH_CONCURRENCY) at a time.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency or self.MAX_BATCH_CONCURRENCY)
+
+        async def validate_item(item: ValidationItem):
+            async with semaphore:
+                return await self.avalidate(item.content, item.agent_id, item.rules, item.context)
+
+        outcomes = await asyncio.gather(*[validate_item(item) for item in items])
+        return self._collect_batch_critiques(items, outcomes, log_critiques)
+
+    async def avalidate(
+        self,
+        content: str,
+        agent_id: str,
+        rules: List[str],
+        context: Optional[Dict[str, Any]] = None
+    ) -> Tuple[bool, List[str], Optional[str]]:
+        """Async version of validate()."""
+        validation_prompt = self._build_validation_prompt(agent_id, rules, context)
+        validation_request = self._build_validation_request(content, agent_id)
+
+        response = await self.agenerate(validation_prompt, validation_request, mode="coach")
+        return self._parse_validation_response(response)
+
+    def validate(
         self,
         content: str,
         agent_id: str,
@@ -249,7 +551,89 @@ class DualLLMClient:
             Tuple of (is_valid, violations, suggested_revision)
         """
         validation_prompt = self._build_validation_prompt(agent_id, rules, context)
-        validation_request = f"""
+        validation_request = self._build_validation_request(content, agent_id)
+
+        response = self.generate(validation_prompt, validation_request, mode="coach")
+        return self._parse_validation_response(response)
+
+    def validate_batch(
+        self,
+        items: List[ValidationItem],
+        max_workers: Optional[int] = None,
+        log_critiques: bool = True
+    ) -> List[Optional[CoachCritique]]:
+        """
+        Validate several outputs with the coach in one parallel fan-out.
+
+        Each item gets exactly the coach request the single-item path would
+        send, so verdicts match generate_validated() (and hit the same
+        response cache entries); only the round-trips overlap.
+
+        Args:
+            items: Outputs to validate
+            max_workers: Concurrent coach requests (default: up to
+                MAX_BATCH_CONCURRENCY, never more than one per item)
+            log_critiques: Append critiques to critique_log (in item order)
+
+        Returns:
+            Per-item CoachCritique, or None where the output passed
+        """
+        if not items:
+            return []
+
+        workers = max_workers or min(len(items), self.MAX_BATCH_CONCURRENCY)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            outcomes = list(pool.map(
+                lambda item: self.validate(
+                    item.content, item.agent_id, item.rules, item.context
+                ),
+                items
+            ))
+        return self._collect_batch_critiques(items, outcomes, log_critiques)
+
+    def _collect_batch_critiques(
+        self,
+        items: List[ValidationItem],
+        outcomes: List[Tuple[bool, List[str], Optional[str]]],
+        log_critiques: bool
+    ) -> List[Optional[CoachCritique]]:
+        """Turn per-item validation outcomes into critiques (None = valid)."""
+        critiques = []
+        for item, (is_valid, violations, suggested) in zip(items, outcomes):
+            if is_valid:
+                critiques.append(None)
+                continue
+            critique = self._make_critique(
+                item.agent_id, item.turn_number, item.content, violations, suggested
+            )
+            critiques.append(critique)
+            if log_critiques:
+                self._critique_log.append(critique)
+        return critiques
+
+    def _make_critique(
+        self,
+        agent_id: str,
+        turn_number: int,
+        content: str,
+        violations: List[str],
+        suggested: Optional[str]
+    ) -> CoachCritique:
+        """Build the CoachCritique recorded for a rejected output."""
+        return CoachCritique(
+            agent_id=agent_id,
+            turn_number=turn_number,
+            original_content=content,
+            critique=f"Violations: {', '.join(violations)}",
+            violations=violations,
+            suggested_revision=suggested,
+            timestamp=time.time(),
+            accepted=False
+        )
+
+    def _build_validation_request(self, content: str, agent_id: str) -> str:
+        """Build the coach's validation request for a single output."""
+        return f"""
 Validate this agent response:
 
 Agent: {agent_id}
@@ -261,9 +645,8 @@ VIOLATIONS: [comma-separated list or "none"]
 SUGGESTION: [brief suggestion for improvement or "none"]
 """
 
-        response = self.generate(validation_prompt, validation_request, mode="coach")
-
-        # Parse validation response
+    def _parse_validation_response(self, response: str) -> Tuple[bool, List[str], Optional[str]]:
+        """Parse a coach VALID/VIOLATIONS/SUGGESTION response."""
         is_valid = "VALID: yes" in response.lower() or "valid: yes" in response.lower()
         violations = []
         suggested = None
@@ -486,6 +869,30 @@ def create_true_dual_llm(
             )
             return response.choices[0].message.content
 
+        def stream_message(
+            self,
+            system_prompt: str,
+            user_message: str,
+            temperature: float = 0.7,
+            max_tokens: int = 512
+        ) -> Iterator[str]:
+            stream = self.client.chat.completions.create(
+                model=self.model,
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_message}
+                ],
+                temperature=temperature,
+                max_tokens=max_tokens,
+                stream=True
+            )
+            try:
+                for chunk in stream:
+                    if chunk.choices and chunk.choices[0].delta.content:
+                        yield chunk.choices[0].delta.content
+            finally:
+                stream.close()
+
     # Create separate clients
     performer_client = VLLMClient(performer_base_url, performer_model, api_key, timeout)
     coach_client = VLLMClient(coach_base_url, coach_model, api_key, timeout)
@@ -497,3 +904,67 @@ def create_true_dual_llm(
     )
 
     return DualLLMClient(performer_client, coach_client, config)
+
+
+def create_async_true_dual_llm(
+    performer_base_url: str,
+    performer_model: str,
+    coach_base_url: str,
+    coach_model: str,
+    performer_temp: float = 0.7,
+    coach_temp: float = 0.1,
+    api_key: str = "not-needed",
+    timeout: float = 180.0,
+    max_concurrency: int = 8
+) -> DualLLMClient:
+    """
+    Async counterpart of create_true_dual_llm().
+
+    Performer and coach are local_rcm AsyncOpenAIClients sharing one pooled
+    keep-alive session (create_async_http_session), and each endpoint gets
+    its own in-flight cap (max_concurrency). Use the returned client's
+    agenerate()/agenerate_validated() methods, and close the session with
+    `await dual.aclose()` (or `async with dual:`).
+
+    Example:
+        dual = create_async_true_dual_llm(
+            performer_base_url="https://a100-pod-8000.proxy.runpod.net/v1",
+            performer_model="Qwen/Qwen2.5-14B-Instruct",
+            coach_base_url="https://a40-pod-8000.proxy.runpod.net/v1",
+            coach_model="Qwen/Qwen2.5-7B-Instruct"
+        )
+        async with dual:
+            results = await asyncio.gather(*[dual.agenerate_validated(...) for ...])
+    """
+    # local_rcm uses flat imports (same pattern as agents/agent_runner.py)
+    local_rcm = str(Path(__file__).parent.parent / "local_rcm")
+    if local_rcm not in sys.path:
+        sys.path.insert(0, local_rcm)
+    from llm_client import AsyncOpenAIClient, create_async_http_session
+
+    http_session = create_async_http_session(
+        max_connections=max_concurrency * 4,
+        max_keepalive_connections=max_concurrency * 2,
+        timeout=timeout
+    )
+
+    def endpoint(base_url: str, model: str) -> AsyncOpenAIClient:
+        return AsyncOpenAIClient(
+            api_key=api_key,
+            model=model,
+            base_url=base_url,
+            timeout=timeout,
+            max_concurrency=max_concurrency,
+            http_client=http_session
+        )
+
+    performer_client = endpoint(performer_base_url, performer_model)
+    coach_client = endpoint(coach_base_url, coach_model)
+
+    config = DualLLMConfig(
+        performer_temperature=performer_temp,
+        coach_temperature=coach_temp,
+        log_coach_critiques=True
+    )
+
+    return DualLLMClient(performer_client, coach_client, config, http_session=http_session)
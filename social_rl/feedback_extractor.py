@@ -11,12 +11,35 @@ This is the "reward function" for Social RL, but it emerges from
 interaction rather than being externally defined.
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from typing import Dict, Any, List, Optional, Set, Tuple
 from collections import defaultdict
 import re
 import json
 
+from .lexicon import LexiconMatcher
+
+
+# Directive (imperative) and compliance (agreement) patterns; each pattern
+# that matches a message adds one to the count
+DIRECTIVE_PATTERNS = [
+    re.compile(r"\b(must|should|need to|have to|will)\b", re.IGNORECASE),
+    re.compile(r"\b(do this|complete|finish|start|begin)\b", re.IGNORECASE),
+    re.compile(r"\b(i want you to|you will|you must)\b", re.IGNORECASE),
+]
+COMPLIANCE_PATTERNS = [
+    re.compile(r"\b(yes|okay|understood|i('ll| will)|certainly|of course)\b", re.IGNORECASE),
+    re.compile(r"\b(right away|immediately|i understand)\b", re.IGNORECASE),
+]
+
+# Openings that usually start a new topic
+TOPIC_SHIFT_PATTERN = re.compile(
+    r"^(now|next|let's|moving on|another thing)"
+    r"|^(i think|in my view|actually)"
+    r"|^(what about|have you considered|shouldn't we)",
+    re.IGNORECASE
+)
+
 
 @dataclass
 class SocialFeedback:
@@ -57,6 +80,12 @@ class SocialFeedback:
             "synthesis_inclusion": self.synthesis_inclusion
         }
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SocialFeedback":
+        """Rebuild from to_dict() (or dataclasses.asdict()) output."""
+        known = cls.__dataclass_fields__
+        return cls(**{k: v for k, v in data.items() if k in known})
+
     def as_reward_signal(self) -> Dict[str, float]:
         """Convert to simple reward signal dict."""
         return {
@@ -163,66 +192,27 @@ class SocialFeedbackExtractor:
         Returns:
             Dict mapping agent_id to SocialFeedback
         """
-        feedback = {
-            pid: SocialFeedback(agent_id=pid, round_number=round_number)
-            for pid in participants
-        }
-
-        # Build name mapping (Worker+Alice -> Alice, alice)
-        name_map = self._build_name_map(participants)
-
-        # Process each message
-        for i, msg in enumerate(messages):
-            speaker_id = msg.get("agent_id", "")
-            content = msg.get("content", "")
-
-            if speaker_id not in feedback:
-                continue
-
-            speaker_fb = feedback[speaker_id]
-
-            # 1. Detect concept embodiment in this message
-            concepts = self._detect_concepts(content)
-            speaker_fb.concepts_embodied.extend(concepts)
-
-            # 2. Count social behaviors
-            social_counts = self._count_social_behaviors(content)
-            speaker_fb.questions_asked += social_counts["questions"]
-            speaker_fb.directives_given += social_counts["directives"]
-            speaker_fb.compliance_shown += social_counts["compliance"]
-
-            # 3. Check if this message initiates a new topic
-            if i == 0 or self._is_topic_shift(content, messages[i-1].get("content", "")):
-                speaker_fb.initiated_exchanges += 1
-
-            # 4. Check for references to other agents
-            for other_id in participants:
-                if other_id == speaker_id:
-                    continue
-                names = name_map.get(other_id, set())
-                if any(name.lower() in content.lower() for name in names):
-                    feedback[other_id].direct_references += 1
-                    feedback[other_id].response_received += 1
+        accumulator = self.start_round(round_number, participants)
+        accumulator.extend(messages)
+        return accumulator.finalize(synthesis)
 
-        # 5. Extract analyst feedback if analyst messages exist
-        analyst_messages = [m for m in messages if self.analyst_id in m.get("agent_id", "")]
-        if analyst_messages:
-            self._extract_analyst_feedback(analyst_messages, feedback, name_map)
-
-        # 6. Process synthesis inclusion
-        if synthesis:
-            self._extract_synthesis_inclusion(synthesis, feedback, name_map)
-
-        # 7. Calculate aggregate scores
-        for agent_id, fb in feedback.items():
-            fb.engagement = self._calculate_engagement(fb, len(messages))
-            fb.theoretical_alignment = self._calculate_alignment(fb)
-            fb.contribution_value = self._calculate_contribution(fb, len(participants))
+    def start_round(self, round_number: int, participants: List[str]) -> "RoundFeedbackAccumulator":
+        """
+        Begin incremental extraction for a round.
 
-        # Store for cumulative access
-        self.round_feedback[round_number] = feedback
+        Feed messages to the returned accumulator as they are produced;
+        its finalize() gives the same feedback as extract_round_feedback()
+        over the full transcript.
+        """
+        return RoundFeedbackAccumulator(self, round_number, participants)
 
-        return feedback
+    @staticmethod
+    def _build_name_matcher(name_map: Dict[str, Set[str]]) -> LexiconMatcher:
+        """One matcher over every participant's lowercased name aliases."""
+        return LexiconMatcher({
+            pid: {"names": sorted({name.lower() for name in names})}
+            for pid, names in name_map.items()
+        })
 
     def _build_name_map(self, participants: List[str]) -> Dict[str, Set[str]]:
         """Build mapping from agent_id to possible name references."""
@@ -263,23 +253,14 @@ class SocialFeedbackExtractor:
         # Questions
         counts["questions"] = content.count("?")
 
-        # Directives (imperative patterns)
-        directive_patterns = [
-            r"\b(must|should|need to|have to|will)\b",
-            r"\b(do this|complete|finish|start|begin)\b",
-            r"\b(i want you to|you will|you must)\b"
-        ]
-        for pattern in directive_patterns:
-            if re.search(pattern, content, re.IGNORECASE):
+        # Directives (imperative patterns) - one count per pattern that matches
+        for pattern in DIRECTIVE_PATTERNS:
+            if pattern.search(content):
                 counts["directives"] += 1
 
         # Compliance (agreement patterns)
-        compliance_patterns = [
-            r"\b(yes|okay|understood|i('ll| will)|certainly|of course)\b",
-            r"\b(right away|immediately|i understand)\b"
-        ]
-        for pattern in compliance_patterns:
-            if re.search(pattern, content, re.IGNORECASE):
+        for pattern in COMPLIANCE_PATTERNS:
+            if pattern.search(content):
                 counts["compliance"] += 1
 
         return counts
@@ -287,15 +268,7 @@ class SocialFeedbackExtractor:
     def _is_topic_shift(self, current: str, previous: str) -> bool:
         """Detect if current message shifts the topic."""
         # Simple heuristic: new topics often start with certain patterns
-        topic_shift_patterns = [
-            r"^(now|next|let's|moving on|another thing)",
-            r"^(i think|in my view|actually)",
-            r"^(what about|have you considered|shouldn't we)"
-        ]
-        for pattern in topic_shift_patterns:
-            if re.search(pattern, current, re.IGNORECASE):
-                return True
-        return False
+        return TOPIC_SHIFT_PATTERN.search(current) is not None
 
     def _extract_analyst_feedback(
         self,
@@ -305,16 +278,14 @@ class SocialFeedbackExtractor:
     ):
         """Extract feedback from analyst's observations."""
         analyst_text = " ".join(m.get("content", "") for m in analyst_messages)
+        found = self._build_name_matcher(name_map).find(analyst_text.lower())
 
         for agent_id, names in name_map.items():
             if agent_id == self.analyst_id:
                 continue
 
             # Count how many times analyst mentions this agent
-            mentions = sum(
-                1 for name in names
-                if name.lower() in analyst_text.lower()
-            )
+            mentions = sum(1 for name in names if name.lower() in found)
             feedback[agent_id].analyst_mentions = mentions
 
             # Check if analyst associates agent with concepts
@@ -452,6 +423,132 @@ class SocialFeedbackExtractor:
         return "\n".join(report)
 
 
+class RoundFeedbackAccumulator:
+    """
+    Running social feedback for one round, updated one message at a time.
+
+    Per-message signals (concepts, social behaviors, topic shifts, name
+    references) are counted once as messages arrive, so checking feedback
+    mid-round costs the same on turn 30 as on turn 3. Round-level signals
+    (analyst observations, synthesis, aggregate scores) are derived from the
+    running counts in snapshot().
+    """
+
+    def __init__(
+        self,
+        extractor: SocialFeedbackExtractor,
+        round_number: int,
+        participants: List[str]
+    ):
+        self.extractor = extractor
+        self.round_number = round_number
+        self.participants = list(participants)
+        self.feedback = {
+            pid: SocialFeedback(agent_id=pid, round_number=round_number)
+            for pid in self.participants
+        }
+        # Build name mapping (Worker+Alice -> Alice, alice)
+        self.name_map = extractor._build_name_map(self.participants)
+        self._name_matcher = extractor._build_name_matcher(self.name_map)
+        self._name_aliases = {
+            pid: {name.lower() for name in names} for pid, names in self.name_map.items()
+        }
+
+        self.message_count = 0
+        self._previous_content = ""
+        self._analyst_messages: List[Dict[str, Any]] = []
+
+    def add_message(self, message: Dict[str, Any]) -> None:
+        """Fold one message (agent_id, content) into the running counts."""
+        extractor = self.extractor
+        speaker_id = message.get("agent_id", "")
+        content = message.get("content", "")
+
+        is_first = self.message_count == 0
+        previous = self._previous_content
+        self.message_count += 1
+        self._previous_content = content
+
+        if extractor.analyst_id in speaker_id:
+            self._analyst_messages.append(message)
+
+        if speaker_id not in self.feedback:
+            return
+
+        speaker_fb = self.feedback[speaker_id]
+
+        # 1. Detect concept embodiment in this message
+        speaker_fb.concepts_embodied.extend(extractor._detect_concepts(content))
+
+        # 2. Count social behaviors
+        social_counts = extractor._count_social_behaviors(content)
+        speaker_fb.questions_asked += social_counts["questions"]
+        speaker_fb.directives_given += social_counts["directives"]
+        speaker_fb.compliance_shown += social_counts["compliance"]
+
+        # 3. Check if this message initiates a new topic
+        if is_first or extractor._is_topic_shift(content, previous):
+            speaker_fb.initiated_exchanges += 1
+
+        # 4. Check for references to other agents (all aliases in one pass)
+        found = self._name_matcher.find(content.lower())
+        if not found:
+            return
+        for other_id in self.participants:
+            if other_id == speaker_id:
+                continue
+            if not found.isdisjoint(self._name_aliases.get(other_id, ())):
+                self.feedback[other_id].direct_references += 1
+                self.feedback[other_id].response_received += 1
+
+    def extend(self, messages: List[Dict[str, Any]]) -> None:
+        for message in messages:
+            self.add_message(message)
+
+    def snapshot(
+        self,
+        synthesis: Optional[str] = None,
+        round_number: Optional[int] = None
+    ) -> Dict[str, SocialFeedback]:
+        """
+        Feedback for the messages seen so far (running counts are untouched).
+
+        Args:
+            synthesis: Optional final synthesis text
+            round_number: Round stamped on the snapshot (default: this round)
+        """
+        extractor = self.extractor
+        feedback = {
+            pid: replace(fb, concepts_embodied=list(fb.concepts_embodied))
+            for pid, fb in self.feedback.items()
+        }
+        if round_number is not None:
+            for fb in feedback.values():
+                fb.round_number = round_number
+
+        # 5. Extract analyst feedback if analyst messages exist
+        if self._analyst_messages:
+            extractor._extract_analyst_feedback(self._analyst_messages, feedback, self.name_map)
+
+        # 6. Process synthesis inclusion
+        if synthesis:
+            extractor._extract_synthesis_inclusion(synthesis, feedback, self.name_map)
+
+        # 7. Calculate aggregate scores
+        for fb in feedback.values():
+            fb.engagement = extractor._calculate_engagement(fb, self.message_count)
+            fb.theoretical_alignment = extractor._calculate_alignment(fb)
+            fb.contribution_value = extractor._calculate_contribution(fb, len(self.participants))
+
+        return feedback
+
+    def finalize(self, synthesis: Optional[str] = None) -> Dict[str, SocialFeedback]:
+        """Final feedback for the round, stored in the extractor's round_feedback."""
+        feedback = self.snapshot(synthesis)
+        self.extractor.round_feedback[self.round_number] = feedback
+        return feedback
+
+
 # Convenience function
 def create_extractor_for_framework(framework_option: str, analyst_id: str = None) -> SocialFeedbackExtractor:
     """Create extractor for a specific framework option."""
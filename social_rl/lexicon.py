@@ -0,0 +1,82 @@
+"""
+Lexicon - Single-pass multi-pattern matching over marker lexicons.
+
+Shared by the semiotic coder (justification / voice / stance markers) and
+the feedback extractor (participant name aliases). pyahocorasick is used
+when installed; otherwise matching falls back to one substring search per
+marker with identical results.
+"""
+
+from typing import Dict, List
+
+
+class LexiconMatcher:
+    """
+    Multi-pattern matcher for a set of marker lexicons.
+
+    Built once per marker set. match() finds every marker of every
+    category in one pass over the (lowercased) text and returns the hits
+    per category in lexicon order - exactly the lists a separate
+    `marker in text` scan per marker would produce.
+
+    With pyahocorasick installed the pass is an Aho-Corasick automaton
+    (one scan of the text however many markers there are). Otherwise each
+    marker gets one C-level substring search, which in CPython is faster
+    than any regex- or pure-Python automaton.
+    """
+
+    def __init__(self, lexicons: Dict[str, Dict[str, List[str]]]):
+        self.lexicons = {
+            name: {category: list(markers) for category, markers in categories.items()}
+            for name, categories in lexicons.items()
+        }
+        self.markers = list(dict.fromkeys(
+            marker
+            for categories in self.lexicons.values()
+            for markers in categories.values()
+            for marker in markers
+        ))
+        self._automaton = self._build_automaton([m for m in self.markers if m])
+
+    @staticmethod
+    def _build_automaton(markers: List[str]):
+        try:
+            import ahocorasick
+        except ImportError:
+            return None
+        if not markers:
+            return None
+        automaton = ahocorasick.Automaton()
+        for marker in markers:
+            automaton.add_word(marker, marker)
+        automaton.make_automaton()
+        return automaton
+
+    def find(self, text: str) -> set:
+        """Set of distinct markers occurring in text."""
+        if self._automaton is not None:
+            found = {marker for _, marker in self._automaton.iter(text)}
+            if "" in self.markers:
+                found.add("")
+            return found
+        return {marker for marker in self.markers if marker in text}
+
+    def match(self, text: str) -> Dict[str, Dict[str, List[str]]]:
+        """Markers found in text, as {lexicon: {category: [markers]}}."""
+        if self._automaton is None:
+            return {
+                name: {
+                    category: [m for m in markers if m in text]
+                    for category, markers in categories.items()
+                }
+                for name, categories in self.lexicons.items()
+            }
+
+        found = self.find(text)
+        return {
+            name: {
+                category: [m for m in markers if m in found]
+                for category, markers in categories.items()
+            }
+            for name, categories in self.lexicons.items()
+        }
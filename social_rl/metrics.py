@@ -13,8 +13,7 @@ Metrics computed:
 
 import re
 from dataclasses import dataclass, field
-from typing import Dict, List, Any, Optional
-from collections import defaultdict
+from typing import Dict, List, Any, Optional, Iterable, Tuple
 
 
 # Pattern definitions for marker detection
@@ -58,6 +57,118 @@ ALIENATION_PATTERNS = [
 ]
 
 
+def _has_top_level_alternation(pattern: str) -> bool:
+    """True if pattern contains a | outside any group or character class."""
+    depth = 0
+    in_class = False
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == "\\":
+            i += 2
+            continue
+        if in_class:
+            in_class = char != "]"
+        elif char == "[":
+            in_class = True
+            # A ] right after [ or [^ is a literal member
+            if pattern[i + 1:i + 2] == "^":
+                i += 1
+            if pattern[i + 1:i + 2] == "]":
+                i += 1
+        elif char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif char == "|" and depth == 0:
+            return True
+        i += 1
+    return False
+
+
+class PatternSet:
+    """
+    A pattern list compiled into one alternation with a named group per pattern.
+
+    One search of the combined regex answers "does any pattern match?".
+    first_match() returns what searching the patterns one by one, in list
+    order, would: the combined match names the matching pattern
+    (match.lastgroup), and only the patterns listed before it need a
+    separate check.
+    """
+
+    def __init__(self, patterns: List[str], flags: int = re.IGNORECASE):
+        self.patterns = [re.compile(p, flags) for p in patterns]
+        self.combined = re.compile(self._combine(patterns), flags) if patterns else None
+
+    @staticmethod
+    def _combine(patterns: List[str]) -> str:
+        """
+        Join patterns into one alternation of named groups.
+
+        CPython's re tries every alternative at every position, so when all
+        patterns start with \\b and a literal letter, the shared \\b and a
+        lookahead on the possible first letters are hoisted in front of the
+        alternation; most positions are then rejected before any branch
+        runs. A pattern with a top-level | has branches that need not start
+        that way, so any such pattern disables the hoist. The matches (and
+        group spans) are the same either way.
+        """
+        if all(
+            p.startswith(r"\b") and p[2:3].isalpha() and p[3:4] not in ("?", "*", "{")
+            and not _has_top_level_alternation(p)
+            for p in patterns
+        ):
+            first_letters = "".join(sorted({p[2] for p in patterns}))
+            branches = "|".join(f"(?P<p{i}>{p[2:]})" for i, p in enumerate(patterns))
+            return rf"\b(?=[{first_letters}])(?:{branches})"
+        return "|".join(f"(?P<p{i}>{p})" for i, p in enumerate(patterns))
+
+    def any(self, text: str) -> bool:
+        return self.combined is not None and self.combined.search(text) is not None
+
+    def first_match(self, text: str) -> Optional[Tuple[int, str]]:
+        """(index, matched text) of the first pattern in list order that matches."""
+        if self.combined is None:
+            return None
+        match = self.combined.search(text)
+        if match is None:
+            return None
+
+        index = int(match.lastgroup[1:])
+        # Earlier patterns cannot match at or before this position (the
+        # alternation would have preferred them), but may match later on
+        for earlier in range(index):
+            found = self.patterns[earlier].search(text, match.start() + 1)
+            if found:
+                return earlier, found.group(0)
+        return index, match.group(0)
+
+
+JUSTIFICATION_SET = PatternSet(JUSTIFICATION_PATTERNS)
+DOMINATION_SET = PatternSet(DOMINATION_PATTERNS)
+ALIENATION_SET = PatternSet(ALIENATION_PATTERNS)
+
+
+def extract_role(agent_id: str) -> str:
+    """Extract role from agent identifier."""
+    agent_lower = agent_id.lower()
+    if "owner" in agent_lower or "manager" in agent_lower or "boss" in agent_lower:
+        return "Owner"
+    elif "worker" in agent_lower or "employee" in agent_lower:
+        return "Worker"
+    else:
+        return "Other"
+
+
+def _increment(counts: Dict[str, int], key: str) -> None:
+    counts[key] = counts.get(key, 0) + 1
+
+
+def _excerpt(content: str) -> str:
+    return content[:200] + "..." if len(content) > 200 else content
+
+
 @dataclass
 class RelationalMetrics:
     """Metrics for a single round or aggregated across rounds."""
@@ -84,6 +195,102 @@ class RelationalMetrics:
     alienation_by_agent: Dict[str, int] = field(default_factory=dict)
     alienation_examples: List[Dict[str, str]] = field(default_factory=list)
 
+    # Raw counts behind the derived ratios (so metrics can be merged)
+    owner_messages: int = 0
+    owner_justified: int = 0
+
+    def update(self, message: Dict[str, Any], round_number: int = 1) -> None:
+        """
+        Fold one message (agent_id, content) into the metrics.
+
+        Args:
+            message: Message dict with 'agent_id' and 'content' keys
+            round_number: Round number for labeling examples
+        """
+        agent_id = message.get("agent_id", "Unknown")
+        content = message.get("content", "")
+
+        # Determine role from agent_id
+        role = extract_role(agent_id)
+
+        # Count participation
+        self.total_messages += 1
+        _increment(self.messages_by_role, role)
+        _increment(self.messages_by_agent, agent_id)
+
+        # Check for justification
+        has_justification = JUSTIFICATION_SET.any(content)
+        if has_justification:
+            self.justification_count += 1
+            _increment(self.justification_by_agent, agent_id)
+
+        # Check for domination (typically owner)
+        domination_match = DOMINATION_SET.first_match(content)
+        if domination_match:
+            self.domination_count += 1
+            _increment(self.domination_by_agent, agent_id)
+            self.domination_examples.append({
+                "round": round_number,
+                "agent": agent_id,
+                "match": domination_match[1],
+                "excerpt": _excerpt(content)
+            })
+
+        # Check for alienation (typically workers)
+        alienation_match = ALIENATION_SET.first_match(content)
+        if alienation_match:
+            self.alienation_count += 1
+            _increment(self.alienation_by_agent, agent_id)
+            self.alienation_examples.append({
+                "round": round_number,
+                "agent": agent_id,
+                "match": alienation_match[1],
+                "excerpt": _excerpt(content)
+            })
+
+        # Track owner justification density
+        if role == "Owner":
+            self.owner_messages += 1
+            if has_justification:
+                self.owner_justified += 1
+
+        self._update_ratios()
+
+    def merge(self, other: "RelationalMetrics") -> "RelationalMetrics":
+        """Add another round's metrics into these (in place); returns self."""
+        self.total_messages += other.total_messages
+        self.justification_count += other.justification_count
+        self.domination_count += other.domination_count
+        self.alienation_count += other.alienation_count
+        self.owner_messages += other.owner_messages
+        self.owner_justified += other.owner_justified
+
+        for mine, theirs in (
+            (self.messages_by_role, other.messages_by_role),
+            (self.messages_by_agent, other.messages_by_agent),
+            (self.justification_by_agent, other.justification_by_agent),
+            (self.domination_by_agent, other.domination_by_agent),
+            (self.alienation_by_agent, other.alienation_by_agent),
+        ):
+            for key, count in theirs.items():
+                mine[key] = mine.get(key, 0) + count
+
+        self.domination_examples.extend(dict(e) for e in other.domination_examples)
+        self.alienation_examples.extend(dict(e) for e in other.alienation_examples)
+
+        self._update_ratios()
+        return self
+
+    def _update_ratios(self) -> None:
+        # Participation ratios
+        if self.total_messages > 0:
+            self.worker_message_ratio = self.messages_by_role.get("Worker", 0) / self.total_messages
+            self.owner_message_ratio = self.messages_by_role.get("Owner", 0) / self.total_messages
+
+        # Owner justification density
+        if self.owner_messages > 0:
+            self.owner_justification_density = self.owner_justified / self.owner_messages
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
         return {
@@ -121,116 +328,43 @@ class RelationalMetricsComputer:
     """
 
     def __init__(self):
-        # Compile patterns for efficiency
-        self._justification_re = [re.compile(p, re.IGNORECASE) for p in JUSTIFICATION_PATTERNS]
-        self._domination_re = [re.compile(p, re.IGNORECASE) for p in DOMINATION_PATTERNS]
-        self._alienation_re = [re.compile(p, re.IGNORECASE) for p in ALIENATION_PATTERNS]
+        # Patterns are compiled once per category (see PatternSet)
+        self.justification_patterns = JUSTIFICATION_SET
+        self.domination_patterns = DOMINATION_SET
+        self.alienation_patterns = ALIENATION_SET
 
     def compute_round_metrics(
         self,
-        messages: List[Dict[str, Any]],
+        messages: Iterable[Dict[str, Any]],
         round_number: int = 1
     ) -> RelationalMetrics:
         """
         Compute metrics for a single round.
 
         Args:
-            messages: List of message dicts with 'agent_id' and 'content' keys
+            messages: Message dicts with 'agent_id' and 'content' keys
             round_number: Round number for labeling examples
 
         Returns:
             RelationalMetrics for this round
         """
         metrics = RelationalMetrics()
-        metrics.total_messages = len(messages)
-
-        # Initialize counters
-        role_counts = defaultdict(int)
-        agent_counts = defaultdict(int)
-        justification_counts = defaultdict(int)
-        domination_counts = defaultdict(int)
-        alienation_counts = defaultdict(int)
-
-        owner_messages = 0
-        owner_justified = 0
-
         for msg in messages:
-            agent_id = msg.get("agent_id", "Unknown")
-            content = msg.get("content", "")
-
-            # Determine role from agent_id
-            role = self._extract_role(agent_id)
-
-            # Count participation
-            role_counts[role] += 1
-            agent_counts[agent_id] += 1
-
-            # Check for justification
-            has_justification = self._check_patterns(content, self._justification_re)
-            if has_justification:
-                metrics.justification_count += 1
-                justification_counts[agent_id] += 1
-
-            # Check for domination (typically owner)
-            domination_match = self._find_pattern_match(content, self._domination_re)
-            if domination_match:
-                metrics.domination_count += 1
-                domination_counts[agent_id] += 1
-                metrics.domination_examples.append({
-                    "round": round_number,
-                    "agent": agent_id,
-                    "match": domination_match,
-                    "excerpt": content[:200] + "..." if len(content) > 200 else content
-                })
-
-            # Check for alienation (typically workers)
-            alienation_match = self._find_pattern_match(content, self._alienation_re)
-            if alienation_match:
-                metrics.alienation_count += 1
-                alienation_counts[agent_id] += 1
-                metrics.alienation_examples.append({
-                    "round": round_number,
-                    "agent": agent_id,
-                    "match": alienation_match,
-                    "excerpt": content[:200] + "..." if len(content) > 200 else content
-                })
-
-            # Track owner justification density
-            if role == "Owner":
-                owner_messages += 1
-                if has_justification:
-                    owner_justified += 1
-
-        # Compute derived metrics
-        metrics.messages_by_role = dict(role_counts)
-        metrics.messages_by_agent = dict(agent_counts)
-        metrics.justification_by_agent = dict(justification_counts)
-        metrics.domination_by_agent = dict(domination_counts)
-        metrics.alienation_by_agent = dict(alienation_counts)
-
-        # Participation ratios
-        worker_count = role_counts.get("Worker", 0)
-        owner_count = role_counts.get("Owner", 0)
-
-        if metrics.total_messages > 0:
-            metrics.worker_message_ratio = worker_count / metrics.total_messages
-            metrics.owner_message_ratio = owner_count / metrics.total_messages
-
-        # Owner justification density
-        if owner_messages > 0:
-            metrics.owner_justification_density = owner_justified / owner_messages
-
+            metrics.update(msg, round_number)
         return metrics
 
     def compute_experiment_metrics(
         self,
-        round_results: List[Dict[str, Any]]
+        round_results: Iterable[Dict[str, Any]]
     ) -> Dict[str, Any]:
         """
         Compute metrics across all rounds in an experiment.
 
+        Each round's metrics are merged into the aggregate, so messages are
+        scanned once and never collected across rounds.
+
         Args:
-            round_results: List of round result dicts
+            round_results: Round result dicts
 
         Returns:
             Dict with per-round and aggregate metrics
@@ -238,8 +372,6 @@ class RelationalMetricsComputer:
         per_round = {}
         aggregate = RelationalMetrics()
 
-        all_messages = []
-
         for result in round_results:
             round_num = result.get("round_number", 1)
             messages = result.get("messages", [])
@@ -248,12 +380,7 @@ class RelationalMetricsComputer:
             round_metrics = self.compute_round_metrics(messages, round_num)
             per_round[f"round_{round_num}"] = round_metrics.to_dict()
 
-            # Collect all messages for aggregate
-            all_messages.extend(messages)
-
-        # Compute aggregate metrics
-        if all_messages:
-            aggregate = self.compute_round_metrics(all_messages, round_number=0)
+            aggregate.merge(round_metrics)
 
         return {
             "per_round": per_round,
@@ -263,28 +390,7 @@ class RelationalMetricsComputer:
 
     def _extract_role(self, agent_id: str) -> str:
         """Extract role from agent identifier."""
-        agent_lower = agent_id.lower()
-        if "owner" in agent_lower or "manager" in agent_lower or "boss" in agent_lower:
-            return "Owner"
-        elif "worker" in agent_lower or "employee" in agent_lower:
-            return "Worker"
-        else:
-            return "Other"
-
-    def _check_patterns(self, text: str, patterns: List[re.Pattern]) -> bool:
-        """Check if any pattern matches."""
-        for pattern in patterns:
-            if pattern.search(text):
-                return True
-        return False
-
-    def _find_pattern_match(self, text: str, patterns: List[re.Pattern]) -> Optional[str]:
-        """Find first matching pattern and return the match."""
-        for pattern in patterns:
-            match = pattern.search(text)
-            if match:
-                return match.group(0)
-        return None
+        return extract_role(agent_id)
 
     def _generate_summary(
         self,
@@ -0,0 +1,26 @@
+"""
+Optional Dependencies - Lazy imports shared by social_rl and the experiments.
+
+Vectorized code paths import numpy on first use rather than at module
+import, so the rest of the package stays importable without it.
+"""
+
+
+def import_numpy(required: bool = True):
+    """
+    Import numpy on demand.
+
+    Args:
+        required: Raise ImportError if numpy is missing; otherwise return
+            None so the caller can fall back to pure Python
+
+    Returns:
+        The numpy module, or None if it is missing and not required
+    """
+    try:
+        import numpy
+    except ImportError:
+        if not required:
+            return None
+        raise ImportError("Please install numpy: pip install numpy")
+    return numpy
@@ -435,6 +435,31 @@ class ProcessRetriever:
         with open(filepath, "w") as f:
             json.dump(self.get_policy_state(), f, indent=2)
 
+    def load_policy_state(self, state: Dict[str, Any]):
+        """Restore policies from get_policy_state() output (e.g. a checkpoint)."""
+        for key, policy_state in state.items():
+            cues = [
+                ProcessCue(
+                    mode=ReasoningMode(cue["mode"]),
+                    cue_text=cue["text"],
+                    intensity=cue["intensity"],
+                    theoretical_grounding=cue.get("grounding", "")
+                )
+                for cue in policy_state.get("cues", [])
+            ]
+            policy = self.policies.get(key)
+            if policy is None:
+                self.policies[key] = ReasoningPolicy(
+                    name=policy_state.get("name", key),
+                    description="",
+                    cues=cues,
+                    feedback_thresholds=dict(policy_state.get("thresholds", {}))
+                )
+            else:
+                policy.name = policy_state.get("name", policy.name)
+                policy.cues = cues
+                policy.feedback_thresholds = dict(policy_state.get("thresholds", {}))
+
     def get_history_summary(self) -> str:
         """Get summary of policy retrieval history."""
         if not self.policy_history:
@@ -15,8 +15,9 @@ import sys
 import time
 import json
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Callable
-from dataclasses import dataclass, field
+from typing import Dict, Any, List, Optional, Callable, Tuple, Set
+from dataclasses import dataclass, field, asdict, replace
+from concurrent.futures import ThreadPoolExecutor
 
 # Use relative imports for social_rl modules
 from .context_injector import (
@@ -24,11 +25,16 @@ from .context_injector import (
     ManifestationType, create_context_injector_from_canvas
 )
 from .feedback_extractor import (
-    SocialFeedbackExtractor, SocialFeedback, ConceptMarkers,
+    SocialFeedbackExtractor, SocialFeedback, ConceptMarkers, RoundFeedbackAccumulator,
     create_extractor_for_framework
 )
 from .process_retriever import ProcessRetriever, ReasoningPolicy
-from .dual_llm_client import DualLLMClient, DualLLMConfig, GenerationResult
+from .dual_llm_client import DualLLMClient, DualLLMConfig, GenerationResult, consume_stream
+from .checkpoint import CheckpointLog, CHECKPOINT_FILENAME
+from .transcript import TranscriptWriter, transcript_path, write_round_transcript
+from .context_store import TurnContextCodec
+from .chat_history import build_chat_messages, flatten_chat_messages, estimate_tokens
+from .context_window import ContextWindow, tiktoken_counter
 
 
 def _get_default_output_dir(experiment_id: str = None) -> str:
@@ -48,6 +54,22 @@ def _get_default_output_dir(experiment_id: str = None) -> str:
     return os.path.join(cwd, "outputs", dir_name)
 
 
+def shared_prefix_length(a: str, b: str) -> int:
+    """Length of the longest common prefix of two strings."""
+    n = min(len(a), len(b))
+    if a[:n] == b[:n]:
+        return n
+    # Invariant: a[:lo] == b[:lo] and a[:hi] != b[:hi]
+    lo, hi = 0, n
+    while hi - lo > 1:
+        mid = (lo + hi) // 2
+        if a[:mid] == b[:mid]:
+            lo = mid
+        else:
+            hi = mid
+    return lo
+
+
 @dataclass
 class SocialRLConfig:
     """Configuration for Social RL execution."""
@@ -56,6 +78,7 @@ class SocialRLConfig:
 
     # Feedback extraction
     extract_feedback_per_turn: bool = True
+    feedback_interval_turns: int = 3  # Turns between per-turn feedback snapshots
     adapt_policies_per_round: bool = True
 
     # Process retrieval
@@ -73,10 +96,65 @@ class SocialRLConfig:
     save_feedback_history: bool = True
     auto_save: bool = True  # Auto-save after each round
     output_dir: str = ""    # Empty = auto-detect
+    checkpoint_turns: bool = True  # Append-only per-turn checkpoint log (needs auto_save)
+    transcript_format: str = "jsonl"  # jsonl (streamed per turn) or json (indented dump)
+    transcript_compression: Optional[str] = None  # None, "gzip", "zstd" (jsonl only)
+    save_turn_context: bool = False  # Opt-in: normalized turn_context per message (jsonl only)
 
     # Challenge mode for A/B testing (empirical semiotics)
     challenge_mode: str = "adaptive"  # off, adaptive, always
 
+    # Token streaming (performer output arrives as deltas)
+    stream_tokens: bool = False           # Also enabled by passing delta_callback
+    stream_max_chars: Optional[int] = None  # Cancel generation past this length
+    stream_cancel_on_leak: bool = True    # Cancel generation once "[If ...]" leaks
+
+    # Pipelined turns (DualLLMClient only): start the next speaker's
+    # performer call while the coach is still validating this turn
+    pipeline_turns: bool = False
+
+    # Prompt layout: "classic" (dynamic context in the system prompt, last 10
+    # messages re-rendered) or "prefix_stable" (static per-agent/round system
+    # prompt, append-only conversation, per-turn guidance last) so server-side
+    # prefix caching (vLLM, Ollama) can reuse earlier turns
+    prompt_layout: str = "classic"
+
+    # Conversation history: "flat" (last 10 messages re-rendered into one
+    # "CONVERSATION SO FAR" user message) or "chat" (prior turns sent as chat
+    # messages via send_messages, newest turns within history_token_budget)
+    history_mode: str = "flat"
+    history_token_budget: int = 2048
+
+    # Token-budgeted context (ContextWindow): None keeps the fixed windows
+    # above; otherwise every history mode and layout sends the newest turns
+    # within this many tokens plus a rolling summary of earlier turns
+    context_token_budget: Optional[int] = None
+    tokenizer: Optional[str] = None  # tiktoken encoding for exact counts (default: estimate)
+
+
+@dataclass
+class TurnDelta:
+    """Partial performer output emitted while a turn is streaming."""
+    agent_id: str
+    round_number: int
+    turn_number: int
+    delta: str
+    content: str  # Text so far (including delta)
+
+
+@dataclass
+class _PreparedTurn:
+    """Everything computed for a turn before the performer is called."""
+    agent: Dict[str, Any]
+    agent_id: str
+    turn_number: int
+    turn_context: TurnContext
+    prar_cue: str
+    agent_feedback: Dict[str, float]
+    system_prompt: str
+    user_message: str
+    chat_messages: Optional[List[Dict[str, str]]] = None  # history_mode="chat"
+
 
 @dataclass
 class SocialRLMessage:
@@ -105,6 +183,20 @@ class SocialRLMessage:
             "validation_metadata": self.validation_metadata
         }
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SocialRLMessage":
+        return cls(
+            agent_id=data["agent_id"],
+            content=data["content"],
+            round_number=data["round_number"],
+            turn_number=data["turn_number"],
+            timestamp=data.get("timestamp", 0.0),
+            turn_context=data.get("turn_context"),
+            prar_cue_used=data.get("prar_cue_used") or "",
+            feedback_snapshot=data.get("feedback_snapshot"),
+            validation_metadata=data.get("validation_metadata")
+        )
+
 
 @dataclass
 class SocialRLRoundResult:
@@ -126,6 +218,17 @@ class SocialRLRoundResult:
             "duration_seconds": self.duration_seconds
         }
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SocialRLRoundResult":
+        return cls(
+            round_number=data["round_number"],
+            messages=[SocialRLMessage.from_dict(m) for m in data.get("messages", [])],
+            feedback={k: SocialFeedback.from_dict(v) for k, v in data.get("feedback", {}).items()},
+            policy_adaptations=data.get("policy_adaptations", []),
+            synthesis=data.get("synthesis", ""),
+            duration_seconds=data.get("duration_seconds", 0.0)
+        )
+
 
 class SocialRLRunner:
     """
@@ -171,7 +274,8 @@ class SocialRLRunner:
 
         # Initialize components
         self.context_injector = create_context_injector_from_canvas(
-            canvas, self.config.manifestation_mode
+            canvas, self.config.manifestation_mode,
+            recent_token_budget=self.config.context_token_budget
         )
         self.feedback_extractor = create_extractor_for_framework(self.framework_option)
         self.process_retriever = ProcessRetriever(
@@ -182,6 +286,13 @@ class SocialRLRunner:
         # State
         self.round_results: Dict[int, SocialRLRoundResult] = {}
         self.accumulated_feedback: Dict[str, Dict[str, float]] = {}
+        self.pipeline_stats = {"speculated": 0, "accepted": 0, "discarded": 0}
+        self.prompt_prefix_log: List[Dict[str, Any]] = []
+        self._count_tokens = (
+            tiktoken_counter(self.config.tokenizer) if self.config.tokenizer else estimate_tokens
+        )
+        self._context_windows: Dict[int, ContextWindow] = {}
+        self._last_prompts: Dict[str, str] = {}
 
         # Setup output directory
         if self.config.output_dir:
@@ -193,6 +304,22 @@ class SocialRLRunner:
         if self.config.auto_save:
             self.output_dir.mkdir(parents=True, exist_ok=True)
 
+        # Per-turn checkpoint log (see SocialRLRunner.resume)
+        self.checkpoint_extras: List[Dict[str, Any]] = []
+        self._resume_messages: Dict[int, List[SocialRLMessage]] = {}
+        self._checkpointed_policy_history = 0
+        self._checkpointed_agent_feedback: Dict[str, int] = {}
+        self._checkpointed_rounds: Set[int] = set()
+        self._checkpoint_codec = TurnContextCodec()
+        self._checkpoint: Optional[CheckpointLog] = None
+        if self.config.auto_save and self.config.checkpoint_turns:
+            self._checkpoint = CheckpointLog(self.output_dir / CHECKPOINT_FILENAME)
+            self._checkpoint.start({
+                "experiment_id": experiment_id,
+                "canvas": canvas,
+                "config": asdict(self.config),
+            })
+
         if self.config.verbose:
             print(f"SocialRLRunner initialized")
             print(f"  Framework: {project.get('theoretical_option_label', self.framework_option)}")
@@ -206,7 +333,8 @@ class SocialRLRunner:
         self,
         round_number: int,
         max_turns: Optional[int] = None,
-        turn_callback: Optional[Callable[[SocialRLMessage], None]] = None
+        turn_callback: Optional[Callable[[SocialRLMessage], None]] = None,
+        delta_callback: Optional[Callable[[TurnDelta], None]] = None
     ) -> SocialRLRoundResult:
         """
         Execute a complete Social RL round.
@@ -215,6 +343,8 @@ class SocialRLRunner:
             round_number: Which round to execute
             max_turns: Override max turns
             turn_callback: Optional callback after each turn
+            delta_callback: Optional callback per streamed token delta
+                (enables streaming, see SocialRLConfig.stream_tokens)
 
         Returns:
             SocialRLRoundResult with messages, feedback, and adaptations
@@ -236,45 +366,77 @@ class SocialRLRunner:
         if max_turns is None:
             max_turns = self._parse_max_turns(round_config.get("end_condition", "15"))
 
-        messages: List[SocialRLMessage] = []
+        # Resumed rounds continue after their last checkpointed turn
+        messages: List[SocialRLMessage] = self._resume_messages.pop(round_number, [])
         policy_adaptations = []
-        turn = 0
+        schedule = [
+            participants[t % len(participants)] for t in range(max_turns)
+        ] if participants else []
 
-        # Main turn loop
-        while turn < max_turns:
-            for agent in participants:
-                if turn >= max_turns:
-                    break
+        # Streamed transcript (resumed turns are rewritten first)
+        transcript = self._open_transcript(round_number, messages)
 
-                turn += 1
+        # Feedback is folded in message by message
+        participant_ids = [p.get("identifier") for p in participants]
+        feedback_state = self.feedback_extractor.start_round(round_number, participant_ids)
+        feedback_state.extend([{"agent_id": m.agent_id, "content": m.content} for m in messages])
+
+        def on_message(
+            message: SocialRLMessage,
+            agent: Dict[str, Any],
+            turn_state: Optional[Dict[str, Any]] = None
+        ) -> None:
+            messages.append(message)
+            feedback_state.add_message({"agent_id": message.agent_id, "content": message.content})
+            if transcript:
+                transcript.write_message(self._transcript_record(message))
 
-                # Execute turn with Social RL components
-                message = self._execute_social_rl_turn(
-                    agent, round_config, messages, turn
+            if self.config.verbose:
+                print(f"[Turn {message.turn_number}] {agent.get('identifier')}:")
+                print(f"  {message.content[:150]}{'...' if len(message.content) > 150 else ''}")
+                if message.prar_cue_used:
+                    print(f"  [PRAR: {message.prar_cue_used[:50]}...]")
+                print()
+
+            if turn_callback:
+                turn_callback(message)
+
+            # Extract per-turn feedback if enabled
+            if self._extracts_feedback_after(message.turn_number):
+                self._extract_incremental_feedback(feedback_state)
+
+            if self._checkpoint:
+                self._checkpoint.append(
+                    "turn",
+                    round_number=round_number,
+                    turn_number=message.turn_number,
+                    message=self._checkpoint_message(message),
+                    state=self._checkpoint_state(turn_state)
                 )
-                messages.append(message)
-
-                if self.config.verbose:
-                    print(f"[Turn {turn}] {agent.get('identifier')}:")
-                    print(f"  {message.content[:150]}{'...' if len(message.content) > 150 else ''}")
-                    if message.prar_cue_used:
-                        print(f"  [PRAR: {message.prar_cue_used[:50]}...]")
-                    print()
-
-                if turn_callback:
-                    turn_callback(message)
 
-                # Extract per-turn feedback if enabled
-                if self.config.extract_feedback_per_turn and turn % 3 == 0:
-                    self._extract_incremental_feedback(messages, participants)
+        try:
+            if self._pipelining_enabled(delta_callback):
+                self._execute_pipelined_turns(
+                    schedule, round_config, messages, on_message
+                )
+            else:
+                # Main turn loop
+                for turn in range(len(messages) + 1, len(schedule) + 1):
+                    agent = schedule[turn - 1]
+
+                    # Execute turn with Social RL components
+                    message = self._execute_social_rl_turn(
+                        agent, round_config, messages, turn, delta_callback
+                    )
+                    on_message(message, agent)
+        except BaseException:
+            # Keep the turns written so far readable
+            if transcript:
+                transcript.close()
+            raise
 
         # Extract final round feedback
-        participant_ids = [p.get("identifier") for p in participants]
-        round_feedback = self.feedback_extractor.extract_round_feedback(
-            round_number,
-            [{"agent_id": m.agent_id, "content": m.content} for m in messages],
-            participant_ids
-        )
+        round_feedback = feedback_state.finalize()
 
         # Adapt policies based on feedback if enabled
         if self.config.adapt_policies_per_round and round_number > 1:
@@ -299,7 +461,16 @@ class SocialRLRunner:
 
         # Auto-save round result
         if self.config.auto_save:
-            self._save_round(result)
+            self._save_round(result, transcript)
+
+        if self._checkpoint:
+            # Turn contexts are already in this round's turn records
+            self._checkpoint.append(
+                "round",
+                round_number=round_number,
+                result=result.to_dict(),
+                state=self._checkpoint_state()
+            )
 
         if self.config.verbose:
             print(f"\nRound {round_number} complete: {len(messages)} messages in {duration:.1f}s")
@@ -312,7 +483,8 @@ class SocialRLRunner:
         agent: Dict[str, Any],
         round_config: Dict[str, Any],
         history: List[SocialRLMessage],
-        turn_number: int
+        turn_number: int,
+        delta_callback: Optional[Callable[[TurnDelta], None]] = None
     ) -> SocialRLMessage:
         """
         Execute a single turn with full Social RL pipeline.
@@ -323,6 +495,17 @@ class SocialRLRunner:
         4. Generate with Coach/Performer validation
         5. Attach feedback snapshot
         """
+        prepared = self._prepare_turn(agent, round_config, history, turn_number)
+        return self._complete_turn(prepared, round_config, delta_callback=delta_callback)
+
+    def _prepare_turn(
+        self,
+        agent: Dict[str, Any],
+        round_config: Dict[str, Any],
+        history: List[SocialRLMessage],
+        turn_number: int
+    ) -> _PreparedTurn:
+        """Steps 1-4 of a turn: context, policy, prompt and user message."""
         agent_id = agent.get("identifier", "Unknown")
 
         # 1. Generate dynamic turn context
@@ -331,10 +514,7 @@ class SocialRLRunner:
             agent_config=agent,
             round_config=round_config,
             turn_number=turn_number,
-            conversation_history=[
-                {"agent_id": m.agent_id, "content": m.content}
-                for m in history
-            ],
+            conversation_history=history,
             accumulated_feedback=self.accumulated_feedback
         )
 
@@ -355,24 +535,82 @@ class SocialRLRunner:
                 policy, agent_feedback, self.config.prar_intensity
             )
 
-        # 3. Compile dynamic prompt
-        system_prompt = self.context_injector.compile_dynamic_prompt(agent, turn_context)
-        if prar_cue:
-            system_prompt += f"\n\n=== REASONING GUIDANCE ===\n{prar_cue}"
+        if self.config.prompt_layout == "prefix_stable":
+            # 3-4. Static system prompt; conversation, then this turn's guidance
+            system_prompt = self.context_injector.compile_static_prompt(agent, turn_context)
+            user_message = self._build_prefix_stable_user_message(
+                history, agent, round_config, turn_context, prar_cue
+            )
+        else:
+            # 3. Compile dynamic prompt
+            system_prompt = self.context_injector.compile_dynamic_prompt(agent, turn_context)
+            if prar_cue:
+                system_prompt += f"\n\n=== REASONING GUIDANCE ===\n{prar_cue}"
+
+            # 4. Build user message (conversation context)
+            user_message = self._build_user_message(history, agent, round_config)
+
+        chat_messages = None
+        if self.config.history_mode == "chat":
+            chat_messages = self._build_chat_messages(
+                history, agent, round_config,
+                turn_context if self.config.prompt_layout == "prefix_stable" else None,
+                prar_cue
+            )
+            # Same window for clients that only take a (system, user) pair
+            user_message = flatten_chat_messages(chat_messages, agent_id)
+
+        return _PreparedTurn(
+            agent=agent,
+            agent_id=agent_id,
+            turn_number=turn_number,
+            turn_context=turn_context,
+            prar_cue=prar_cue,
+            agent_feedback=agent_feedback,
+            system_prompt=system_prompt,
+            user_message=user_message,
+            chat_messages=chat_messages
+        )
 
-        # 4. Build user message (conversation context)
-        user_message = self._build_user_message(history, agent, round_config)
+    def _complete_turn(
+        self,
+        prepared: _PreparedTurn,
+        round_config: Dict[str, Any],
+        delta_callback: Optional[Callable[[TurnDelta], None]] = None,
+        draft: Optional[str] = None,
+        draft_validation: Optional[tuple] = None
+    ) -> SocialRLMessage:
+        """Step 5 of a turn: generate (and validate) the response."""
+        agent = prepared.agent
+        agent_id = prepared.agent_id
+        turn_number = prepared.turn_number
+        self._record_prompt_prefix(prepared, round_config)
+
+        # Token streaming hook
+        on_delta = None
+        if delta_callback:
+            round_number = round_config.get("round_number", 1)
+            on_delta = lambda delta, text: delta_callback(
+                TurnDelta(agent_id, round_number, turn_number, delta, text)
+            )
 
         # 5. Generate response (with validation if enabled)
         if self.config.use_coach_validation:
             content, validation_meta = self._generate_with_validation(
-                system_prompt, user_message, round_config.get("rules", ""),
-                agent.get("behaviors", {}).get("raw", ""),
+                prepared.system_prompt, prepared.user_message, round_config.get("rules", ""),
+                self._agent_behaviors(agent),
                 agent_id=agent_id,
-                turn_number=turn_number
+                turn_number=turn_number,
+                on_delta=on_delta,
+                draft=draft,
+                draft_validation=draft_validation,
+                chat_messages=prepared.chat_messages
             )
         else:
-            content = self._generate_simple(system_prompt, user_message)
+            content = self._generate_simple(
+                prepared.system_prompt, prepared.user_message, on_delta,
+                chat_messages=prepared.chat_messages
+            )
             validation_meta = None
 
         # Create message with Social RL metadata
@@ -381,12 +619,375 @@ class SocialRLRunner:
             content=content,
             round_number=round_config.get("round_number", 1),
             turn_number=turn_number,
-            turn_context=turn_context.to_dict(),
-            prar_cue_used=prar_cue,
-            feedback_snapshot=agent_feedback.copy() if agent_feedback else None,
+            turn_context=prepared.turn_context.to_dict(),
+            prar_cue_used=prepared.prar_cue,
+            feedback_snapshot=prepared.agent_feedback.copy() if prepared.agent_feedback else None,
             validation_metadata=validation_meta
         )
 
+    # =========================================================================
+    # Pipelined turns (speculative next-speaker generation)
+    # =========================================================================
+
+    def _pipelining_enabled(self, delta_callback: Optional[Callable] = None) -> bool:
+        return (
+            self.config.pipeline_turns
+            and self.dual_llm is not None
+            and self.config.use_coach_validation
+            and not self._streaming_enabled(delta_callback)
+        )
+
+    def _extracts_feedback_after(self, turn_number: int) -> bool:
+        interval = max(1, self.config.feedback_interval_turns)
+        return self.config.extract_feedback_per_turn and turn_number % interval == 0
+
+    def _execute_pipelined_turns(
+        self,
+        schedule: List[Dict[str, Any]],
+        round_config: Dict[str, Any],
+        messages: List[SocialRLMessage],
+        on_message: Callable[..., None]
+    ) -> None:
+        """
+        Run the turn loop with coach validation overlapped with the next turn.
+
+        While the coach checks turn k's draft, turn k+1 is prepared against a
+        history that assumes the draft is accepted, and its performer call
+        starts. If the coach accepts, that speculative work is exactly what
+        the sequential loop would have produced; if it rejects, the
+        speculation is discarded (context/policy state rolled back) and turn
+        k+1 is rebuilt after turn k's corrective regeneration.
+
+        No speculation happens across turns that trigger incremental feedback
+        extraction, since that changes the inputs to the next turn's context.
+        """
+        first_turn = len(messages) + 1
+        max_turns = len(schedule)
+        if first_turn > max_turns:
+            return
+
+        rules_list = self._coach_rules(round_config.get("rules", ""))
+
+        def perform(prepared: _PreparedTurn) -> str:
+            return self.dual_llm.generate(
+                prepared.system_prompt, prepared.user_message, mode="performer"
+            )
+
+        def validate(prepared: _PreparedTurn, draft: str) -> tuple:
+            return self.dual_llm.validate(
+                content=draft,
+                agent_id=prepared.agent_id,
+                rules=rules_list,
+                context={"behaviors": self._agent_behaviors(prepared.agent)}
+            )
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            prepared = self._prepare_turn(
+                schedule[first_turn - 1], round_config, messages, first_turn
+            )
+            draft_future = pool.submit(perform, prepared)
+
+            for turn in range(first_turn, max_turns + 1):
+                draft = draft_future.result()
+                coach_future = pool.submit(validate, prepared, draft)
+
+                # Speculate: prepare turn k+1 as if the draft is accepted
+                speculative = None
+                if turn < max_turns and not self._extracts_feedback_after(turn):
+                    snapshot = self._snapshot_turn_state()
+                    provisional = SocialRLMessage(
+                        agent_id=prepared.agent_id,
+                        content=self._filter_prompt_leaks(draft)
+                        if ("[If " in draft or "[if " in draft) else draft,
+                        round_number=round_config.get("round_number", 1),
+                        turn_number=turn
+                    )
+                    next_prepared = self._prepare_turn(
+                        schedule[turn], round_config, messages + [provisional], turn + 1
+                    )
+                    speculative = (next_prepared, pool.submit(perform, next_prepared), snapshot)
+                    self.pipeline_stats["speculated"] += 1
+
+                draft_validation = coach_future.result()
+                if speculative and not draft_validation[0]:
+                    # Coach rejected: the next speaker saw the wrong history
+                    self._restore_turn_state(speculative[2])
+                    speculative = None
+                    self.pipeline_stats["discarded"] += 1
+
+                message = self._complete_turn(
+                    prepared, round_config, draft=draft, draft_validation=draft_validation
+                )
+                # Checkpoint the state as of before the speculative preparation
+                on_message(message, prepared.agent, speculative[2] if speculative else None)
+
+                if turn == max_turns:
+                    break
+                if speculative:
+                    prepared, draft_future = speculative[0], speculative[1]
+                    self.pipeline_stats["accepted"] += 1
+                else:
+                    prepared = self._prepare_turn(schedule[turn], round_config, messages, turn + 1)
+                    draft_future = pool.submit(perform, prepared)
+
+    # =========================================================================
+    # Checkpoint / resume
+    # =========================================================================
+
+    def _checkpoint_state(self, turn_state: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Runner state for the checkpoint log.
+
+        turn_state is a _snapshot_turn_state() taken earlier (the pipelined
+        loop passes the pre-speculation snapshot so the checkpoint never
+        includes the next turn's speculative preparation).
+
+        Append-only state is delta-encoded against the previous record, so
+        records stay the same size however long the run gets:
+        policy_history and each agent's agent_feedback list are written from
+        policy_history_start / agent_feedback_start on, and round_feedback
+        only holds rounds not written before plus the in-progress round-0
+        snapshot. resume() stitches the deltas back together.
+        """
+        turn_state = turn_state or self._snapshot_turn_state()
+        history_end = turn_state["policy_history_len"]
+        history_start = min(self._checkpointed_policy_history, history_end)
+        self._checkpointed_policy_history = history_end
+
+        agent_feedback = self.context_injector.agent_feedback
+        feedback_start = {
+            agent_id: min(self._checkpointed_agent_feedback.get(agent_id, 0), len(entries))
+            for agent_id, entries in agent_feedback.items()
+        }
+        feedback_start = {
+            agent_id: start for agent_id, start in feedback_start.items()
+            if start < len(agent_feedback[agent_id])
+        }
+        self._checkpointed_agent_feedback = {
+            agent_id: len(entries) for agent_id, entries in agent_feedback.items()
+        }
+
+        round_feedback = {
+            round_num: feedback
+            for round_num, feedback in self.feedback_extractor.round_feedback.items()
+            if round_num == 0 or round_num not in self._checkpointed_rounds
+        }
+        self._checkpointed_rounds.update(round_feedback)
+
+        tracker = turn_state["tracker"]
+        return {
+            "accumulated_feedback": self.accumulated_feedback,
+            "policies": self.process_retriever.get_policy_state(),
+            "policy_history_start": history_start,
+            "policy_history": self.process_retriever.policy_history[history_start:history_end],
+            "semiotic_tracker": (
+                {k: v for k, v in tracker.items() if k != "config"}
+                if tracker is not None else None
+            ),
+            "current_round_divergence": turn_state["round_divergence"],
+            "agent_feedback_start": feedback_start,
+            "agent_feedback": {
+                agent_id: agent_feedback[agent_id][start:]
+                for agent_id, start in feedback_start.items()
+            },
+            "round_feedback": {
+                str(round_num): {agent_id: asdict(fb) for agent_id, fb in feedback.items()}
+                for round_num, feedback in round_feedback.items()
+            },
+            "pipeline_stats": self.pipeline_stats,
+        }
+
+    def _checkpoint_message(self, message: SocialRLMessage) -> Dict[str, Any]:
+        """Message dict for a turn record, with its turn_context normalized."""
+        record = message.to_dict()
+        if message.turn_context is not None:
+            ref, table_records = self._checkpoint_codec.encode(message.turn_context)
+            for table_record in table_records:
+                self._checkpoint.append(table_record.pop("type"), **table_record)
+            record["turn_context_ref"] = ref
+        self._checkpoint_codec.add_message(message.agent_id, message.content)
+        return record
+
+    def _restore_checkpoint_message(self, record: Dict[str, Any]) -> SocialRLMessage:
+        """Inverse of _checkpoint_message (table records must be loaded first)."""
+        record = dict(record)
+        ref = record.pop("turn_context_ref", None)
+        if ref is not None:
+            record["turn_context"] = self._checkpoint_codec.decode(ref)
+        self._checkpoint_codec.add_message(record["agent_id"], record["content"])
+        return SocialRLMessage.from_dict(record)
+
+    def _load_checkpoint_state(
+        self,
+        state: Dict[str, Any],
+        policy_history: List[Dict[str, Any]],
+        agent_feedback: Dict[str, List[Dict[str, Any]]],
+        round_feedback: Dict[str, Dict[str, Any]]
+    ) -> None:
+        """
+        Apply the last _checkpoint_state() record to this runner.
+
+        policy_history, agent_feedback and round_feedback are the
+        delta-encoded fields already replayed over the whole log by resume().
+        """
+        self.accumulated_feedback = state["accumulated_feedback"]
+        self.process_retriever.load_policy_state(state["policies"])
+        self.process_retriever.policy_history = policy_history
+        self._checkpointed_policy_history = len(policy_history)
+
+        tracker = self.context_injector.semiotic_tracker
+        if tracker is not None and state["semiotic_tracker"] is not None:
+            tracker.__dict__.update(state["semiotic_tracker"])
+        self.context_injector._current_round_divergence = state["current_round_divergence"]
+        self.context_injector.agent_feedback = agent_feedback
+        self._checkpointed_agent_feedback = {
+            agent_id: len(entries) for agent_id, entries in agent_feedback.items()
+        }
+
+        self.feedback_extractor.round_feedback = {
+            int(round_num): {
+                agent_id: SocialFeedback.from_dict(fb) for agent_id, fb in feedback.items()
+            }
+            for round_num, feedback in round_feedback.items()
+        }
+        self._checkpointed_rounds = set(self.feedback_extractor.round_feedback)
+        self.pipeline_stats = state["pipeline_stats"]
+
+    def save_checkpoint(self, extra: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Append a state-only checkpoint record.
+
+        Call this after mutating runner state between rounds (e.g.
+        context_injector.update_semiotic_state) so a resume sees it. Extras
+        are returned in order via checkpoint_extras after resume().
+        """
+        if self._checkpoint:
+            self._checkpoint.append("state", extra=extra or {}, state=self._checkpoint_state())
+            if extra:
+                self.checkpoint_extras.append(extra)
+
+    @classmethod
+    def resume(
+        cls,
+        experiment_dir: str,
+        llm_client: Any,
+        dual_llm_client: Optional[DualLLMClient] = None,
+        config: Optional[SocialRLConfig] = None
+    ) -> "SocialRLRunner":
+        """
+        Rebuild a runner from an experiment's checkpoint log.
+
+        Completed rounds are restored into round_results; a partially
+        completed round continues from its last checkpointed turn the next
+        time execute_round() is called for it. LLM clients are not part of
+        the checkpoint and must be passed in again.
+
+        Args:
+            experiment_dir: Output directory of the interrupted run
+            llm_client: LLM client for generation
+            dual_llm_client: Optional DualLLMClient
+            config: Override the checkpointed configuration
+
+        Returns:
+            SocialRLRunner ready to continue the experiment
+        """
+        log = CheckpointLog(Path(experiment_dir) / CHECKPOINT_FILENAME)
+        records = log.read()
+        header = records[0]
+
+        config = config or SocialRLConfig(**header["config"])
+        config.output_dir = str(experiment_dir)
+
+        # Build without starting a new log, then attach the existing one
+        runner = cls(
+            header["canvas"],
+            llm_client,
+            config=replace(config, checkpoint_turns=False),
+            dual_llm_client=dual_llm_client,
+            experiment_id=header.get("experiment_id")
+        )
+        runner.config = config
+        if config.auto_save and config.checkpoint_turns:
+            log.repair()
+            runner._checkpoint = log
+
+        codec = runner._checkpoint_codec
+        partial: Dict[int, List[SocialRLMessage]] = {}
+        turn_contexts: Dict[Tuple[int, int], Dict[str, Any]] = {}
+        policy_history: List[Dict[str, Any]] = []
+        agent_feedback: Dict[str, List[Dict[str, Any]]] = {}
+        round_feedback: Dict[str, Dict[str, Any]] = {}
+        state = None
+        for record in records[1:]:
+            if codec.load_record(record):
+                continue
+            if record["type"] == "turn":
+                message = runner._restore_checkpoint_message(record["message"])
+                turn_contexts[(message.round_number, message.turn_number)] = message.turn_context
+                partial.setdefault(record["round_number"], []).append(message)
+            elif record["type"] == "round":
+                result = SocialRLRoundResult.from_dict(record["result"])
+                for message in result.messages:
+                    message.turn_context = turn_contexts.get(
+                        (message.round_number, message.turn_number)
+                    )
+                runner.round_results[record["round_number"]] = result
+                partial.pop(record["round_number"], None)
+            elif record["type"] == "state" and record.get("extra"):
+                runner.checkpoint_extras.append(record["extra"])
+
+            if "state" in record:
+                state = record["state"]
+                start = state["policy_history_start"]
+                policy_history = policy_history[:start] + state["policy_history"]
+                feedback_start = state.get("agent_feedback_start", {})
+                for agent_id, entries in state["agent_feedback"].items():
+                    start = feedback_start.get(agent_id, 0)
+                    agent_feedback[agent_id] = agent_feedback.get(agent_id, [])[:start] + entries
+                round_feedback.update(state["round_feedback"])
+
+        if state is not None:
+            runner._load_checkpoint_state(state, policy_history, agent_feedback, round_feedback)
+        runner._resume_messages = partial
+
+        if runner.config.verbose:
+            in_progress = {r: len(m) for r, m in partial.items()}
+            print(f"Resumed from {log.path}")
+            print(f"  Completed rounds: {sorted(runner.round_results)}")
+            if in_progress:
+                print(f"  In-progress rounds (turns done): {in_progress}")
+
+        return runner
+
+    def _snapshot_turn_state(self) -> Dict[str, Any]:
+        """
+        Capture state that _prepare_turn mutates, for rollback.
+
+        That is the ContextInjector's turn state (semiotic tracker, round
+        divergence, component cache, conversation index), the
+        ProcessRetriever's policy_history (its only mutable state) and the
+        per-round ContextWindows.
+        """
+        return {
+            **self.context_injector.snapshot_turn_state(),
+            "policy_history_len": len(self.process_retriever.policy_history),
+            "context_windows": {
+                round_number: window.checkpoint()
+                for round_number, window in self._context_windows.items()
+            },
+        }
+
+    def _restore_turn_state(self, snapshot: Dict[str, Any]) -> None:
+        """Undo a speculative _prepare_turn (see _snapshot_turn_state)."""
+        self.context_injector.restore_turn_state(snapshot)
+        del self.process_retriever.policy_history[snapshot["policy_history_len"]:]
+        windows = snapshot["context_windows"]
+        for round_number in list(self._context_windows):
+            if round_number not in windows:
+                del self._context_windows[round_number]
+            else:
+                self._context_windows[round_number].rollback(windows[round_number])
+
     def _build_user_message(
         self,
         history: List[SocialRLMessage],
@@ -395,14 +996,130 @@ class SocialRLRunner:
     ) -> str:
         """Build the user message with conversation context."""
         if history:
-            context_lines = ["CONVERSATION SO FAR:"]
-            for msg in history[-10:]:
+            summary, recent = self._history_window(history, round_config, default=history[-10:])
+            context_lines = [summary, ""] if summary else []
+            context_lines.append("CONVERSATION SO FAR:")
+            for msg in recent:
                 context_lines.append(f"[{msg.agent_id}]: {msg.content}")
             context = "\n".join(context_lines)
             return f"{context}\n\nIt is now your turn to respond as {agent.get('name', 'Unknown')}."
         else:
             return f"The round begins. {round_config.get('scenario', '')}\n\nRespond as {agent.get('name', 'Unknown')}."
 
+    def _history_window(
+        self,
+        history: List[SocialRLMessage],
+        round_config: Dict[str, Any],
+        default: List[SocialRLMessage]
+    ) -> Tuple[Optional[str], List[SocialRLMessage]]:
+        """
+        (summary, recent messages) under context_token_budget.
+
+        Without a budget the caller's default window is used unsummarized.
+        """
+        budget = self.config.context_token_budget
+        if not budget:
+            return None, default
+
+        round_number = round_config.get("round_number", 1)
+        window = self._context_windows.get(round_number)
+        if window is None:
+            window = self._context_windows[round_number] = ContextWindow(
+                token_budget=budget, count_tokens=self._count_tokens
+            )
+        summary, start = window.view(history)
+        return summary, history[start:]
+
+    def _build_prefix_stable_user_message(
+        self,
+        history: List[SocialRLMessage],
+        agent: Dict[str, Any],
+        round_config: Dict[str, Any],
+        turn_context: TurnContext,
+        prar_cue: str
+    ) -> str:
+        """
+        Build the user message for the prefix_stable layout.
+
+        The whole round so far comes first and only ever grows by appended
+        lines; everything that changes per turn follows it.
+        """
+        summary, recent = self._history_window(history, round_config, default=history)
+        lines = [summary, ""] if summary else []
+        lines.append("CONVERSATION SO FAR:")
+        lines.extend(f"[{msg.agent_id}]: {msg.content}" for msg in recent)
+
+        name = agent.get('name', 'Unknown')
+        prompt = f"It is now your turn to respond as {name}." if history else f"The round begins. Respond as {name}."
+        return "\n".join(lines) + f"\n\n{self._turn_guidance(turn_context, prar_cue)}\n\n{prompt}"
+
+    def _turn_guidance(self, turn_context: TurnContext, prar_cue: str) -> str:
+        """Per-turn guidance block of the prefix_stable layout."""
+        guidance = self.context_injector.compile_turn_guidance(turn_context)
+        if prar_cue:
+            guidance += f"\n\n=== REASONING GUIDANCE ===\n{prar_cue}"
+        return guidance
+
+    def _build_chat_messages(
+        self,
+        history: List[SocialRLMessage],
+        agent: Dict[str, Any],
+        round_config: Dict[str, Any],
+        turn_context: Optional[TurnContext] = None,
+        prar_cue: str = ""
+    ) -> List[Dict[str, str]]:
+        """
+        Build the chat messages for history_mode="chat".
+
+        With turn_context (prefix_stable layout) the per-turn guidance goes
+        in the closing message instead of the system prompt.
+        """
+        name = agent.get('name', 'Unknown')
+        closing = f"It is now your turn to respond as {name}." if history else f"Respond as {name}."
+        if turn_context is not None:
+            closing = f"{self._turn_guidance(turn_context, prar_cue)}\n\n{closing}"
+
+        summary, start = None, None
+        if self.config.context_token_budget:
+            summary, recent = self._history_window(history, round_config, default=history)
+            start = len(history) - len(recent)
+
+        return build_chat_messages(
+            history,
+            agent.get("identifier", "Unknown"),
+            opening=f"The round begins. {round_config.get('scenario', '')}",
+            closing=closing,
+            token_budget=self.config.history_token_budget,
+            count_tokens=self._count_tokens,
+            start=start,
+            summary=summary
+        )
+
+    def _record_prompt_prefix(self, prepared: _PreparedTurn, round_config: Dict[str, Any]) -> None:
+        """Log how much of this call's prompt repeats the agent's previous call."""
+        prompt = f"{prepared.system_prompt}\n{prepared.user_message}"
+        previous = self._last_prompts.get(prepared.agent_id, "")
+        self._last_prompts[prepared.agent_id] = prompt
+        self.prompt_prefix_log.append({
+            "agent_id": prepared.agent_id,
+            "round_number": round_config.get("round_number", 1),
+            "turn_number": prepared.turn_number,
+            "prompt_chars": len(prompt),
+            "shared_prefix_chars": shared_prefix_length(previous, prompt),
+        })
+
+    def get_prompt_prefix_stats(self) -> Dict[str, Any]:
+        """Summarize prompt_prefix_log (shared prefix with each agent's previous call)."""
+        prompt_chars = sum(entry["prompt_chars"] for entry in self.prompt_prefix_log)
+        shared_chars = sum(entry["shared_prefix_chars"] for entry in self.prompt_prefix_log)
+        return {
+            "layout": self.config.prompt_layout,
+            "calls": len(self.prompt_prefix_log),
+            "prompt_chars": prompt_chars,
+            "shared_prefix_chars": shared_chars,
+            "shared_prefix_ratio": shared_chars / prompt_chars if prompt_chars else 0.0,
+        }
+
     def _generate_with_validation(
         self,
         system_prompt: str,
@@ -410,15 +1127,26 @@ class SocialRLRunner:
         rules: str,
         behaviors: str,
         agent_id: str = "Unknown",
-        turn_number: int = 0
+        turn_number: int = 0,
+        on_delta: Optional[Callable[[str, str], None]] = None,
+        draft: Optional[str] = None,
+        draft_validation: Optional[tuple] = None,
+        chat_messages: Optional[List[Dict[str, str]]] = None
     ) -> tuple:
-        """Generate with Coach/Performer validation pattern."""
+        """
+        Generate with Coach/Performer validation pattern.
+
+        DualLLMClient takes a (system, user) pair, so chat_messages only
+        apply to the single-client path (user_message carries the same
+        window flattened).
+        """
         metadata = {"attempts": 0, "validations": [], "filtered": False, "used_dual_llm": False}
+        streaming = self._streaming_enabled(on_delta)
 
         # Use DualLLMClient if available
         if self.dual_llm is not None:
             metadata["used_dual_llm"] = True
-            rules_list = [r.strip() for r in rules.split(".") if r.strip()] if rules else []
+            rules_list = self._coach_rules(rules)
 
             result: GenerationResult = self.dual_llm.generate_validated(
                 system_prompt=system_prompt,
@@ -426,10 +1154,17 @@ class SocialRLRunner:
                 agent_id=agent_id,
                 rules=rules_list,
                 context={"behaviors": behaviors},
-                turn_number=turn_number
+                turn_number=turn_number,
+                on_delta=on_delta if streaming else None,
+                stream_guard=self._stream_guard if streaming else None,
+                stream_settled=self._stream_settled if streaming else None,
+                draft=draft,
+                draft_validation=draft_validation
             )
 
             metadata["attempts"] = result.retries + 1
+            if result.stream_cancelled:
+                metadata["stream_cancelled"] = True
             metadata["validations"] = [
                 {"valid": c.accepted, "issues": c.violations}
                 for c in result.coach_critiques
@@ -447,7 +1182,9 @@ class SocialRLRunner:
             metadata["attempts"] = attempt + 1
 
             # Performer generates
-            raw_output = self.llm.send_message(system_prompt, user_message)
+            raw_output = self._generate_simple(
+                system_prompt, user_message, on_delta, metadata, chat_messages=chat_messages
+            )
 
             # Simple prompt leak filter
             if "[If " in raw_output or "[if " in raw_output:
@@ -463,15 +1200,113 @@ class SocialRLRunner:
                     return raw_output, metadata
 
                 # Add feedback for retry
-                user_message += f"\n\n[Previous attempt had issues: {issues}. Please try again following the rules.]"
+                retry_note = f"\n\n[Previous attempt had issues: {issues}. Please try again following the rules.]"
+                user_message += retry_note
+                if chat_messages:
+                    last = chat_messages[-1]
+                    chat_messages = chat_messages[:-1] + [
+                        {"role": last["role"], "content": last["content"] + retry_note}
+                    ]
             else:
                 return raw_output, metadata
 
         return raw_output, metadata
 
-    def _generate_simple(self, system_prompt: str, user_message: str) -> str:
-        """Simple generation without validation."""
-        return self.llm.send_message(system_prompt, user_message)
+    @staticmethod
+    def _coach_rules(rules: str) -> List[str]:
+        """Split a round's rules text into the rule list the coach validates against."""
+        return [r.strip() for r in rules.split(".") if r.strip()] if rules else []
+
+    @staticmethod
+    def _agent_behaviors(agent: Dict[str, Any]) -> str:
+        """Raw behavioral rules passed to the coach as validation context."""
+        return agent.get("behaviors", {}).get("raw", "")
+
+    def _generate_simple(
+        self,
+        system_prompt: str,
+        user_message: str,
+        on_delta: Optional[Callable[[str, str], None]] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        chat_messages: Optional[List[Dict[str, str]]] = None
+    ) -> str:
+        """
+        Simple generation without validation.
+
+        chat_messages are sent with send_messages / stream_messages when the
+        client has them; otherwise the flattened user_message is sent.
+        """
+        chat = chat_messages is not None and hasattr(self.llm, "send_messages")
+        stream_method = "stream_messages" if chat else "stream_message"
+        if not self._streaming_enabled(on_delta) or not hasattr(self.llm, stream_method):
+            if chat:
+                return self.llm.send_messages(system_prompt, chat_messages)
+            return self.llm.send_message(system_prompt, user_message)
+
+        deltas = (
+            self.llm.stream_messages(system_prompt, chat_messages) if chat
+            else self.llm.stream_message(system_prompt, user_message)
+        )
+        content, cancelled = consume_stream(
+            deltas, on_delta, self._stream_guard, self._stream_settled
+        )
+        if cancelled and metadata is not None:
+            metadata["stream_cancelled"] = True
+        return content
+
+    def _streaming_enabled(self, on_delta: Optional[Callable] = None) -> bool:
+        return self.config.stream_tokens or on_delta is not None
+
+    def _stream_guard(self, text: str) -> Optional[str]:
+        """
+        Decide whether to cancel a streaming generation.
+
+        Returns None to keep streaming, or the text to keep: everything
+        before a leaked "[If ...]" cue, or the output cut back to the last
+        sentence end within stream_max_chars.
+        """
+        if self.config.stream_cancel_on_leak:
+            for marker in ("[If ", "[if "):
+                idx = text.find(marker)
+                if idx != -1:
+                    return text[:idx].rstrip()
+
+        max_chars = self.config.stream_max_chars
+        if max_chars and len(text) > max_chars:
+            return text[:self._sentence_cut(text, max_chars)].rstrip()
+
+        return None
+
+    @staticmethod
+    def _sentence_cut(text: str, max_chars: int) -> int:
+        """Where _stream_guard cuts text longer than max_chars."""
+        kept = text[:max_chars]
+        cut = max(kept.rfind(". "), kept.rfind("! "), kept.rfind("? "))
+        return cut + 1 if cut > max_chars // 2 else max_chars
+
+    def _stream_settled(self, text: str) -> int:
+        """
+        Length of the prefix of text that _stream_guard can no longer cut.
+
+        Deltas past it are held back: trailing whitespace, a "[If " cue that
+        may still be arriving, and (with stream_max_chars) anything after
+        the sentence end a later length cut would return to.
+        """
+        settled = len(text)
+        if self.config.stream_cancel_on_leak:
+            for i in range(max(0, len(text) - 3), len(text)):
+                if "[If ".startswith(text[i:]) or "[if ".startswith(text[i:]):
+                    settled = i
+                    break
+
+        max_chars = self.config.stream_max_chars
+        if max_chars:
+            # A later length cut keeps at least up to the last sentence end
+            # past max_chars // 2 (any further one lies beyond text)
+            cut = self._sentence_cut(text, max_chars)
+            if cut < len(text):
+                settled = min(settled, cut)
+        return len(text[:settled].rstrip())
 
     def _filter_prompt_leaks(self, text: str) -> str:
         """Remove prompt leaks from output."""
@@ -496,20 +1331,11 @@ class SocialRLRunner:
 
         return len(issues) == 0, issues
 
-    def _extract_incremental_feedback(
-        self,
-        messages: List[SocialRLMessage],
-        participants: List[Dict[str, Any]]
-    ):
+    def _extract_incremental_feedback(self, feedback_state: RoundFeedbackAccumulator):
         """Extract feedback incrementally during round."""
-        participant_ids = [p.get("identifier") for p in participants]
-        msg_dicts = [{"agent_id": m.agent_id, "content": m.content} for m in messages]
-
-        # Extract but don't update accumulated yet
-        _ = self.feedback_extractor.extract_round_feedback(
-            0,  # Temp round number
-            msg_dicts,
-            participant_ids
+        # Snapshot the running counts but don't update accumulated yet
+        self.feedback_extractor.round_feedback[0] = feedback_state.snapshot(
+            round_number=0  # Temp round number
         )
 
     def _adapt_policies_from_feedback(self, round_number: int) -> List[Dict[str, Any]]:
@@ -642,15 +1468,62 @@ class SocialRLRunner:
 
         return "\n".join(report)
 
-    def _save_round(self, result: SocialRLRoundResult):
+    def _open_transcript(
+        self,
+        round_number: int,
+        messages: List[SocialRLMessage]
+    ) -> Optional[TranscriptWriter]:
+        """Start a streamed JSONL transcript for a round (auto_save + jsonl only)."""
+        if not self.config.auto_save or self.config.transcript_format != "jsonl":
+            return None
+
+        writer = TranscriptWriter(
+            transcript_path(self.output_dir, round_number, self.config.transcript_compression),
+            self.config.transcript_compression
+        )
+        for message in messages:
+            writer.write_message(self._transcript_record(message))
+        return writer
+
+    def _transcript_record(self, message: SocialRLMessage) -> Dict[str, Any]:
+        """Transcript message record: to_dict(), plus turn_context if saved."""
+        record = message.to_dict()
+        if self.config.save_turn_context and message.turn_context is not None:
+            record["turn_context"] = message.turn_context
+        return record
+
+    def _write_round_file(self, output_path: Path, result: SocialRLRoundResult) -> Path:
+        """Write a whole round in the configured transcript format."""
+        if self.config.transcript_format == "jsonl":
+            output_file = transcript_path(
+                output_path, result.round_number, self.config.transcript_compression
+            )
+            round_record = result.to_dict()
+            round_record["messages"] = [self._transcript_record(m) for m in result.messages]
+            write_round_transcript(output_file, round_record, self.config.transcript_compression)
+        else:
+            output_file = output_path / f"round{result.round_number}_social_rl.json"
+            with open(output_file, "w") as f:
+                json.dump(result.to_dict(), f, indent=2)
+        return output_file
+
+    def _save_round(
+        self,
+        result: SocialRLRoundResult,
+        transcript: Optional[TranscriptWriter] = None
+    ):
         """Save a single round result (called automatically if auto_save=True)."""
         try:
             # Ensure directory exists
             self.output_dir.mkdir(parents=True, exist_ok=True)
 
-            output_file = self.output_dir / f"round{result.round_number}_social_rl.json"
-            with open(output_file, "w") as f:
-                json.dump(result.to_dict(), f, indent=2)
+            if transcript:
+                # Messages are already on disk; only the summary is left
+                transcript.write_summary(result.to_dict())
+                transcript.close()
+                output_file = transcript.path
+            else:
+                output_file = self._write_round_file(self.output_dir, result)
 
             # Also save policy state after each round
             policy_file = self.output_dir / "policy_state.json"
@@ -667,9 +1540,8 @@ class SocialRLRunner:
         output_path.mkdir(parents=True, exist_ok=True)
 
         # Save round results
-        for round_num, result in self.round_results.items():
-            with open(output_path / f"round{round_num}_social_rl.json", "w") as f:
-                json.dump(result.to_dict(), f, indent=2)
+        for result in self.round_results.values():
+            self._write_round_file(output_path, result)
 
         # Save policy state
         self.process_retriever.save_policy_state(str(output_path / "policy_state.json"))
@@ -321,9 +321,10 @@ def validate_round_result(data: Dict[str, Any]) -> bool:
 
 
 def load_round_result(filepath: str) -> SocialRLRoundResultWithMeta:
-    """Load and validate a round result from JSON file."""
-    with open(filepath, 'r') as f:
-        data = json.load(f)
+    """Load and validate a round result from a JSON or JSONL transcript file."""
+    from .transcript import load_round_transcript
+
+    data = load_round_transcript(filepath)
     validate_round_result(data)
     return data
 
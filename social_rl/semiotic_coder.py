@@ -16,13 +16,31 @@ Usage:
     coder = SemioticCoder(llm_client)
     coded = coder.code_transcript(round_data)
     summary = coder.compute_semiotic_summary(coded)
+
+    # Whole corpora (experiment dirs or message lists), in parallel
+    for source_index, code in coder.code_corpus(experiment_dirs):
+        ...
 """
 
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Tuple, Iterable, Iterator, Union
 from dataclasses import dataclass, field
 from enum import Enum
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from pathlib import Path
+import asyncio
+import hashlib
+import inspect
 import json
+import os
+import queue
 import re
+import threading
+
+from .lexicon import LexiconMatcher
+from .optional_deps import import_numpy
 
 
 # =============================================================================
@@ -113,6 +131,141 @@ class SemioticSummary:
     stance_valence: float = 0.0       # (bridging - dismissive) / total
 
 
+# =============================================================================
+# COLUMNAR AGGREGATION
+# =============================================================================
+
+# Columns SemioticCodeTable.summarize() can group by
+GROUP_COLUMNS = ("condition", "round_number", "agent_id")
+
+_JUSTIFICATIONS = list(JustificationType)
+_VOICES = list(VoiceMarker)
+_STANCES = list(RelationalStance)
+_JUSTIFICATION_INDEX = {member: i for i, member in enumerate(_JUSTIFICATIONS)}
+_VOICE_INDEX = {member: i for i, member in enumerate(_VOICES)}
+_STANCE_INDEX = {member: i for i, member in enumerate(_STANCES)}
+
+# One count slot per category member: justification | voice | stance
+_VOICE_OFFSET = len(_JUSTIFICATIONS)
+_STANCE_OFFSET = _VOICE_OFFSET + len(_VOICES)
+_SLOTS = _STANCE_OFFSET + len(_STANCES)
+
+
+@dataclass
+class SemioticCodeTable:
+    """Coded utterances as columns, with categories encoded as small ints.
+
+    Lets summaries over whole sweeps be computed in one grouped count
+    instead of one pass per category and agent:
+
+        table = SemioticCodeTable.from_codes(codes_a, condition="A")
+        table.extend(codes_b, condition="B")
+        table.summarize(by=("condition", "round_number", "agent_id"))
+    """
+    agent_id: List[str] = field(default_factory=list)
+    round_number: List[int] = field(default_factory=list)
+    condition: List[Optional[str]] = field(default_factory=list)
+    justification: array = field(default_factory=lambda: array("B"))
+    voice: array = field(default_factory=lambda: array("B"))
+    stance: array = field(default_factory=lambda: array("B"))
+
+    @classmethod
+    def from_codes(cls, codes: Iterable[SemioticCode], condition: Optional[str] = None) -> "SemioticCodeTable":
+        table = cls()
+        table.extend(codes, condition)
+        return table
+
+    def extend(self, codes: Iterable[SemioticCode], condition: Optional[str] = None) -> None:
+        """Append coded utterances, all labelled with condition."""
+        for code in codes:
+            self.agent_id.append(code.agent_id)
+            self.round_number.append(code.round_number)
+            self.condition.append(condition)
+            self.justification.append(_JUSTIFICATION_INDEX[code.justification])
+            self.voice.append(_VOICE_INDEX[code.voice])
+            self.stance.append(_STANCE_INDEX[code.stance])
+
+    def __len__(self) -> int:
+        return len(self.agent_id)
+
+    def _slot_counts(self, group_ids: List[int], n_groups: int) -> List[List[int]]:
+        """Per-group count of every category member, in one grouped pass."""
+        np = import_numpy(required=False)
+        if np is not None and group_ids:
+            base = np.asarray(group_ids, dtype=np.int64) * _SLOTS
+            slots = np.concatenate([
+                base + np.frombuffer(self.justification, dtype=np.uint8),
+                base + _VOICE_OFFSET + np.frombuffer(self.voice, dtype=np.uint8),
+                base + _STANCE_OFFSET + np.frombuffer(self.stance, dtype=np.uint8),
+            ])
+            counts = np.bincount(slots, minlength=n_groups * _SLOTS)
+            return counts.reshape(n_groups, _SLOTS).tolist()
+
+        flat = [0] * (n_groups * _SLOTS)
+        for gid, j, v, st in zip(group_ids, self.justification, self.voice, self.stance):
+            base = gid * _SLOTS
+            flat[base + j] += 1
+            flat[base + _VOICE_OFFSET + v] += 1
+            flat[base + _STANCE_OFFSET + st] += 1
+        return [flat[g * _SLOTS:(g + 1) * _SLOTS] for g in range(n_groups)]
+
+    def summarize(self, by: Tuple[str, ...] = ("agent_id",)) -> Dict[Any, SemioticSummary]:
+        """Compute a SemioticSummary per group.
+
+        Args:
+            by: Columns from GROUP_COLUMNS to group by
+
+        Returns:
+            Dict keyed by the group value (a tuple when grouping by several
+            columns), in order of first appearance. Summaries not grouped by
+            agent have agent_id "all".
+        """
+        unknown = [name for name in by if name not in GROUP_COLUMNS]
+        if unknown or not by:
+            raise ValueError(f"Cannot group by {unknown or by} (expected columns from {GROUP_COLUMNS})")
+
+        columns = [getattr(self, name) for name in by]
+        keys = columns[0] if len(columns) == 1 else list(zip(*columns))
+        group_index: Dict[Any, int] = {}
+        group_ids = [group_index.setdefault(key, len(group_index)) for key in keys]
+        counts = self._slot_counts(group_ids, len(group_index))
+
+        agent_pos = by.index("agent_id") if "agent_id" in by else None
+        just = _JUSTIFICATION_INDEX
+        voice = {m: _VOICE_OFFSET + i for m, i in _VOICE_INDEX.items()}
+        stance = {m: _STANCE_OFFSET + i for m, i in _STANCE_INDEX.items()}
+
+        summaries = {}
+        for key, gid in group_index.items():
+            c = counts[gid]
+            total = sum(c[:_VOICE_OFFSET])
+            if agent_pos is None:
+                aid = "all"
+            else:
+                aid = key if len(by) == 1 else key[agent_pos]
+
+            alien_count = c[voice[VoiceMarker.ALIENATED]]
+            empower_count = c[voice[VoiceMarker.EMPOWERED]]
+            bridge_count = c[stance[RelationalStance.BRIDGING]]
+            dismiss_count = c[stance[RelationalStance.DISMISSIVE]]
+
+            summaries[key] = SemioticSummary(
+                agent_id=aid,
+                total_turns=total,
+                justification_ratio=c[just[JustificationType.JUSTIFICATORY]] / total,
+                assertion_ratio=c[just[JustificationType.ASSERTIVE]] / total,
+                alienation_count=alien_count,
+                empowerment_count=empower_count,
+                conditional_count=c[voice[VoiceMarker.CONDITIONAL]],
+                bridging_count=bridge_count,
+                dismissive_count=dismiss_count,
+                direct_address_count=c[stance[RelationalStance.DIRECT_ADDRESS]],
+                voice_valence=(empower_count - alien_count) / total,
+                stance_valence=(bridge_count - dismiss_count) / total
+            )
+        return summaries
+
+
 # =============================================================================
 # LEXICON-BASED CODING (fast, transparent)
 # =============================================================================
@@ -173,11 +326,68 @@ STANCE_MARKERS = {
 }
 
 
-def lexicon_code_utterance(content: str, agent_id: str, turn: int, round_num: int) -> SemioticCode:
+_lexicon_matcher: Optional[LexiconMatcher] = None
+_lexicon_sources: Tuple[Tuple[List[str], int], ...] = ()
+
+
+def _marker_lists() -> Tuple[List[str], ...]:
+    return (
+        *JUSTIFICATION_MARKERS.values(),
+        *VOICE_MARKERS.values(),
+        *STANCE_MARKERS.values(),
+    )
+
+
+def get_lexicon_matcher() -> LexiconMatcher:
+    """
+    Matcher for the current module-level marker lexicons.
+
+    Built once per marker set. The check per call only compares each
+    category's list object and length against the ones the matcher was
+    built from, so replacing, adding or appending to a marker list
+    rebuilds it; after editing a list in place without changing its length,
+    call reset_lexicon_matcher().
+    """
+    global _lexicon_matcher, _lexicon_sources
+    lists = _marker_lists()
+    if (
+        _lexicon_matcher is None
+        or len(lists) != len(_lexicon_sources)
+        or any(
+            markers is not source or len(markers) != length
+            for markers, (source, length) in zip(lists, _lexicon_sources)
+        )
+    ):
+        _lexicon_matcher = LexiconMatcher({
+            "justification": JUSTIFICATION_MARKERS,
+            "voice": VOICE_MARKERS,
+            "stance": STANCE_MARKERS,
+        })
+        # Keep the lists themselves so their ids cannot be reused
+        _lexicon_sources = tuple((markers, len(markers)) for markers in lists)
+    return _lexicon_matcher
+
+
+def reset_lexicon_matcher() -> None:
+    """Force the next get_lexicon_matcher() to rebuild from the lexicons."""
+    global _lexicon_matcher, _lexicon_sources
+    _lexicon_matcher = None
+    _lexicon_sources = ()
+
+
+def lexicon_code_utterance(
+    content: str,
+    agent_id: str,
+    turn: int,
+    round_num: int,
+    matcher: Optional[LexiconMatcher] = None
+) -> SemioticCode:
     """Code an utterance using lexicon matching.
 
     Fast, transparent, reproducible. Use as baseline or
-    supplement to LLM coding.
+    supplement to LLM coding. Pass a prebuilt matcher (with "justification",
+    "voice" and "stance" lexicons) to code with other markers than the
+    module-level ones.
     """
     content_lower = content.lower()
     code = SemioticCode(
@@ -187,15 +397,12 @@ def lexicon_code_utterance(content: str, agent_id: str, turn: int, round_num: in
         content=content
     )
 
+    # One pass over the text for all marker categories
+    hits = (matcher or get_lexicon_matcher()).match(content_lower)
+
     # Justification coding
-    just_markers = []
-    assert_markers = []
-    for marker in JUSTIFICATION_MARKERS["justificatory"]:
-        if marker in content_lower:
-            just_markers.append(marker)
-    for marker in JUSTIFICATION_MARKERS["assertive"]:
-        if marker in content_lower:
-            assert_markers.append(marker)
+    just_markers = hits["justification"]["justificatory"]
+    assert_markers = hits["justification"]["assertive"]
 
     code.justification_markers = just_markers + assert_markers
     if len(just_markers) > len(assert_markers):
@@ -206,18 +413,9 @@ def lexicon_code_utterance(content: str, agent_id: str, turn: int, round_num: in
         code.justification = JustificationType.NEUTRAL
 
     # Voice coding
-    alien_markers = []
-    empower_markers = []
-    cond_markers = []
-    for marker in VOICE_MARKERS["alienated"]:
-        if marker in content_lower:
-            alien_markers.append(marker)
-    for marker in VOICE_MARKERS["empowered"]:
-        if marker in content_lower:
-            empower_markers.append(marker)
-    for marker in VOICE_MARKERS["conditional"]:
-        if marker in content_lower:
-            cond_markers.append(marker)
+    alien_markers = hits["voice"]["alienated"]
+    empower_markers = hits["voice"]["empowered"]
+    cond_markers = hits["voice"]["conditional"]
 
     code.voice_markers = alien_markers + empower_markers + cond_markers
     if len(alien_markers) > max(len(empower_markers), len(cond_markers)):
@@ -230,18 +428,9 @@ def lexicon_code_utterance(content: str, agent_id: str, turn: int, round_num: in
         code.voice = VoiceMarker.NEUTRAL
 
     # Stance coding
-    bridge_markers = []
-    dismiss_markers = []
-    direct_markers = []
-    for marker in STANCE_MARKERS["bridging"]:
-        if marker in content_lower:
-            bridge_markers.append(marker)
-    for marker in STANCE_MARKERS["dismissive"]:
-        if marker in content_lower:
-            dismiss_markers.append(marker)
-    for marker in STANCE_MARKERS["direct"]:
-        if marker in content_lower:
-            direct_markers.append(marker)
+    bridge_markers = hits["stance"]["bridging"]
+    dismiss_markers = hits["stance"]["dismissive"]
+    direct_markers = hits["stance"]["direct"]
 
     code.stance_markers = bridge_markers + dismiss_markers + direct_markers
     if len(dismiss_markers) > len(bridge_markers):
@@ -284,7 +473,7 @@ Code this utterance on three dimensions:
    - neutral: No clear stance
 
 Respond in this exact JSON format:
-{
+{{
   "justification": "justificatory|assertive|neutral",
   "voice": "alienated|empowered|conditional|neutral",
   "stance": "bridging|dismissive|direct_address|impersonal|neutral",
@@ -293,7 +482,7 @@ Respond in this exact JSON format:
   "stance_markers": ["extracted phrases..."],
   "confidence": 0.0-1.0,
   "notes": "brief reasoning"
-}
+}}
 
 UTTERANCE TO CODE:
 Agent: {agent_id}
@@ -301,6 +490,18 @@ Content: {content}
 """
 
 
+LLM_CODER_SYSTEM_PROMPT = "You are a precise semiotic coder. Respond only with valid JSON."
+
+
+def llm_prompt_version() -> str:
+    """Hash of the LLM coding prompts; changes whenever either prompt is edited."""
+    digest = hashlib.sha256()
+    digest.update(LLM_CODER_SYSTEM_PROMPT.encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(LLM_CODING_PROMPT.encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
 class SemioticCoder:
     """Semiotic coder using lexicon and/or LLM."""
 
@@ -308,17 +509,34 @@ class SemioticCoder:
         self,
         llm_client: Optional[Any] = None,
         use_llm: bool = False,
-        llm_temperature: float = 0.1
+        llm_temperature: float = 0.1,
+        code_cache: Optional[Any] = None,
+        model: Optional[str] = None
     ):
         """
         Args:
             llm_client: Optional LLM client for richer coding
             use_llm: If True, use LLM coding (falls back to lexicon if no client)
             llm_temperature: Temperature for LLM coder (low for consistency)
+            code_cache: Optional SemioticCodeCache for LLM codes
+            model: Model name for cache keys (default: llm_client.model);
+                required with code_cache if the client has no .model
+
+        Raises:
+            ValueError: If code_cache is given and no model name is known
         """
         self.llm_client = llm_client
         self.use_llm = use_llm and llm_client is not None
         self.llm_temperature = llm_temperature
+        self.code_cache = code_cache
+        self.model = model or getattr(llm_client, "model", None)
+        if code_cache is not None and not self.model:
+            # Guessing (e.g. the wrapper class name) would let two models
+            # behind the same wrapper share one cache key
+            raise ValueError(
+                f"code_cache needs a model name for its keys, but "
+                f"{type(llm_client).__name__} has no .model attribute; pass model="
+            )
 
     def code_utterance(
         self,
@@ -341,47 +559,111 @@ class SemioticCoder:
         round_num: int
     ) -> SemioticCode:
         """Code using LLM."""
-        prompt = LLM_CODING_PROMPT.format(agent_id=agent_id, content=content)
+        cached = self._cached_code(content, agent_id, turn, round_num)
+        if cached is not None:
+            return cached
 
         try:
             response = self.llm_client.send_message(
-                system_prompt="You are a precise semiotic coder. Respond only with valid JSON.",
-                user_message=prompt,
+                system_prompt=LLM_CODER_SYSTEM_PROMPT,
+                user_message=LLM_CODING_PROMPT.format(agent_id=agent_id, content=content),
                 temperature=self.llm_temperature,
                 max_tokens=512
             )
+            return self._store_code(self._parse_llm_code(response, content, agent_id, turn, round_num))
+
+        except Exception as e:
+            return self._llm_fallback(e, content, agent_id, turn, round_num)
 
-            # Parse JSON response
-            # Handle potential markdown code blocks
-            response = response.strip()
-            if response.startswith("```"):
-                response = response.split("```")[1]
-                if response.startswith("json"):
-                    response = response[4:]
-
-            data = json.loads(response)
-
-            code = SemioticCode(
-                agent_id=agent_id,
-                turn_number=turn,
-                round_number=round_num,
-                content=content,
-                justification=JustificationType(data.get("justification", "neutral")),
-                voice=VoiceMarker(data.get("voice", "neutral")),
-                stance=RelationalStance(data.get("stance", "neutral")),
-                justification_markers=data.get("justification_markers", []),
-                voice_markers=data.get("voice_markers", []),
-                stance_markers=data.get("stance_markers", []),
-                confidence=data.get("confidence", 0.8),
-                coder_notes=f"llm-coded: {data.get('notes', '')}"
+    async def _allm_code(
+        self,
+        content: str,
+        agent_id: str,
+        turn: int,
+        round_num: int
+    ) -> SemioticCode:
+        """Async version of _llm_code() (blocking clients run in a worker thread)."""
+        cached = self._cached_code(content, agent_id, turn, round_num)
+        if cached is not None:
+            return cached
+
+        try:
+            kwargs = dict(
+                system_prompt=LLM_CODER_SYSTEM_PROMPT,
+                user_message=LLM_CODING_PROMPT.format(agent_id=agent_id, content=content),
+                temperature=self.llm_temperature,
+                max_tokens=512
             )
-            return code
+            if inspect.iscoroutinefunction(self.llm_client.send_message):
+                response = await self.llm_client.send_message(**kwargs)
+            else:
+                response = await asyncio.to_thread(self.llm_client.send_message, **kwargs)
+            return self._store_code(self._parse_llm_code(response, content, agent_id, turn, round_num))
 
         except Exception as e:
-            # Fall back to lexicon coding
-            code = lexicon_code_utterance(content, agent_id, turn, round_num)
-            code.coder_notes = f"llm-fallback (error: {str(e)[:50]})"
-            return code
+            return self._llm_fallback(e, content, agent_id, turn, round_num)
+
+    def _cached_code(
+        self,
+        content: str,
+        agent_id: str,
+        turn: int,
+        round_num: int
+    ) -> Optional[SemioticCode]:
+        if self.code_cache is None:
+            return None
+        return self.code_cache.get(content, agent_id, self.model, turn, round_num)
+
+    def _store_code(self, code: SemioticCode) -> SemioticCode:
+        if self.code_cache is not None:
+            self.code_cache.put(code, self.model)
+        return code
+
+    @staticmethod
+    def _parse_llm_code(
+        response: str,
+        content: str,
+        agent_id: str,
+        turn: int,
+        round_num: int
+    ) -> SemioticCode:
+        """Build a SemioticCode from the coder's JSON response."""
+        # Handle potential markdown code blocks
+        response = response.strip()
+        if response.startswith("```"):
+            response = response.split("```")[1]
+            if response.startswith("json"):
+                response = response[4:]
+
+        data = json.loads(response)
+
+        return SemioticCode(
+            agent_id=agent_id,
+            turn_number=turn,
+            round_number=round_num,
+            content=content,
+            justification=JustificationType(data.get("justification", "neutral")),
+            voice=VoiceMarker(data.get("voice", "neutral")),
+            stance=RelationalStance(data.get("stance", "neutral")),
+            justification_markers=data.get("justification_markers", []),
+            voice_markers=data.get("voice_markers", []),
+            stance_markers=data.get("stance_markers", []),
+            confidence=data.get("confidence", 0.8),
+            coder_notes=f"llm-coded: {data.get('notes', '')}"
+        )
+
+    @staticmethod
+    def _llm_fallback(
+        error: Exception,
+        content: str,
+        agent_id: str,
+        turn: int,
+        round_num: int
+    ) -> SemioticCode:
+        """Fall back to lexicon coding when the LLM call or parse fails."""
+        code = lexicon_code_utterance(content, agent_id, turn, round_num)
+        code.coder_notes = f"llm-fallback (error: {str(error)[:50]})"
+        return code
 
     def code_transcript(self, round_data: Dict) -> List[SemioticCode]:
         """Code all messages in a round transcript.
@@ -407,6 +689,165 @@ class SemioticCoder:
 
         return codes
 
+    def code_corpus(
+        self,
+        sources: Iterable[Union[str, Path, Iterable[Dict]]],
+        workers: Optional[int] = None,
+        shard_size: int = 256,
+        max_concurrency: int = 8
+    ) -> Iterator[Tuple[int, SemioticCode]]:
+        """Code many experiments / message streams, streaming codes in order.
+
+        Lexicon coding is sharded across a process pool; LLM coding runs
+        _llm_code through an async pool of at most max_concurrency requests,
+        on one event loop for the whole corpus.
+        Codes come out in a stable order regardless of worker timing:
+        source order, then round order, then message order - the same
+        codes code_transcript() would give round by round.
+
+        Args:
+            sources: Experiment directories (str / Path) and/or iterables of
+                message dicts (SocialRLMessage.to_dict() shape; round_number
+                defaults to 1)
+            workers: Lexicon worker processes (default: CPU count; 1 = in-process)
+            shard_size: Utterances per shard handed to a worker
+            max_concurrency: Concurrent LLM requests when use_llm is set
+
+        Yields:
+            (source_index, SemioticCode) with source_index into sources
+        """
+        shards = _corpus_shards(sources, shard_size)
+
+        if self.use_llm:
+            yield from self._llm_code_corpus(shards, max_concurrency)
+            return
+
+        workers = workers or os.cpu_count() or 1
+        if workers == 1:
+            for shard in shards:
+                for item, code in zip(shard, _lexicon_code_shard(shard)):
+                    yield item[0], code
+            return
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            # Keep a bounded window of shards in flight; results are taken
+            # in submission order so the stream is deterministic.
+            pending: deque = deque()
+            for shard in shards:
+                pending.append((shard, pool.submit(_lexicon_code_shard, shard)))
+                if len(pending) >= 2 * workers:
+                    yield from _drain_shard(*pending.popleft())
+            while pending:
+                yield from _drain_shard(*pending.popleft())
+
+    def _llm_code_corpus(
+        self,
+        shards: Iterator[List[Tuple[int, str, str, int, int]]],
+        max_concurrency: int,
+        window: int = 2
+    ) -> Iterator[Tuple[int, SemioticCode]]:
+        """LLM-code shards on one event loop, yielding codes in shard order.
+
+        A single asyncio.run() in a worker thread covers every shard, so
+        async clients keep their semaphore and HTTP session on one loop, up
+        to `window` shards are in flight at once, and code_corpus() also
+        works from inside a running event loop. Coded shards come back
+        through a bounded queue; closing the generator cancels the rest.
+        """
+        results: queue.Queue = queue.Queue(maxsize=window)
+        running: Dict[str, Any] = {}
+
+        async def produce():
+            running["loop"], running["task"] = asyncio.get_running_loop(), asyncio.current_task()
+            semaphore = asyncio.Semaphore(max_concurrency)
+            pending: deque = deque()
+            try:
+                while True:
+                    while len(pending) < window:
+                        shard = await asyncio.to_thread(next, shards, None)
+                        if shard is None:
+                            break
+                        pending.append((shard, asyncio.ensure_future(self._allm_code_shard(shard, semaphore))))
+                    if not pending:
+                        return
+                    shard, task = pending.popleft()
+                    await asyncio.to_thread(results.put, (shard, await task))
+            finally:
+                for _, task in pending:
+                    task.cancel()
+
+        def run():
+            try:
+                asyncio.run(produce())
+            except asyncio.CancelledError:
+                pass
+            except BaseException as e:
+                results.put((None, e))
+                return
+            results.put((None, None))
+
+        thread = threading.Thread(target=run, name="semiotic-llm-coder", daemon=True)
+        thread.start()
+        try:
+            while True:
+                shard, codes = results.get()
+                if shard is None:
+                    if codes is not None:
+                        raise codes
+                    return
+                for (source_index, *_), code in zip(shard, codes):
+                    yield source_index, code
+        finally:
+            # Stopped early: cancel in-flight shards, unblock the producer
+            cancelled = False
+            while thread.is_alive():
+                if not cancelled and "task" in running:
+                    try:
+                        running["loop"].call_soon_threadsafe(running["task"].cancel)
+                    except RuntimeError:
+                        pass  # loop already closed
+                    cancelled = True
+                try:
+                    results.get(timeout=0.05)
+                except queue.Empty:
+                    pass
+            thread.join()
+
+    async def _allm_code_shard(
+        self,
+        shard: List[Tuple[int, str, str, int, int]],
+        semaphore: asyncio.Semaphore
+    ) -> List[SemioticCode]:
+        """LLM-code one shard; semaphore bounds requests across all shards."""
+
+        async def code(item):
+            _, content, agent_id, turn, round_num = item
+            async with semaphore:
+                return await self._allm_code(content, agent_id, turn, round_num)
+
+        return await asyncio.gather(*[code(item) for item in shard])
+
+    def recoding_report(self, sources: Iterable[Union[str, Path, Iterable[Dict]]]) -> Dict[str, Any]:
+        """Count the utterances in sources that LLM coding would still send.
+
+        Args:
+            sources: As for code_corpus()
+
+        Returns:
+            SemioticCodeCache.report() counts (total / cached / stale / new /
+            needs_recoding); without a cache every utterance is new
+        """
+        utterances = (
+            (content, agent_id)
+            for _, content, agent_id, _, _ in _corpus_utterances(sources)
+        )
+        if self.code_cache is not None:
+            return self.code_cache.report(utterances, self.model)
+
+        total = sum(1 for _ in utterances)
+        return {"total": total, "cached": 0, "stale": 0, "new": total,
+                "needs_recoding": total, "prompt_version": llm_prompt_version()}
+
     def compute_semiotic_summary(
         self,
         codes: List[SemioticCode],
@@ -421,50 +862,9 @@ class SemioticCoder:
         Returns:
             Dict mapping agent_id to SemioticSummary
         """
-        # Group by agent
-        by_agent: Dict[str, List[SemioticCode]] = {}
-        for code in codes:
-            if agent_id and code.agent_id != agent_id:
-                continue
-            if code.agent_id not in by_agent:
-                by_agent[code.agent_id] = []
-            by_agent[code.agent_id].append(code)
-
-        summaries = {}
-        for aid, agent_codes in by_agent.items():
-            total = len(agent_codes)
-            if total == 0:
-                continue
-
-            # Count categories
-            just_count = sum(1 for c in agent_codes if c.justification == JustificationType.JUSTIFICATORY)
-            assert_count = sum(1 for c in agent_codes if c.justification == JustificationType.ASSERTIVE)
-
-            alien_count = sum(1 for c in agent_codes if c.voice == VoiceMarker.ALIENATED)
-            empower_count = sum(1 for c in agent_codes if c.voice == VoiceMarker.EMPOWERED)
-            cond_count = sum(1 for c in agent_codes if c.voice == VoiceMarker.CONDITIONAL)
-
-            bridge_count = sum(1 for c in agent_codes if c.stance == RelationalStance.BRIDGING)
-            dismiss_count = sum(1 for c in agent_codes if c.stance == RelationalStance.DISMISSIVE)
-            direct_count = sum(1 for c in agent_codes if c.stance == RelationalStance.DIRECT_ADDRESS)
-
-            summary = SemioticSummary(
-                agent_id=aid,
-                total_turns=total,
-                justification_ratio=just_count / total,
-                assertion_ratio=assert_count / total,
-                alienation_count=alien_count,
-                empowerment_count=empower_count,
-                conditional_count=cond_count,
-                bridging_count=bridge_count,
-                dismissive_count=dismiss_count,
-                direct_address_count=direct_count,
-                voice_valence=(empower_count - alien_count) / total if total > 0 else 0,
-                stance_valence=(bridge_count - dismiss_count) / total if total > 0 else 0
-            )
-            summaries[aid] = summary
-
-        return summaries
+        if agent_id:
+            codes = [c for c in codes if c.agent_id == agent_id]
+        return SemioticCodeTable.from_codes(codes).summarize()
 
     def to_dataframe_rows(self, codes: List[SemioticCode]) -> List[Dict]:
         """Convert coded utterances to rows suitable for pandas DataFrame."""
@@ -487,6 +887,60 @@ class SemioticCoder:
         return rows
 
 
+def _lexicon_code_shard(shard: List[Tuple[int, str, str, int, int]]) -> List[SemioticCode]:
+    """Process-pool worker: lexicon-code one shard of corpus utterances."""
+    return [
+        lexicon_code_utterance(content, agent_id, turn, round_num)
+        for _, content, agent_id, turn, round_num in shard
+    ]
+
+
+def _drain_shard(shard, future) -> Iterator[Tuple[int, SemioticCode]]:
+    for item, code in zip(shard, future.result()):
+        yield item[0], code
+
+
+def _corpus_utterances(
+    sources: Iterable[Union[str, Path, Iterable[Dict]]]
+) -> Iterator[Tuple[int, str, str, int, int]]:
+    """Flatten corpus sources into (source_index, content, agent_id, turn, round)."""
+    from .transcript import load_round_transcripts
+
+    for source_index, source in enumerate(sources):
+        if isinstance(source, (str, Path)):
+            for round_num, round_data in load_round_transcripts(Path(source)).items():
+                for msg in round_data.get("messages", []):
+                    yield (
+                        source_index,
+                        msg.get("content", ""),
+                        msg.get("agent_id", "unknown"),
+                        msg.get("turn_number", 0),
+                        round_data.get("round_number", round_num)
+                    )
+        else:
+            for msg in source:
+                yield (
+                    source_index,
+                    msg.get("content", ""),
+                    msg.get("agent_id", "unknown"),
+                    msg.get("turn_number", 0),
+                    msg.get("round_number", 1)
+                )
+
+
+def _corpus_shards(
+    sources: Iterable[Union[str, Path, Iterable[Dict]]],
+    shard_size: int
+) -> Iterator[List[Tuple[int, str, str, int, int]]]:
+    """Lazily group corpus utterances into shards of shard_size."""
+    utterances = _corpus_utterances(sources)
+    while True:
+        shard = list(islice(utterances, max(1, shard_size)))
+        if not shard:
+            return
+        yield shard
+
+
 # =============================================================================
 # ANALYSIS FUNCTIONS
 # =============================================================================
@@ -499,12 +953,17 @@ def compare_conditions(
 ) -> Dict:
     """Compare semiotic patterns between two experimental conditions.
 
+    Codes for both conditions typically come from one SemioticCoder with a
+    code_cache, so re-running a comparison only LLM-codes new messages.
+
     Returns summary statistics for A/B comparison.
     """
-    coder = SemioticCoder()
+    table = SemioticCodeTable.from_codes(condition_a_codes, condition="a")
+    table.extend(condition_b_codes, condition="b")
+    by_condition = table.summarize(by=("condition", "agent_id"))
 
-    summary_a = coder.compute_semiotic_summary(condition_a_codes)
-    summary_b = coder.compute_semiotic_summary(condition_b_codes)
+    summary_a = {aid: s for (cond, aid), s in by_condition.items() if cond == "a"}
+    summary_b = {aid: s for (cond, aid), s in by_condition.items() if cond == "b"}
 
     comparison = {
         "condition_a": condition_a_name,
@@ -536,21 +995,30 @@ def compare_conditions(
     return comparison
 
 
-def load_and_code_experiment(experiment_dir: str, use_llm: bool = False, llm_client: Any = None) -> Dict:
+def load_and_code_experiment(
+    experiment_dir: str,
+    use_llm: bool = False,
+    llm_client: Any = None,
+    code_cache: Optional[Any] = None,
+    model: Optional[str] = None
+) -> Dict:
     """Load an experiment directory and code all rounds.
 
     Args:
         experiment_dir: Path to experiment output directory
         use_llm: Whether to use LLM coding
         llm_client: LLM client if using LLM coding
+        code_cache: Optional SemioticCodeCache so previously coded
+            utterances are not sent to the LLM again
+        model: Model name for cache keys (default: llm_client.model)
 
     Returns:
         Dict with coded rounds and summaries
     """
-    from pathlib import Path
-
     exp_path = Path(experiment_dir)
-    coder = SemioticCoder(llm_client=llm_client, use_llm=use_llm)
+    coder = SemioticCoder(
+        llm_client=llm_client, use_llm=use_llm, code_cache=code_cache, model=model
+    )
 
     results = {
         "experiment_dir": str(exp_path),
@@ -559,14 +1027,10 @@ def load_and_code_experiment(experiment_dir: str, use_llm: bool = False, llm_cli
         "overall_summary": {}
     }
 
-    # Find all round files
-    round_files = sorted(exp_path.glob("round*_social_rl.json"))
-
-    for rf in round_files:
-        with open(rf) as f:
-            round_data = json.load(f)
+    # Load all round transcripts (JSONL or legacy JSON)
+    from .transcript import load_round_transcripts
 
-        round_num = round_data.get("round_number", int(rf.stem.split("_")[0].replace("round", "")))
+    for round_num, round_data in load_round_transcripts(exp_path).items():
         codes = coder.code_transcript(round_data)
         summary = coder.compute_semiotic_summary(codes)
 
@@ -0,0 +1,297 @@
+"""
+Transcript Store - Append-only JSONL round transcripts.
+
+Replaces the whole-file round{n}_social_rl.json dump with a stream of
+compact records written as the round runs:
+
+    {"type":"message","agent_id":...,"content":...,"turn_number":1,...}
+    {"type":"message",...}
+    {"type":"round","round_number":1,"feedback":{...},"synthesis":...,...}
+
+One message record is appended (and flushed) per turn, and the round
+summary follows once the round completes, so memory stays flat for long
+rounds and a crash loses at most the turn in flight. Files may be framed
+with gzip (stdlib) or zstd (requires `zstandard`).
+
+Messages may carry their turn_context; it is stored normalized (see
+context_store.TurnContextCodec) and only rehydrated when asked for.
+
+load_round_transcript() rebuilds the SocialRLRoundResult.to_dict() shape,
+and load_round_transcripts() reads a whole experiment directory in either
+the JSONL or the legacy .json format.
+
+Usage:
+    from social_rl.transcript import load_round_transcripts
+
+    rounds = load_round_transcripts("outputs/G_seed2")
+    for msg in rounds[1]["messages"]:
+        print(msg["agent_id"], msg["content"])
+"""
+
+import io
+import re
+import gzip
+import json
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Iterator, Union
+
+from .context_store import TurnContextCodec
+
+
+TRANSCRIPT_SUFFIXES = {
+    None: ".jsonl",
+    "gzip": ".jsonl.gz",
+    "zstd": ".jsonl.zst",
+}
+
+_ROUND_FILE = re.compile(r"^round(\d+)_social_rl\.(json|jsonl|jsonl\.gz|jsonl\.zst)$")
+
+# Summary fields of SocialRLRoundResult.to_dict() (everything except messages)
+_SUMMARY_DEFAULTS = {
+    "feedback": {},
+    "policy_adaptations": [],
+    "synthesis": "",
+    "duration_seconds": 0.0,
+}
+
+
+def _dumps(record: Dict[str, Any]) -> str:
+    return json.dumps(record, separators=(",", ":"), default=str) + "\n"
+
+
+def _import_zstd():
+    try:
+        import zstandard
+    except ImportError:
+        raise ImportError("Please install zstandard: pip install zstandard")
+    return zstandard
+
+
+def transcript_path(
+    output_dir: Union[str, Path],
+    round_number: int,
+    compression: Optional[str] = None
+) -> Path:
+    """Path of a round's JSONL transcript for the given compression."""
+    if compression not in TRANSCRIPT_SUFFIXES:
+        raise ValueError(f"Unknown transcript compression: {compression}")
+    return Path(output_dir) / f"round{round_number}_social_rl{TRANSCRIPT_SUFFIXES[compression]}"
+
+
+class TranscriptWriter:
+    """
+    Streaming writer for one round's transcript.
+
+    Every record is flushed through the compressor as it is written, so
+    the file is readable up to the last complete record even if the
+    process dies mid-round.
+    """
+
+    def __init__(self, path: Union[str, Path], compression: Optional[str] = None):
+        if compression not in TRANSCRIPT_SUFFIXES:
+            raise ValueError(f"Unknown transcript compression: {compression}")
+
+        self.path = Path(path)
+        self.compression = compression
+        self.messages_written = 0
+        self.codec = TurnContextCodec()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._raw = None
+        self._zstd = None
+        if compression == "gzip":
+            self._stream = gzip.open(self.path, "wb")
+        elif compression == "zstd":
+            zstandard = _import_zstd()
+            self._zstd = zstandard
+            self._raw = open(self.path, "wb")
+            self._stream = zstandard.ZstdCompressor().stream_writer(self._raw)
+        else:
+            self._stream = open(self.path, "wb")
+
+    def _write(self, record: Dict[str, Any]) -> None:
+        self._stream.write(_dumps(record).encode("utf-8"))
+        if self._zstd is not None:
+            self._stream.flush(self._zstd.FLUSH_BLOCK)
+        else:
+            self._stream.flush()
+
+    def write_message(self, message: Dict[str, Any]) -> None:
+        """
+        Append one message record (a SocialRLMessage.to_dict()).
+
+        A "turn_context" entry, if present, is written as a normalized
+        turn_context_ref preceded by any new table records.
+        """
+        record = dict(message, type="message")
+        turn_context = record.pop("turn_context", None)
+        if turn_context is not None:
+            ref, table_records = self.codec.encode(turn_context)
+            for table_record in table_records:
+                self._write(table_record)
+            record["turn_context_ref"] = ref
+
+        self._write(record)
+        self.codec.add_message(message.get("agent_id"), message.get("content"))
+        self.messages_written += 1
+
+    def write_summary(self, round_result: Dict[str, Any]) -> None:
+        """
+        Append the round-summary record.
+
+        Accepts a full SocialRLRoundResult.to_dict(); its messages are
+        assumed to have been written already and are not repeated.
+        """
+        summary = {k: v for k, v in round_result.items() if k != "messages"}
+        summary["message_count"] = self.messages_written
+        self._write(dict(summary, type="round"))
+
+    def close(self) -> None:
+        if self._stream is None:
+            return
+        self._stream.close()
+        if self._raw is not None:
+            self._raw.close()
+        self._stream = None
+
+    def __enter__(self) -> "TranscriptWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def write_round_transcript(
+    path: Union[str, Path],
+    round_result: Dict[str, Any],
+    compression: Optional[str] = None
+) -> None:
+    """Write a complete SocialRLRoundResult.to_dict() as a JSONL transcript."""
+    with TranscriptWriter(path, compression) as writer:
+        for message in round_result.get("messages", []):
+            writer.write_message(message)
+        writer.write_summary(round_result)
+
+
+def _open_text(path: Path):
+    """Open a transcript for reading; returns (file, truncation error types)."""
+    name = path.name
+    if name.endswith(".gz"):
+        return gzip.open(path, "rt", encoding="utf-8"), (EOFError,)
+    if name.endswith(".zst"):
+        zstandard = _import_zstd()
+        reader = zstandard.ZstdDecompressor().stream_reader(
+            open(path, "rb"), read_across_frames=True, closefd=True
+        )
+        return io.TextIOWrapper(reader, encoding="utf-8"), (zstandard.ZstdError,)
+    return open(path, encoding="utf-8"), ()
+
+
+def iter_transcript(path: Union[str, Path]) -> Iterator[Dict[str, Any]]:
+    """
+    Yield the records of a JSONL transcript in order.
+
+    A torn final record or truncated compressed stream (crash mid-write)
+    ends iteration; corruption before the last line raises ValueError.
+    """
+    path = Path(path)
+    f, truncation_errors = _open_text(path)
+    torn_line = None
+    with f:
+        try:
+            for line_number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                if torn_line is not None:
+                    raise ValueError(f"Corrupt transcript record at line {torn_line} of {path}")
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    torn_line = line_number
+                    continue
+                yield record
+        except truncation_errors:
+            # Compressed stream cut off mid-frame: keep what was readable
+            pass
+
+
+def load_round_transcript(
+    path: Union[str, Path],
+    include_turn_context: bool = False
+) -> Dict[str, Any]:
+    """
+    Load a round transcript in the SocialRLRoundResult.to_dict() shape.
+
+    Accepts JSONL (optionally .gz / .zst) and the legacy indented .json
+    file. A transcript without its summary record (interrupted round)
+    loads with the messages written so far and empty summary fields.
+
+    Args:
+        path: Transcript file
+        include_turn_context: Rehydrate each message's stored turn_context
+    """
+    path = Path(path)
+    if path.suffix == ".json":
+        with open(path) as f:
+            return json.load(f)
+
+    codec = TurnContextCodec()
+    messages: List[Dict[str, Any]] = []
+    summary: Dict[str, Any] = {}
+    for record in iter_transcript(path):
+        if codec.load_record(record):
+            continue
+        record_type = record.pop("type", "message")
+        if record_type == "message":
+            ref = record.pop("turn_context_ref", None)
+            if include_turn_context and ref is not None:
+                record["turn_context"] = codec.decode(ref)
+            codec.add_message(record.get("agent_id"), record.get("content"))
+            messages.append(record)
+        elif record_type == "round":
+            record.pop("message_count", None)
+            summary = record
+
+    round_number = summary.get("round_number")
+    if round_number is None:
+        if messages:
+            round_number = messages[0].get("round_number")
+        else:
+            match = _ROUND_FILE.match(path.name)
+            round_number = int(match.group(1)) if match else None
+
+    result = {"round_number": round_number, "messages": messages}
+    for key, default in _SUMMARY_DEFAULTS.items():
+        result[key] = summary.get(key, default)
+    # Keep any extra summary fields (e.g. schema "meta")
+    result.update((k, v) for k, v in summary.items() if k != "round_number")
+    return result
+
+
+def find_round_transcripts(experiment_dir: Union[str, Path]) -> Dict[int, Path]:
+    """
+    Map round number -> transcript file for an experiment directory.
+
+    When a round exists in several formats the JSONL transcript wins over
+    the legacy .json dump.
+    """
+    found: Dict[int, Path] = {}
+    for path in sorted(Path(experiment_dir).iterdir()):
+        match = _ROUND_FILE.match(path.name)
+        if not match:
+            continue
+        round_number = int(match.group(1))
+        if round_number not in found or found[round_number].suffix == ".json":
+            found[round_number] = path
+    return dict(sorted(found.items()))
+
+
+def load_round_transcripts(
+    experiment_dir: Union[str, Path],
+    include_turn_context: bool = False
+) -> Dict[int, Dict[str, Any]]:
+    """Load every round of an experiment directory, keyed by round number."""
+    return {
+        round_number: load_round_transcript(path, include_turn_context)
+        for round_number, path in find_round_transcripts(experiment_dir).items()
+    }
@@ -0,0 +1,99 @@
+"""
+Shared fixtures for SocialRLRunner tests.
+
+Provides one test canvas (factory workplace, Worker+Alice / Owner+Marta)
+and one runner factory, so test modules only define the client behaviour
+they exercise. Runners built without a client get an EchoClient.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+
+AGENT_PROMPTS = {
+    "Worker+Alice": "You are Alice, a factory worker.",
+    "Worker+Ben": "You are Ben, a line worker.",
+    "Owner+Marta": "You are Marta, the factory owner.",
+}
+
+
+class EchoClient:
+    """Client that gives every call the same reply."""
+
+    def __init__(self, reply: str = "We should think about what this means for all of us."):
+        self.reply = reply
+
+    def send_message(self, system_prompt, user_message, temperature=0.7, max_tokens=512):
+        return self.reply
+
+
+def build_canvas(agents=("Worker+Alice", "Owner+Marta"), rounds=1, **round_fields):
+    """
+    Build a test canvas.
+
+    Args:
+        agents: Agent identifiers (from AGENT_PROMPTS) or full agent dicts
+        rounds: Number of rounds; every round uses the same fields
+        **round_fields: Overrides for scenario, rules, tasks, ...
+    """
+    agent_dicts = [
+        agent if isinstance(agent, dict) else {
+            "identifier": agent,
+            "name": agent.split("+", 1)[1],
+            "prompt": AGENT_PROMPTS[agent],
+        }
+        for agent in agents
+    ]
+    participants = ", ".join(agent["identifier"] for agent in agent_dicts)
+    return {
+        "project": {"goal": "Test simulation", "theoretical_option": "A"},
+        "agents": agent_dicts,
+        "rounds": [
+            {
+                "round_number": round_num,
+                "scenario": "Morning shift begins",
+                "rules": "Maintain role consistency",
+                "platform_config": {"participants": participants},
+                **round_fields,
+            }
+            for round_num in range(1, rounds + 1)
+        ],
+    }
+
+
+@pytest.fixture
+def make_canvas():
+    """Factory fixture for test canvases (see build_canvas)."""
+    return build_canvas
+
+
+@pytest.fixture
+def make_runner():
+    """
+    Factory fixture for a quiet SocialRLRunner.
+
+    make_runner(client=None, canvas=None, dual_llm_client=None, **config_kwargs)
+    builds a runner with verbose/auto_save off and an EchoClient unless a
+    client is given. Coach validation defaults to on exactly when a
+    DualLLMClient is passed; any SocialRLConfig field can be overridden
+    through config_kwargs.
+    """
+    from social_rl.runner import SocialRLRunner, SocialRLConfig
+
+    def factory(client=None, canvas=None, dual_llm_client=None, **config_kwargs):
+        config_kwargs.setdefault("verbose", False)
+        config_kwargs.setdefault("auto_save", False)
+        config_kwargs.setdefault("use_coach_validation", dual_llm_client is not None)
+        return SocialRLRunner(
+            canvas if canvas is not None else build_canvas(),
+            client if client is not None else EchoClient(),
+            config=SocialRLConfig(**config_kwargs),
+            dual_llm_client=dual_llm_client,
+        )
+
+    return factory
@@ -0,0 +1,128 @@
+"""
+Test: Batched Semiotic State Tracker
+
+Tests that BatchedSemioticStateTracker:
+- Reproduces SemioticStateTracker EMAs and decisions bit for bit per lane
+- Supports a different SemioticStateConfig per lane
+- Leaves EMAs unchanged for missing (NaN) metrics
+- Grows its preallocated history past the initial capacity
+"""
+
+import sys
+import random
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from social_rl.context_injector import (
+    SemioticStateConfig, SemioticStateTracker, SEMIOTIC_METRICS, COLLAPSE_STATES
+)
+
+np = pytest.importorskip("numpy")
+from social_rl.context_injector import BatchedSemioticStateTracker
+
+
+def random_round(rng, drop_keys=False):
+    """Metrics drifting towards collapse often enough to trigger injections."""
+    metrics = {
+        "engagement": rng.uniform(0.0, 0.4),
+        "voice_valence": rng.uniform(-0.6, 0.2),
+        "stance_valence": rng.uniform(0.5, 1.0),
+        "justificatory_pct": rng.uniform(0.5, 1.0),
+    }
+    if drop_keys and rng.random() < 0.3:
+        del metrics[rng.choice(SEMIOTIC_METRICS)]
+    return metrics
+
+
+def random_config(rng):
+    return SemioticStateConfig(
+        ema_alpha=rng.uniform(0.1, 0.9),
+        min_dwell_rounds=rng.randrange(1, 4),
+        harmony_collapse_engagement_threshold=rng.uniform(0.15, 0.35),
+        harmony_collapse_stance_threshold=rng.uniform(0.6, 0.9),
+        harmony_collapse_justification_threshold=rng.uniform(0.5, 0.8),
+        retreat_voice_threshold=rng.uniform(-0.3, 0.0),
+        retreat_justification_threshold=rng.uniform(0.6, 0.9),
+        collapse_confirmation_rounds=rng.randrange(1, 4),
+    )
+
+
+def run_scalar(config, rounds):
+    """Scalar tracker driven the way ContextInjector drives it."""
+    tracker = SemioticStateTracker(config)
+    decisions = []
+    for metrics in rounds:
+        tracker.update(metrics)
+        decision = tracker.should_inject_divergence()
+        if decision[0]:
+            tracker.record_divergence_injection(decision[1], "test")
+        decisions.append(decision)
+    return tracker, decisions
+
+
+class TestBatchedParity:
+    """Lane-by-lane comparison against the scalar tracker."""
+
+    @pytest.mark.parametrize("drop_keys", [False, True])
+    def test_matches_scalar_bit_for_bit(self, drop_keys):
+        rng = random.Random(0)
+        configs = [random_config(rng) for _ in range(40)]
+        lanes = [[random_round(rng, drop_keys) for _ in range(30)] for _ in configs]
+
+        batched = BatchedSemioticStateTracker(configs, capacity=4)
+        for r in range(30):
+            inject, codes = batched.step(
+                BatchedSemioticStateTracker.stack_metrics([lane[r] for lane in lanes])
+            )
+            if r == 29:
+                final = (inject, codes)
+
+        for i, (config, rounds) in enumerate(zip(configs, lanes)):
+            scalar, decisions = run_scalar(config, rounds)
+
+            assert batched.lane_metric_history(i) == scalar.metric_history
+            assert batched.lane_state_summary(i) == scalar.get_state_summary()
+            assert [COLLAPSE_STATES[c] for c in batched.divergence_history[:, i] if c] == [
+                entry["collapse_type"] for entry in scalar.divergence_log
+            ]
+            assert (bool(final[0][i]), COLLAPSE_STATES[final[1][i]]) == decisions[-1]
+
+        assert batched.divergence_counts().sum() > 0
+
+    def test_shared_config_broadcast(self):
+        rng = random.Random(1)
+        rounds = [random_round(rng) for _ in range(10)]
+        batched = BatchedSemioticStateTracker(n_lanes=3)
+        for metrics in rounds:
+            batched.update(BatchedSemioticStateTracker.stack_metrics([metrics] * 3))
+
+        scalar = SemioticStateTracker()
+        for metrics in rounds:
+            scalar.update(metrics)
+        for lane in range(3):
+            assert dict(zip(SEMIOTIC_METRICS, batched.ema[lane].tolist())) == scalar.get_ema_metrics()
+
+
+class TestBatchedTracker:
+    """Tests for array bookkeeping."""
+
+    def test_missing_metric_keeps_ema(self):
+        batched = BatchedSemioticStateTracker(n_lanes=2)
+        batched.update([[np.nan, 0.0, 0.5, 0.4], [1.0, 0.0, 0.5, 0.4]])
+        assert batched.ema[0, 0] == 0.5
+        assert batched.ema[1, 0] > 0.5
+
+    def test_history_grows_past_capacity(self):
+        batched = BatchedSemioticStateTracker(n_lanes=2, capacity=1)
+        for _ in range(5):
+            batched.step(np.full((2, 4), 0.5))
+        assert batched.ema_history.shape == (5, 2, 4)
+        assert batched.collapse_history.shape == (5, 2)
+
+    def test_shape_checked(self):
+        with pytest.raises(ValueError):
+            BatchedSemioticStateTracker(n_lanes=2).update([[0.5, 0.0, 0.5, 0.4]])
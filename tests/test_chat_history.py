@@ -0,0 +1,191 @@
+"""
+Test: Chat History Mode
+
+Tests that history_mode="chat":
+- Keeps the newest turns that fit the token budget (not the last N messages)
+- Sends the speaker's own turns as assistant messages, others' as user messages
+- Uses send_messages when the client has it, a flattened window otherwise
+- Is supported by the local_rcm clients (native or flattened)
+"""
+
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add project root and local_rcm to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "local_rcm"))
+
+from social_rl.chat_history import (
+    estimate_tokens, history_window_start, build_chat_messages, flatten_chat_messages
+)
+from llm_client import LLMClient, MockClient, OpenAIClient, merge_consecutive_roles
+
+
+def msg(agent_id, content):
+    return SimpleNamespace(agent_id=agent_id, content=content)
+
+
+class TestWindow:
+    """Tests for the token-budgeted window."""
+
+    def test_budget_counts_tokens_not_messages(self):
+        history = [msg("A", "x" * 400), msg("B", "short"), msg("A", "tiny"), msg("B", "hi")]
+        # 100 + 2 + 1 + 1 tokens
+        assert history_window_start(history, 4) == 1
+        assert history_window_start(history, 104) == 0
+        assert history_window_start(history, 3) == 2
+
+    def test_newest_message_always_kept(self):
+        history = [msg("A", "x" * 4000)]
+        assert history_window_start(history, 10) == 0
+        assert history_window_start([], 10) == 0
+
+    def test_roles(self):
+        history = [msg("A", "one"), msg("B", "two"), msg("A", "three")]
+        messages = build_chat_messages(history, "A", "open", "close", token_budget=100)
+
+        assert messages == [
+            {"role": "user", "content": "open"},
+            {"role": "assistant", "content": "one"},
+            {"role": "user", "content": "[B]: two"},
+            {"role": "assistant", "content": "three"},
+            {"role": "user", "content": "close"},
+        ]
+        assert flatten_chat_messages(messages, "A") == (
+            "open\n\nCONVERSATION SO FAR:\n[A]: one\n[B]: two\n[A]: three\n\nclose"
+        )
+
+    def test_dict_history(self):
+        history = [msg("A", "one"), msg("B", "two")]
+        dict_history = [{"agent_id": m.agent_id, "content": m.content} for m in history]
+
+        assert build_chat_messages(dict_history, "A", "open", "close", token_budget=100) == (
+            build_chat_messages(history, "A", "open", "close", token_budget=100)
+        )
+
+    def test_estimate(self):
+        assert estimate_tokens("") == 0
+        assert estimate_tokens("abcd") == 1
+        assert estimate_tokens("abcde") == 2
+
+
+class ChatClient:
+    def __init__(self):
+        self.chats = []
+        self.flat = []
+
+    def send_message(self, system_prompt, user_message, temperature=0.7, max_tokens=512):
+        self.flat.append(user_message)
+        return f"Flat reply {len(self.flat)}"
+
+    def send_messages(self, system_prompt, messages):
+        self.chats.append(messages)
+        return f"Reply {len(self.chats)} " + "word " * 40
+
+
+class FlatClient:
+    def __init__(self):
+        self.flat = []
+
+    def send_message(self, system_prompt, user_message, temperature=0.7, max_tokens=512):
+        self.flat.append(user_message)
+        return f"Reply {len(self.flat)}"
+
+
+def run_round(make_runner, client, **kwargs):
+    runner = make_runner(client, history_mode="chat", **kwargs)
+    return runner.execute_round(1, max_turns=12)
+
+
+class TestRunnerChatMode:
+    """Tests for SocialRLRunner with history_mode="chat"."""
+
+    def test_sends_chat_messages(self, make_runner):
+        client = ChatClient()
+        run_round(make_runner, client)
+
+        assert len(client.chats) == 12 and not client.flat
+        first, last = client.chats[0], client.chats[-1]
+        assert first[0]["content"] == "The round begins. Morning shift begins"
+        assert first[-1] == {"role": "user", "content": "Respond as Alice."}
+
+        # Turn 12 is Marta's: her own turns are assistant messages
+        roles = [m["role"] for m in last[1:-1]]
+        assert roles == (["user", "assistant"] * 6)[:11]
+        assert last[-1]["content"] == "It is now your turn to respond as Marta."
+
+    def test_window_respects_token_budget(self, make_runner):
+        client = ChatClient()
+        run_round(make_runner, client, history_token_budget=60)
+
+        # Each reply is ~50 tokens: only the newest one fits
+        assert all(len(chat) <= 3 for chat in client.chats)
+        assert client.chats[-1][1]["content"].startswith("[Worker+Alice]: Reply 11")
+
+    def test_flat_client_gets_same_window(self, make_runner):
+        client = FlatClient()
+        run_round(make_runner, client, history_token_budget=2)
+
+        assert client.flat[0].startswith("The round begins. Morning shift begins")
+        assert client.flat[-1].endswith("[Worker+Alice]: Reply 11\n\nIt is now your turn to respond as Marta.")
+        assert "Reply 10" not in client.flat[-1]
+
+    def test_prefix_stable_guidance_in_closing_message(self, make_runner):
+        client = ChatClient()
+        run_round(make_runner, client, prompt_layout="prefix_stable")
+        assert "=== HOW YOU'RE EXPERIENCING THIS ===" in client.chats[-1][-1]["content"]
+
+
+class TestClients:
+    """Tests for send_messages on local_rcm clients."""
+
+    def test_base_client_flattens(self):
+        class PairOnly(LLMClient):
+            def send_message(self, system_prompt, user_message):
+                return user_message
+
+            def send_json(self, system_prompt, user_message):
+                return {}
+
+        reply = PairOnly().send_messages("sys", [
+            {"role": "user", "content": "[B]: hi"},
+            {"role": "assistant", "content": "hello"},
+            {"role": "user", "content": "your turn"},
+        ])
+        assert reply == "[B]: hi\n\n[You]: hello\n\nyour turn"
+
+    def test_mock_client(self):
+        client = MockClient()
+        assert client.send_messages("sys", [{"role": "user", "content": "x"}]) == "Mock response #1"
+        assert "".join(client.stream_messages("sys", [{"role": "user", "content": "x"}])) == "Mock response #2"
+
+    def test_openai_client_sends_history(self):
+        sent = {}
+
+        def create(**kwargs):
+            sent.update(kwargs)
+            return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content="ok"))])
+
+        client = OpenAIClient.__new__(OpenAIClient)
+        client.model = "m"
+        client.client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+
+        history = [{"role": "user", "content": "a"}, {"role": "assistant", "content": "b"},
+                   {"role": "user", "content": "c"}]
+        assert client.send_messages("sys", history) == "ok"
+        assert sent["messages"] == [{"role": "system", "content": "sys"}] + history
+
+        client.send_message("sys", "hello")
+        assert sent["messages"] == [{"role": "system", "content": "sys"}, {"role": "user", "content": "hello"}]
+
+    def test_merge_consecutive_roles(self):
+        merged = merge_consecutive_roles([
+            {"role": "user", "content": "a"}, {"role": "user", "content": "b"},
+            {"role": "assistant", "content": "c"}, {"role": "user", "content": "d"},
+        ])
+        assert merged == [
+            {"role": "user", "content": "a\n\nb"},
+            {"role": "assistant", "content": "c"},
+            {"role": "user", "content": "d"},
+        ]
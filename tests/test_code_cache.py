@@ -0,0 +1,156 @@
+"""
+Test: Semiotic Code Cache
+
+Tests that SemioticCodeCache / SemioticCoder(code_cache=...):
+- Only sends uncached utterances to the LLM
+- Persists codes across processes via SQLite
+- Invalidates codes when LLM_CODING_PROMPT changes
+- Reports how many utterances need recoding
+"""
+
+import sys
+import json
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from social_rl import semiotic_coder
+from social_rl.semiotic_coder import SemioticCoder, JustificationType
+from social_rl.code_cache import SemioticCodeCache
+
+
+MESSAGES = [
+    {"agent_id": "CES_A", "content": "Because it matters for everyone.", "turn_number": 1},
+    {"agent_id": "CES_B", "content": "No one listens to us.", "turn_number": 2},
+    {"agent_id": "CES_A", "content": "Because it matters for everyone.", "turn_number": 3},
+]
+
+
+class CountingClient:
+    model = "test-coder"
+
+    def __init__(self):
+        self.calls = 0
+
+    def send_message(self, system_prompt, user_message, temperature=0.7, max_tokens=512):
+        self.calls += 1
+        return json.dumps({"justification": "justificatory", "voice": "alienated",
+                           "justification_markers": ["because"], "notes": "ok"})
+
+
+class FailingClient(CountingClient):
+    def send_message(self, system_prompt, user_message, temperature=0.7, max_tokens=512):
+        self.calls += 1
+        return "not json"
+
+
+def round_data(messages):
+    return {"round_number": 2, "messages": messages}
+
+
+class TestSemioticCodeCache:
+    """Tests for cached LLM coding."""
+
+    def test_repeats_are_not_resent(self):
+        client = CountingClient()
+        coder = SemioticCoder(client, use_llm=True, code_cache=SemioticCodeCache())
+
+        first = coder.code_transcript(round_data(MESSAGES))
+        second = coder.code_transcript(round_data(MESSAGES))
+
+        assert client.calls == 2
+        assert first == second
+        assert first[2].turn_number == 3
+        assert first[2].justification == JustificationType.JUSTIFICATORY
+
+    def test_persists_across_instances(self, tmp_path):
+        path = str(tmp_path / "codes.sqlite")
+        SemioticCoder(CountingClient(), use_llm=True, code_cache=SemioticCodeCache(path)) \
+            .code_transcript(round_data(MESSAGES))
+
+        client = CountingClient()
+        cache = SemioticCodeCache(path)
+        codes = SemioticCoder(client, use_llm=True, code_cache=cache).code_transcript(round_data(MESSAGES))
+
+        assert client.calls == 0
+        assert len(cache) == 2
+        assert codes[1].agent_id == "CES_B" and codes[1].coder_notes == "llm-coded: ok"
+
+    def test_key_includes_agent_and_model(self):
+        cache = SemioticCodeCache()
+        SemioticCoder(CountingClient(), use_llm=True, code_cache=cache).code_transcript(round_data(MESSAGES))
+
+        other_agent = dict(MESSAGES[0], agent_id="CES_C")
+        client = CountingClient()
+        SemioticCoder(client, use_llm=True, code_cache=cache).code_transcript(round_data([other_agent]))
+        SemioticCoder(client, use_llm=True, code_cache=cache, model="bigger") \
+            .code_transcript(round_data(MESSAGES[:1]))
+
+        assert client.calls == 2
+
+    def test_fallbacks_not_cached(self):
+        client = FailingClient()
+        cache = SemioticCodeCache()
+        coder = SemioticCoder(client, use_llm=True, code_cache=cache)
+
+        coder.code_transcript(round_data(MESSAGES))
+
+        assert len(cache) == 0
+        assert client.calls == 3
+
+    def test_model_name_required_with_cache(self):
+        class Wrapper:
+            def __init__(self, client):
+                self._client = client
+
+            def send_message(self, *args, **kwargs):
+                return self._client.send_message(*args, **kwargs)
+
+        with pytest.raises(ValueError):
+            SemioticCoder(Wrapper(CountingClient()), use_llm=True, code_cache=SemioticCodeCache())
+
+        coder = SemioticCoder(Wrapper(CountingClient()), use_llm=True,
+                              code_cache=SemioticCodeCache(), model="wrapped-coder")
+        assert coder.model == "wrapped-coder"
+        # Without a cache no key is needed
+        assert SemioticCoder(Wrapper(CountingClient()), use_llm=True).model is None
+
+    def test_prompt_change_invalidates(self, monkeypatch, tmp_path):
+        cache = SemioticCodeCache(str(tmp_path / "codes.sqlite"))
+        SemioticCoder(CountingClient(), use_llm=True, code_cache=cache).code_transcript(round_data(MESSAGES))
+
+        monkeypatch.setattr(semiotic_coder, "LLM_CODING_PROMPT",
+                            semiotic_coder.LLM_CODING_PROMPT + "\nBe brief.")
+        client = CountingClient()
+        SemioticCoder(client, use_llm=True, code_cache=cache).code_transcript(round_data(MESSAGES))
+
+        assert client.calls == 2
+        assert cache.prune() == 2
+        assert len(cache) == 2
+
+
+class TestRecodingReport:
+    """Tests for the recoding report."""
+
+    def test_counts_cached_stale_and_new(self, monkeypatch):
+        cache = SemioticCodeCache()
+        coder = SemioticCoder(CountingClient(), use_llm=True, code_cache=cache)
+        coder.code_transcript(round_data(MESSAGES[:1]))
+
+        monkeypatch.setattr(semiotic_coder, "LLM_CODING_PROMPT",
+                            semiotic_coder.LLM_CODING_PROMPT + "\nBe brief.")
+        coder.code_transcript(round_data(MESSAGES[1:2]))
+        extra = {"agent_id": "CES_C", "content": "We can change this.", "turn_number": 4}
+
+        report = coder.recoding_report([MESSAGES, [extra]])
+
+        assert {k: report[k] for k in ("total", "cached", "stale", "new", "needs_recoding")} == \
+            {"total": 4, "cached": 1, "stale": 2, "new": 1, "needs_recoding": 3}
+        assert report["prompt_version"] == semiotic_coder.llm_prompt_version()
+
+    def test_without_cache_everything_is_new(self):
+        report = SemioticCoder(CountingClient(), use_llm=True).recoding_report([MESSAGES])
+        assert report["needs_recoding"] == 3
@@ -0,0 +1,147 @@
+"""
+Test: Normalized Turn Context Storage
+
+Tests that TurnContextCodec / JSONL transcripts:
+- Rehydrate every turn_context exactly
+- Store static round fields and repeated strings once
+- Store recent_exchanges as message references
+- Stay much smaller than embedding the full turn_context per message
+"""
+
+import sys
+import json
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from social_rl.context_store import TurnContextCodec
+from social_rl.transcript import load_round_transcript, transcript_path
+
+
+def make_context(turn, exchanges=None):
+    return {
+        "agent_id": "Worker+Alice" if turn % 2 else "Owner+Marta",
+        "round_number": 1,
+        "turn_number": turn,
+        "base_scenario": "A long scenario description. " * 20,
+        "base_rules": "Maintain role consistency",
+        "concept_a_manifestation": "The line speeds up again.",
+        "concept_b_manifestation": "",
+        "experiential_context": "",
+        "recent_exchanges": exchanges or [],
+        "prar_cue": "[REFLECT] Consider the group.",
+    }
+
+
+class TestTurnContextCodec:
+    """Tests for the encoder/decoder."""
+
+    def test_round_trip(self):
+        """Test that decode(encode(ctx)) == ctx, including exchanges."""
+        codec = TurnContextCodec()
+        codec.add_message("Worker+Alice", "first")
+        codec.add_message("Owner+Marta", "second")
+        context = make_context(3, [
+            {"agent_id": "Worker+Alice", "content": "first"},
+            {"agent_id": "Owner+Marta", "content": "second"},
+            {"agent_id": "Outsider", "content": "never logged"},
+        ])
+
+        ref, _ = codec.encode(context)
+
+        assert codec.decode(ref) == context
+        assert ref["exchanges"][:2] == [0, 1]
+        assert ref["exchanges"][2] == {"agent_id": "Outsider", "content": "never logged"}
+
+    def test_tables_written_once(self):
+        """Test that statics and repeated strings only produce table records once."""
+        codec = TurnContextCodec()
+        _, first = codec.encode(make_context(1))
+        _, second = codec.encode(make_context(2))
+
+        assert [r["type"] for r in first].count("static") == 1
+        # Only the new agent id is new on the second turn
+        assert second == [{"type": "string", "id": len(codec.strings) - 1, "value": "Owner+Marta"}]
+
+    def test_replayed_tables_decode(self):
+        """Test that a fresh codec rebuilt from table records decodes refs."""
+        writer = TurnContextCodec()
+        records, refs = [], []
+        for turn in range(1, 5):
+            ref, tables = writer.encode(make_context(turn))
+            records.extend(tables)
+            refs.append(ref)
+
+        reader = TurnContextCodec()
+        for record in records:
+            assert reader.load_record(record)
+        assert [reader.decode(r) for r in refs] == [make_context(t) for t in range(1, 5)]
+
+    def test_changed_static_field_stays_exact(self):
+        """Test that a static field differing mid-round is stored per turn."""
+        codec = TurnContextCodec()
+        codec.encode(make_context(1))
+        changed = dict(make_context(2), base_rules="New rule")
+
+        ref, _ = codec.encode(changed)
+        assert "base_rules" not in ref["static"]
+        assert codec.decode(ref) == changed
+
+
+class TestTranscriptTurnContexts:
+    """Tests for turn contexts stored in runner transcripts."""
+
+    @pytest.fixture
+    def run_round(self, make_runner, make_canvas):
+        canvas = make_canvas(scenario="Morning shift begins. " * 40)
+
+        def run(tmp_path, save_turn_context=True, **kwargs):
+            runner = make_runner(
+                canvas=canvas, auto_save=True, output_dir=str(tmp_path),
+                save_turn_context=save_turn_context, **kwargs
+            )
+            return runner.execute_round(1, max_turns=16)
+
+        return run
+
+    def test_rehydrated_on_demand(self, run_round, tmp_path):
+        """Test that include_turn_context restores every message's context."""
+        result = run_round(tmp_path)
+        path = transcript_path(tmp_path, 1)
+
+        plain = load_round_transcript(path)
+        full = load_round_transcript(path, include_turn_context=True)
+
+        assert all("turn_context" not in m for m in plain["messages"])
+        assert [m["turn_context"] for m in full["messages"]] == \
+            [m.turn_context for m in result.messages]
+
+    def test_smaller_than_embedded_contexts(self, run_round, tmp_path):
+        """Test that stored contexts cost far less than embedding them per message."""
+        result = run_round(tmp_path / "with")
+        run_round(tmp_path / "without", save_turn_context=False)
+
+        overhead = (
+            transcript_path(tmp_path / "with", 1).stat().st_size
+            - transcript_path(tmp_path / "without", 1).stat().st_size
+        )
+        embedded = sum(
+            len(json.dumps({"turn_context": m.turn_context}, separators=(",", ":")))
+            for m in result.messages
+        )
+        assert overhead < embedded / 3
+
+    def test_turn_context_can_be_disabled(self, run_round, tmp_path):
+        run_round(tmp_path, save_turn_context=False)
+        full = load_round_transcript(transcript_path(tmp_path, 1), include_turn_context=True)
+        assert all("turn_context" not in m for m in full["messages"])
+
+    def test_turn_context_is_opt_in(self, make_runner, tmp_path):
+        """Test that default transcripts carry no turn_context payload."""
+        make_runner(auto_save=True, output_dir=str(tmp_path)).execute_round(1, max_turns=4)
+
+        path = transcript_path(tmp_path, 1)
+        assert "turn_context" not in path.read_text()
@@ -0,0 +1,199 @@
+"""
+Test: Token-Budgeted Context Window
+
+Tests that ContextWindow / context_token_budget:
+- Keeps the newest turns within the token budget, evicting in batches
+- Folds evicted turns into a rolling summary computed once per boundary
+- Counts each message's tokens once and recovers from rewritten history
+- Bounds prompt size in every history mode and layout of the runner
+"""
+
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from social_rl.context_window import ContextWindow, extractive_summary, tiktoken_counter
+from social_rl.context_injector import ContextInjector
+
+
+def msg(agent_id, content):
+    return SimpleNamespace(agent_id=agent_id, content=content)
+
+
+def long_history(n, words=20):
+    return [
+        msg("A" if i % 2 else "B", f"Turn {i} opens here. " + "word " * words)
+        for i in range(n)
+    ]
+
+
+class TestContextWindow:
+    """Tests for ContextWindow.view()."""
+
+    def test_no_summary_within_budget(self):
+        window = ContextWindow(token_budget=1000)
+        assert window.view(long_history(5)) == (None, 0)
+
+    def test_window_fits_budget(self):
+        window = ContextWindow(token_budget=300, summary_reserve=60, evict_batch=1)
+        history = []
+        for message in long_history(40):
+            history.append(message)
+            summary, start = window.view(history)
+            assert window.window_tokens(start) <= 300 - (60 if start else 0)
+            assert (summary is None) == (start == 0)
+
+    def test_batched_eviction(self):
+        window = ContextWindow(token_budget=300, summary_reserve=60, evict_batch=4)
+        history = []
+        starts = []
+        for message in long_history(40):
+            history.append(message)
+            starts.append(window.view(history)[1])
+
+        assert all(start % 4 == 0 for start in starts)
+        assert starts == sorted(starts)
+        # The boundary moves far less often than once per turn
+        assert len(set(starts)) < len(starts) // 2
+
+    def test_summary_computed_once_per_boundary(self):
+        window = ContextWindow(token_budget=300, summary_reserve=60, evict_batch=4)
+        history = []
+        for message in long_history(40):
+            history.append(message)
+            window.view(history)
+            window.view(history)
+
+        boundaries = {b for b in window._summaries}
+        assert window.stats["summaries_computed"] == len(boundaries)
+        assert window.stats["tokens_counted"] == 40
+        assert window.stats["views"] == 80
+
+    def test_summary_covers_evicted_turns(self):
+        window = ContextWindow(token_budget=300, summary_reserve=80, evict_batch=4)
+        history = long_history(30)
+        summary, start = window.view(history)
+
+        assert summary.startswith(f"EARLIER IN THIS ROUND ({start} turns summarized):")
+        assert f"- [{history[start - 1].agent_id}]: Turn {start - 1} opens here." in summary
+
+    def test_rewritten_history_invalidates_cache(self):
+        window = ContextWindow(token_budget=300, summary_reserve=60, evict_batch=4)
+        history = long_history(30)
+        window.view(history)
+
+        history[22] = msg("C", "Rewritten turn. " + "word " * 20)
+        summary, start = window.view(history)
+
+        assert "- [C]: Rewritten turn." in summary
+        assert window.stats["tokens_counted"] == 30 + 8
+        assert summary == ContextWindow(300, summary_reserve=60, evict_batch=4).view(history)[0]
+
+    def test_dict_messages(self):
+        window = ContextWindow(token_budget=100, evict_batch=1, summary_reserve=20)
+        history = [{"agent_id": "A", "content": "x" * 200} for _ in range(4)]
+        summary, start = window.view(history)
+        assert start == 3 and summary.startswith("EARLIER IN THIS ROUND (3 turns")
+
+    def test_summary_is_bounded(self):
+        summary = None
+        for i in range(20):
+            summary = extractive_summary(summary, [msg("A", f"Point {i}. " + "x" * 500)], max_points=5)
+        lines = summary.split("\n")
+        assert lines[0] == "EARLIER IN THIS ROUND (20 turns summarized):"
+        assert len(lines) == 6 and lines[-1] == "- [A]: Point 19."
+
+    def test_tiktoken_counter(self):
+        pytest.importorskip("tiktoken")
+        count = tiktoken_counter()
+        assert count("hello world") == 2
+
+
+class TestInjectorRecentExchanges:
+    """Tests for ContextInjector(recent_token_budget=...)."""
+
+    def test_default_is_last_three(self):
+        injector = ContextInjector(framework=None)
+        history = [{"agent_id": "A", "content": str(i)} for i in range(6)]
+        assert injector._recent_exchanges(history) == history[-3:]
+
+    def test_budget_keeps_newest_that_fit(self):
+        injector = ContextInjector(framework=None, recent_token_budget=10)
+        history = [{"agent_id": "A", "content": "x" * 12} for _ in range(6)]
+        # 3 tokens each: three fit in 10
+        assert injector._recent_exchanges(history) == history[-3:]
+        injector.recent_token_budget = 2
+        assert injector._recent_exchanges(history) == history[-1:]
+
+
+class VerboseClient:
+    def __init__(self):
+        self.flat = []
+        self.chats = []
+
+    def send_message(self, system_prompt, user_message, temperature=0.7, max_tokens=512):
+        self.flat.append(user_message)
+        return f"Reply {len(self.flat)} is long. " + "word " * 80
+
+    def send_messages(self, system_prompt, messages):
+        self.chats.append(messages)
+        return f"Reply {len(self.chats)} is long. " + "word " * 80
+
+
+def run_round(make_runner, client, **kwargs):
+    runner = make_runner(client, **kwargs)
+    runner.execute_round(1, max_turns=16)
+    return runner
+
+
+class TestRunnerContextBudget:
+    """Tests for SocialRLConfig.context_token_budget."""
+
+    @pytest.mark.parametrize("prompt_layout", ["classic", "prefix_stable"])
+    def test_flat_prompts_bounded(self, make_runner, prompt_layout):
+        unbounded = VerboseClient()
+        run_round(make_runner, unbounded, prompt_layout="prefix_stable")
+        client = VerboseClient()
+        runner = run_round(make_runner, client, prompt_layout=prompt_layout, context_token_budget=400)
+
+        assert max(map(len, client.flat)) < max(map(len, unbounded.flat))
+        assert "EARLIER IN THIS ROUND" in client.flat[-1]
+        assert "Reply 15 is long." in client.flat[-1]
+        assert runner._context_windows[1].stats["tokens_counted"] == 15
+
+    def test_chat_messages_bounded(self, make_runner):
+        client = VerboseClient()
+        run_round(make_runner, client, history_mode="chat", context_token_budget=400)
+
+        last = client.chats[-1]
+        assert "EARLIER IN THIS ROUND" in last[0]["content"]
+        assert last[0]["content"].startswith("The round begins. Morning shift begins")
+        assert sum(len(m["content"]) for m in last[1:-1]) // 4 <= 400
+        assert last[-2]["content"].startswith("[Worker+Alice]: Reply 15 is long.")
+
+    def test_turn_context_recent_exchanges_bounded(self, make_runner):
+        runner = make_runner(VerboseClient(), context_token_budget=150)
+        generate = runner.context_injector.generate_turn_context
+        contexts = []
+
+        def capture(**kwargs):
+            contexts.append(generate(**kwargs))
+            return contexts[-1]
+
+        runner.context_injector.generate_turn_context = capture
+        runner.execute_round(1, max_turns=6)
+
+        # Replies are ~105 tokens: only the newest fits in 150
+        assert [len(c.recent_exchanges) for c in contexts] == [0, 1, 1, 1, 1, 1]
+
+    def test_default_unchanged(self, make_runner):
+        client = VerboseClient()
+        runner = run_round(make_runner, client)
+        assert "EARLIER IN THIS ROUND" not in client.flat[-1]
+        assert client.flat[-1].count("[") == 10
+        assert not runner._context_windows
@@ -0,0 +1,133 @@
+"""
+Test: Incremental Conversation Index
+
+Tests that ConversationIndex / ContextInjector.conversation_index:
+- Counts references and recent interaction patterns as a full rescan does
+- Processes each appended message once, across a whole round
+- Rebuilds from the first differing message when history is rewritten
+- Gives the same TurnContext as a fresh injector recomputing from scratch
+"""
+
+import sys
+import random
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from social_rl.conversation_index import ConversationIndex, PATTERN_KEYWORDS
+from social_rl.context_injector import (
+    ContextInjector, ManifestationType, TheoreticalFramework
+)
+
+
+AGENTS = ["Worker+Alice", "Owner+Marta", "Worker+Ben", "Analyst"]
+FRAGMENTS = [
+    "Alice", "marta", "BEN", "we must", "but why?", "okay", "I'll do it",
+    "however", "the line", "need to finish", "yes", "refuse",
+]
+
+
+def random_history(n, seed):
+    rng = random.Random(seed)
+    return [
+        {"agent_id": rng.choice(AGENTS),
+         "content": " ".join(rng.choice(FRAGMENTS) for _ in range(rng.randrange(1, 5)))}
+        for _ in range(n)
+    ]
+
+
+def rescanned_references(history, agent_id):
+    key = agent_id.split("+")[-1].lower()
+    return sum(1 for msg in history if key in msg["content"].lower())
+
+
+def rescanned_patterns(recent):
+    return {
+        name: any(word in msg["content"].lower() for msg in recent for word in words)
+        for name, words in PATTERN_KEYWORDS.items()
+    }
+
+
+class TestConversationIndex:
+    """Tests for incremental sync()."""
+
+    def test_matches_full_rescan(self):
+        index = ConversationIndex()
+        history = random_history(60, seed=0)
+
+        for n in range(len(history) + 1):
+            assert index.sync(history[:n]) == history[:n]
+            for agent_id in AGENTS:
+                assert index.references(agent_id) == rescanned_references(history[:n], agent_id)
+            assert index.recent_patterns() == rescanned_patterns(history[max(0, n - 3):n])
+
+        assert index.stats == {"appended": 60, "rebuilds": 0}
+
+    def test_message_objects(self):
+        index = ConversationIndex()
+        history = [SimpleNamespace(agent_id="Owner+Marta", content="Alice, you must hurry.")]
+        assert index.sync(history) == [{"agent_id": "Owner+Marta", "content": "Alice, you must hurry."}]
+        assert index.references("Worker+Alice") == 1
+
+    def test_rewritten_history_rebuilds(self):
+        index = ConversationIndex()
+        history = random_history(20, seed=1)
+        index.sync(history)
+
+        rewritten = history[:12] + [{"agent_id": "Analyst", "content": "Alice refuses?"}]
+        assert index.sync(rewritten) == rewritten
+        assert index.references("Worker+Alice") == rescanned_references(rewritten, "Worker+Alice")
+        assert index.recent_patterns() == rescanned_patterns(rewritten[-3:])
+        assert index.stats["rebuilds"] == 1
+
+    def test_new_round_resets(self):
+        index = ConversationIndex()
+        index.sync(random_history(10, seed=2))
+        assert index.sync([]) == []
+        assert index.references("Worker+Alice") == 0
+        assert index.recent_patterns() == dict.fromkeys(index.recent_patterns(), False)
+
+
+FRAMEWORK = TheoreticalFramework.from_canvas_project({"theoretical_option": "A"})
+
+
+@pytest.mark.parametrize("mode", [ManifestationType.REACTIVE, ManifestationType.ADAPTIVE])
+def test_turn_context_matches_fresh_injector(mode):
+    injector = ContextInjector(FRAMEWORK, mode=mode)
+    history = random_history(30, seed=3)
+    feedback = {"Worker+Alice": {"engagement": 0.8}}
+    round_config = {"round_number": 1, "end_condition": "Total messages: 30"}
+
+    for turn in range(1, 31):
+        agent_id = AGENTS[turn % len(AGENTS)]
+        agent = {"identifier": agent_id, "role": agent_id.split("+")[0]}
+        args = (agent_id, agent, round_config, turn, history[:turn - 1], feedback)
+        incremental = injector.generate_turn_context(*args)
+        fresh = ContextInjector(FRAMEWORK, mode=mode).generate_turn_context(*args)
+        assert incremental == fresh
+
+
+class MentioningClient:
+    """Replies that mention Alice and match interaction patterns."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def send_message(self, system_prompt, user_message, temperature=0.7, max_tokens=512):
+        self.calls += 1
+        return f"Alice, but we must keep going? Reply {self.calls}."
+
+
+def test_runner_indexes_each_message_once(make_runner, make_canvas):
+    runner = make_runner(MentioningClient(), make_canvas(rounds=2))
+    for round_number in (1, 2):
+        runner.execute_round(round_number, max_turns=20)
+
+    index = runner.context_injector.conversation_index
+    # Each round's 19 prior messages are indexed once; the new round resets
+    assert index.stats == {"appended": 38, "rebuilds": 1}
+    assert index.references("Worker+Alice") == 19
@@ -0,0 +1,122 @@
+"""
+Test: Counterfactual Divergence Replay
+
+Tests that experiments/replay_divergence.py:
+- Loads round metrics and observed regimes from semiotic_state_log.json
+- Builds config grids from SemioticStateConfig fields, rejecting ignored ones
+- Fires divergence exactly where SemioticStateTracker would, per config
+"""
+
+import sys
+import json
+import random
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from social_rl.context_injector import SemioticStateTracker, SEMIOTIC_METRICS
+
+np = pytest.importorskip("numpy")
+from experiments.replay_divergence import load_replay_experiments, config_grid, replay, parse_grid
+
+
+def write_experiment(outputs, name, rounds, condition="G"):
+    exp_dir = outputs / name
+    exp_dir.mkdir()
+    (exp_dir / "meta.json").write_text(json.dumps({"experiment_id": name, "condition": condition}))
+    (exp_dir / "semiotic_state_log.json").write_text(json.dumps({
+        "experiment_id": name,
+        "rounds": [
+            {"round_number": i, "raw_metrics": metrics, "collapse_type": "none"}
+            for i, metrics in enumerate(rounds, 1)
+        ],
+    }))
+
+
+@pytest.fixture
+def outputs(tmp_path):
+    rng = random.Random(0)
+    for i in range(6):
+        rounds = [
+            {"engagement": rng.uniform(0.0, 0.4), "voice_valence": rng.uniform(-0.6, 0.2),
+             "stance_valence": rng.uniform(0.5, 1.0), "justificatory_pct": rng.uniform(0.5, 1.0)}
+            for _ in range(rng.choice([3, 5]))
+        ]
+        write_experiment(tmp_path, f"G_seed{i}", rounds)
+    (tmp_path / "not_an_experiment").mkdir()
+    return tmp_path
+
+
+def scalar_fires(config, rounds):
+    tracker = SemioticStateTracker(config)
+    fired = []
+    for metrics in rounds:
+        tracker.update(dict(zip(SEMIOTIC_METRICS, metrics)))
+        inject, collapse_type = tracker.should_inject_divergence()
+        if inject:
+            tracker.record_divergence_injection(collapse_type, "replay")
+        fired.append(collapse_type if inject else None)
+    return fired
+
+
+class TestReplay:
+    """Tests for the replay engine."""
+
+    def test_load(self, outputs):
+        experiments = load_replay_experiments(str(outputs))
+        assert [exp.name for exp in experiments] == [f"G_seed{i}" for i in range(6)]
+        assert all(len(exp.regimes) == len(exp.metrics) for exp in experiments)
+
+    def test_config_grid(self):
+        configs = config_grid(ema_alpha=[0.2, 0.5], min_dwell_rounds=[1, 2, 3])
+        assert len(configs) == 6
+        assert {(c.ema_alpha, c.min_dwell_rounds) for c in configs} == {
+            (a, d) for a in (0.2, 0.5) for d in (1, 2, 3)
+        }
+        with pytest.raises(ValueError):
+            config_grid(alpha=[0.1])
+
+    def test_ignored_fields_rejected(self):
+        with pytest.raises(ValueError, match="hysteresis_band"):
+            config_grid(hysteresis_band=[0.05, 0.2])
+        with pytest.raises(ValueError, match="hysteresis_band"):
+            config_grid(**parse_grid(["ema_alpha=0.2", "hysteresis_band=0.1"]))
+
+    def test_single_regimes_module(self):
+        """Test that regimes come from the same module the rest of the tree uses."""
+        from experiments import replay_divergence, social_aesthetics_regimes
+        assert replay_divergence.classify_regimes is social_aesthetics_regimes.classify_regimes
+
+    def test_parse_grid_uses_field_types(self):
+        assert parse_grid(["min_dwell_rounds=1,2", "ema_alpha=0.5"]) == {
+            "min_dwell_rounds": [1, 2], "ema_alpha": [0.5]
+        }
+
+    def test_matches_scalar_tracker(self, outputs):
+        experiments = load_replay_experiments(str(outputs))
+        configs = config_grid(
+            ema_alpha=[0.2, 0.5, 0.9],
+            min_dwell_rounds=[1, 2],
+            collapse_confirmation_rounds=[1, 2],
+            harmony_collapse_engagement_threshold=[0.25, 0.4],
+        )
+        result = replay(experiments, configs)
+
+        counts = result.fire_counts()
+        first = result.first_fire_rounds()
+        for k, config in enumerate(configs):
+            for e, exp in enumerate(experiments):
+                expected = scalar_fires(config, exp.metrics)
+                codes = result.fired[exp.name][k].tolist()
+                assert [(None, "harmony", "retreat")[c] for c in codes] == expected
+                assert counts[k, e] == sum(x is not None for x in expected)
+                fired_rounds = [r for r, x in enumerate(expected, 1) if x]
+                assert first[k, e] == (fired_rounds[0] if fired_rounds else 0)
+
+        assert counts.sum() > 0
+        summary = result.config_summary(0)
+        assert summary["total_injections"] == counts[0].sum()
+        assert set(summary["fire_rate_by_condition"]) == {"G"}
@@ -0,0 +1,162 @@
+"""
+Test: DualLLMClient Async Generation
+
+Tests that the async generation path:
+- Works with both blocking and coroutine-based clients
+- Produces the same validation results as the sync path
+- Keeps several generations in flight concurrently
+- Closes the shared HTTP session (aclose / async with)
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# Add project root and local_rcm to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "local_rcm"))
+
+import pytest
+
+from social_rl.dual_llm_client import DualLLMClient, DualLLMConfig, create_async_true_dual_llm
+from llm_client import AsyncMockClient
+
+
+class ScriptedClient:
+    """Blocking client: performer replies with text, coach rejects once."""
+
+    def __init__(self):
+        self.coach_calls = 0
+
+    def send_message(self, system_prompt, user_message, temperature=0.7, max_tokens=512):
+        if temperature < 0.5:
+            self.coach_calls += 1
+            if self.coach_calls == 1:
+                return "VALID: no\nVIOLATIONS: off-topic, too long\nSUGGESTION: stay brief"
+            return "VALID: yes\nVIOLATIONS: none\nSUGGESTION: none"
+        return "Performer output"
+
+
+class SlowAsyncClient:
+    """Coroutine client that sleeps to simulate network latency."""
+
+    def __init__(self, delay: float = 0.05):
+        self.delay = delay
+
+    async def send_message(self, system_prompt, user_message, temperature=0.7, max_tokens=512):
+        await asyncio.sleep(self.delay)
+        if temperature < 0.5:
+            return "VALID: yes\nVIOLATIONS: none\nSUGGESTION: none"
+        return "Async output"
+
+
+class TestAsyncGeneration:
+    """Tests for agenerate / agenerate_validated."""
+
+    def test_async_matches_sync_with_blocking_client(self):
+        """Test that the async path reproduces the sync critique sequence."""
+        config = DualLLMConfig(max_validation_retries=2)
+
+        sync_result = DualLLMClient(ScriptedClient(), config=config).generate_validated(
+            "system", "user", agent_id="Worker+Alice", rules=["Stay on topic"]
+        )
+        async_result = asyncio.run(
+            DualLLMClient(ScriptedClient(), config=config).agenerate_validated(
+                "system", "user", agent_id="Worker+Alice", rules=["Stay on topic"]
+            )
+        )
+
+        assert async_result.content == sync_result.content
+        assert async_result.retries == sync_result.retries == 1
+        assert [c.violations for c in async_result.coach_critiques] == \
+            [c.violations for c in sync_result.coach_critiques]
+
+    def test_concurrent_generations_overlap(self):
+        """Test that gathered generations run concurrently, not serially."""
+        dual = DualLLMClient(SlowAsyncClient(delay=0.05))
+
+        async def run_many():
+            return await asyncio.gather(*[
+                dual.agenerate_validated("system", "user", agent_id=f"Agent{i}", rules=[])
+                for i in range(8)
+            ])
+
+        start = time.time()
+        results = asyncio.run(run_many())
+        elapsed = time.time() - start
+
+        assert all(r.content == "Async output" for r in results)
+        # 8 x (performer + coach) serially would take ~0.8s
+        assert elapsed < 0.5
+
+
+class FakeSession:
+    def __init__(self):
+        self.closed = 0
+
+    async def aclose(self):
+        self.closed += 1
+
+
+class SessionClient(SlowAsyncClient):
+    """Async client that owns its own session."""
+
+    def __init__(self):
+        super().__init__(delay=0)
+        self.session = FakeSession()
+
+    async def aclose(self):
+        await self.session.aclose()
+
+
+class TestSessionLifecycle:
+    """Tests for DualLLMClient.aclose()."""
+
+    def test_aclose_closes_shared_and_owned_sessions(self):
+        shared = FakeSession()
+        performer, coach = SessionClient(), SessionClient()
+
+        async def run():
+            async with DualLLMClient(performer, coach, http_session=shared) as dual:
+                await dual.agenerate("system", "user")
+            await dual.aclose()  # idempotent for the shared session
+
+        asyncio.run(run())
+        assert shared.closed == 1
+        assert performer.session.closed >= 1 and coach.session.closed >= 1
+
+    def test_single_client_closed_once(self):
+        client = SessionClient()
+        asyncio.run(DualLLMClient(client).aclose())
+        assert client.session.closed == 1
+
+    def test_factory_shares_one_session(self):
+        pytest.importorskip("openai")
+        pytest.importorskip("httpx")
+
+        async def run():
+            dual = create_async_true_dual_llm(
+                "http://performer.invalid/v1", "p", "http://coach.invalid/v1", "c"
+            )
+            session = dual.http_session
+            assert dual.performer.http_client is session is dual.coach.http_client
+            await dual.aclose()
+            return session
+
+        assert asyncio.run(run()).is_closed
+
+
+class TestAsyncMockClient:
+    """Tests for the local_rcm async mock's concurrency cap."""
+
+    def test_send_json_waits_for_semaphore(self):
+        async def run():
+            client = AsyncMockClient(max_concurrency=1)
+            async with client.semaphore:
+                pending = asyncio.ensure_future(client.send_json("system", "user"))
+                await asyncio.sleep(0.01)
+                assert not pending.done()
+            return await pending
+
+        assert asyncio.run(run())["ok"] is True
@@ -0,0 +1,143 @@
+"""
+Test: DualLLMClient Batched Coach Validation
+
+Tests that validate_batch / avalidate_batch:
+- Return per-item critiques identical to the single-item path
+- Keep item order in results and in the critique log
+- Overlap coach round-trips instead of running them serially
+- Cap concurrent coach requests for large batches
+"""
+
+import asyncio
+import sys
+import threading
+import time
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from social_rl.dual_llm_client import DualLLMClient, ValidationItem
+
+
+class RuleCoachClient:
+    """Coach that rejects any content mentioning 'strike'."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+
+    def send_message(self, system_prompt, user_message, temperature=0.7, max_tokens=512):
+        time.sleep(self.delay)
+        if "strike" in user_message:
+            return "VALID: no\nVIOLATIONS: direct confrontation\nSUGGESTION: soften tone"
+        return "VALID: yes\nVIOLATIONS: none\nSUGGESTION: none"
+
+
+class PeakCoachClient(RuleCoachClient):
+    """Coach that records the most requests it had in flight at once."""
+
+    def __init__(self, delay: float = 0.01):
+        super().__init__(delay)
+        self.in_flight = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def send_message(self, *args, **kwargs):
+        with self._lock:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        try:
+            return super().send_message(*args, **kwargs)
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+ITEMS = [
+    ValidationItem("We should talk it through.", "Worker+Alice", ["No direct confrontation"], turn_number=1),
+    ValidationItem("Let's strike tomorrow!", "Worker+Ben", ["No direct confrontation"], turn_number=2),
+    ValidationItem("Output is up this week.", "Owner+Marta", ["Stay in character"], {"round": 1}, 3),
+]
+
+
+def single_item_critiques(dual):
+    """Critiques produced one at a time via the existing single-item path."""
+    critiques = []
+    for item in ITEMS:
+        is_valid, violations, suggested = dual.validate(
+            item.content, item.agent_id, item.rules, item.context
+        )
+        critiques.append(None if is_valid else dual._make_critique(
+            item.agent_id, item.turn_number, item.content, violations, suggested
+        ))
+    return critiques
+
+
+def comparable(critique):
+    if critique is None:
+        return None
+    return (critique.agent_id, critique.turn_number, critique.original_content,
+            critique.critique, critique.violations, critique.suggested_revision)
+
+
+class TestBatchValidation:
+    """Tests for batched coach validation."""
+
+    def test_batch_matches_single_item_path(self):
+        """Test that batch critiques equal the single-item critiques."""
+        dual = DualLLMClient(RuleCoachClient())
+
+        batch = dual.validate_batch(ITEMS)
+        expected = single_item_critiques(DualLLMClient(RuleCoachClient()))
+
+        assert [comparable(c) for c in batch] == [comparable(c) for c in expected]
+        assert batch[0] is None and batch[2] is None
+        assert batch[1].violations == ["direct confrontation"]
+        assert dual.critique_log == [batch[1]]
+
+    def test_async_batch_matches_sync_batch(self):
+        """Test that avalidate_batch returns the same critiques."""
+        sync_batch = DualLLMClient(RuleCoachClient()).validate_batch(ITEMS)
+        async_batch = asyncio.run(DualLLMClient(RuleCoachClient()).avalidate_batch(ITEMS))
+
+        assert [comparable(c) for c in async_batch] == [comparable(c) for c in sync_batch]
+
+    def test_batch_overlaps_round_trips(self):
+        """Test that N coach calls take about one round-trip, not N."""
+        dual = DualLLMClient(RuleCoachClient(delay=0.05))
+        items = [ValidationItem(f"message {i}", f"Agent{i}", []) for i in range(8)]
+
+        start = time.time()
+        critiques = dual.validate_batch(items)
+        elapsed = time.time() - start
+
+        assert critiques == [None] * 8
+        # 8 serial coach calls would take ~0.4s
+        assert elapsed < 0.3
+
+    def test_log_critiques_flag(self):
+        """Test that audits can skip appending to the critique log."""
+        dual = DualLLMClient(RuleCoachClient())
+        dual.validate_batch(ITEMS, log_critiques=False)
+        assert dual.critique_log == []
+
+    def test_large_batch_is_capped(self):
+        """Test that a big audit does not open one coach request per item."""
+        items = [ValidationItem(f"message {i}", f"Agent{i}", []) for i in range(40)]
+
+        coach = PeakCoachClient()
+        assert DualLLMClient(coach).validate_batch(items) == [None] * 40
+        assert coach.peak == DualLLMClient.MAX_BATCH_CONCURRENCY
+
+        coach = PeakCoachClient()
+        DualLLMClient(coach).validate_batch(items, max_workers=3)
+        assert coach.peak == 3
+
+    def test_async_batch_is_capped(self):
+        """Test that avalidate_batch bounds its concurrent coach requests."""
+        items = [ValidationItem(f"message {i}", f"Agent{i}", []) for i in range(20)]
+        coach = PeakCoachClient()
+
+        critiques = asyncio.run(DualLLMClient(coach).avalidate_batch(items, max_concurrency=4))
+        assert critiques == [None] * 20
+        assert coach.peak <= 4
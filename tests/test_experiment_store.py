@@ -0,0 +1,206 @@
+"""
+Test: Columnar Experiment Store
+
+Tests that experiments/experiment_store.py:
+- Extracts meta, regime, round-metric, message and feedback rows from an
+  experiment directory (JSON and JSONL transcripts)
+- Ingests incrementally (unchanged directories are not re-read, and only
+  the files of changed or removed directories are rewritten or deleted)
+- Gives analyze_sweep and compare_semiotic the same results as scanning
+  the JSON files
+"""
+
+import sys
+import json
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from experiments.experiment_store import experiment_rows, experiment_signature, TABLES
+from social_rl.transcript import write_round_transcript
+
+
+META = {
+    "experiment_id": "G_seed1",
+    "model": "qwen2.5:7b",
+    "condition": "G",
+    "seed": 1,
+    "context_mode": "adaptive",
+    "challenge_mode": "always",
+    "dual_llm": True,
+    "regime_trajectory": ["ACTIVE_CONTESTATION", "PRODUCTIVE_DISSONANCE"],
+    "final_regime": "PRODUCTIVE_DISSONANCE",
+    "divergence_events": 1,
+}
+
+SEMIOTIC_LOG = {
+    "experiment_id": "G_seed1",
+    "rounds": [
+        {"round_number": 1, "regime": "ACTIVE_CONTESTATION",
+         "raw_metrics": {"engagement": 1.0, "voice_valence": 0.0,
+                         "stance_valence": 0.5, "justificatory_pct": 0.25},
+         "ema_metrics": {}, "collapse_type": "none", "divergence_injected": False},
+    ],
+}
+
+
+def round_data(round_number):
+    return {
+        "round_number": round_number,
+        "messages": [
+            {"agent_id": "CES_A", "content": f"hello {round_number}", "round_number": round_number,
+             "turn_number": 1, "timestamp": 1.0, "prar_cue_used": ""},
+            {"agent_id": "CES_B", "content": "reply", "round_number": round_number,
+             "turn_number": 2, "timestamp": 2.0, "prar_cue_used": ""},
+        ],
+        "feedback": {"CES_A": {"agent_id": "CES_A", "round_number": round_number,
+                               "engagement": 0.4, "concepts_embodied": ["x"]}},
+        "policy_adaptations": [],
+        "synthesis": "",
+        "duration_seconds": 3.0,
+    }
+
+
+def make_experiment(outputs, name="G_seed1"):
+    exp_dir = outputs / name
+    exp_dir.mkdir(parents=True)
+    (exp_dir / "meta.json").write_text(json.dumps(dict(META, experiment_id=name)))
+    (exp_dir / "semiotic_state_log.json").write_text(json.dumps(SEMIOTIC_LOG))
+    # Round 1 in the legacy format, round 2 streamed
+    (exp_dir / "round1_social_rl.json").write_text(json.dumps(round_data(1), indent=2))
+    write_round_transcript(exp_dir / "round2_social_rl.jsonl", round_data(2))
+    return exp_dir
+
+
+class TestExperimentRows:
+    """Tests for the pure-Python row extraction."""
+
+    def test_rows_per_table(self, tmp_path):
+        rows = experiment_rows(make_experiment(tmp_path))
+
+        assert set(rows) == set(TABLES)
+        assert rows["meta"][0]["condition"] == "G"
+        assert [r["regime"] for r in rows["regimes"]] == META["regime_trajectory"]
+        assert rows["round_metrics"][0]["justificatory_pct"] == 0.25
+        assert [(m["round_number"], m["turn_number"]) for m in rows["messages"]] == \
+            [(1, 1), (1, 2), (2, 1), (2, 2)]
+        assert rows["agent_feedback"][0] == {
+            "experiment": "G_seed1", "round_number": 1, "agent_id": "CES_A", "engagement": 0.4
+        }
+
+    def test_non_experiment_dir(self, tmp_path):
+        assert experiment_rows(tmp_path) is None
+
+    def test_signature_tracks_changes(self, tmp_path):
+        exp_dir = make_experiment(tmp_path)
+        before = experiment_signature(exp_dir)
+        (exp_dir / "round3_social_rl.jsonl").write_text("")
+        assert experiment_signature(exp_dir) != before
+
+
+class TestExperimentStore:
+    """Tests for Parquet ingestion (requires pyarrow)."""
+
+    def test_incremental_ingest(self, tmp_path):
+        pytest.importorskip("pyarrow")
+        from experiments.experiment_store import ExperimentStore
+
+        outputs = tmp_path / "outputs"
+        make_experiment(outputs, "G_seed1")
+        store = ExperimentStore(str(tmp_path / "store"))
+
+        assert store.ingest(str(outputs), verbose=False)["added"] == 1
+        make_experiment(outputs, "G_seed2")
+        stats = ExperimentStore(str(tmp_path / "store")).ingest(str(outputs), verbose=False)
+
+        assert stats == {"added": 1, "updated": 0, "removed": 0, "unchanged": 1}
+        assert len(store.rows("messages", ["G_seed2"])) == 4
+        assert sorted({r["experiment"] for r in store.rows("meta")}) == ["G_seed1", "G_seed2"]
+
+    def test_ingest_touches_only_changed_experiments(self, tmp_path):
+        pytest.importorskip("pyarrow")
+        from experiments.experiment_store import ExperimentStore
+        import shutil
+
+        outputs = tmp_path / "outputs"
+        for name in ("G_seed1", "G_seed2", "G_seed3"):
+            make_experiment(outputs, name)
+        store = ExperimentStore(str(tmp_path / "store"))
+        store.ingest(str(outputs), verbose=False)
+
+        parts = sorted((tmp_path / "store").glob("*/*.parquet"))
+        assert len(parts) == 3 * len(TABLES)
+        before = {path: path.stat().st_mtime_ns for path in parts}
+
+        # Change one experiment (its feedback gains a score column), drop another
+        round3 = dict(round_data(3))
+        round3["feedback"] = {"CES_B": {"engagement": 0.9, "direct_references": 2}}
+        write_round_transcript(outputs / "G_seed2" / "round3_social_rl.jsonl", round3)
+        shutil.rmtree(outputs / "G_seed3")
+        stats = store.ingest(str(outputs), verbose=False)
+
+        assert stats == {"added": 0, "updated": 1, "removed": 1, "unchanged": 1}
+        assert not list((tmp_path / "store").glob("*/G_seed3.parquet"))
+        for path, mtime in before.items():
+            if path.stem == "G_seed1":
+                assert path.stat().st_mtime_ns == mtime
+        assert sorted({r["experiment"] for r in store.rows("messages")}) == ["G_seed1", "G_seed2"]
+
+        feedback = store.rows("agent_feedback")
+        assert {r["direct_references"] for r in feedback} == {None, 2}
+        assert len(store.rows("messages", ["G_seed2"])) == 6
+
+    def test_old_single_file_store_is_rebuilt(self, tmp_path):
+        pytest.importorskip("pyarrow")
+        from experiments.experiment_store import ExperimentStore
+
+        store_dir = tmp_path / "store"
+        store_dir.mkdir()
+        (store_dir / "manifest.json").write_text(json.dumps({"version": 1, "experiments": {"G_seed1": "x"}}))
+        (store_dir / "messages.parquet").write_bytes(b"old")
+
+        outputs = tmp_path / "outputs"
+        make_experiment(outputs)
+        store = ExperimentStore(str(store_dir))
+        assert not (store_dir / "messages.parquet").exists()
+        assert store.ingest(str(outputs), verbose=False)["added"] == 1
+        assert len(store.rows("messages")) == 4
+
+    def test_sweep_entries_match_json_scan(self, tmp_path):
+        pytest.importorskip("pyarrow")
+        from experiments.experiment_store import ExperimentStore, sweep_entries
+        from experiments.analyze_sweep import load_experiment, extract_regime_trajectory
+
+        outputs = tmp_path / "outputs"
+        exp_dir = make_experiment(outputs)
+        store = ExperimentStore(str(tmp_path / "store"))
+        store.ingest(str(outputs), verbose=False)
+
+        entry = sweep_entries(store)[0]
+        assert entry["trajectory"] == extract_regime_trajectory(load_experiment(exp_dir))
+        assert entry["meta"] == load_experiment(exp_dir)["meta"]
+
+    def test_compare_semiotic_matches_json_scan(self, tmp_path, capsys):
+        pytest.importorskip("pyarrow")
+        from experiments import compare_semiotic
+        from experiments.experiment_store import ExperimentStore
+        from social_rl.semiotic_coder import SemioticCoder
+
+        outputs = tmp_path / "outputs"
+        exp_dir = make_experiment(outputs, "G_seed1")
+        make_experiment(outputs, "G_seed2")
+        store = ExperimentStore(str(tmp_path / "store"))
+        store.ingest(str(outputs), verbose=False)
+
+        coder = SemioticCoder()
+        assert compare_semiotic.analyze_experiment(str(exp_dir), "G", coder, store) == \
+            compare_semiotic.analyze_experiment(str(exp_dir), "G", coder)
+
+        args = ["--outputs-dir", str(outputs), "--off", "G_seed1", "--on", "G_seed2"]
+        compare_semiotic.main(args)
+        from_json = capsys.readouterr().out
+        compare_semiotic.main(args + ["--store", str(tmp_path / "store")])
+        assert capsys.readouterr().out == from_json
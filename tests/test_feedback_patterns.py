@@ -0,0 +1,76 @@
+"""
+Test: Precompiled Feedback Patterns
+
+Tests that SocialFeedbackExtractor's compiled patterns and name matcher:
+- Count directives / compliance once per matching pattern
+- Detect topic shifts only at the start of a message
+- Credit every participant whose aliases appear, including shared roles
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from social_rl.feedback_extractor import create_extractor_for_framework
+
+
+@pytest.fixture
+def extractor():
+    return create_extractor_for_framework("A")
+
+
+class TestSocialBehaviorPatterns:
+    """Tests for directive, compliance and topic-shift patterns."""
+
+    @pytest.mark.parametrize("content, expected", [
+        ("You must finish the report. I want you to begin now?", {"questions": 1, "directives": 3, "compliance": 0}),
+        ("YES, I'll do it right away.", {"questions": 0, "directives": 0, "compliance": 2}),
+        ("Musty willows finished nothing", {"questions": 0, "directives": 0, "compliance": 0}),
+    ])
+    def test_behavior_counts(self, extractor, content, expected):
+        assert extractor._count_social_behaviors(content) == expected
+
+    @pytest.mark.parametrize("content, shifted", [
+        ("Moving on, the quotas.", True),
+        ("actually I disagree", True),
+        ("Shouldn't we stop?", True),
+        ("I agree. Now let's go.", False),
+    ])
+    def test_topic_shift(self, extractor, content, shifted):
+        assert extractor._is_topic_shift(content, "") is shifted
+
+
+class TestNameReferences:
+    """Tests for the single-pass alias matcher."""
+
+    def test_shared_role_alias_credits_everyone(self, extractor):
+        participants = ["Worker+Alice", "Worker+Ben", "Owner+Marta"]
+        feedback = extractor.extract_round_feedback(1, [
+            {"agent_id": "Owner+Marta", "content": "Every worker stays late."},
+        ], participants)
+
+        assert feedback["Worker+Alice"].direct_references == 1
+        assert feedback["Worker+Ben"].direct_references == 1
+        assert feedback["Owner+Marta"].direct_references == 0
+
+    def test_self_reference_not_counted(self, extractor):
+        participants = ["Worker+Alice", "Owner+Marta"]
+        feedback = extractor.extract_round_feedback(1, [
+            {"agent_id": "Worker+Alice", "content": "ALICE here, reporting."},
+        ], participants)
+
+        assert feedback["Worker+Alice"].direct_references == 0
+
+    def test_analyst_mentions_count_aliases(self, extractor):
+        participants = ["Worker+Alice", "Owner+Marta", "Analyst+Reporter"]
+        feedback = extractor.extract_round_feedback(1, [
+            {"agent_id": "Analyst+Reporter", "content": "Alice the worker defers to Marta."},
+        ], participants)
+
+        # "Alice" and "alice" are both aliases of Worker+Alice, plus the role
+        assert feedback["Worker+Alice"].analyst_mentions == 3
+        assert feedback["Owner+Marta"].analyst_mentions == 2
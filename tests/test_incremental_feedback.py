@@ -0,0 +1,133 @@
+"""
+Test: Incremental Feedback Extraction
+
+Tests that RoundFeedbackAccumulator / SocialRLRunner:
+- Snapshot the same feedback as a batch extraction over the prefix so far
+- Leave the running counts untouched when snapshotting
+- Finalize to the batch extract_round_feedback() result
+- Fold messages in during the round (feedback_interval_turns)
+"""
+
+import sys
+import random
+from dataclasses import asdict
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from social_rl.feedback_extractor import create_extractor_for_framework
+
+
+PARTICIPANTS = ["Worker+Alice", "Owner+Marta", "Worker+Ben", "Analyst+Reporter"]
+
+PHRASES = [
+    "Alice, you must finish this.",
+    "Yes, I understand. Marta said so?",
+    "Now what about power and control? No say, powerless.",
+    "I think Ben is right, we have to comply, no choice.",
+    "The analyst notes Alice seems alienated and powerless in a meaningless routine.",
+    "What's the point, it's meaningless, I feel the disconnect.",
+    "Okay, right away.",
+]
+
+
+def random_messages(n, seed=0):
+    rng = random.Random(seed)
+    return [
+        {"agent_id": rng.choice(PARTICIPANTS + ["Outsider"]), "content": rng.choice(PHRASES)}
+        for _ in range(n)
+    ]
+
+
+def as_dicts(feedback):
+    return {agent_id: asdict(fb) for agent_id, fb in feedback.items()}
+
+
+class TestRoundFeedbackAccumulator:
+    """Tests for message-by-message extraction."""
+
+    def test_snapshots_match_batch_prefixes(self):
+        messages = random_messages(30)
+        state = create_extractor_for_framework("A").start_round(1, PARTICIPANTS)
+
+        for i, message in enumerate(messages, 1):
+            state.add_message(message)
+            batch = create_extractor_for_framework("A").extract_round_feedback(
+                1, messages[:i], PARTICIPANTS
+            )
+            assert as_dicts(state.snapshot()) == as_dicts(batch)
+
+    def test_snapshot_does_not_mutate_running_counts(self):
+        messages = random_messages(20, seed=1)
+        state = create_extractor_for_framework("A").start_round(1, PARTICIPANTS)
+        state.extend(messages)
+
+        first = as_dicts(state.snapshot(synthesis="Alice and Marta argued."))
+        second = as_dicts(state.snapshot(synthesis="Alice and Marta argued."))
+
+        assert first == second
+
+    def test_finalize_matches_batch_and_is_stored(self):
+        messages = random_messages(25, seed=2)
+        synthesis = "Alice and Marta argued; Ben complied."
+
+        extractor = create_extractor_for_framework("A")
+        state = extractor.start_round(3, PARTICIPANTS)
+        state.extend(messages)
+        incremental = state.finalize(synthesis)
+
+        batch = create_extractor_for_framework("A").extract_round_feedback(
+            3, messages, PARTICIPANTS, synthesis
+        )
+        assert as_dicts(incremental) == as_dicts(batch)
+        assert extractor.round_feedback[3] is incremental
+
+    def test_snapshot_round_override(self):
+        state = create_extractor_for_framework("A").start_round(2, PARTICIPANTS)
+        state.extend(random_messages(5))
+        assert {fb.round_number for fb in state.snapshot(round_number=0).values()} == {0}
+
+
+class CyclingClient:
+    def __init__(self):
+        self.turn = 0
+
+    def send_message(self, system_prompt, user_message, temperature=0.7, max_tokens=512):
+        self.turn += 1
+        return PHRASES[self.turn % len(PHRASES)]
+
+
+class TestRunnerFeedback:
+    """Tests for feedback folded in by SocialRLRunner."""
+
+    @pytest.fixture
+    def run_round(self, make_runner):
+        def run(**kwargs):
+            runner = make_runner(CyclingClient(), **kwargs)
+            return runner, runner.execute_round(1, max_turns=7)
+
+        return run
+
+    def test_round_feedback_matches_batch(self, run_round):
+        runner, result = run_round(feedback_interval_turns=1)
+
+        batch = create_extractor_for_framework("A").extract_round_feedback(
+            1,
+            [{"agent_id": m.agent_id, "content": m.content} for m in result.messages],
+            ["Worker+Alice", "Owner+Marta"]
+        )
+        assert as_dicts(result.feedback) == as_dicts(batch)
+
+    def test_interval_snapshot_covers_turns_so_far(self, run_round):
+        runner, result = run_round(feedback_interval_turns=3)
+
+        # Last snapshot was taken after turn 6
+        batch = create_extractor_for_framework("A").extract_round_feedback(
+            0,
+            [{"agent_id": m.agent_id, "content": m.content} for m in result.messages[:6]],
+            ["Worker+Alice", "Owner+Marta"]
+        )
+        assert as_dicts(runner.feedback_extractor.round_feedback[0]) == as_dicts(batch)
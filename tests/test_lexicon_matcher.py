@@ -0,0 +1,155 @@
+"""
+Test: Single-Pass Lexicon Matcher
+
+Tests that LexiconMatcher / lexicon_code_utterance:
+- Return exactly the codes of the per-marker substring scans
+- Handle overlapping and nested markers
+- Agree between the Aho-Corasick and substring-scan backends
+- Pick up runtime edits to the marker lexicons
+- Build the module matcher once per marker set and accept prebuilt matchers
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from social_rl import semiotic_coder
+from social_rl.lexicon import LexiconMatcher
+from social_rl.semiotic_coder import (
+    get_lexicon_matcher, reset_lexicon_matcher, lexicon_code_utterance,
+    JUSTIFICATION_MARKERS, VOICE_MARKERS, STANCE_MARKERS
+)
+
+
+LEXICONS = {
+    "justification": JUSTIFICATION_MARKERS,
+    "voice": VOICE_MARKERS,
+    "stance": STANCE_MARKERS,
+}
+
+TEXTS = [
+    "",
+    "Because we must act, obviously. Since it is necessary, therefore we act.",
+    "My vote doesn't matter and no one listens to people like me. What's the point?",
+    "That doesn't make sense - you're wrong, you're missing the point you said.",
+    "I hear what you say, that's a fair point; building on your point, together we can change.",
+    "MAYBE IF they actually listened... Depending On the day, I might consider it.",
+    "We demanded change; our community deserves better. Collective action works.",
+    "Nothing in here matches any marker at all.",
+]
+
+
+def reference_hits(text_lower):
+    """The original one-scan-per-marker implementation."""
+    return {
+        name: {
+            category: [m for m in markers if m in text_lower]
+            for category, markers in categories.items()
+        }
+        for name, categories in LEXICONS.items()
+    }
+
+
+class TestLexiconMatcher:
+    """Tests for the multi-pattern matcher."""
+
+    @pytest.mark.parametrize("text", TEXTS)
+    def test_matches_reference_scan(self, text):
+        matcher = LexiconMatcher(LEXICONS)
+        assert matcher.match(text.lower()) == reference_hits(text.lower())
+
+    @pytest.mark.parametrize("text", TEXTS)
+    def test_substring_backend_matches(self, text):
+        """Test the fallback used when pyahocorasick is not installed."""
+        matcher = LexiconMatcher(LEXICONS)
+        matcher._automaton = None
+        assert matcher.match(text.lower()) == reference_hits(text.lower())
+
+    def test_automaton_backend_matches(self):
+        pytest.importorskip("ahocorasick")
+        matcher = LexiconMatcher(LEXICONS)
+        assert matcher._automaton is not None
+
+        every_marker = " | ".join(matcher.markers)
+        assert matcher.match(every_marker) == reference_hits(every_marker)
+
+    def test_overlapping_markers(self):
+        """Test that nested markers are all reported."""
+        matcher = LexiconMatcher({"stance": STANCE_MARKERS})
+        hits = matcher.match("that doesn't make sense, you're wrong")["stance"]
+
+        assert "doesn't make sense" in hits["dismissive"]
+        assert "you're wrong" in hits["dismissive"]
+        assert "you're" in hits["direct"]
+
+    def test_duplicate_markers_preserved(self):
+        """Test that a marker listed twice is reported twice, like the scan."""
+        matcher = LexiconMatcher({"x": {"a": ["because", "since", "because"]}})
+        assert matcher.match("because")["x"]["a"] == ["because", "because"]
+
+
+class TestLexiconCodeUtterance:
+    """Tests for codes produced through the shared matcher."""
+
+    @pytest.mark.parametrize("text", TEXTS)
+    def test_codes_unchanged(self, text):
+        code = lexicon_code_utterance(text, "Agent", 1, 1)
+        hits = reference_hits(text.lower())
+
+        assert code.justification_markers == \
+            hits["justification"]["justificatory"] + hits["justification"]["assertive"]
+        assert code.voice_markers == \
+            hits["voice"]["alienated"] + hits["voice"]["empowered"] + hits["voice"]["conditional"]
+        assert code.stance_markers == \
+            hits["stance"]["bridging"] + hits["stance"]["dismissive"] + hits["stance"]["direct"]
+
+    def test_matcher_built_once(self):
+        assert get_lexicon_matcher() is get_lexicon_matcher()
+
+    def test_lexicon_edits_rebuild_matcher(self, monkeypatch):
+        before = get_lexicon_matcher()
+        monkeypatch.setitem(
+            semiotic_coder.JUSTIFICATION_MARKERS, "justificatory",
+            JUSTIFICATION_MARKERS["justificatory"] + ["for the sake of"]
+        )
+
+        code = lexicon_code_utterance("For the sake of argument.", "Agent", 1, 1)
+        assert get_lexicon_matcher() is not before
+        assert code.justification_markers == ["for the sake of"]
+
+    def test_in_place_append_rebuilds_matcher(self, monkeypatch):
+        markers = list(STANCE_MARKERS["bridging"])
+        monkeypatch.setitem(semiotic_coder.STANCE_MARKERS, "bridging", markers)
+        get_lexicon_matcher()
+
+        markers.append("meet you halfway")
+        code = lexicon_code_utterance("I can meet you halfway.", "Agent", 1, 1)
+        assert "meet you halfway" in code.stance_markers
+
+    def test_coding_does_not_rebuild(self, monkeypatch):
+        get_lexicon_matcher()
+        built = []
+        monkeypatch.setattr(
+            semiotic_coder, "LexiconMatcher",
+            lambda lexicons: built.append(lexicons) or LexiconMatcher(lexicons)
+        )
+        for text in TEXTS:
+            lexicon_code_utterance(text, "Agent", 1, 1)
+        assert built == []
+
+        reset_lexicon_matcher()
+        get_lexicon_matcher()
+        assert len(built) == 1
+
+    def test_prebuilt_matcher(self):
+        matcher = LexiconMatcher({
+            "justification": {"justificatory": ["thus"], "assertive": []},
+            "voice": {"alienated": [], "empowered": [], "conditional": []},
+            "stance": {"bridging": [], "dismissive": [], "direct": []},
+        })
+        code = lexicon_code_utterance("Thus, because it is so.", "Agent", 1, 1, matcher=matcher)
+        assert code.justification_markers == ["thus"]
@@ -0,0 +1,118 @@
+"""
+Test: Prefix-Stable Prompt Layout
+
+Tests that SocialRLConfig(prompt_layout="prefix_stable"):
+- Sends each agent a byte-identical system prompt for the whole round
+- Grows the conversation append-only in the user message
+- Shares a longer prompt prefix between calls than the classic layout
+- Logs the shared-prefix length of every call
+"""
+
+import os
+import sys
+import random
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from social_rl.runner import SocialRLConfig, shared_prefix_length
+
+
+# Agents with persona fields, so the static system prompt has real content
+AGENTS = [
+    {"identifier": "Worker+Alice", "name": "Alice", "goal": "Keep the job",
+     "persona": "A factory worker.", "behaviors": {"raw": "Stay in character."}},
+    {"identifier": "Owner+Marta", "name": "Marta", "goal": "Meet the quota",
+     "persona": "The factory owner."},
+]
+
+
+class RecordingClient:
+    def __init__(self):
+        self.calls = []
+
+    def send_message(self, system_prompt, user_message, temperature=0.7, max_tokens=512):
+        self.calls.append((system_prompt, user_message))
+        # Replies of realistic length, so the conversation dominates the prompt
+        return f"Reply number {len(self.calls)}. " + "Quotas and the shift schedule. " * 15
+
+
+@pytest.fixture
+def run_round(make_runner, make_canvas):
+    canvas = make_canvas(agents=AGENTS, tasks="Discuss the quota")
+
+    def run(layout, mode="adaptive", max_turns=14):
+        client = RecordingClient()
+        runner = make_runner(client, canvas, prompt_layout=layout, manifestation_mode=mode)
+        runner.execute_round(1, max_turns=max_turns)
+        return runner, client.calls
+
+    return run
+
+
+class TestSharedPrefixLength:
+    """Tests for the prefix metric helper."""
+
+    def test_matches_commonprefix(self):
+        rng = random.Random(0)
+        for _ in range(500):
+            a = "".join(rng.choice("ab") for _ in range(rng.randrange(12)))
+            b = "".join(rng.choice("ab") for _ in range(rng.randrange(12)))
+            assert shared_prefix_length(a, b) == len(os.path.commonprefix([a, b]))
+
+
+class TestPrefixStableLayout:
+    """Tests for the prefix_stable prompt layout."""
+
+    @pytest.mark.parametrize("mode", ["progressive", "adaptive"])
+    def test_system_prompt_static_per_agent(self, run_round, mode):
+        runner, calls = run_round("prefix_stable", mode)
+        alice = {system for system, _ in calls if "Worker+Alice" in system.splitlines()[0]}
+        marta = {system for system, _ in calls if "Owner+Marta" in system.splitlines()[0]}
+
+        assert len(alice) == len(marta) == 1
+        assert "SCENARIO: Morning shift begins" in alice.pop()
+
+    def test_conversation_is_append_only(self, run_round):
+        _, calls = run_round("prefix_stable")
+        users = [user for _, user in calls]
+
+        for turn, (previous, current) in enumerate(zip(users, users[1:]), 1):
+            conversation = previous.split("\n\n", 1)[0]
+            assert current.startswith(conversation)
+            assert current.startswith(conversation + f"\n[") and f"Reply number {turn}." in current
+
+    def test_dynamic_guidance_follows_conversation(self, run_round):
+        _, calls = run_round("prefix_stable")
+        _, user = calls[-1]
+        assert user.index("Reply number 13.") < user.index("=== HOW YOU'RE EXPERIENCING THIS ===")
+        assert user.endswith("It is now your turn to respond as Alice.") or user.endswith("Marta.")
+
+    def test_shares_more_prefix_than_classic(self, run_round):
+        stable, _ = run_round("prefix_stable")
+        classic, _ = run_round("classic")
+
+        assert len(stable.prompt_prefix_log) == len(classic.prompt_prefix_log) == 14
+        assert stable.prompt_prefix_log[0]["shared_prefix_chars"] == 0
+        assert (
+            stable.get_prompt_prefix_stats()["shared_prefix_ratio"]
+            > classic.get_prompt_prefix_stats()["shared_prefix_ratio"]
+        )
+
+    def test_prefix_covers_previous_conversation(self, run_round):
+        runner, calls = run_round("prefix_stable")
+
+        # From an agent's second call on, its static prompt and the whole
+        # conversation it saw last time are reused
+        for turn in range(2, len(calls)):
+            system, user = calls[turn - 2]
+            reusable = len(system) + 1 + len(user.split("\n\n", 1)[0])
+            assert runner.prompt_prefix_log[turn]["shared_prefix_chars"] >= reusable
+
+    def test_classic_is_default(self, run_round):
+        assert SocialRLConfig().prompt_layout == "classic"
+        _, calls = run_round("classic")
+        assert "=== HOW YOU'RE EXPERIENCING THIS ===" in calls[-1][0]
@@ -0,0 +1,79 @@
+"""
+Test: Batch Regime Classification
+
+Tests that classify_regimes():
+- Labels every row exactly as identify_regime() does, boundaries included
+- Reports zero distance exactly for rows inside a signature
+- Measures distance to the nearest signature box otherwise
+"""
+
+import sys
+import math
+import random
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from experiments.social_aesthetics_regimes import (
+    identify_regime, RegimeType, REGIME_PRIORITY, REGIME_SIGNATURES
+)
+
+np = pytest.importorskip("numpy")
+from experiments.social_aesthetics_regimes import classify_regimes
+
+
+def boundary_rows():
+    """Every combination of signature bound values (ties and edges)."""
+    values = [sorted({
+        bound
+        for sig in REGIME_SIGNATURES.values()
+        for bound in getattr(sig, name)
+    }) for name in (
+        "engagement_range", "voice_valence_range",
+        "stance_valence_range", "justificatory_pct_range"
+    )]
+    return [(e, v, s, j) for e in values[0] for v in values[1] for s in values[2] for j in values[3]]
+
+
+class TestClassifyRegimes:
+    """Tests for the vectorized classifier."""
+
+    def test_labels_match_scalar_on_boundaries(self):
+        rows = boundary_rows()
+        result = classify_regimes(rows)
+        assert result.labels == [identify_regime(*row) for row in rows]
+
+    def test_labels_match_scalar_on_random_rows(self):
+        rng = random.Random(0)
+        rows = [
+            (rng.uniform(-0.1, 1.1), rng.uniform(-1, 1), rng.uniform(-0.1, 1.1), rng.uniform(-0.1, 1.1))
+            for _ in range(5000)
+        ]
+        result = classify_regimes(np.array(rows), chunk_size=777)
+
+        assert result.labels == [identify_regime(*row) for row in rows]
+        assert np.array_equal(result.distances == 0, np.array([l is not None for l in result.labels]))
+        assert all(n == l for n, l in zip(result.nearest, result.labels) if l is not None)
+
+    def test_distance_to_nearest_box(self):
+        # Engagement 0.0 sits inside both collapse boxes; stance 0.45 is
+        # 0.05 above the retreat box and 0.15 below the harmony box
+        result = classify_regimes([(0.0, 0.05, 0.45, 0.9)])
+
+        assert result.labels == [None]
+        assert result.nearest == [RegimeType.PROCEDURALIST_RETREAT]
+        assert math.isclose(result.distances[0], 0.05)
+
+    def test_nan_rows(self):
+        result = classify_regimes([(float("nan"), 0.0, 0.5, 0.4)])
+        assert result.labels == [None] and result.nearest == [None]
+
+    def test_shape_checked(self):
+        with pytest.raises(ValueError):
+            classify_regimes([0.5, 0.0, 0.5, 0.4])
+
+    def test_priority_order_is_scalar_order(self):
+        assert len(REGIME_PRIORITY) == len(REGIME_SIGNATURES)
@@ -0,0 +1,128 @@
+"""
+Test: Streaming Relational Metrics
+
+Tests that social_rl/metrics.py:
+- Reports the first pattern in list order from one combined regex
+- Accumulates metrics message by message with update()
+- Merges per-round metrics into the same aggregate as a full recompute
+"""
+
+import sys
+import random
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from social_rl.metrics import (
+    PatternSet, RelationalMetrics, RelationalMetricsComputer,
+    DOMINATION_PATTERNS, compute_experiment_metrics
+)
+
+
+FRAGMENTS = [
+    "because I said so", "that's final", "my decision is", "final", "I'm in charge",
+    "just doing my job", "I guess we have to", "whatever you say", "since",
+    "explaining why", "the line is slow", "end of discussion",
+]
+AGENTS = ["Owner+Marta", "Worker+Alice", "Worker+Ben", "Analyst"]
+
+
+def random_messages(n, seed):
+    rng = random.Random(seed)
+    return [
+        {"agent_id": rng.choice(AGENTS),
+         "content": " ".join(rng.choice(FRAGMENTS) for _ in range(rng.randrange(4)))}
+        for _ in range(n)
+    ]
+
+
+def first_in_list_order(patterns, text):
+    for i, pattern in enumerate(patterns):
+        match = pattern.search(text)
+        if match:
+            return i, match.group(0)
+    return None
+
+
+class TestPatternSet:
+    """Tests for the combined per-category regex."""
+
+    def test_earlier_pattern_wins_over_leftmost_match(self):
+        patterns = PatternSet(DOMINATION_PATTERNS)
+        text = "My decision is final, and that's final."
+
+        # "that's final" (pattern 1) beats the leftmost "my decision is ... final" (10)
+        assert patterns.first_match(text) == (1, "that's final")
+
+    def test_matches_per_pattern_scan(self):
+        patterns = PatternSet(DOMINATION_PATTERNS)
+        for message in random_messages(300, seed=0):
+            text = message["content"]
+            assert patterns.first_match(text) == first_in_list_order(patterns.patterns, text)
+            assert patterns.any(text) == (first_in_list_order(patterns.patterns, text) is not None)
+
+    @pytest.mark.parametrize("pattern_list", [
+        [r"\bso that\b", r"(?:in order) to\b"],   # not hoistable
+        [r"\bs?ince\b", r"\bbecause\b"],          # optional first letter
+        [r"\bwe\b|\bus\b", r"\bthey\b"],            # top-level alternation
+    ])
+    def test_plain_alternation_fallback(self, pattern_list):
+        patterns = PatternSet(pattern_list)
+        for text in ["since then", "ince", "in order to win", "so that", "nothing", "trust us now"]:
+            assert patterns.first_match(text) == first_in_list_order(patterns.patterns, text)
+            assert patterns.any(text) == (first_in_list_order(patterns.patterns, text) is not None)
+
+    def test_nested_alternation_still_hoisted(self):
+        patterns = PatternSet([r"\bw(?:e|ho)\b", r"\bthey [a|b]\b"])
+        assert patterns.combined.pattern.startswith(r"\b(?=[tw])")
+        assert patterns.first_match("they | who") == (0, "who")
+        assert patterns.first_match("they a") == (1, "they a")
+
+
+class TestStreamingMetrics:
+    """Tests for update() / merge()."""
+
+    def test_update_matches_round_computation(self):
+        messages = random_messages(40, seed=1)
+        streamed = RelationalMetrics()
+        for message in messages:
+            streamed.update(message, round_number=2)
+
+        assert streamed == RelationalMetricsComputer().compute_round_metrics(messages, 2)
+
+    def test_merge_equals_single_pass_over_all_rounds(self):
+        rounds = [random_messages(30, seed=s) for s in range(3)]
+        computer = RelationalMetricsComputer()
+
+        merged = RelationalMetrics()
+        for i, messages in enumerate(rounds, 1):
+            merged.merge(computer.compute_round_metrics(messages, i))
+
+        full = RelationalMetrics()
+        for i, messages in enumerate(rounds, 1):
+            for message in messages:
+                full.update(message, round_number=i)
+
+        assert merged == full
+        assert merged.to_dict() == full.to_dict()
+
+    def test_experiment_metrics(self):
+        results = [
+            {"round_number": i, "messages": random_messages(20, seed=10 + i)}
+            for i in (1, 2)
+        ]
+        metrics = compute_experiment_metrics(results)
+
+        per_round_total = sum(
+            r["participation"]["total_messages"] for r in metrics["per_round"].values()
+        )
+        assert metrics["aggregate"]["participation"]["total_messages"] == per_round_total == 40
+        # Aggregate examples keep the round they came from
+        assert {e["round"] for e in metrics["aggregate"]["domination"]["examples"]} <= {1, 2}
+
+    def test_empty_experiment(self):
+        metrics = compute_experiment_metrics([])
+        assert metrics["aggregate"]["participation"]["total_messages"] == 0
@@ -0,0 +1,206 @@
+"""
+Test: LLM Response Cache
+
+Tests that the response cache:
+- Serves identical deterministic requests without calling the client
+- Passes sampled (high-temperature) calls straight through
+- Persists entries to SQLite across cache instances
+- Honors LRU size limits and TTL expiry
+- Never stores or serves error replies and send_json fallback verdicts
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# Add local_rcm to path (same pattern as agents/agent_runner.py)
+sys.path.insert(0, str(Path(__file__).parent.parent / "local_rcm"))
+
+from response_cache import ResponseCache, CachedLLMClient, make_cache_key, is_error_response
+from llm_client import OllamaClient, json_error_fallback
+
+
+class CountingClient:
+    """Client that records how often it is actually called."""
+
+    model = "counting-model"
+
+    def __init__(self):
+        self.calls = 0
+
+    def send_message(self, system_prompt, user_message, temperature=0.7, max_tokens=512):
+        self.calls += 1
+        return f"reply {self.calls} to {user_message}"
+
+    def send_json(self, system_prompt, user_message):
+        self.calls += 1
+        return {"ok": True, "call": self.calls}
+
+
+class TestCachedLLMClient:
+    """Tests for the caching wrapper."""
+
+    def test_deterministic_calls_hit_cache(self):
+        """Test that a repeated temperature-0 call is served from cache."""
+        client = CountingClient()
+        cached = CachedLLMClient(client)
+
+        first = cached.send_message("sys", "validate this", temperature=0.0, max_tokens=256)
+        second = cached.send_message("sys", "validate this", temperature=0.0, max_tokens=256)
+
+        assert first == second
+        assert client.calls == 1
+        assert cached.get_stats()["hits"] == 1
+        assert cached.get_stats()["misses"] == 1
+
+    def test_key_covers_full_request(self):
+        """Test that changing any request field is a cache miss."""
+        client = CountingClient()
+        cached = CachedLLMClient(client, temperature_threshold=0.1)
+
+        cached.send_message("sys", "msg", 0.0, 256)
+        cached.send_message("sys", "msg", 0.1, 256)
+        cached.send_message("sys", "msg", 0.0, 128)
+        cached.send_message("other", "msg", 0.0, 256)
+
+        assert client.calls == 4
+
+    def test_sampled_calls_bypass_cache(self):
+        """Test that calls above the threshold always reach the client."""
+        client = CountingClient()
+        cached = CachedLLMClient(client, temperature_threshold=0.1)
+
+        cached.send_message("sys", "msg", temperature=0.7)
+        cached.send_message("sys", "msg", temperature=0.7)
+
+        assert client.calls == 2
+        assert cached.get_stats()["misses"] == 0
+
+    def test_default_temperature_for_two_arg_clients(self):
+        """Test that LLMClient-style send_json is cached but sampled send_message is not."""
+        client = CountingClient()
+        cached = CachedLLMClient(client)
+
+        cached.send_json("sys", "answer")
+        assert cached.send_json("sys", "answer") == {"ok": True, "call": 1}
+        cached.send_message("sys", "question")
+        cached.send_message("sys", "question")
+        assert client.calls == 3
+
+        deterministic = CachedLLMClient(client, default_temperature=0.0)
+        deterministic.send_message("sys", "question")
+        deterministic.send_message("sys", "question")
+        assert client.calls == 4
+
+        unknown = CachedLLMClient(client, json_temperature=None)
+        unknown.send_json("sys", "answer")
+        unknown.send_json("sys", "answer")
+        assert client.calls == 6
+
+    def test_error_replies_not_cached(self):
+        """Test that transport error strings are never stored."""
+
+        class FailingClient(CountingClient):
+            def send_message(self, system_prompt, user_message, temperature=0.7, max_tokens=512):
+                self.calls += 1
+                return "Error calling Ollama: connection refused"
+
+        client = FailingClient()
+        cached = CachedLLMClient(client)
+        cached.send_message("sys", "msg", temperature=0.0)
+        cached.send_message("sys", "msg", temperature=0.0)
+
+        assert client.calls == 2
+
+    @pytest.mark.parametrize("fallback", [
+        json_error_fallback(ConnectionError("connection refused")),
+        {"ok": True, "reason": "Validation skipped due to local model error"},
+    ])
+    def test_json_fallback_verdicts_not_cached(self, fallback):
+        """Test that send_json error fallbacks are never replayed as coach verdicts."""
+
+        class FailingClient(CountingClient):
+            def send_json(self, system_prompt, user_message):
+                self.calls += 1
+                return dict(fallback)
+
+        client = FailingClient()
+        cache = ResponseCache()
+        cached = CachedLLMClient(client, cache, default_temperature=0.0)
+        cached.send_json("sys", "answer")
+        cached.send_json("sys", "answer")
+
+        assert client.calls == 2
+        assert len(cache) == 0
+
+    def test_stored_fallback_treated_as_miss(self):
+        """Test that a fallback persisted by an older version is not served."""
+        client = CountingClient()
+        cache = ResponseCache()
+        cached = CachedLLMClient(client, cache, default_temperature=0.0)
+        key = make_cache_key(
+            method="send_json", system_prompt="sys", user_message="answer",
+            model=cached.model, temperature=0.0, max_tokens=None,
+        )
+        cache.put(key, {"ok": True, "reason": "Validation skipped due to local model error"})
+
+        assert cached.send_json("sys", "answer") == {"ok": True, "call": 1}
+        assert cached.send_json("sys", "answer") == {"ok": True, "call": 1}
+
+    def test_ollama_json_failure_is_marked(self):
+        """Test that OllamaClient.send_json marks its fallback verdict."""
+
+        class BrokenSession:
+            def post(self, *args, **kwargs):
+                raise ConnectionError("connection refused")
+
+        client = OllamaClient.__new__(OllamaClient)
+        client.base_url, client.model, client.timeout = "http://localhost:1", "m", 1
+        client.session = BrokenSession()
+
+        verdict = client.send_json("sys", "answer")
+        assert verdict["ok"] and is_error_response(verdict)
+
+
+class TestResponseCache:
+    """Tests for the two-tier store."""
+
+    def test_sqlite_persists_across_instances(self, tmp_path):
+        """Test that a new cache on the same file sees earlier entries."""
+        path = str(tmp_path / "cache.sqlite")
+        key = make_cache_key(system_prompt="s", user_message="u", model="m")
+
+        cache = ResponseCache(path)
+        cache.put(key, "stored reply")
+        cache.close()
+
+        reopened = ResponseCache(path)
+        assert reopened.get(key) == "stored reply"
+        assert reopened.disk_hits == 1
+        assert reopened.get(key) == "stored reply"
+        assert reopened.memory_hits == 1
+
+    def test_lru_and_disk_eviction(self, tmp_path):
+        """Test that both tiers respect their size limits."""
+        cache = ResponseCache(
+            str(tmp_path / "cache.sqlite"), max_memory_entries=2, max_disk_entries=3
+        )
+        for i in range(5):
+            cache.put(f"k{i}", i)
+
+        assert len(cache) == 3
+        assert cache.get("k0") is None
+        assert cache.get("k4") == 4
+        assert cache.get_stats()["memory_entries"] == 2
+
+    def test_ttl_expiry(self):
+        """Test that expired entries are treated as misses."""
+        cache = ResponseCache(ttl_seconds=0.05)
+        cache.put("k", "v")
+        assert cache.get("k") == "v"
+
+        time.sleep(0.1)
+        assert cache.get("k") is None
+        assert cache.misses == 1
@@ -0,0 +1,160 @@
+"""
+Test: Concurrent Sweep Scheduler
+
+Tests that experiments/run_sweep.py:
+- Expands condition specs (ranges, commas, duplicates) and rejects unknown ones
+- Builds one job per (condition, seed) pair with the condition's settings
+- Keeps concurrent LLM calls per endpoint within the in-flight cap
+"""
+
+import sys
+import time
+import threading
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from experiments.run_sweep import (
+    SWEEP_CONDITIONS, parse_conditions, build_sweep_jobs, sweep_endpoints
+)
+from experiments.run_ces_experiment import EndpointGatedClient
+
+
+class SlowClient:
+    """Client that records how many calls are in flight at once."""
+
+    def __init__(self, delay: float = 0.01):
+        self.delay = delay
+        self.in_flight = 0
+        self.peak = 0
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def _enter(self):
+        with self._lock:
+            self.in_flight += 1
+            self.calls += 1
+            self.peak = max(self.peak, self.in_flight)
+
+    def _exit(self):
+        with self._lock:
+            self.in_flight -= 1
+
+    def send_message(self, system_prompt, user_message, temperature=0.7, max_tokens=512):
+        self._enter()
+        try:
+            time.sleep(self.delay)
+            return "ok"
+        finally:
+            self._exit()
+
+    def stream_message(self, system_prompt, user_message, temperature=0.7, max_tokens=512):
+        self._enter()
+        try:
+            for word in ("o", "k"):
+                time.sleep(self.delay / 2)
+                yield word
+        finally:
+            self._exit()
+
+
+class TestParseConditions:
+    """Tests for parse_conditions()."""
+
+    def test_ranges_and_lists(self):
+        assert parse_conditions(["A-D", "G"]) == ["A", "B", "C", "D", "G"]
+        assert parse_conditions(["a,c", "h"]) == ["A", "C", "H"]
+        assert parse_conditions(["A-H"]) == list(SWEEP_CONDITIONS)
+
+    def test_duplicates_kept_once_in_order(self):
+        assert parse_conditions(["G", "A-C", "b", "G"]) == ["G", "A", "B", "C"]
+
+    @pytest.mark.parametrize("spec", ["Z", "A-J"])
+    def test_unknown_condition(self, spec):
+        with pytest.raises(ValueError):
+            parse_conditions([spec])
+
+
+class TestBuildSweepJobs:
+    """Tests for build_sweep_jobs()."""
+
+    def test_conditions_times_seeds(self):
+        jobs = build_sweep_jobs(["A", "G"], [1, 2, 3], experiment_suffix="_fixed",
+                                provider="mock", rounds=1)
+
+        assert [(j["condition"], j["seed"]) for j in jobs] == [
+            ("A", 1), ("A", 2), ("A", 3), ("G", 1), ("G", 2), ("G", 3)
+        ]
+        assert [j["experiment_id"] for j in jobs][:2] == ["A_seed1_fixed", "A_seed2_fixed"]
+        for job in jobs:
+            for key, value in SWEEP_CONDITIONS[job["condition"]].items():
+                assert job[key] == value
+            assert job["provider"] == "mock" and job["rounds"] == 1
+
+    def test_jobs_do_not_share_kwargs(self):
+        jobs = build_sweep_jobs(["A"], [1, 2], model="m")
+        jobs[0]["model"] = "changed"
+        assert jobs[1]["model"] == "m"
+
+    def test_sweep_endpoints(self):
+        assert sweep_endpoints("ollama") == ["http://localhost:11434"]
+        assert sweep_endpoints(
+            "vllm", performer_url="http://a/v1/", coach_url="http://b/v1"
+        ) == ["http://a/v1", "http://b/v1"]
+        assert sweep_endpoints(
+            "vllm", performer_url="http://a/v1", coach_url="http://a/v1/"
+        ) == ["http://a/v1"]
+
+
+class TestEndpointInflightCap:
+    """Tests for EndpointGatedClient under concurrent sweep workers."""
+
+    @pytest.mark.parametrize("cap", [1, 3])
+    def test_concurrent_calls_never_exceed_cap(self, cap):
+        client = SlowClient()
+        gate = threading.BoundedSemaphore(cap)
+        # One wrapper per run, all sharing the endpoint's gate
+        runs = [EndpointGatedClient(client, gate) for _ in range(8)]
+
+        def run(gated):
+            for _ in range(5):
+                gated.send_message("s", "u")
+                "".join(gated.stream_message("s", "u"))
+
+        with ThreadPoolExecutor(max_workers=len(runs)) as pool:
+            list(pool.map(run, runs))
+
+        assert client.calls == 8 * 5 * 2
+        assert client.peak == cap
+
+    def test_manager_gate_shared_across_workers(self):
+        """Test the multiprocessing.Manager semaphore run_sweep hands to workers."""
+        client = SlowClient()
+        with multiprocessing.Manager() as manager:
+            gate = manager.BoundedSemaphore(2)
+            with ThreadPoolExecutor(max_workers=6) as pool:
+                list(pool.map(
+                    lambda _: EndpointGatedClient(client, gate).send_message("s", "u"),
+                    range(12)
+                ))
+
+        assert client.calls == 12
+        assert client.peak == 2
+
+    def test_gate_released_when_stream_closed_early(self):
+        client = SlowClient()
+        gate = threading.BoundedSemaphore(1)
+        gated = EndpointGatedClient(client, gate)
+
+        stream = gated.stream_message("s", "u")
+        next(stream)
+        stream.close()
+
+        assert gate.acquire(blocking=False)
+        gate.release()
+        assert client.in_flight == 0
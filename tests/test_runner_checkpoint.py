@@ -0,0 +1,188 @@
+"""
+Test: SocialRLRunner Checkpoint / Resume
+
+Tests that the per-turn checkpoint log:
+- Lets a run that crashed mid-round continue from its last completed turn
+- Produces the same transcript and runner state as an uninterrupted run
+- Tolerates a torn final record, and resumes again after appending past it
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from social_rl.runner import SocialRLRunner
+from social_rl.checkpoint import CheckpointLog, CHECKPOINT_FILENAME
+
+
+class Crash(Exception):
+    pass
+
+
+class ScriptedClient:
+    """Deterministic client that can crash on its Nth call."""
+
+    def __init__(self, crash_on: int = 0):
+        self.calls = 0
+        self.crash_on = crash_on
+
+    def send_message(self, system_prompt, user_message, temperature=0.7, max_tokens=512):
+        self.calls += 1
+        if self.calls == self.crash_on:
+            raise Crash("endpoint went away")
+        return f"I think we should discuss this. ({len(user_message)} chars of context)"
+
+
+@pytest.fixture
+def make_checkpointed_runner(make_runner, make_canvas):
+    """Auto-saving runner over a three-agent, two-round canvas."""
+    canvas = make_canvas(agents=("Worker+Alice", "Worker+Ben", "Owner+Marta"), rounds=2)
+
+    def factory(client, output_dir, auto_save=True):
+        return make_runner(
+            client, canvas,
+            manifestation_mode="adaptive",
+            auto_save=auto_save,
+            output_dir=str(output_dir)
+        )
+
+    return factory
+
+
+COLLAPSE_METRICS = {
+    "engagement": 0.0, "voice_valence": 0.2,
+    "stance_valence": 1.0, "justificatory_pct": 1.0,
+}
+
+
+def run_rounds(runner, rounds=(1, 2), max_turns=7):
+    for round_num in rounds:
+        if round_num not in runner.round_results:
+            runner.execute_round(round_num, max_turns=max_turns)
+            # Between rounds, as the experiment scripts do: feed semiotic
+            # metrics (a collapse, so divergence fires next round) and save
+            for _ in range(6):
+                runner.context_injector.update_semiotic_state(COLLAPSE_METRICS)
+            for agent_id, signal in runner.accumulated_feedback.items():
+                runner.context_injector.update_feedback(agent_id, signal)
+            runner.save_checkpoint()
+
+
+def tracker_state(runner):
+    tracker = runner.context_injector.semiotic_tracker
+    return {k: v for k, v in tracker.__dict__.items() if k != "config"}
+
+
+def transcript(runner):
+    return [
+        (m.agent_id, m.turn_number, m.content, m.turn_context)
+        for round_num in sorted(runner.round_results)
+        for m in runner.round_results[round_num].messages
+    ]
+
+
+class TestCheckpointResume:
+    """Tests for crash recovery via SocialRLRunner.resume."""
+
+    def test_resume_mid_round_matches_uninterrupted_run(self, make_checkpointed_runner, tmp_path):
+        """Test that a crash on turn 4 of round 2 resumes to the same result."""
+        reference = make_checkpointed_runner(ScriptedClient(), tmp_path / "reference")
+        run_rounds(reference)
+
+        crashed = make_checkpointed_runner(ScriptedClient(crash_on=11), tmp_path / "crashed")
+        with pytest.raises(Crash):
+            run_rounds(crashed)
+        assert 2 not in crashed.round_results
+
+        resumed = SocialRLRunner.resume(str(tmp_path / "crashed"), ScriptedClient())
+        assert sorted(resumed.round_results) == [1]
+        assert len(resumed._resume_messages[2]) == 3
+
+        run_rounds(resumed)
+
+        assert transcript(resumed) == transcript(reference)
+        assert resumed.accumulated_feedback == reference.accumulated_feedback
+        assert resumed.context_injector.agent_feedback == reference.context_injector.agent_feedback
+        assert resumed.feedback_extractor.round_feedback == reference.feedback_extractor.round_feedback
+        assert resumed.process_retriever.policy_history == reference.process_retriever.policy_history
+        assert resumed.process_retriever.get_policy_state() == \
+            reference.process_retriever.get_policy_state()
+
+        reference_tracker = tracker_state(reference)
+        assert reference_tracker["_collapse_state"] is not None
+        assert reference_tracker["metric_history"] and reference_tracker["divergence_log"]
+        assert tracker_state(resumed) == reference_tracker
+
+    def test_records_do_not_repeat_earlier_rounds(self, make_checkpointed_runner, tmp_path):
+        """Test that finished rounds' feedback is written once, not per turn."""
+        runner = make_checkpointed_runner(ScriptedClient(), tmp_path)
+        run_rounds(runner)
+
+        records = CheckpointLog(tmp_path / CHECKPOINT_FILENAME).read()
+        turn_states = [r["state"] for r in records if r["type"] == "turn"]
+        assert all(set(state["round_feedback"]) <= {"0"} for state in turn_states)
+        assert all(state["agent_feedback"] == {} for state in turn_states)
+
+        round_states = [r["state"] for r in records if r["type"] == "round"]
+        assert [set(state["round_feedback"]) - {"0"} for state in round_states] == [{"1"}, {"2"}]
+        feedback_states = [r["state"] for r in records if r["type"] == "state"]
+        assert [state["agent_feedback_start"] for state in feedback_states] == [
+            dict.fromkeys(runner.context_injector.agent_feedback, 0),
+            dict.fromkeys(runner.context_injector.agent_feedback, 1),
+        ]
+
+    def test_save_checkpoint_extras_round_trip(self, make_checkpointed_runner, tmp_path):
+        """Test that between-round extras come back in order."""
+        runner = make_checkpointed_runner(ScriptedClient(), tmp_path)
+        runner.execute_round(1, max_turns=3)
+        runner.save_checkpoint(extra={"round": 1, "regime": "ENGAGED"})
+
+        resumed = SocialRLRunner.resume(str(tmp_path), ScriptedClient())
+        assert resumed.checkpoint_extras == [{"round": 1, "regime": "ENGAGED"}]
+
+    def test_torn_final_record_is_ignored(self, make_checkpointed_runner, tmp_path):
+        """Test that a half-written last line does not block resume."""
+        runner = make_checkpointed_runner(ScriptedClient(), tmp_path)
+        runner.execute_round(1, max_turns=3)
+
+        path = tmp_path / CHECKPOINT_FILENAME
+        with open(path, "a") as f:
+            f.write('{"type": "turn", "round_numb')
+
+        records = CheckpointLog(path).read()
+        assert records[-1]["type"] == "round"
+        resumed = SocialRLRunner.resume(str(tmp_path), ScriptedClient())
+        assert [m.content for m in resumed.round_results[1].messages] == \
+            [m.content for m in runner.round_results[1].messages]
+
+    def test_torn_record_then_repeated_crashes(self, make_checkpointed_runner, tmp_path):
+        """Test that a torn tail is cut off so later appends stay readable."""
+        reference = make_checkpointed_runner(ScriptedClient(), tmp_path / "reference")
+        run_rounds(reference)
+
+        crashed = make_checkpointed_runner(ScriptedClient(crash_on=4), tmp_path / "crashed")
+        with pytest.raises(Crash):
+            run_rounds(crashed)
+        path = tmp_path / "crashed" / CHECKPOINT_FILENAME
+        with open(path, "a") as f:
+            f.write('{"type": "turn", "round_numb')
+
+        resumed = SocialRLRunner.resume(str(tmp_path / "crashed"), ScriptedClient(crash_on=6))
+        with pytest.raises(Crash):
+            run_rounds(resumed)
+
+        resumed = SocialRLRunner.resume(str(tmp_path / "crashed"), ScriptedClient())
+        run_rounds(resumed)
+        assert transcript(resumed) == transcript(reference)
+        assert all(record["type"] for record in CheckpointLog(path).read())
+
+    def test_checkpointing_disabled_without_auto_save(self, make_checkpointed_runner, tmp_path):
+        """Test that in-memory runs write no checkpoint log."""
+        runner = make_checkpointed_runner(ScriptedClient(), tmp_path, auto_save=False)
+        runner.execute_round(1, max_turns=2)
+
+        assert not (tmp_path / CHECKPOINT_FILENAME).exists()
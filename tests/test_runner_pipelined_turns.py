@@ -0,0 +1,161 @@
+"""
+Test: SocialRLRunner Pipelined Turns
+
+Tests that pipelined (speculative) turn execution:
+- Produces exactly the same round as the sequential loop, including
+  turns where the coach rejects and the speculation is discarded
+- Rolls back context/policy state touched by discarded speculation, so
+  every piece of runner state matches the sequential loop field by field
+- Overlaps coach validation with the next speaker's performer call
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from social_rl.dual_llm_client import DualLLMClient
+
+
+class PerformerClient:
+    """Deterministic performer: reply depends only on the prompts."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+
+    def send_message(self, system_prompt, user_message, temperature=0.7, max_tokens=512):
+        time.sleep(self.delay)
+        revised = " (revised)" if "Your previous response had these issues" in system_prompt else ""
+        return f"Reply to {len(user_message)} chars{revised}"
+
+
+class CoachClient:
+    """Deterministic coach: rejects unrevised drafts with an odd length tag."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+
+    def send_message(self, system_prompt, user_message, temperature=0.1, max_tokens=256):
+        time.sleep(self.delay)
+        content = user_message.split("Content: ", 1)[1].split("\n", 1)[0]
+        length = int(content.split("Reply to ", 1)[1].split(" ", 1)[0])
+        if length % 2 == 1 and "(revised)" not in content:
+            return "VALID: no\nVIOLATIONS: odd length\nSUGGESTION: revise"
+        return "VALID: yes\nVIOLATIONS: none\nSUGGESTION: none"
+
+
+@pytest.fixture
+def run_round(make_runner, make_canvas):
+    canvas = make_canvas(agents=("Worker+Alice", "Worker+Ben", "Owner+Marta"))
+
+    def run(pipeline: bool, max_turns: int = 7, delay: float = 0.0, seed_collapse: bool = False, **config_overrides):
+        dual = DualLLMClient(PerformerClient(delay), CoachClient(delay))
+        runner = make_runner(
+            PerformerClient(), canvas, dual,
+            manifestation_mode="adaptive", pipeline_turns=pipeline, **config_overrides
+        )
+        if seed_collapse:
+            # Earlier rounds in paternalistic harmony: divergence fires this round
+            runner.accumulated_feedback = {"Worker+Alice": {"engagement": 0.1}}
+            for _ in range(6):
+                runner.context_injector.update_semiotic_state({
+                    "engagement": 0.0, "voice_valence": 0.2,
+                    "stance_valence": 1.0, "justificatory_pct": 1.0,
+                })
+        result = runner.execute_round(1, max_turns=max_turns)
+        return runner, result
+
+    return run
+
+
+def round_state(runner, result):
+    """Everything a round leaves behind, minus wall-clock timestamps."""
+    injector = runner.context_injector
+    tracker = injector.semiotic_tracker
+    return {
+        "messages": [
+            {**m.to_dict(), "timestamp": None, "turn_context": m.turn_context}
+            for m in result.messages
+        ],
+        "policy_history": runner.process_retriever.policy_history,
+        "critiques": [
+            (c.agent_id, c.turn_number, c.original_content, c.violations, c.suggested_revision)
+            for c in runner.dual_llm.critique_log
+        ],
+        "tracker": (
+            {k: v for k, v in tracker.__dict__.items() if k != "config"}
+            if tracker is not None else None
+        ),
+        "round_divergence": injector._current_round_divergence,
+        "agent_feedback": injector.agent_feedback,
+        "accumulated_feedback": runner.accumulated_feedback,
+        "cache": (dict(injector._component_cache), injector.get_cache_stats()),
+        "conversation_index": (
+            injector.conversation_index.messages, injector.conversation_index.stats,
+            injector.conversation_index.recent_patterns(),
+            injector.conversation_index._mentions,
+        ),
+        "context_windows": {
+            r: (w._tokens, w._total, w._summaries, w.stats)
+            for r, w in runner._context_windows.items()
+        },
+        "prompt_prefix_log": runner.prompt_prefix_log,
+    }
+
+
+class TestPipelinedTurns:
+    """Tests for speculative next-speaker execution."""
+
+    def test_matches_sequential_round(self, run_round):
+        """Test that pipelined and sequential rounds are identical."""
+        seq_runner, seq = run_round(pipeline=False)
+        pipe_runner, pipe = run_round(pipeline=True)
+
+        assert [m.content for m in pipe.messages] == [m.content for m in seq.messages]
+        assert [m.turn_context for m in pipe.messages] == [m.turn_context for m in seq.messages]
+        assert [m.validation_metadata for m in pipe.messages] == \
+            [m.validation_metadata for m in seq.messages]
+        assert [(c.agent_id, c.original_content) for c in pipe_runner.dual_llm.critique_log] == \
+            [(c.agent_id, c.original_content) for c in seq_runner.dual_llm.critique_log]
+        assert len(pipe_runner.process_retriever.policy_history) == \
+            len(seq_runner.process_retriever.policy_history)
+
+    def test_rejected_rounds_match_sequential_state(self, run_round):
+        """Test that discarded speculation leaves no trace in any runner state."""
+        for overrides in ({}, {"context_token_budget": 40}):
+            seq_runner, seq = run_round(pipeline=False, max_turns=9, seed_collapse=True, **overrides)
+            pipe_runner, pipe = run_round(pipeline=True, max_turns=9, seed_collapse=True, **overrides)
+
+            assert pipe_runner.pipeline_stats["discarded"] > 0
+            assert seq_runner.context_injector.get_divergence_log()
+
+            seq_state = round_state(seq_runner, seq)
+            pipe_state = round_state(pipe_runner, pipe)
+            for name in seq_state:
+                assert pipe_state[name] == seq_state[name], name
+
+    def test_rejections_discard_speculation(self, run_round):
+        """Test that the scripted coach rejections exercised the rollback path."""
+        runner, result = run_round(pipeline=True)
+        stats = runner.pipeline_stats
+
+        assert any(m.validation_metadata["attempts"] > 1 for m in result.messages)
+        assert stats["discarded"] > 0
+        assert stats["accepted"] + stats["discarded"] == stats["speculated"]
+
+    def test_coach_overlaps_next_performer(self, run_round):
+        """Test that pipelining hides coach latency behind the next generation."""
+        start = time.time()
+        run_round(pipeline=False, max_turns=5, delay=0.03)
+        sequential = time.time() - start
+
+        start = time.time()
+        runner, _ = run_round(pipeline=True, max_turns=5, delay=0.03)
+        pipelined = time.time() - start
+
+        assert runner.pipeline_stats["accepted"] > 0
+        assert pipelined < sequential
@@ -0,0 +1,220 @@
+"""
+Test: SocialRLRunner Token Streaming
+
+Tests that streaming mode:
+- Emits per-token deltas that add up to the final message
+- Cancels a generation once a prompt leak or the length budget is hit
+- Never streams text the guard later cuts from the final message
+- Works through DualLLMClient (coach validation) and the plain client path
+- Works with the local_rcm clients' stream_message
+"""
+
+import sys
+import random
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+# Add project root and local_rcm to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "local_rcm"))
+
+from social_rl.runner import TurnDelta
+from social_rl.dual_llm_client import DualLLMClient, consume_stream
+from llm_client import MockClient, OpenAIClient
+
+
+class StreamingClient:
+    """Client that streams a scripted reply word by word and records closes."""
+
+    def __init__(self, reply: str):
+        self.reply = reply
+        self.words_sent = 0
+        self.closed_early = 0
+
+    def send_message(self, system_prompt, user_message, temperature=0.7, max_tokens=512):
+        if temperature < 0.5:
+            return "VALID: yes\nVIOLATIONS: none\nSUGGESTION: none"
+        return self.reply
+
+    def stream_message(self, system_prompt, user_message, temperature=0.7, max_tokens=512):
+        words = self.reply.split(" ")
+        try:
+            for i, word in enumerate(words):
+                self.words_sent += 1
+                yield word if i == 0 else " " + word
+        except GeneratorExit:
+            self.closed_early += 1
+            raise
+
+
+class TestConsumeStream:
+    """Tests for the stream accumulator."""
+
+    def test_accumulates_and_reports_deltas(self):
+        """Test that deltas are forwarded with the running text."""
+        seen = []
+        text, cancelled = consume_stream(iter(["a", "b", "c"]), lambda d, t: seen.append((d, t)))
+
+        assert text == "abc"
+        assert not cancelled
+        assert seen == [("a", "a"), ("b", "ab"), ("c", "abc")]
+
+    def test_guard_cancels_and_closes_stream(self):
+        """Test that the guard stops consumption and closes the generator."""
+        client = StreamingClient("one two three four five")
+        text, cancelled = consume_stream(
+            client.stream_message("s", "u"),
+            stream_guard=lambda t: t if "two" in t else None
+        )
+
+        assert cancelled
+        assert text == "one two"
+        assert client.words_sent == 2
+        assert client.closed_early == 1
+
+    def test_guard_holds_back_cut_text(self, make_runner):
+        """Test that deltas never include text the guard cuts off."""
+        runner = make_runner(StreamingClient(""))
+        seen = []
+        text, cancelled = consume_stream(
+            iter(["Fine", " by", " me.", " [", "If", " challenged: push back]"]),
+            lambda d, t: seen.append(d),
+            runner._stream_guard, runner._stream_settled
+        )
+
+        assert cancelled
+        assert text == "Fine by me."
+        assert seen == ["Fine", " by", " me."]
+
+    def test_guard_without_settled_streams_at_end(self):
+        """Test that a guard without stream_settled holds everything back."""
+        seen = []
+        text, cancelled = consume_stream(
+            iter(["a", "b", "c"]), lambda d, t: seen.append((d, t)),
+            stream_guard=lambda t: None
+        )
+
+        assert (text, cancelled) == ("abc", False)
+        assert seen == [("abc", "abc")]
+
+    @pytest.mark.parametrize("max_chars", [None, 30, 45])
+    def test_streamed_text_matches_result(self, make_runner, max_chars):
+        """Test that deltas add up to the result for any chunking."""
+        rng = random.Random(max_chars)
+        runner = make_runner(StreamingClient(""), stream_max_chars=max_chars)
+        pieces = ["Yes. ", "We ", "should. ", "[", "I", "f ", "[if", "x ", "! ", "ok ", " ", "go? "]
+
+        for _ in range(200):
+            reply = "".join(rng.choice(pieces) for _ in range(rng.randrange(1, 15)))
+            cuts = sorted(rng.sample(range(1, len(reply)), min(len(reply) - 1, rng.randrange(0, 8))))
+            chunks = [reply[i:j] for i, j in zip([0] + cuts, cuts + [len(reply)])]
+            seen = []
+            text, _ = consume_stream(
+                iter(chunks), lambda d, t: seen.append((d, t)),
+                runner._stream_guard, runner._stream_settled
+            )
+
+            assert "".join(d for d, _ in seen) == text
+            assert all(t == text[:len(t)] for _, t in seen)
+
+
+class TestRunnerStreaming:
+    """Tests for streaming turns through SocialRLRunner."""
+
+    def test_deltas_rebuild_messages(self, make_runner):
+        """Test that concatenated deltas equal each final message."""
+        deltas = []
+        client = StreamingClient("We need fair hours.")
+        runner = make_runner(client, dual_llm_client=DualLLMClient(client))
+        result = runner.execute_round(1, max_turns=2, delta_callback=deltas.append)
+
+        assert all(isinstance(d, TurnDelta) for d in deltas)
+        for message in result.messages:
+            streamed = "".join(d.delta for d in deltas if d.turn_number == message.turn_number)
+            assert streamed == message.content
+        assert deltas[0].agent_id == "Worker+Alice"
+
+    def test_cancel_on_prompt_leak(self, make_runner):
+        """Test that generation stops at a leaked [If ...] cue."""
+        client = StreamingClient("Fine by me. [If challenged: push back] and more words here")
+        runner = make_runner(client, use_coach_validation=False, stream_tokens=True)
+        result = runner.execute_round(1, max_turns=1)
+
+        assert result.messages[0].content == "Fine by me."
+        assert client.closed_early == 1
+
+    def test_leak_never_streamed(self, make_runner):
+        """Test that streamed deltas stop where the leak-cancelled message ends."""
+        deltas = []
+        client = StreamingClient("Fine by me. [If challenged: push back] and more words here")
+        runner = make_runner(client, dual_llm_client=DualLLMClient(client))
+        result = runner.execute_round(1, max_turns=1, delta_callback=deltas.append)
+
+        assert "".join(d.delta for d in deltas) == result.messages[0].content == "Fine by me."
+
+    def test_cancel_on_length_budget(self, make_runner):
+        """Test that generation stops past stream_max_chars at a sentence end."""
+        client = StreamingClient("First point here. Second point is much longer than the budget allows")
+        runner = make_runner(
+            client, dual_llm_client=DualLLMClient(client), stream_tokens=True, stream_max_chars=30
+        )
+        result = runner.execute_round(1, max_turns=1)
+
+        message = result.messages[0]
+        assert message.content == "First point here."
+        assert message.validation_metadata["stream_cancelled"] is True
+        assert client.closed_early == 1
+
+    def test_streaming_off_by_default(self, make_runner):
+        """Test that runs without delta_callback keep the blocking path."""
+        client = StreamingClient("Blocking reply.")
+        runner = make_runner(client, dual_llm_client=DualLLMClient(client))
+        result = runner.execute_round(1, max_turns=1)
+
+        assert result.messages[0].content == "Blocking reply."
+        assert client.words_sent == 0
+
+
+class TestLocalRcmStreaming:
+    """Tests for streaming through local_rcm clients."""
+
+    def test_dual_llm_streams_mock_client(self):
+        """Test that generate_stream passes sampling settings local_rcm clients accept."""
+        dual = DualLLMClient(MockClient(), MockClient())
+        assert "".join(dual.generate_stream("system", "user")) == "Mock response #1"
+
+    def test_openai_client_forwards_sampling_settings(self):
+        """Test that OpenAIClient.stream_message sends temperature/max_tokens."""
+        sent = {}
+
+        class Stream:
+            def __init__(self, **kwargs):
+                sent.update(kwargs)
+
+            def __iter__(self):
+                yield SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content="ok"))])
+
+            def close(self):
+                pass
+
+        client = OpenAIClient.__new__(OpenAIClient)
+        client.model = "m"
+        client.client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=Stream)))
+
+        dual = DualLLMClient(client)
+        assert "".join(dual.generate_stream("system", "user", max_tokens=64)) == "ok"
+        assert sent["temperature"] == dual.config.performer_temperature
+        assert sent["max_tokens"] == 64
+        assert sent["stream"] is True
+
+    def test_runner_streams_mock_client(self, make_runner):
+        """Test a streamed round with a local_rcm client."""
+        deltas = []
+        runner = make_runner(MockClient())
+        result = runner.execute_round(1, max_turns=2, delta_callback=deltas.append)
+
+        for message in result.messages:
+            streamed = "".join(d.delta for d in deltas if d.turn_number == message.turn_number)
+            assert streamed == message.content
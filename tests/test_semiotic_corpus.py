@@ -0,0 +1,193 @@
+"""
+Test: Batch Semiotic Coding
+
+Tests that SemioticCoder.code_corpus:
+- Codes experiment directories and message iterables alike
+- Streams codes in source / round / message order across workers
+- Gives the same codes as code_transcript()
+- Bounds concurrent LLM requests
+- Codes every shard on one event loop (async clients keep their semaphore)
+"""
+
+import sys
+import json
+import asyncio
+import time
+import threading
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "local_rcm"))
+
+from social_rl.semiotic_coder import SemioticCoder
+from llm_client import AsyncLLMClient
+from social_rl.transcript import write_round_transcript
+
+
+UTTERANCES = [
+    "Because we must act, therefore I demand change.",
+    "My vote doesn't matter and no one listens.",
+    "I hear what you say, that's a fair point.",
+    "That doesn't make sense, you're wrong.",
+    "Maybe if they listened, I might consider it.",
+]
+
+
+def round_data(round_number, count=7):
+    return {
+        "round_number": round_number,
+        "messages": [
+            {"agent_id": f"CES_{i % 3}", "content": UTTERANCES[i % len(UTTERANCES)],
+             "round_number": round_number, "turn_number": i + 1}
+            for i in range(count)
+        ],
+        "feedback": {},
+        "policy_adaptations": [],
+        "synthesis": "",
+        "duration_seconds": 1.0,
+    }
+
+
+def make_experiment(tmp_path, name):
+    exp_dir = tmp_path / name
+    exp_dir.mkdir()
+    (exp_dir / "round1_social_rl.json").write_text(json.dumps(round_data(1)))
+    write_round_transcript(exp_dir / "round2_social_rl.jsonl", round_data(2, count=5))
+    return exp_dir
+
+
+def reference_codes(coder, exp_dir):
+    return [
+        code
+        for n in (1, 2)
+        for code in coder.code_transcript(round_data(n, count=7 if n == 1 else 5))
+    ]
+
+
+class CountingClient:
+    """Blocking client that records how many requests overlap."""
+
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def send_message(self, system_prompt, user_message, temperature=0.7, max_tokens=512):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(0.01)
+        with self.lock:
+            self.active -= 1
+        return json.dumps({"justification": "justificatory", "notes": user_message[-12:]})
+
+
+class TestLexiconCorpus:
+    """Tests for process-pool lexicon coding."""
+
+    def test_matches_code_transcript(self, tmp_path):
+        coder = SemioticCoder()
+        exp_a = make_experiment(tmp_path, "A_seed1")
+        exp_b = make_experiment(tmp_path, "B_seed1")
+
+        coded = list(coder.code_corpus([exp_a, str(exp_b)], workers=2, shard_size=3))
+
+        assert [i for i, _ in coded] == [0] * 12 + [1] * 12
+        assert [c for _, c in coded] == reference_codes(coder, exp_a) * 2
+
+    def test_message_iterables(self):
+        coder = SemioticCoder()
+        messages = round_data(3)["messages"]
+
+        coded = list(coder.code_corpus([iter(messages), []], workers=1, shard_size=2))
+
+        assert [c for _, c in coded] == coder.code_transcript(round_data(3))
+        assert {i for i, _ in coded} == {0}
+
+    def test_worker_count_does_not_change_order(self, tmp_path):
+        coder = SemioticCoder()
+        sources = [make_experiment(tmp_path, f"G_seed{i}") for i in range(3)]
+
+        serial = list(coder.code_corpus(sources, workers=1))
+        parallel = list(coder.code_corpus(sources, workers=3, shard_size=1))
+
+        assert serial == parallel
+
+
+class TestLLMCorpus:
+    """Tests for the bounded async LLM pool."""
+
+    def test_order_and_concurrency_bound(self):
+        client = CountingClient()
+        coder = SemioticCoder(llm_client=client, use_llm=True)
+        messages = round_data(1, count=12)["messages"]
+
+        coded = list(coder.code_corpus([messages], max_concurrency=3))
+
+        assert [c.turn_number for _, c in coded] == list(range(1, 13))
+        assert all(c.coder_notes.startswith("llm-coded") for _, c in coded)
+        assert 1 < client.peak <= 3
+
+    def test_async_client_across_shards(self):
+        # Semaphore smaller than a shard: it is created on the first shard's
+        # loop, so every shard must run on that same loop
+        client = AsyncCountingClient(max_concurrency=2)
+        coder = SemioticCoder(llm_client=client, use_llm=True)
+        messages = round_data(1, count=17)["messages"]
+
+        coded = list(coder.code_corpus([messages], shard_size=5, max_concurrency=8))
+
+        assert [c.turn_number for _, c in coded] == list(range(1, 18))
+        assert all(c.coder_notes.startswith("llm-coded") for _, c in coded), \
+            [c.coder_notes for _, c in coded]
+        assert len(client.loops) == 1
+        assert client.peak == 2
+
+    def test_inside_running_loop(self):
+        coder = SemioticCoder(llm_client=AsyncCountingClient(), use_llm=True)
+        messages = round_data(1, count=6)["messages"]
+
+        async def main():
+            return list(coder.code_corpus([messages], shard_size=4))
+
+        coded = asyncio.run(main())
+        assert [c.turn_number for _, c in coded] == list(range(1, 7))
+        assert all(c.coder_notes.startswith("llm-coded") for _, c in coded)
+
+    def test_early_close_stops_coding(self):
+        client = AsyncCountingClient(max_concurrency=2)
+        coder = SemioticCoder(llm_client=client, use_llm=True)
+        messages = round_data(1, count=60)["messages"]
+
+        stream = coder.code_corpus([messages], shard_size=5)
+        first = [next(stream) for _ in range(3)]
+        stream.close()
+
+        assert [c.turn_number for _, c in first] == [1, 2, 3]
+        assert client.calls < 60
+
+
+class AsyncCountingClient(AsyncLLMClient):
+    """Async client that records overlap and which loops it ran on."""
+
+    def __init__(self, max_concurrency=8):
+        super().__init__(max_concurrency)
+        self.active = 0
+        self.peak = 0
+        self.calls = 0
+        self.loops = set()
+
+    async def send_message(self, system_prompt, user_message, temperature=None, max_tokens=None, timeout=None):
+        self.loops.add(id(asyncio.get_running_loop()))
+        async with self.semaphore:
+            self.calls += 1
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            await asyncio.sleep(0.005)
+            self.active -= 1
+        return json.dumps({"justification": "justificatory", "notes": user_message[-12:]})
+
+    async def send_json(self, system_prompt, user_message, timeout=None):
+        return {}
@@ -0,0 +1,132 @@
+"""
+Test: Columnar Semiotic Summaries
+
+Tests that SemioticCodeTable / compute_semiotic_summary:
+- Give exactly the summaries of the per-agent counting loops
+- Agree between the NumPy and pure-Python backends
+- Break down by round and condition in one call
+"""
+
+import sys
+import random
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from social_rl import semiotic_coder
+from social_rl.semiotic_coder import (
+    SemioticCoder, SemioticCode, SemioticCodeTable, SemioticSummary,
+    JustificationType, VoiceMarker, RelationalStance, compare_conditions
+)
+
+
+def random_codes(n, seed=0):
+    rng = random.Random(seed)
+    return [
+        SemioticCode(
+            agent_id=f"CES_{rng.randrange(4)}",
+            turn_number=i,
+            round_number=rng.randrange(1, 4),
+            content="",
+            justification=rng.choice(list(JustificationType)),
+            voice=rng.choice(list(VoiceMarker)),
+            stance=rng.choice(list(RelationalStance)),
+        )
+        for i in range(n)
+    ]
+
+
+def reference_summary(codes):
+    """The original per-agent, per-category counting loops."""
+    by_agent = {}
+    for code in codes:
+        by_agent.setdefault(code.agent_id, []).append(code)
+
+    summaries = {}
+    for aid, agent_codes in by_agent.items():
+        total = len(agent_codes)
+        count = lambda pred: sum(1 for c in agent_codes if pred(c))
+        alien = count(lambda c: c.voice == VoiceMarker.ALIENATED)
+        empower = count(lambda c: c.voice == VoiceMarker.EMPOWERED)
+        bridge = count(lambda c: c.stance == RelationalStance.BRIDGING)
+        dismiss = count(lambda c: c.stance == RelationalStance.DISMISSIVE)
+        summaries[aid] = SemioticSummary(
+            agent_id=aid,
+            total_turns=total,
+            justification_ratio=count(lambda c: c.justification == JustificationType.JUSTIFICATORY) / total,
+            assertion_ratio=count(lambda c: c.justification == JustificationType.ASSERTIVE) / total,
+            alienation_count=alien,
+            empowerment_count=empower,
+            conditional_count=count(lambda c: c.voice == VoiceMarker.CONDITIONAL),
+            bridging_count=bridge,
+            dismissive_count=dismiss,
+            direct_address_count=count(lambda c: c.stance == RelationalStance.DIRECT_ADDRESS),
+            voice_valence=(empower - alien) / total,
+            stance_valence=(bridge - dismiss) / total,
+        )
+    return summaries
+
+
+@pytest.fixture(params=["numpy", "python"])
+def backend(request, monkeypatch):
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(semiotic_coder, "import_numpy", lambda required=True: None)
+    return request.param
+
+
+class TestSemioticCodeTable:
+    """Tests for grouped counting."""
+
+    def test_matches_reference(self, backend):
+        codes = random_codes(500)
+        summaries = SemioticCoder().compute_semiotic_summary(codes)
+
+        assert summaries == reference_summary(codes)
+        assert list(summaries) == list(reference_summary(codes))
+
+    def test_agent_filter(self, backend):
+        codes = random_codes(200)
+        summaries = SemioticCoder().compute_semiotic_summary(codes, agent_id="CES_1")
+
+        assert summaries == {"CES_1": reference_summary(codes)["CES_1"]}
+
+    def test_round_and_condition_breakdown(self, backend):
+        codes_a, codes_b = random_codes(300, seed=1), random_codes(300, seed=2)
+        table = SemioticCodeTable.from_codes(codes_a, condition="A")
+        table.extend(codes_b, condition="B")
+
+        grouped = table.summarize(by=("condition", "round_number", "agent_id"))
+
+        for (condition, round_number, agent_id), summary in grouped.items():
+            source = codes_a if condition == "A" else codes_b
+            subset = [c for c in source if c.round_number == round_number]
+            assert summary == reference_summary(subset)[agent_id]
+
+    def test_summary_without_agent_key(self, backend):
+        codes = random_codes(100)
+        by_round = SemioticCodeTable.from_codes(codes).summarize(by=("round_number",))
+
+        assert sum(s.total_turns for s in by_round.values()) == 100
+        assert {s.agent_id for s in by_round.values()} == {"all"}
+
+    def test_empty_and_invalid(self):
+        assert SemioticCoder().compute_semiotic_summary([]) == {}
+        with pytest.raises(ValueError):
+            SemioticCodeTable().summarize(by=("content",))
+
+
+class TestCompareConditions:
+    def test_deltas_from_single_grouped_pass(self):
+        codes_a, codes_b = random_codes(200, seed=3), random_codes(200, seed=4)
+        ref_a, ref_b = reference_summary(codes_a), reference_summary(codes_b)
+
+        comparison = compare_conditions(codes_a, codes_b, "OFF", "ON")
+
+        for agent, row in comparison["by_agent"].items():
+            assert row["OFF_voice_valence"] == ref_a[agent].voice_valence
+            assert row["voice_delta"] == ref_b[agent].voice_valence - ref_a[agent].voice_valence
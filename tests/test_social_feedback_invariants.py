@@ -159,7 +159,7 @@ class TestFeedbackFromActualOutputs:
 
     def test_actual_feedback_values_valid(self):
         """Test that feedback from actual outputs is within valid ranges."""
-        import json
+        from social_rl.transcript import find_round_transcripts, load_round_transcript
 
         outputs_dir = Path(__file__).parent.parent / "outputs"
 
@@ -172,11 +172,9 @@ class TestFeedbackFromActualOutputs:
             pytest.skip("No Social RL outputs found")
 
         for output_dir in output_dirs:
-            round_files = list(output_dir.glob("round*_social_rl.json"))
-
-            for round_file in round_files:
-                with open(round_file, 'r') as f:
-                    data = json.load(f)
+            # JSONL transcripts and legacy round*_social_rl.json dumps
+            for round_file in find_round_transcripts(output_dir).values():
+                data = load_round_transcript(round_file)
 
                 feedback_dict = data.get("feedback", {})
 
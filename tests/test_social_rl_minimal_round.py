@@ -210,6 +210,8 @@ class TestOutputFileValidation:
 
     def test_existing_output_files(self):
         """Test that existing output files conform to schema."""
+        from social_rl.transcript import find_round_transcripts, load_round_transcript
+
         outputs_dir = Path(__file__).parent.parent / "outputs"
 
         if not outputs_dir.exists():
@@ -222,16 +224,28 @@ class TestOutputFileValidation:
             pytest.skip("No Social RL outputs found")
 
         for output_dir in output_dirs:
-            round_files = list(output_dir.glob("round*_social_rl.json"))
-
-            for round_file in round_files:
-                with open(round_file, 'r') as f:
-                    data = json.load(f)
+            # JSONL transcripts and legacy round*_social_rl.json dumps
+            for round_file in find_round_transcripts(output_dir).values():
+                data = load_round_transcript(round_file)
 
                 # Should not raise
                 assert validate_round_result(data) is True, \
                     f"Validation failed for {round_file}"
 
+    def test_runner_output_files(self, tmp_path):
+        """Test that the transcripts the runner writes now conform to schema."""
+        from social_rl.runner import SocialRLRunner, SocialRLConfig
+        from social_rl.transcript import find_round_transcripts, load_round_transcript
+
+        config = SocialRLConfig(verbose=False, auto_save=True, output_dir=str(tmp_path))
+        runner = SocialRLRunner(MINIMAL_CANVAS, MockLLMClient(), config=config)
+        runner.execute_round(1, max_turns=2)
+
+        round_files = find_round_transcripts(runner.output_dir)
+        assert list(round_files) == [1]
+        assert round_files[1].suffix != ".json"
+        assert validate_round_result(load_round_transcript(round_files[1])) is True
+
 
 class TestMinimalCanvasValidation:
     """Tests for minimal canvas structure."""
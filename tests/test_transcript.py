@@ -0,0 +1,141 @@
+"""
+Test: JSONL Transcript Store
+
+Tests that streamed round transcripts:
+- Load back into the SocialRLRoundResult.to_dict() shape
+- Are written turn by turn while the round runs
+- Survive a crash mid-round (torn record / truncated gzip stream)
+- Coexist with legacy round{n}_social_rl.json files
+"""
+
+import sys
+import json
+import gzip
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from social_rl.transcript import (
+    TranscriptWriter, load_round_transcript, load_round_transcripts,
+    transcript_path, write_round_transcript
+)
+
+
+@pytest.fixture
+def run_round(make_runner):
+    def run(output_dir, **config_kwargs):
+        runner = make_runner(auto_save=True, output_dir=str(output_dir), **config_kwargs)
+        return runner, runner.execute_round(1, max_turns=4)
+
+    return run
+
+
+ROUND = {
+    "round_number": 2,
+    "messages": [
+        {"agent_id": "A", "content": "first", "round_number": 2, "turn_number": 1},
+        {"agent_id": "B", "content": "second", "round_number": 2, "turn_number": 2},
+    ],
+    "feedback": {"A": {"engagement": 0.5}},
+    "policy_adaptations": [],
+    "synthesis": "",
+    "duration_seconds": 1.5,
+}
+
+
+class TestTranscriptFormat:
+    """Tests for the writer and loader."""
+
+    @pytest.mark.parametrize("compression", [None, "gzip"])
+    def test_round_trip(self, tmp_path, compression):
+        """Test that a written round loads back unchanged."""
+        path = transcript_path(tmp_path, 2, compression)
+        write_round_transcript(path, ROUND, compression)
+
+        assert load_round_transcript(path) == ROUND
+
+    def test_one_compact_record_per_line(self, tmp_path):
+        """Test the on-disk layout: message lines then a summary line."""
+        path = transcript_path(tmp_path, 2)
+        write_round_transcript(path, ROUND)
+
+        lines = path.read_text().splitlines()
+        assert [json.loads(line)["type"] for line in lines] == ["message", "message", "round"]
+        assert ": " not in lines[0]
+
+    def test_torn_final_record(self, tmp_path):
+        """Test that a crash mid-write keeps the complete records."""
+        path = transcript_path(tmp_path, 2)
+        writer = TranscriptWriter(path)
+        writer.write_message(ROUND["messages"][0])
+        writer.close()
+        with open(path, "a") as f:
+            f.write('{"type":"message","agent_id":"B","cont')
+
+        loaded = load_round_transcript(path)
+        assert loaded["messages"] == ROUND["messages"][:1]
+        assert loaded["round_number"] == 2
+        assert loaded["feedback"] == {}
+
+    def test_truncated_gzip_stream(self, tmp_path):
+        """Test that an unclosed gzip transcript is readable up to the last flush."""
+        path = transcript_path(tmp_path, 2, "gzip")
+        writer = TranscriptWriter(path, "gzip")
+        for message in ROUND["messages"]:
+            writer.write_message(message)
+        # Simulate a crash: the gzip trailer is never written
+        data = path.read_bytes()
+        writer.close()
+        path.write_bytes(data)
+
+        assert load_round_transcript(path)["messages"] == ROUND["messages"]
+
+    def test_unknown_compression(self, tmp_path):
+        with pytest.raises(ValueError):
+            TranscriptWriter(tmp_path / "x.jsonl", compression="lz4")
+
+
+class TestRunnerTranscripts:
+    """Tests for transcripts written by SocialRLRunner."""
+
+    def test_streamed_transcript_matches_round_result(self, run_round, tmp_path):
+        """Test that the JSONL transcript equals result.to_dict()."""
+        runner, result = run_round(tmp_path)
+
+        assert (tmp_path / "round1_social_rl.jsonl").exists()
+        assert not (tmp_path / "round1_social_rl.json").exists()
+        assert load_round_transcripts(tmp_path)[1] == json.loads(json.dumps(result.to_dict()))
+
+    def test_messages_written_as_turns_complete(self, make_runner, tmp_path):
+        """Test that each turn is on disk before the next one starts."""
+        seen = []
+
+        def on_turn(message):
+            path = tmp_path / "round1_social_rl.jsonl"
+            seen.append(len(load_round_transcript(path)["messages"]))
+
+        runner = make_runner(auto_save=True, output_dir=str(tmp_path))
+        runner.execute_round(1, max_turns=3, turn_callback=on_turn)
+
+        assert seen == [1, 2, 3]
+
+    def test_legacy_json_format(self, run_round, tmp_path):
+        """Test that transcript_format='json' keeps the indented dump loadable."""
+        runner, result = run_round(tmp_path, transcript_format="json")
+
+        assert not (tmp_path / "round1_social_rl.jsonl").exists()
+        assert load_round_transcripts(tmp_path)[1]["messages"] == \
+            [m.to_dict() for m in result.messages]
+
+    def test_gzip_transcripts(self, run_round, tmp_path):
+        runner, result = run_round(tmp_path, transcript_compression="gzip")
+
+        path = tmp_path / "round1_social_rl.jsonl.gz"
+        with gzip.open(path, "rt") as f:
+            types = [json.loads(line)["type"] for line in f]
+        assert types.count("message") == len(result.messages)
+        assert types[-1] == "round"
+        assert len(load_round_transcripts(tmp_path)[1]["messages"]) == 4
@@ -0,0 +1,98 @@
+"""
+Test: Memoized TurnContext Components
+
+Tests that ContextInjector:
+- Produces the same TurnContext with memoization as recomputing every turn
+- Serves progressive manifestations from the cache once per intensity level
+- Clears the cache on round change and feedback update
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from social_rl.context_injector import (
+    ContextInjector, ManifestationType, TheoreticalFramework
+)
+
+
+FRAMEWORK = TheoreticalFramework.from_canvas_project({
+    "theoretical_option": "A",
+    "concept_a": {"name": "Alienation"},
+    "concept_b": {"name": "Non-domination"},
+})
+
+AGENTS = {
+    "Worker+Alice": {"identifier": "Worker+Alice", "role": "Worker", "persona": "A tired machinist. Ten years in."},
+    "Owner+Marta": {"identifier": "Owner+Marta", "role": "Owner", "persona": "The owner."},
+    "Worker+Ben": {"identifier": "Worker+Ben", "role": "Worker", "persona": "A tired machinist. Ten years in."},
+}
+
+
+def round_config(number):
+    return {
+        "round_number": number,
+        "scenario": f"Shift {number}",
+        "end_condition": "Total messages: 12",
+        "concept_a_manifestation": "The line speeds up.",
+        "concept_b_manifestation": "Nobody asks you.",
+    }
+
+
+def run_turns(injector, rounds=2, turns=12):
+    contexts = []
+    for number in range(1, rounds + 1):
+        history = []
+        for turn in range(1, turns + 1):
+            agent_id = list(AGENTS)[turn % len(AGENTS)]
+            contexts.append(injector.generate_turn_context(
+                agent_id, AGENTS[agent_id], round_config(number), turn, history
+            ).to_dict())
+            history.append({"agent_id": agent_id, "content": f"But Alice, we must hurry? Turn {turn}."})
+    return contexts
+
+
+class Uncached(ContextInjector):
+    def _memoized(self, key, compute):
+        return compute()
+
+
+class TestTurnContextCache:
+    """Tests for the per-round component cache."""
+
+    @pytest.mark.parametrize("mode", list(ManifestationType))
+    def test_matches_uncached(self, mode):
+        assert run_turns(ContextInjector(FRAMEWORK, mode=mode)) == run_turns(Uncached(FRAMEWORK, mode=mode))
+
+    def test_hit_rate(self):
+        injector = ContextInjector(FRAMEWORK, mode=ManifestationType.PROGRESSIVE)
+        run_turns(injector, rounds=1, turns=12)
+        stats = injector.get_cache_stats()
+
+        # One lookup per turn; low / medium / high each miss once
+        assert stats["hits"] + stats["misses"] == 12
+        assert stats["misses"] == 3
+        assert stats["hit_rate"] == pytest.approx(9 / 12)
+
+    def test_cleared_on_round_change(self):
+        injector = ContextInjector(FRAMEWORK)
+        cfg = round_config(1)
+        first = injector.generate_turn_context("Worker+Alice", AGENTS["Worker+Alice"], cfg, 1, [])
+
+        changed = dict(round_config(2), concept_a_manifestation="The line stops.")
+        second = injector.generate_turn_context("Worker+Alice", AGENTS["Worker+Alice"], changed, 1, [])
+
+        assert first.concept_a_manifestation == "The line speeds up."
+        assert second.concept_a_manifestation == "The line stops."
+
+    def test_cleared_on_feedback_update(self):
+        injector = ContextInjector(FRAMEWORK)
+        injector.generate_turn_context("Worker+Alice", AGENTS["Worker+Alice"], round_config(1), 1, [])
+        assert injector.get_cache_stats()["entries"] > 0
+
+        injector.update_feedback("Worker+Alice", {"engagement": 0.2})
+        assert injector.get_cache_stats()["entries"] == 0